@@ -3,7 +3,6 @@ Abyssal Depths Mode for EVE Rebellion
 Triglavian roguelike extraction mode with rooms, hazards, and timer.
 """
 
-import json
 import math
 import random
 from dataclasses import dataclass, field
@@ -12,6 +11,8 @@ from typing import Any, Dict, List, Optional
 
 import pygame
 
+from core.snapshot import load_json_table
+
 
 @dataclass
 class AbyssalRoomState:
@@ -238,8 +239,7 @@ class AbyssalDepthsMode:
         config_path = Path("config/chapters/abyssal_depths_config.json")
         if config_path.exists():
             try:
-                with open(config_path, "r") as f:
-                    return json.load(f)
+                return load_json_table(str(config_path))
             except Exception as e:
                 print(f"[Abyssal] Error loading config: {e}")
         return self._default_config()
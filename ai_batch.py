@@ -0,0 +1,423 @@
+"""
+Batched AI update engine for EVE Rebellion
+
+Runs the six ai_behaviors behaviors for whole groups of enemies at once.
+Enemies are grouped by behavior type; each group keeps its per-enemy AI
+state in NumPy arrays and computes (vx, vy, should_shoot) for every member
+in one vectorized pass against the player position.
+
+Usage:
+
+    engine = AIBatchEngine(SCREEN_WIDTH, SCREEN_HEIGHT)
+    enemy.ai = create_ai_behavior(enemy, engine=engine)
+
+    # Each frame - either step explicitly...
+    engine.update(player_pos, player_bullets)
+    # ...or let the first enemy's update() step the whole engine
+    vx, vy, should_shoot = enemy.ai.update(player_pos, player_bullets)
+
+The movement rules match the per-enemy classes in ai_behaviors exactly;
+only the random draws come from the engine's own generator.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ai_behaviors import (
+    AI_BASIC,
+    AI_KAMIKAZE,
+    AI_SNIPER,
+    AI_SPAWNER,
+    AI_TANK,
+    AI_WEAVER,
+    AIBehavior,
+    get_ai_for_enemy,
+)
+
+# Kamikaze phases
+PHASE_APPROACH = 0
+PHASE_LOCK_ON = 1
+PHASE_DIVE = 2
+
+
+class BatchedAI(AIBehavior):
+    """Per-enemy handle onto a row of an AIBatchEngine group.
+
+    Keeps the AIBehavior interface, so code written against the per-enemy
+    classes works unchanged.
+    """
+
+    def __init__(self, enemy: Any, engine: "AIBatchEngine", group: "_BatchGroup"):
+        self.enemy = enemy
+        self.engine = engine
+        self.group = group
+        self.behavior_type = group.behavior_type
+        self.screen_width = engine.screen_width
+        self.screen_height = engine.screen_height
+        self.slot = -1
+        self.spawn_queue: List[Dict[str, Any]] = []
+        # Engine step whose results this handle last returned; a new handle
+        # counts as having seen the current step, so its first update() steps
+        # the engine unless another enemy already did this frame
+        self.last_step = engine.steps
+
+    def update(
+        self, player_pos: Tuple[float, float], bullets: Any = None, dt: float = 1 / 60
+    ) -> Tuple[float, float, bool]:
+        """Return this enemy's (vx, vy, should_shoot) from the current engine step.
+
+        If this handle already returned the current step's results, the
+        whole engine is stepped first (the first enemy updated each frame
+        drives the batch).
+        """
+        if self.last_step == self.engine.steps:
+            self.engine.update(player_pos, bullets, dt)
+        self.last_step = self.engine.steps
+        results = self.group.results
+        if not 0 <= self.slot < len(results):
+            return 0.0, 0.0, False
+        return results[self.slot]
+
+    def get_fire_rate_modifier(self) -> float:
+        return self.group.fire_rate_modifier
+
+    def get_spawn_queue(self):
+        """Get and clear the spawn queue."""
+        queue = self.spawn_queue
+        self.spawn_queue = []
+        return queue
+
+    def release(self):
+        """Remove this enemy from the engine."""
+        self.engine.remove(self)
+
+
+class _BatchGroup:
+    """Enemies sharing one behavior, with AI state stored column-wise."""
+
+    behavior_type = AI_BASIC
+    fire_rate_modifier = 1.0
+    # Extra per-enemy state columns and their initial values
+    fields: Dict[str, float] = {}
+
+    def __init__(self, engine: "AIBatchEngine", capacity: int = 16):
+        self.engine = engine
+        self.handles: List[BatchedAI] = []
+        columns = {"timer": 0.0, "speed": 0.0, "vx": 0.0, "vy": 0.0, "shoot": 0.0}
+        columns.update(self.fields)
+        self.defaults = columns
+        self.arrays = {name: np.zeros(capacity) for name in columns}
+        # (vx, vy, should_shoot) per slot from the last step, as Python values
+        self.results: List[Tuple[float, float, bool]] = []
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def add(self, handle: BatchedAI):
+        slot = len(self.handles)
+        if slot == len(self.arrays["timer"]):
+            for name, column in self.arrays.items():
+                grown = np.zeros(slot * 2)
+                grown[:slot] = column
+                self.arrays[name] = grown
+        for name, value in self.defaults.items():
+            self.arrays[name][slot] = value
+        self.arrays["speed"][slot] = handle.enemy.speed
+        self.init_slot(slot)
+        handle.slot = slot
+        self.handles.append(handle)
+
+    def init_slot(self, slot: int):
+        """Set randomized initial state for a new member."""
+
+    def remove(self, handle: BatchedAI):
+        """Swap-remove a member, moving the last row into its slot."""
+        slot = handle.slot
+        last = len(self.handles) - 1
+        if slot != last:
+            moved = self.handles[last]
+            for column in self.arrays.values():
+                column[slot] = column[last]
+            self.handles[slot] = moved
+            moved.slot = slot
+            if last < len(self.results):
+                self.results[slot] = self.results[last]
+        self.handles.pop()
+        del self.results[last:]
+        handle.slot = -1
+
+    def step(self, px: float, py: float, bullets_xy, dt: float):
+        """Advance every member one frame and store vx, vy and shoot."""
+        n = len(self.handles)
+        if n == 0:
+            self.results = []
+            return
+        rects = [h.enemy.rect for h in self.handles]
+        positions = np.array([(r.centerx, r.centery) for r in rects], dtype=float)
+        ex = positions[:, 0]
+        ey = positions[:, 1]
+        cols = {name: column[:n] for name, column in self.arrays.items()}
+        cols["timer"] += dt
+        vx, vy, shoot = self.compute(cols, ex, ey, px, py, bullets_xy, dt)
+        cols["vx"][:] = vx
+        cols["vy"][:] = vy
+        cols["shoot"][:] = shoot
+        self.results = list(
+            zip(cols["vx"].tolist(), cols["vy"].tolist(), np.asarray(shoot, dtype=bool).tolist())
+        )
+
+    def compute(self, cols, ex, ey, px, py, bullets_xy, dt):
+        raise NotImplementedError
+
+
+class _BasicGroup(_BatchGroup):
+    behavior_type = AI_BASIC
+
+    def compute(self, cols, ex, ey, px, py, bullets_xy, dt):
+        n = len(ex)
+        # Drift toward player's x with some variance
+        dx = px + self.engine.rng.uniform(-100, 100, n) - ex
+        vx = np.where(np.abs(dx) > 20, np.sign(dx) * np.minimum(np.abs(dx) * 0.02, 1.5), 0.0)
+        vy = cols["speed"] * 0.6
+        shoot = (py > ey) & (np.abs(px - ex) < 150)
+        return vx, vy, shoot
+
+
+class _KamikazeGroup(_BatchGroup):
+    behavior_type = AI_KAMIKAZE
+    fire_rate_modifier = 0.0
+    fields = {
+        "phase": PHASE_APPROACH,
+        "dive_speed": 0.0,
+        "max_dive_speed": 8.0,
+        "target_x": 0.0,
+        "target_y": 0.0,
+    }
+
+    def compute(self, cols, ex, ey, px, py, bullets_xy, dt):
+        speed = cols["speed"]
+        phase = cols["phase"]
+        approach = phase == PHASE_APPROACH
+        lock_on = phase == PHASE_LOCK_ON
+        dive = phase == PHASE_DIVE
+
+        vx = np.zeros(len(ex))
+        vy = speed.copy()
+
+        # Move down until in range, then lock onto the player's position
+        descending = approach & (ey < 150)
+        vy[descending] = speed[descending] * 0.8
+        locking = approach & ~descending
+        phase[locking] = PHASE_LOCK_ON
+        cols["target_x"][locking] = px
+        cols["target_y"][locking] = py
+
+        # Start the dive
+        phase[lock_on] = PHASE_DIVE
+        cols["dive_speed"][lock_on] = speed[lock_on]
+
+        # Accelerate toward the player
+        if dive.any():
+            dive_speed = np.minimum(cols["dive_speed"][dive] + 0.2, cols["max_dive_speed"][dive])
+            cols["dive_speed"][dive] = dive_speed
+            dx = px - ex[dive]
+            dy = py - ey[dive]
+            dist = np.maximum(1, np.sqrt(dx * dx + dy * dy))
+            vx[dive] = dx / dist * dive_speed
+            vy[dive] = dy / dist * dive_speed
+
+        # Never shoot - all energy into the dive
+        return vx, vy, np.zeros(len(ex), dtype=bool)
+
+
+class _WeaverGroup(_BatchGroup):
+    behavior_type = AI_WEAVER
+    fields = {"dodge_direction": 1.0, "dodge_timer": 0.0}
+    weave_amplitude = 80
+    weave_frequency = 2.0
+
+    def init_slot(self, slot):
+        self.arrays["dodge_direction"][slot] = self.engine.rng.choice((-1.0, 1.0))
+
+    def compute(self, cols, ex, ey, px, py, bullets_xy, dt):
+        n = len(ex)
+        cols["dodge_timer"] += dt
+
+        # First nearby, approaching bullet for each weaver
+        dodging = np.zeros(n, dtype=bool)
+        dodge_dir = np.zeros(n)
+        if bullets_xy is not None and len(bullets_xy):
+            bdx = bullets_xy[:, 0][None, :] - ex[:, None]
+            bdy = bullets_xy[:, 1][None, :] - ey[:, None]
+            threat = (bdx * bdx + bdy * bdy < 100 * 100) & (bullets_xy[:, 1][None, :] < ey[:, None])
+            dodging = threat.any(axis=1)
+            first = threat.argmax(axis=1)
+            dodge_dir = np.where(bdx[np.arange(n), first] > 0, -1.0, 1.0)
+            cols["dodge_direction"][dodging] = dodge_dir[dodging]
+
+        # Normal weaving movement
+        weave = np.sin(cols["timer"] * self.weave_frequency) * self.weave_amplitude
+        dx = self.engine.screen_width / 2 + weave - ex
+        vx = np.minimum(np.abs(dx) * 0.1, 3.0) * np.copysign(1, dx)
+        vy = cols["speed"] * 0.7
+
+        # Sharp evasive maneuver
+        vx = np.where(dodging, dodge_dir * 5.0, vx)
+        vy = np.where(dodging, cols["speed"] * 0.3, vy)
+
+        # Shoot only when not dodging
+        shoot = ~dodging & (np.abs(px - ex) < 100)
+        return vx, vy, shoot
+
+
+class _SniperGroup(_BatchGroup):
+    behavior_type = AI_SNIPER
+    fire_rate_modifier = 0.4
+    fields = {"aiming": 0.0, "aim_timer": 0.0}
+    optimal_range = 350
+
+    def compute(self, cols, ex, ey, px, py, bullets_xy, dt):
+        speed = cols["speed"]
+        dx = px - ex
+        dy = py - ey
+        dist = np.sqrt(dx * dx + dy * dy)
+
+        # Maintain optimal range: back off, approach, or strafe slowly
+        too_close = dist < self.optimal_range - 50
+        too_far = ~too_close & (dist > self.optimal_range + 50)
+        strafe = np.sin(cols["timer"] * 0.5) * 1.5
+        vx = np.where(
+            too_close, 0.0, np.where(too_far, dx / np.maximum(1, np.abs(dx)) * 0.5, strafe)
+        )
+        vy = np.where(too_close, -0.5 * speed, np.where(too_far, 0.7 * speed, 0.1))
+
+        # Stay in bounds
+        vx = np.where(ex < 50, np.abs(vx), vx)
+        vx = np.where(ex > self.engine.screen_width - 50, -np.abs(vx), vx)
+
+        # Aim for 0.5s once lined up, then fire
+        aiming = cols["aiming"].astype(bool)
+        start = (np.abs(px - ex) < 50) & ~aiming
+        cols["aim_timer"][start] = 0.0
+        aiming |= start
+        cols["aim_timer"][aiming] += dt
+        shoot = aiming & (cols["aim_timer"] > 0.5)
+        cols["aiming"][:] = aiming & ~shoot
+        return vx, vy, shoot
+
+
+class _SpawnerGroup(_BatchGroup):
+    behavior_type = AI_SPAWNER
+    fields = {"last_spawn": 0.0, "children_spawned": 0.0}
+    spawn_cooldown = 3.0
+    max_children = 6
+
+    def compute(self, cols, ex, ey, px, py, bullets_xy, dt):
+        n = len(ex)
+        timer = cols["timer"]
+
+        # Stay at back of screen
+        target_y = 100
+        vy = np.where(ey < target_y, 0.5, np.where(ey > target_y + 50, -0.3, 0.0))
+
+        # Slow lateral movement, kept in bounds
+        vx = np.sin(timer * 0.3) * 1.0
+        vx = np.where(ex < 100, np.abs(vx), vx)
+        vx = np.where(ex > self.engine.screen_width - 100, -np.abs(vx), vx)
+
+        # Spawn check - signal drones for game.py to spawn
+        ready = (timer - cols["last_spawn"] > self.spawn_cooldown) & (
+            cols["children_spawned"] < self.max_children
+        )
+        for slot in np.flatnonzero(ready):
+            cols["last_spawn"][slot] = timer[slot]
+            cols["children_spawned"][slot] += 1
+            offset = int(self.engine.rng.integers(-30, 31))
+            self.handles[slot].spawn_queue.append(
+                {"type": "drone", "x": int(ex[slot]) + offset, "y": int(ey[slot]) + 30}
+            )
+
+        # Occasional shooting
+        shoot = self.engine.rng.random(n) < 0.02
+        return vx, vy, shoot
+
+
+class _TankGroup(_BatchGroup):
+    behavior_type = AI_TANK
+    fire_rate_modifier = 1.5
+    advance_speed = 0.3
+
+    def compute(self, cols, ex, ey, px, py, bullets_xy, dt):
+        # Slow, inexorable advance with slight tracking of player
+        vy = cols["speed"] * self.advance_speed
+        dx = px - ex
+        vx = np.where(np.abs(dx) > 50, np.copysign(0.3, dx), 0.0)
+
+        # Stay in bounds
+        vx = np.where(ex < 80, 0.3, vx)
+        vx = np.where(ex > self.engine.screen_width - 80, -0.3, vx)
+
+        # Suppressive fire - always shooting when in range
+        shoot = (ey > 50) & (ey < py)
+        return vx, vy, shoot
+
+
+BATCH_GROUPS = {
+    AI_BASIC: _BasicGroup,
+    AI_KAMIKAZE: _KamikazeGroup,
+    AI_WEAVER: _WeaverGroup,
+    AI_SNIPER: _SniperGroup,
+    AI_SPAWNER: _SpawnerGroup,
+    AI_TANK: _TankGroup,
+}
+
+
+class AIBatchEngine:
+    """Steps every registered enemy's AI in one vectorized pass per behavior."""
+
+    def __init__(
+        self, screen_width: int = 800, screen_height: int = 700, seed: Optional[int] = None
+    ):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.rng = np.random.default_rng(seed)
+        self.groups = {name: group(self) for name, group in BATCH_GROUPS.items()}
+        self.steps = 0
+
+    def __len__(self) -> int:
+        return sum(len(group) for group in self.groups.values())
+
+    def add(self, enemy: Any, behavior_type: Optional[str] = None) -> BatchedAI:
+        """Register an enemy and return its AI handle.
+
+        Enemies added partway through a frame's updates should not be
+        updated until the next frame, or they step the engine a second time.
+        """
+        if behavior_type is None:
+            behavior_type = get_ai_for_enemy(enemy.enemy_type)
+        group = self.groups.get(behavior_type, self.groups[AI_BASIC])
+        handle = BatchedAI(enemy, self, group)
+        group.add(handle)
+        return handle
+
+    def remove(self, handle: BatchedAI):
+        """Unregister an enemy. Safe to call twice."""
+        if handle.slot >= 0:
+            handle.group.remove(handle)
+
+    def prune(self):
+        """Unregister enemies whose sprite has been killed."""
+        for group in self.groups.values():
+            for handle in [h for h in group.handles if not h.enemy.alive()]:
+                group.remove(handle)
+
+    def update(self, player_pos: Tuple[float, float], bullets: Any = None, dt: float = 1 / 60):
+        """Advance every group one frame against the player position."""
+        px, py = player_pos
+        bullets_xy = None
+        if bullets and len(self.groups[AI_WEAVER]):
+            bullets_xy = np.array([(b.rect.centerx, b.rect.centery) for b in bullets], dtype=float)
+        for group in self.groups.values():
+            group.step(px, py, bullets_xy, dt)
+        self.steps += 1
@@ -451,10 +451,21 @@ def get_ai_for_enemy(enemy_type: str) -> str:
     return ai_mapping.get(enemy_type, AI_BASIC)
 
 
-def create_ai_behavior(enemy: Any, behavior_type: str = None) -> AIBehavior:
-    """Create an AI behavior instance for an enemy."""
+def create_ai_behavior(enemy: Any, behavior_type: str = None, engine: Any = None) -> AIBehavior:
+    """Create an AI behavior instance for an enemy.
+
+    Args:
+        enemy: Enemy sprite (needs rect, speed and enemy_type).
+        behavior_type: One of the AI_* constants; defaults to the enemy's type mapping.
+        engine: Optional ai_batch.AIBatchEngine. When given, the enemy joins
+            the engine's batch for its behavior and the returned handle reads
+            its results from the batched update.
+    """
     if behavior_type is None:
         behavior_type = get_ai_for_enemy(enemy.enemy_type)
 
+    if engine is not None:
+        return engine.add(enemy, behavior_type)
+
     ai_class = AI_BEHAVIORS.get(behavior_type, BasicAI)
     return ai_class(enemy)
@@ -5,10 +5,20 @@ EVE Asset Manager
 Centralized asset management for all EVE projects.
 Downloads and syncs ship renders, icons, and other assets.
 
+Downloads share one pooled, resumable engine (core.downloader); the ETags
+it records are kept in manifest.json so --revalidate can re-check existing
+files with conditional requests.
+
+Images are stored once by content hash in blobs/ (core.blob_store) and
+hard-linked into ships/<size>/<name>_<type_id>.png and into projects.
+manifest.json maps each (type_id, variation, size) to its blob, so a ship
+sharing a render with one already fetched costs no download or disk.
+
 Usage:
     python asset_manager.py --sync-all
     python asset_manager.py --download-ships --output ~/eve_assets
     python asset_manager.py --link-to-project ~/projects/EVE_Rebellion
+    python asset_manager.py --hardlink-to-project ~/projects/EVE_Rebellion
 """
 
 import argparse
@@ -18,9 +28,10 @@ import shutil
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import httpx
+from core.blob_store import BlobStore
+from core.downloader import DownloadJob, DownloadOutcome, download_files
 
 # ============================================================================
 # SHIP DATABASE
@@ -148,7 +159,10 @@ class AssetManager:
         self.asset_dir = asset_dir
         self.ships_dir = asset_dir / "ships"
         self.icons_dir = asset_dir / "icons"
+        self.downloads_dir = asset_dir / "downloads"  # Staging for in-flight downloads
         self.manifest_path = asset_dir / "manifest.json"
+        self.store = BlobStore(asset_dir / "blobs")
+        self.last_download: Dict[str, int] = {}
 
         # Create directories
         self.ships_dir.mkdir(parents=True, exist_ok=True)
@@ -173,49 +187,103 @@ class AssetManager:
         self.manifest["updated"] = datetime.now().isoformat()
         self.manifest_path.write_text(json.dumps(self.manifest, indent=2))
 
-    async def download_ship(
-        self, type_id: int, name: str, size: int = 256, variation: str = "render"
-    ) -> DownloadResult:
-        """Download a single ship image."""
-        # Determine output path
-        if variation == "render":
-            output_dir = self.ships_dir / str(size)
-        else:
-            output_dir = self.icons_dir / str(size)
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / f"{name}_{type_id}.png"
+    def _target(self, type_id: int, name: str, size: int, variation: str) -> Path:
+        base_dir = self.ships_dir if variation == "render" else self.icons_dir
+        return base_dir / str(size) / f"{name}_{type_id}.png"
 
-        # Skip if exists
-        if output_path.exists():
-            return DownloadResult(type_id, name, size, True, output_path)
+    def _known_blob(self, source_key: str) -> Optional[str]:
+        """Digest already stored for a (type_id, variation, size) key."""
+        digest = self.manifest.setdefault("sources", {}).get(source_key)
+        return digest if digest and self.store.has(digest) else None
 
-        # Download
-        url = f"{IMAGE_SERVER}/types/{type_id}/{variation}?size={size}"
+    async def _download(
+        self, requests: List[Tuple[int, str, int, str]], revalidate: bool = False
+    ) -> List[DownloadResult]:
+        """Fetch (type_id, name, size, variation) requests as one pooled batch.
+
+        Each distinct image is fetched once, and only if its blob is not
+        already known; every requested name is then linked to the blob.
+        """
+        sources = self.manifest.setdefault("sources", {})
+        files = self.manifest.setdefault("files", {})
+        jobs: Dict[str, DownloadJob] = {}
+        known = set()
+        for type_id, name, size, variation in requests:
+            key = f"{type_id}/{variation}/{size}"
+            target = self._target(type_id, name, size, variation)
+            if not self._known_blob(key) and target.exists():
+                # Adopt images downloaded before the store existed
+                sources[key] = self.store.add(target)
+            if self._known_blob(key):
+                known.add(key)
+            if key in jobs or (self._known_blob(key) and not revalidate):
+                continue
+            staging = self.downloads_dir / f"{type_id}_{variation}_{size}.png"
+            if self._known_blob(key):
+                # Give the conditional request a file to revalidate
+                self.store.materialize(sources[key], staging)
+            jobs[key] = DownloadJob(
+                f"{IMAGE_SERVER}/types/{type_id}/{variation}?size={size}", staging
+            )
+
+        outcomes: List[DownloadOutcome] = await asyncio.to_thread(
+            download_files,
+            list(jobs.values()),
+            self.manifest.setdefault("validators", {}),
+            revalidate=revalidate,
+        )
+        errors = {}
+        for key, outcome in zip(jobs, outcomes):
+            if outcome.status == "downloaded":
+                sources[key] = self.store.add(outcome.job.path)
+                # Changed on the server, so not a reuse after all
+                known.discard(key)
+            elif not outcome.ok:
+                errors[key] = outcome.error
+            if outcome.job.path.exists():
+                outcome.job.path.unlink()
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, follow_redirects=True)
+        results = []
+        reused = 0
+        for type_id, name, size, variation in requests:
+            key = f"{type_id}/{variation}/{size}"
+            digest = self._known_blob(key)
+            if digest is None:
+                error = errors.get(key, "not downloaded")
+                results.append(DownloadResult(type_id, name, size, False, error=error))
+                continue
+            target = self._target(type_id, name, size, variation)
+            self.store.materialize(digest, target)
+            files[target.relative_to(self.asset_dir).as_posix()] = digest
+            results.append(DownloadResult(type_id, name, size, True, target))
+            reused += key in known
+
+        self.last_download = {
+            "images": len(requests),
+            "fetched": sum(1 for o in outcomes if o.status == "downloaded"),
+            "reused": reused,
+            "failed": sum(1 for result in results if not result.success),
+            "bytes": sum(o.bytes for o in outcomes),
+        }
+        return results
 
-                if response.status_code == 200:
-                    output_path.write_bytes(response.content)
-                    return DownloadResult(type_id, name, size, True, output_path)
-                else:
-                    return DownloadResult(
-                        type_id, name, size, False, error=f"HTTP {response.status_code}"
-                    )
-        except Exception as e:
-            return DownloadResult(type_id, name, size, False, error=str(e))
+    async def download_ship(
+        self, type_id: int, name: str, size: int = 256, variation: str = "render"
+    ) -> DownloadResult:
+        """Download a single ship image."""
+        results = await self._download([(type_id, name, size, variation)])
+        self._save_manifest()
+        return results[0]
 
     async def download_all_ships(
         self,
         sizes: List[int] = [256],
         classes: Optional[List[str]] = None,
         factions: Optional[List[str]] = None,
+        revalidate: bool = False,
     ) -> List[DownloadResult]:
         """Download all ships matching criteria."""
-        results = []
-        tasks = []
+        requests = []
 
         for ship_class, ships in SHIP_DATABASE.items():
             if classes and ship_class not in classes:
@@ -226,18 +294,19 @@ class AssetManager:
                     continue
 
                 for size in sizes:
-                    tasks.append(self.download_ship(info["type_id"], name, size))
-
-        print(f"📥 Downloading {len(tasks)} images...")
-
-        # Run with concurrency limit
-        semaphore = asyncio.Semaphore(10)
+                    requests.append((info["type_id"], name, size, "render"))
 
-        async def bounded_download(task):
-            async with semaphore:
-                return await task
+        print(f"📥 Downloading {len(requests)} images...")
 
-        results = await asyncio.gather(*[bounded_download(t) for t in tasks])
+        results = await self._download(requests, revalidate=revalidate)
+        stats = self.last_download
+        print(
+            f"   Fetched {stats['fetched']} distinct images "
+            f"({stats['bytes'] / (1024 * 1024):.1f} MB), "
+            f"reused {stats['reused']} from the blob store"
+        )
+        if stats["failed"]:
+            print(f"   {stats['failed']} images failed to download")
 
         # Update manifest
         for result in results:
@@ -257,7 +326,12 @@ class AssetManager:
         return results
 
     def link_to_project(self, project_path: Path, link_type: str = "symlink"):
-        """Link assets to a project."""
+        """Link assets to a project.
+
+        link_type is "symlink" (one link to the whole ships directory),
+        "hardlink" (a hard link per image into the blob store, falling back
+        to copies across filesystems) or "copy" (independent copies).
+        """
         target_dir = project_path / "assets" / "eve_ships"
 
         if link_type == "symlink":
@@ -279,6 +353,29 @@ class AssetManager:
             shutil.copytree(self.ships_dir, target_dir)
             print(f"✅ Copied {self.ships_dir} → {target_dir}")
 
+        elif link_type == "hardlink":
+            if target_dir.is_symlink():
+                target_dir.unlink()
+            elif target_dir.exists():
+                shutil.rmtree(target_dir)
+
+            linked = copied = 0
+            for relative, digest in self.manifest.get("files", {}).items():
+                if not relative.startswith("ships/") or not self.store.has(digest):
+                    continue
+                target = target_dir / relative[len("ships/") :]
+                if self.store.materialize(digest, target):
+                    linked += 1
+                else:
+                    copied += 1
+            print(f"✅ Linked {linked} images ({copied} copied) → {target_dir}")
+
+    def prune(self) -> int:
+        """Delete blobs no longer referenced by the manifest."""
+        referenced = set(self.manifest.get("files", {}).values())
+        referenced.update(self.manifest.get("sources", {}).values())
+        return self.store.prune(referenced)
+
     def generate_type_mapping(self) -> Dict[str, int]:
         """Generate name to type_id mapping."""
         mapping = {}
@@ -291,13 +388,26 @@ class AssetManager:
         """Get asset statistics."""
         render_count = sum(1 for _ in self.ships_dir.rglob("*.png"))
         icon_count = sum(1 for _ in self.icons_dir.rglob("*.png"))
-        total_size = sum(f.stat().st_size for f in self.asset_dir.rglob("*.png"))
+
+        # Hard links share an inode; count each one's bytes once
+        inodes = set()
+        total_size = 0
+        linked_size = 0
+        for path in self.asset_dir.rglob("*.png"):
+            stat = path.stat()
+            if (stat.st_dev, stat.st_ino) not in inodes:
+                inodes.add((stat.st_dev, stat.st_ino))
+                total_size += stat.st_size
+            if self.store.root not in path.parents:
+                linked_size += stat.st_size
 
         return {
             "renders": render_count,
             "icons": icon_count,
             "total_files": render_count + icon_count,
+            "blobs": sum(1 for _ in self.store.digests()),
             "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "linked_size_mb": round(linked_size / (1024 * 1024), 2),
             "ship_classes": len(SHIP_DATABASE),
             "unique_ships": sum(len(ships) for ships in SHIP_DATABASE.values()),
         }
@@ -310,7 +420,8 @@ def print_stats(manager: AssetManager):
     print(f"   Ship renders: {stats['renders']}")
     print(f"   Icons: {stats['icons']}")
     print(f"   Total files: {stats['total_files']}")
-    print(f"   Total size: {stats['total_size_mb']} MB")
+    print(f"   Total size: {stats['total_size_mb']} MB on disk in {stats['blobs']} blobs")
+    print(f"   Linked size: {stats['linked_size_mb']} MB without deduplication")
     print(f"   Ship database: {stats['unique_ships']} ships in {stats['ship_classes']} classes")
 
 
@@ -332,8 +443,15 @@ async def main():
         "--classes", type=str, help="Ship classes to download (frigates,cruisers,etc)"
     )
     parser.add_argument("--factions", type=str, help="Factions to download (minmatar,gallente,etc)")
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-check existing images with conditional requests",
+    )
     parser.add_argument("--link-to-project", type=Path, help="Link assets to a project")
     parser.add_argument("--copy-to-project", type=Path, help="Copy assets to a project")
+    parser.add_argument("--hardlink-to-project", type=Path, help="Hard-link assets into a project")
+    parser.add_argument("--prune", action="store_true", help="Delete unreferenced blobs")
     parser.add_argument("--stats", action="store_true", help="Show asset statistics")
     parser.add_argument(
         "--generate-mapping", action="store_true", help="Generate type ID mapping JSON"
@@ -357,7 +475,7 @@ async def main():
     if args.sync_all:
         sizes = [64, 256, 512]
         print(f"🔄 Syncing all ships in sizes: {sizes}")
-        results = await manager.download_all_ships(sizes=sizes)
+        results = await manager.download_all_ships(sizes=sizes, revalidate=args.revalidate)
         success = sum(1 for r in results if r.success)
         print(f"\n✅ Downloaded {success}/{len(results)} images")
         print_stats(manager)
@@ -367,7 +485,9 @@ async def main():
         classes = args.classes.split(",") if args.classes else None
         factions = args.factions.split(",") if args.factions else None
 
-        results = await manager.download_all_ships(sizes=sizes, classes=classes, factions=factions)
+        results = await manager.download_all_ships(
+            sizes=sizes, classes=classes, factions=factions, revalidate=args.revalidate
+        )
         success = sum(1 for r in results if r.success)
         print(f"\n✅ Downloaded {success}/{len(results)} images")
 
@@ -377,6 +497,12 @@ async def main():
     if args.copy_to_project:
         manager.link_to_project(args.copy_to_project, "copy")
 
+    if args.hardlink_to_project:
+        manager.link_to_project(args.hardlink_to_project, "hardlink")
+
+    if args.prune:
+        print(f"🧹 Removed {manager.prune()} unreferenced blobs")
+
 
 if __name__ == "__main__":
     asyncio.run(main())
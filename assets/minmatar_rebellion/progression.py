@@ -1,8 +1,9 @@
 """Skill Point persistence system for Minmatar Rebellion"""
 
-import json
 import os
 
+from core.persistence import get_persistence
+
 SAVE_FILE = os.path.join(os.path.expanduser("~"), ".minmatar_rebellion_save.json")
 
 
@@ -17,24 +18,23 @@ def load_progress():
         "highest_stage": 0,
     }
 
-    if not os.path.exists(SAVE_FILE):
-        return default_data
-
     try:
-        with open(SAVE_FILE, "r") as f:
-            data = json.load(f)
-            # Merge with defaults in case of missing keys
-            for key in default_data:
-                if key not in data:
-                    data[key] = default_data[key]
-            return data
+        # Includes progress queued by save_progress but not yet on disk
+        data = get_persistence().read_json(SAVE_FILE)
+        # Merge with defaults in case of missing keys
+        for key in default_data:
+            if key not in data:
+                data[key] = default_data[key]
+        return data
+    except FileNotFoundError:
+        return default_data
     except Exception as e:
         print(f"Error loading save: {e}")
         return default_data
 
 
 def save_progress(sp, unlocked_ships, wolf_unlocked, jaguar_unlocked, total_kills, highest_stage):
-    """Save player progress"""
+    """Save player progress (written in the background)"""
     data = {
         "total_sp": sp,
         "unlocked_ships": unlocked_ships,
@@ -44,13 +44,8 @@ def save_progress(sp, unlocked_ships, wolf_unlocked, jaguar_unlocked, total_kill
         "highest_stage": highest_stage,
     }
 
-    try:
-        with open(SAVE_FILE, "w") as f:
-            json.dump(data, f, indent=2)
-        return True
-    except Exception as e:
-        print(f"Error saving progress: {e}")
-        return False
+    get_persistence().write_json(SAVE_FILE, data, indent=2)
+    return True
 
 
 def add_sp(amount):
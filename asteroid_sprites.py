@@ -0,0 +1,262 @@
+"""
+Shared asteroid sprite library for EVE Rebellion
+
+Every asteroid in the game - the scrolling field in SpaceBackground, the
+hazard asteroids in environmental_hazards and the Stage 1 parallax belt -
+draws from the same small set of procedurally generated shapes:
+
+- Each size class (small/medium/large) has a fixed number of shapes,
+  generated from a seeded RNG so they are identical on every run
+- Shapes are stored normalized to radius 1 and rendered (with lighting,
+  craters and composition details) once per radius/palette
+- Rotation is quantized to ROTATION_FRAMES steps; each frame is rendered
+  on first use and kept in the shared asset cache
+
+Frames have the same size as the unrotated sprite, so a sprite's rect does
+not change as it spins.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import pygame
+
+from core.asset_cache import AssetCache, get_asset_cache
+
+# Compositions
+ROCK = "rock"
+METALLIC = "metallic"
+ICE = "ice"
+
+# (name, largest radius, outline vertex range)
+SIZE_CLASSES = (
+    ("small", 25, (7, 10)),
+    ("medium", 45, (8, 12)),
+    ("large", 1 << 16, (10, 14)),
+)
+
+SHAPES_PER_CLASS = 6
+ROTATION_FRAMES = 36  # 10 degree steps
+RADIUS_STEP = 3  # Radii are rounded to this many pixels
+PADDING = 2  # Transparent border around the shape
+
+ORE_COLORS = [
+    (180, 150, 80),  # Gold
+    (120, 180, 200),  # Platinum
+    (160, 100, 60),  # Copper
+]
+
+
+@dataclass(frozen=True)
+class AsteroidShape:
+    """Asteroid geometry, normalized to radius 1."""
+
+    outline: Tuple[Tuple[float, float], ...]  # (angle, radius)
+    bumps: Tuple[Tuple[float, float, float, bool], ...]  # (angle, dist, radius, lighter)
+    craters: Tuple[Tuple[float, float, float], ...]  # (angle, dist, radius)
+    veins: Tuple[Tuple[float, float, float, int], ...]  # (angle, span, dist, ore)
+    crystals: Tuple[Tuple[float, float, float], ...]  # (angle, dist, radius)
+
+
+def size_class_for(radius: float) -> str:
+    """Get the size class name for a radius."""
+    for name, max_radius, _ in SIZE_CLASSES:
+        if radius <= max_radius:
+            return name
+    return SIZE_CLASSES[-1][0]
+
+
+def quantize_radius(radius: float) -> int:
+    """Round a radius to the library's radius step."""
+    return max(RADIUS_STEP, int(round(radius / RADIUS_STEP)) * RADIUS_STEP)
+
+
+def frame_index(angle: float, frames: int = ROTATION_FRAMES) -> int:
+    """Get the rotation frame nearest to an angle in degrees."""
+    return int(round((angle % 360) * frames / 360)) % frames
+
+
+def generate_shape(size_class: str, index: int) -> AsteroidShape:
+    """Generate one library shape. The same arguments always give the same shape."""
+    vertex_range = next(v for name, _, v in SIZE_CLASSES if name == size_class)
+    rng = random.Random(f"asteroid:{size_class}:{index}")
+    tau = math.pi * 2
+
+    num_points = rng.randint(*vertex_range)
+    outline = tuple(
+        ((i / num_points) * tau + rng.uniform(-0.15, 0.15), rng.uniform(0.6, 1.0))
+        for i in range(num_points)
+    )
+    bumps = tuple(
+        (rng.uniform(0, tau), rng.uniform(0.2, 0.6), rng.uniform(0.1, 0.2), rng.random() > 0.5)
+        for _ in range(rng.randint(3, 8))
+    )
+    craters = tuple(
+        (rng.uniform(0, tau), rng.uniform(0, 0.45), rng.uniform(0.12, 0.25))
+        for _ in range(rng.randint(1, 4))
+    )
+    veins = tuple(
+        (rng.uniform(0, tau), rng.uniform(0.5, 1.5), rng.uniform(0.3, 0.55), rng.randrange(3))
+        for _ in range(rng.randint(1, 3))
+    )
+    crystals = tuple(
+        (rng.uniform(0, tau), rng.uniform(0.2, 0.55), rng.uniform(0.06, 0.16))
+        for _ in range(rng.randint(2, 5))
+    )
+    return AsteroidShape(outline, bumps, craters, veins, crystals)
+
+
+def _shade(color, amount, alpha):
+    """Lighten (positive) or darken (negative) an RGB color, adding alpha."""
+    return (
+        max(0, min(255, color[0] + amount)),
+        max(0, min(255, color[1] + amount)),
+        max(0, min(255, color[2] + amount)),
+        max(0, min(255, alpha)),
+    )
+
+
+def render_asteroid(
+    shape: AsteroidShape,
+    radius: int,
+    color: Tuple[int, int, int],
+    alpha: int = 255,
+    composition: str = ROCK,
+) -> pygame.Surface:
+    """Render a shape at a radius with top-left lighting baked in.
+
+    Alpha is baked into every pixel, so the sprite never needs set_alpha().
+    """
+    side = radius * 2 + PADDING * 2
+    surf = pygame.Surface((side, side), pygame.SRCALPHA)
+    cx = cy = radius + PADDING
+
+    def polar(angle, dist):
+        return (
+            int(cx + dist * radius * math.cos(angle)),
+            int(cy + dist * radius * math.sin(angle)),
+        )
+
+    points = [polar(angle, r) for angle, r in shape.outline]
+    pygame.draw.polygon(surf, (*color, alpha), points)
+
+    # Rocky texture bumps
+    for angle, dist, r, lighter in shape.bumps:
+        bump_color = _shade(color, 12 if lighter else -15, alpha)
+        pygame.draw.circle(surf, bump_color, polar(angle, dist), max(2, int(r * radius)))
+
+    # Craters with a lit rim on the upper-left
+    for angle, dist, r in shape.craters:
+        crater_r = max(2, int(r * radius))
+        x, y = polar(angle, dist)
+        pygame.draw.circle(surf, _shade(color, -30, alpha), (x, y), crater_r)
+        pygame.draw.arc(
+            surf,
+            _shade(color, 20, alpha + 10),
+            (x - crater_r, y - crater_r, crater_r * 2, crater_r * 2),
+            math.pi * 0.75,
+            math.pi * 1.75,
+            1,
+        )
+
+    if composition == METALLIC and radius > 20:
+        for angle, span, dist, ore in shape.veins:
+            vein = [polar(angle + span * t / 5, dist) for t in range(6)]
+            pygame.draw.lines(surf, (*ORE_COLORS[ore], min(255, alpha + 30)), False, vein, 2)
+
+    if composition == ICE and radius > 15:
+        for angle, dist, r in shape.crystals:
+            crystal_r = max(2, int(r * radius))
+            pygame.draw.circle(
+                surf, (200, 230, 255, min(255, alpha + 40)), polar(angle, dist), crystal_r
+            )
+
+    # Lit upper edges, shadowed lower edges
+    highlight = _shade(color, 35, alpha + 25)
+    shadow = _shade(color, -25, alpha)
+    for i, p1 in enumerate(points):
+        p2 = points[(i + 1) % len(points)]
+        mid_angle = math.atan2((p1[1] + p2[1]) / 2 - cy, (p1[0] + p2[0]) / 2 - cx)
+        pygame.draw.line(surf, highlight if -math.pi < mid_angle < 0 else shadow, p1, p2, 2)
+
+    return surf
+
+
+class AsteroidLibrary:
+    """Pre-generated asteroid shapes with cached sprites and rotation frames."""
+
+    def __init__(
+        self,
+        shapes_per_class: int = SHAPES_PER_CLASS,
+        rotation_frames: int = ROTATION_FRAMES,
+        cache: Optional[AssetCache] = None,
+    ):
+        self.shapes_per_class = shapes_per_class
+        self.rotation_frames = rotation_frames
+        self.cache = cache if cache is not None else get_asset_cache()
+        self.shapes = {
+            (name, i): generate_shape(name, i)
+            for name, _, _ in SIZE_CLASSES
+            for i in range(shapes_per_class)
+        }
+
+    def pick_shape(self, rng=random) -> int:
+        """Pick a random shape index."""
+        return rng.randrange(self.shapes_per_class)
+
+    def sprite(self, radius, shape, color, alpha=255, composition=ROCK) -> pygame.Surface:
+        """Get the unrotated sprite for a shape, radius and palette.
+
+        Args:
+            radius: Asteroid radius in pixels (rounded to RADIUS_STEP).
+            shape: Shape index from pick_shape().
+            color: Base RGB color.
+            alpha: Alpha baked into the sprite.
+            composition: ROCK, METALLIC or ICE.
+        """
+        radius = quantize_radius(radius)
+        size_class = size_class_for(radius)
+        key = (size_class, shape % self.shapes_per_class, radius, tuple(color), alpha, composition)
+        return self.cache.get(
+            "asteroids",
+            key,
+            lambda: render_asteroid(self.shapes[key[:2]], radius, key[3], alpha, composition),
+        )
+
+    def frame(self, radius, shape, angle, color, alpha=255, composition=ROCK) -> pygame.Surface:
+        """Get the sprite rotated to the nearest frame of angle (degrees, counter-clockwise)."""
+        index = frame_index(angle, self.rotation_frames)
+        base = self.sprite(radius, shape, color, alpha, composition)
+        if index == 0:
+            return base
+
+        def rotate():
+            rotated = pygame.transform.rotozoom(base, index * 360 / self.rotation_frames, 1.0)
+            # The shape fits inside its radius, so cropping back to the base
+            # size loses nothing and keeps every frame the same size
+            area = base.get_rect(center=rotated.get_rect().center)
+            return rotated.subsurface(area.clip(rotated.get_rect())).copy()
+
+        key = (
+            quantize_radius(radius),
+            shape % self.shapes_per_class,
+            tuple(color),
+            alpha,
+            composition,
+            index,
+        )
+        return self.cache.get("asteroid_frames", key, rotate)
+
+
+# Process-wide library, created on first use
+_asteroid_library: Optional[AsteroidLibrary] = None
+
+
+def get_asteroid_library() -> AsteroidLibrary:
+    """Get the shared asteroid library."""
+    global _asteroid_library
+    if _asteroid_library is None:
+        _asteroid_library = AsteroidLibrary()
+    return _asteroid_library
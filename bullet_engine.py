@@ -0,0 +1,231 @@
+"""
+Array-backed enemy bullet engine for EVE Rebellion
+
+Enemy fire used to be one EnemyBullet sprite per shot, each with its own
+rect, group membership and update() call. The engine instead keeps every
+live enemy projectile as a column in one float array (position, velocity,
+acceleration, angular velocity, lifetime, radius, damage, stamp id) and
+handles a frame in a few vectorized passes:
+
+- integrate: rotate velocity by the angular velocity, add acceleration,
+  move, and count down lifetime
+- cull: drop bullets that left the screen or expired, compacting the
+  array so live bullets stay contiguous
+- collide: circle-vs-circle test against the player's hitbox
+- draw: one Surface.blits call of shared stamp surfaces
+
+Usage:
+
+    bullets = EnemyBulletEngine()
+    bullets.add_stamp("laser", laser_surface)
+
+    bullets.spawn(x, y, vx, vy, damage=10)     # scalars or arrays
+    bullets.update()                           # once per frame
+    for x, y, damage in bullets.collide(cx, cy, radius):
+        ...
+    bullets.draw(screen)
+"""
+
+import math
+from itertools import repeat
+from typing import Any, List, Tuple
+
+import numpy as np
+
+from constants import ENEMY_BULLET_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Row of each per-bullet field in EnemyBulletEngine.data
+FIELDS = ("x", "y", "vx", "vy", "ax", "ay", "spin", "life", "radius", "damage", "stamp")
+X, Y, VX, VY, AX, AY, SPIN, LIFE, RADIUS, DAMAGE, STAMP = range(len(FIELDS))
+
+
+class EnemyBulletEngine:
+    """All live enemy projectiles, stored column-wise."""
+
+    def __init__(
+        self,
+        screen_width: int = SCREEN_WIDTH,
+        screen_height: int = SCREEN_HEIGHT,
+        margin: int = 16,
+        capacity: int = 256,
+    ):
+        """
+        Args:
+            screen_width: Playfield width in pixels
+            screen_height: Playfield height in pixels
+            margin: How far past the screen edge a bullet may travel
+                before it is culled
+            capacity: Initial number of bullet slots (grows as needed)
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.margin = margin
+        self.data = np.zeros((len(FIELDS), capacity))
+        self.count = 0
+        # Stamp surfaces and their half sizes, indexed by stamp id
+        self.stamps: List[Any] = []
+        self.stamp_names: List[str] = []
+        self._stamp_offsets = np.zeros((2, 0))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add_stamp(self, name: str, surface: Any) -> int:
+        """Register a shared bullet image and return its stamp id."""
+        if name in self.stamp_names:
+            index = self.stamp_names.index(name)
+            self.stamps[index] = surface
+        else:
+            index = len(self.stamps)
+            self.stamps.append(surface)
+            self.stamp_names.append(name)
+        width, height = surface.get_size()
+        offsets = np.zeros((2, len(self.stamps)))
+        offsets[:, : self._stamp_offsets.shape[1]] = self._stamp_offsets
+        offsets[:, index] = (width // 2, height // 2)
+        self._stamp_offsets = offsets
+        return index
+
+    def stamp_id(self, name: str) -> int:
+        """Look up a registered stamp id by name."""
+        return self.stamp_names.index(name)
+
+    def spawn(
+        self,
+        x,
+        y,
+        vx,
+        vy,
+        damage=10,
+        ax=0.0,
+        ay=0.0,
+        spin=0.0,
+        life=math.inf,
+        radius=ENEMY_BULLET_RADIUS,
+        stamp=0,
+    ) -> int:
+        """Add one bullet, or many when any argument is an array.
+
+        Arguments broadcast against each other, so a ring of bullets can be
+        spawned from one position with arrays of velocities.
+
+        Args:
+            x, y: Center position
+            vx, vy: Velocity in pixels per frame
+            damage: Damage dealt on hit
+            ax, ay: Acceleration in pixels per frame squared
+            spin: Angular velocity of the heading in radians per frame
+            life: Frames until the bullet expires
+            radius: Collision radius
+            stamp: Stamp id used to draw the bullet
+
+        Returns:
+            Number of bullets added
+        """
+        # Same order as FIELDS
+        values = (x, y, vx, vy, ax, ay, spin, life, radius, damage, stamp)
+        columns = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+        added = columns[0].size
+        if added == 0:
+            return 0
+        start = self.count
+        self._reserve(start + added)
+        rows = self.data[:, start : start + added]
+        for field, column in enumerate(columns):
+            rows[field] = column.ravel()
+        self.count += added
+        return added
+
+    def _reserve(self, size: int):
+        capacity = self.data.shape[1]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        grown = np.zeros((len(FIELDS), capacity))
+        grown[:, : self.count] = self.data[:, : self.count]
+        self.data = grown
+
+    def _keep(self, keep):
+        """Compact the live bullets down to the ones marked in ``keep``."""
+        kept = int(np.count_nonzero(keep))
+        if kept != self.count:
+            self.data[:, :kept] = self.data[:, : self.count][:, keep]
+            self.count = kept
+
+    def clear(self):
+        """Remove every bullet."""
+        self.count = 0
+
+    def update(self):
+        """Advance every bullet one frame and cull dead ones."""
+        n = self.count
+        if n == 0:
+            return
+        d = self.data[:, :n]
+
+        # Curving shots: rotate the velocity by the angular velocity
+        spin = d[SPIN]
+        if spin.any():
+            cos, sin = np.cos(spin), np.sin(spin)
+            vx = d[VX] * cos - d[VY] * sin
+            d[VY] = d[VX] * sin + d[VY] * cos
+            d[VX] = vx
+
+        d[VX] += d[AX]
+        d[VY] += d[AY]
+        d[X] += d[VX]
+        d[Y] += d[VY]
+        d[LIFE] -= 1
+
+        margin = self.margin
+        keep = (
+            (d[LIFE] > 0)
+            & (d[X] > -margin)
+            & (d[X] < self.screen_width + margin)
+            & (d[Y] > -margin)
+            & (d[Y] < self.screen_height + margin)
+        )
+        self._keep(keep)
+
+    def collide(self, x: float, y: float, radius: float) -> List[Tuple[float, float, float]]:
+        """Remove and return bullets touching a circular hitbox.
+
+        Returns:
+            (x, y, damage) of each bullet that hit
+        """
+        n = self.count
+        if n == 0:
+            return []
+        d = self.data[:, :n]
+        dx = d[X] - x
+        dy = d[Y] - y
+        reach = d[RADIUS] + radius
+        hit = dx * dx + dy * dy <= reach * reach
+        if not hit.any():
+            return []
+        hits = list(zip(d[X, hit].tolist(), d[Y, hit].tolist(), d[DAMAGE, hit].tolist()))
+        self._keep(~hit)
+        return hits
+
+    def draw(self, surface) -> int:
+        """Blit every bullet's stamp centered on its position.
+
+        Returns:
+            Number of bullets drawn
+        """
+        n = self.count
+        if n == 0 or not self.stamps:
+            return 0
+        d = self.data[:, :n]
+        stamp = d[STAMP].astype(np.intp)
+        left = (d[X] - self._stamp_offsets[0, stamp]).astype(int).tolist()
+        top = (d[Y] - self._stamp_offsets[1, stamp]).astype(int).tolist()
+        # Iterators built in C, so no per-bullet Python work before blitting
+        positions = zip(left, top)
+        if len(self.stamps) == 1:
+            images = repeat(self.stamps[0])
+        else:
+            images = map(self.stamps.__getitem__, stamp.tolist())
+        surface.blits(zip(images, positions), doreturn=False)
+        return n
@@ -0,0 +1,349 @@
+"""
+Declarative bullet patterns for boss attacks
+
+Boss attack patterns are written in JSON (data/patterns/<enemy_type>.json)
+and compiled ahead of time into flat emitter timelines: for every frame of
+a phase's loop, a contiguous block of rows describing the bullets to spawn
+that frame. At runtime a boss walks its timeline and hands the current
+frame's rows to the EnemyBulletEngine in one spawn() call, so a dense
+phase costs a table slice per frame instead of per-emitter Python logic.
+
+Pattern file format:
+
+    {
+        "phases": [
+            {
+                "health": 1.0,          # active at or below this health fraction
+                "loop": 240,            # frames before the timeline repeats
+                "emitters": [
+                    {"type": "ring", "at": 0, "count": 24, "speed": 3},
+                    {"type": "fan", "at": 60, "count": 5, "spread": 40,
+                     "aim": true, "repeat": 3, "every": 8},
+                    {"type": "spiral", "at": 120, "count": 3, "rotate": 12,
+                     "repeat": 20, "every": 4},
+                    {"type": "wave", "at": 0, "count": 3, "spread": 20,
+                     "amplitude": 45, "period": 16, "repeat": 32, "every": 5}
+                ]
+            }
+        ]
+    }
+
+Emitter types (angles in degrees, 0 = straight down, positive = toward +x):
+
+- ring: ``count`` bullets evenly around a full circle
+- fan: ``count`` bullets spread over ``spread`` degrees
+- spiral: a ring that turns ``rotate`` degrees on each repeat
+- wave: a fan whose center sweeps ``amplitude`` degrees back and forth
+  over ``period`` repeats
+
+Common emitter keys: at, repeat, every, angle, rotate, speed, accel (along
+the heading), spin (degrees per frame), damage, life (frames), aim (relative
+to the direction of the player), offset ([x, y] from the boss center) and
+stamp (bullet engine stamp name).
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Columns of a compiled timeline row
+ROW_FIELDS = ("ox", "oy", "vx", "vy", "ax", "ay", "spin", "damage", "life", "aim", "stamp")
+OX, OY, VX, VY, AX, AY, SPIN, DAMAGE, LIFE, AIM, STAMP = range(len(ROW_FIELDS))
+
+EMITTER_TYPES = ("ring", "fan", "spiral", "wave")
+
+# Emitter keys and their defaults
+EMITTER_DEFAULTS: Dict[str, Any] = {
+    "type": None,
+    "at": 0,
+    "repeat": 1,
+    "every": 1,
+    "count": 1,
+    "angle": 0.0,
+    "spread": 0.0,
+    "rotate": 0.0,
+    "amplitude": 0.0,
+    "period": 1,
+    "speed": 3.0,
+    "accel": 0.0,
+    "spin": 0.0,
+    "damage": 15,
+    "life": math.inf,
+    "aim": False,
+    "offset": [0, 0],
+    "stamp": "laser",
+}
+
+DEFAULT_LOOP = 240
+
+
+class PatternError(ValueError):
+    """A bullet pattern file is malformed."""
+
+
+@dataclass
+class PhaseTimeline:
+    """One boss phase compiled to a flat, frame-indexed table."""
+
+    health: float
+    loop: int
+    rows: np.ndarray  # (bullets, len(ROW_FIELDS)), sorted by frame
+    starts: np.ndarray  # rows[starts[f]:starts[f + 1]] spawn on frame f
+
+
+@dataclass
+class CompiledPattern:
+    """All phases of a boss pattern, highest health threshold first."""
+
+    name: str
+    phases: List[PhaseTimeline]
+    stamps: List[str]
+
+    def phase_for(self, health: float) -> int:
+        """Index of the phase active at a health fraction."""
+        index = 0
+        for i, phase in enumerate(self.phases):
+            if health <= phase.health:
+                index = i
+        return index
+
+
+def _emitter_headings(emitter: Dict[str, Any], repeat: int) -> np.ndarray:
+    """Headings (degrees) of the bullets fired by one repeat of an emitter."""
+    kind = emitter["type"]
+    count = emitter["count"]
+    base = emitter["angle"] + repeat * emitter["rotate"]
+    if kind in ("ring", "spiral"):
+        return base + np.arange(count) * (360.0 / count)
+    if kind == "wave":
+        base += emitter["amplitude"] * math.sin(2 * math.pi * repeat / emitter["period"])
+    if count == 1:
+        return np.array([base], dtype=float)
+    half = emitter["spread"] / 2
+    return base + np.linspace(-half, half, count)
+
+
+def _validate_emitter(raw: Any, where: str) -> Dict[str, Any]:
+    if not isinstance(raw, dict):
+        raise PatternError(f"{where}: emitter must be an object")
+    unknown = set(raw) - set(EMITTER_DEFAULTS)
+    if unknown:
+        raise PatternError(f"{where}: unknown keys {sorted(unknown)}")
+    emitter = {**EMITTER_DEFAULTS, **raw}
+    if emitter["type"] not in EMITTER_TYPES:
+        raise PatternError(f"{where}: type must be one of {', '.join(EMITTER_TYPES)}")
+    for key in ("at", "repeat", "every", "count", "period"):
+        if not isinstance(emitter[key], int) or isinstance(emitter[key], bool):
+            raise PatternError(f"{where}: {key} must be an integer")
+    if emitter["count"] < 1 or emitter["repeat"] < 1 or emitter["every"] < 1:
+        raise PatternError(f"{where}: count, repeat and every must be at least 1")
+    if emitter["period"] < 1 or emitter["at"] < 0:
+        raise PatternError(f"{where}: period must be at least 1 and at not negative")
+    for key in ("angle", "spread", "rotate", "amplitude", "speed", "accel", "spin", "damage"):
+        value = emitter[key]
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise PatternError(f"{where}: {key} must be a number")
+    if emitter["life"] != math.inf and (
+        not isinstance(emitter["life"], (int, float)) or emitter["life"] <= 0
+    ):
+        raise PatternError(f"{where}: life must be a positive number of frames")
+    offset = emitter["offset"]
+    if not (isinstance(offset, list) and len(offset) == 2):
+        raise PatternError(f"{where}: offset must be [x, y]")
+    if not isinstance(emitter["aim"], bool):
+        raise PatternError(f"{where}: aim must be true or false")
+    if not isinstance(emitter["stamp"], str):
+        raise PatternError(f"{where}: stamp must be a string")
+    return emitter
+
+
+def compile_phase(raw: Any, where: str, stamps: List[str]) -> PhaseTimeline:
+    """Expand one phase's emitters into a frame-sorted timeline."""
+    if not isinstance(raw, dict):
+        raise PatternError(f"{where}: phase must be an object")
+    loop = raw.get("loop", DEFAULT_LOOP)
+    health = raw.get("health", 1.0)
+    if not isinstance(loop, int) or loop < 1:
+        raise PatternError(f"{where}: loop must be a positive integer")
+    if not isinstance(health, (int, float)) or not 0 < health <= 1:
+        raise PatternError(f"{where}: health must be in (0, 1]")
+    emitters = raw.get("emitters")
+    if not isinstance(emitters, list) or not emitters:
+        raise PatternError(f"{where}: emitters must be a non-empty list")
+
+    frames: List[int] = []
+    rows: List[Tuple[float, ...]] = []
+    for i, raw_emitter in enumerate(emitters):
+        emitter = _validate_emitter(raw_emitter, f"{where}.emitters[{i}]")
+        if emitter["stamp"] not in stamps:
+            stamps.append(emitter["stamp"])
+        stamp = stamps.index(emitter["stamp"])
+        ox, oy = emitter["offset"]
+        spin = math.radians(emitter["spin"])
+        for repeat in range(emitter["repeat"]):
+            frame = emitter["at"] + repeat * emitter["every"]
+            if frame >= loop:
+                raise PatternError(
+                    f"{where}.emitters[{i}]: fires on frame {frame}, past the {loop}-frame loop"
+                )
+            for heading in np.radians(_emitter_headings(emitter, repeat)):
+                dx, dy = math.sin(heading), math.cos(heading)
+                frames.append(frame)
+                rows.append(
+                    (
+                        ox,
+                        oy,
+                        dx * emitter["speed"],
+                        dy * emitter["speed"],
+                        dx * emitter["accel"],
+                        dy * emitter["accel"],
+                        spin,
+                        emitter["damage"],
+                        emitter["life"],
+                        float(emitter["aim"]),
+                        stamp,
+                    )
+                )
+
+    order = np.argsort(np.asarray(frames), kind="stable")
+    sorted_frames = np.asarray(frames)[order]
+    table = np.asarray(rows, dtype=float)[order]
+    starts = np.searchsorted(sorted_frames, np.arange(loop + 1))
+    return PhaseTimeline(float(health), loop, table, starts)
+
+
+def compile_pattern(name: str, raw: Any) -> CompiledPattern:
+    """Compile a parsed pattern file.
+
+    Raises:
+        PatternError: If the pattern is malformed.
+    """
+    if not isinstance(raw, dict) or not isinstance(raw.get("phases"), list) or not raw["phases"]:
+        raise PatternError(f"{name}: expected an object with a non-empty phases list")
+    stamps: List[str] = []
+    phases = [
+        compile_phase(phase, f"{name}.phases[{i}]", stamps) for i, phase in enumerate(raw["phases"])
+    ]
+    phases.sort(key=lambda phase: -phase.health)
+    return CompiledPattern(name, phases, stamps)
+
+
+class BulletPatternRunner:
+    """Walks a compiled pattern's timeline for one boss."""
+
+    def __init__(self, pattern: CompiledPattern):
+        self.pattern = pattern
+        self.phase = 0
+        self.frame = 0
+        self._stamp_ids: Optional[np.ndarray] = None
+        self._engine: Any = None
+
+    def update(self, x: float, y: float, health: float, target: Any, engine: Any) -> int:
+        """Spawn this frame's bullets into an EnemyBulletEngine.
+
+        Args:
+            x, y: Boss center
+            health: Boss health fraction, selects the phase
+            target: (x, y) aimed emitters fire toward
+            engine: EnemyBulletEngine receiving the bullets
+
+        Returns:
+            Number of bullets spawned
+        """
+        phase_index = self.pattern.phase_for(health)
+        if phase_index != self.phase:
+            self.phase = phase_index
+            self.frame = 0
+        phase = self.pattern.phases[phase_index]
+        frame = self.frame
+        self.frame = (frame + 1) % phase.loop
+
+        start, end = phase.starts[frame], phase.starts[frame + 1]
+        if start == end:
+            return 0
+        rows = phase.rows[start:end]
+
+        vx, vy, ax, ay = rows[:, VX], rows[:, VY], rows[:, AX], rows[:, AY]
+        aimed = rows[:, AIM] != 0
+        if aimed.any():
+            # Rotate headings so 0 degrees points at the target
+            theta = math.atan2(target[0] - x, target[1] - y)
+            cos, sin = math.cos(theta), math.sin(theta)
+            vx, vy = (
+                np.where(aimed, vx * cos + vy * sin, vx),
+                np.where(aimed, vy * cos - vx * sin, vy),
+            )
+            ax, ay = (
+                np.where(aimed, ax * cos + ay * sin, ax),
+                np.where(aimed, ay * cos - ax * sin, ay),
+            )
+
+        return engine.spawn(
+            x + rows[:, OX],
+            y + rows[:, OY],
+            vx,
+            vy,
+            rows[:, DAMAGE],
+            ax,
+            ay,
+            rows[:, SPIN],
+            rows[:, LIFE],
+            stamp=self._stamps_for(engine)[rows[:, STAMP].astype(np.intp)],
+        )
+
+    def _stamps_for(self, engine) -> np.ndarray:
+        """Map the pattern's stamp names to the engine's stamp ids."""
+        if self._engine is not engine or self._stamp_ids is None:
+            ids = []
+            for name in self.pattern.stamps:
+                try:
+                    ids.append(engine.stamp_id(name))
+                except ValueError:
+                    ids.append(0)
+            self._stamp_ids = np.asarray(ids, dtype=float)
+            self._engine = engine
+        return self._stamp_ids
+
+
+_patterns: Optional[Dict[str, CompiledPattern]] = None
+
+
+def _reload_pattern(category: str, name: str, raw: Any):
+    """DataStore callback: recompile a pattern file that changed on disk."""
+    if _patterns is None:
+        return
+    if raw is None:
+        _patterns.pop(name, None)
+        return
+    try:
+        _patterns[name] = compile_pattern(name, raw)
+    except PatternError as e:
+        print(f"Warning: Keeping previous bullet pattern, {e}")
+
+
+def get_bullet_patterns() -> Dict[str, CompiledPattern]:
+    """Compiled patterns from data/patterns, by enemy type (compiled once).
+
+    Edited pattern files are recompiled when the data store reloads them;
+    bosses spawned afterwards use the new version.
+    """
+    global _patterns
+    if _patterns is None:
+        from core.loader import get_data_store, load_patterns
+
+        _patterns = {}
+        for name, raw in load_patterns().items():
+            try:
+                _patterns[name] = compile_pattern(name, raw)
+            except PatternError as e:
+                print(f"Warning: Skipping bullet pattern {e}")
+        get_data_store().subscribe(_reload_pattern, "patterns")
+    return _patterns
+
+
+def create_pattern_runner(enemy_type: str) -> Optional[BulletPatternRunner]:
+    """Runner for an enemy type's pattern, or None if it has none."""
+    pattern = get_bullet_patterns().get(enemy_type)
+    return BulletPatternRunner(pattern) if pattern else None
@@ -247,6 +247,8 @@ BULLET_SPEED = 12
 BULLET_DAMAGE = 10
 ROCKET_SPEED = 8
 ROCKET_DAMAGE = 50
+ENEMY_BULLET_RADIUS = 3  # Collision radius of an enemy laser
+PLAYER_HITBOX_RADIUS = 18  # Enemy fire hits within this distance of the ship's center
 
 # Enemy stats
 ENEMY_STATS = {
@@ -1142,11 +1144,12 @@ def load_expansion_stages():
     Load expansion stages from data/stages/ directory and add them to STAGES.
 
     This function is called at module initialization to integrate expansion
-    content. It skips example_stage.json and any stages already in the base
-    STAGES list.
+    content. It skips example_stage.json, stages that fail schema validation
+    and any stages already in the base STAGES list.
     """
     try:
         from core.loader import load_stages
+        from core.stage_compiler import StageSchemaError, validate_stage
 
         # Load all stage JSON files
         json_stages = load_stages()
@@ -1166,10 +1169,18 @@ def load_expansion_stages():
             if stage_data.get("name") in existing_names:
                 continue
 
+            try:
+                validate_stage(stage_id, stage_data, ENEMY_STATS)
+            except StageSchemaError as e:
+                print(f"Warning: Skipping invalid stage {e}")
+                continue
+
             # Convert JSON format to STAGES format
             converted_stage = _convert_json_stage_to_stage_format(stage_data)
 
             if converted_stage:
+                # Lets the stage compiler build waves from the JSON file
+                converted_stage["source"] = stage_id
                 STAGES.append(converted_stage)
 
     except ImportError:
@@ -0,0 +1,331 @@
+"""Unified LRU cache for loaded and generated surfaces.
+
+Replaces the ad-hoc per-module dicts (carrier images, background ship
+silhouettes, ship renders, sprite sheets) with one process-wide cache that:
+
+    - accounts for the pixel memory of every cached surface
+    - enforces a global byte budget plus optional per-category quotas
+    - evicts least-recently-used entries first, skipping pinned ones
+    - exposes hit/miss/eviction stats for the debug overlay
+
+Typical use:
+
+    cache = get_asset_cache()
+    image = cache.get("carriers", key, loader=lambda: load_image(path))
+
+Modules that index a dict directly can use cache.view(category) instead,
+which behaves like a dict backed by the cache.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+MB = 1024 * 1024
+
+DEFAULT_BUDGET = 256 * MB
+
+# Per-category byte quotas; categories not listed are bounded only by the budget
+DEFAULT_QUOTAS = {
+    "carriers": 16 * MB,
+    "background_ships": 4 * MB,
+    "ship_renders": 64 * MB,
+    "sprite_sheets": 96 * MB,
+    "thrust_frames": 64 * MB,
+    "asteroids": 8 * MB,
+    "asteroid_frames": 32 * MB,
+}
+
+
+def surface_bytes(value: Any) -> int:
+    """Pixel memory owned by a surface, or by a list/tuple/dict of surfaces.
+
+    Subsurfaces share their parent's pixels and count as zero. Objects that
+    are not surfaces also count as zero.
+    """
+    if isinstance(value, (list, tuple)):
+        return sum(surface_bytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(surface_bytes(v) for v in value.values())
+    get_pitch = getattr(value, "get_pitch", None)
+    if get_pitch is None:
+        return 0
+    if value.get_parent() is not None:
+        return 0
+    return get_pitch() * value.get_height()
+
+
+class _Entry:
+    __slots__ = ("value", "size", "pins")
+
+    def __init__(self, value, size):
+        self.value = value
+        self.size = size
+        self.pins = 0
+
+
+class _CategoryStats:
+    __slots__ = ("entries", "bytes", "hits", "misses", "evictions")
+
+    def __init__(self):
+        self.entries = 0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class AssetCache:
+    """Byte-budgeted LRU cache shared by every asset-loading module."""
+
+    def __init__(self, budget: int = DEFAULT_BUDGET, quotas: Optional[Dict[str, int]] = None):
+        self.budget = budget
+        self.quotas = dict(DEFAULT_QUOTAS if quotas is None else quotas)
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._stats: Dict[str, _CategoryStats] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    def _category(self, category: str) -> _CategoryStats:
+        stats = self._stats.get(category)
+        if stats is None:
+            stats = self._stats[category] = _CategoryStats()
+        return stats
+
+    def get(self, category: str, key: Hashable, loader: Optional[Callable[[], Any]] = None):
+        """Look up an entry, loading and caching it on a miss.
+
+        Args:
+            category: Cache category (used for quotas and stats).
+            key: Key within the category.
+            loader: Optional callable producing the value on a miss. A loader
+                returning None is not cached.
+
+        Returns:
+            The cached value, or None on a miss without a loader.
+        """
+        with self._lock:
+            entry = self._entries.get((category, key))
+            stats = self._category(category)
+            if entry is not None:
+                self._entries.move_to_end((category, key))
+                stats.hits += 1
+                return entry.value
+            stats.misses += 1
+
+        if loader is None:
+            return None
+        value = loader()
+        if value is not None:
+            self.put(category, key, value)
+        return value
+
+    def peek(self, category: str, key: Hashable) -> bool:
+        """Check for an entry without touching LRU order or stats."""
+        with self._lock:
+            return (category, key) in self._entries
+
+    def put(self, category: str, key: Hashable, value: Any, size: Optional[int] = None):
+        """Insert or replace an entry, evicting others to stay within limits.
+
+        Args:
+            size: Byte size override; defaults to surface_bytes(value).
+        """
+        if size is None:
+            size = surface_bytes(value)
+        with self._lock:
+            full_key = (category, key)
+            stats = self._category(category)
+            old = self._entries.pop(full_key, None)
+            pins = 0
+            if old is not None:
+                pins = old.pins
+                self._bytes -= old.size
+                stats.bytes -= old.size
+                stats.entries -= 1
+
+            entry = _Entry(value, size)
+            entry.pins = pins
+            self._entries[full_key] = entry
+            self._bytes += size
+            stats.bytes += size
+            stats.entries += 1
+
+            quota = self.quotas.get(category)
+            if quota is not None and stats.bytes > quota:
+                self._evict(lambda c: c == category, lambda: stats.bytes > quota, full_key)
+            if self._bytes > self.budget:
+                self._evict(lambda c: True, lambda: self._bytes > self.budget, full_key)
+
+    def _evict(self, matches, over_limit, keep):
+        """Drop least-recently-used unpinned entries while over_limit()."""
+        for full_key in list(self._entries):
+            if not over_limit():
+                break
+            if full_key == keep or not matches(full_key[0]):
+                continue
+            entry = self._entries[full_key]
+            if entry.pins:
+                continue
+            self._remove(full_key)
+            self._stats[full_key[0]].evictions += 1
+
+    def _remove(self, full_key):
+        entry = self._entries.pop(full_key)
+        stats = self._stats[full_key[0]]
+        self._bytes -= entry.size
+        stats.bytes -= entry.size
+        stats.entries -= 1
+
+    def discard(self, category: str, key: Hashable):
+        """Remove an entry if present."""
+        with self._lock:
+            if (category, key) in self._entries:
+                self._remove((category, key))
+
+    def clear(self, category: Optional[str] = None):
+        """Remove every unpinned entry, optionally only in one category."""
+        with self._lock:
+            for full_key in list(self._entries):
+                if category is not None and full_key[0] != category:
+                    continue
+                if not self._entries[full_key].pins:
+                    self._remove(full_key)
+
+    def pin(self, category: str, key: Hashable) -> bool:
+        """Protect an entry from eviction until unpin(). Pins nest.
+
+        Returns:
+            True if the entry exists and was pinned.
+        """
+        with self._lock:
+            entry = self._entries.get((category, key))
+            if entry is None:
+                return False
+            entry.pins += 1
+            return True
+
+    def unpin(self, category: str, key: Hashable):
+        """Release one pin on an entry."""
+        with self._lock:
+            entry = self._entries.get((category, key))
+            if entry is not None and entry.pins > 0:
+                entry.pins -= 1
+
+    @contextmanager
+    def pinned(self, category: str, key: Hashable):
+        """Context manager that pins an entry for the duration of a block."""
+        pinned = self.pin(category, key)
+        try:
+            yield
+        finally:
+            if pinned:
+                self.unpin(category, key)
+
+    def view(self, category: str, namespace: Hashable = None) -> "CacheView":
+        """Dict-like view of one category (optionally namespaced)."""
+        return CacheView(self, category, namespace)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache totals plus per-category entries, bytes and hit rate."""
+        with self._lock:
+            categories = {name: s.as_dict() for name, s in self._stats.items()}
+            hits = sum(s.hits for s in self._stats.values())
+            misses = sum(s.misses for s in self._stats.values())
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "budget": self.budget,
+                "hits": hits,
+                "misses": misses,
+                "evictions": sum(s.evictions for s in self._stats.values()),
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "categories": categories,
+            }
+
+
+class CacheView:
+    """Dict-like access to one AssetCache category.
+
+    Lets code written against a plain dict (key in d / d[key] / d[key] = v)
+    use the shared cache. A membership test that fails counts as a miss; the
+    following lookup counts as the hit.
+    """
+
+    def __init__(self, cache: AssetCache, category: str, namespace: Hashable = None):
+        self.cache = cache
+        self.category = category
+        self.namespace = namespace
+
+    def _key(self, key):
+        return key if self.namespace is None else (self.namespace, key)
+
+    def __contains__(self, key) -> bool:
+        if self.cache.peek(self.category, self._key(key)):
+            return True
+        with self.cache._lock:
+            self.cache._category(self.category).misses += 1
+        return False
+
+    def __getitem__(self, key):
+        if not self.cache.peek(self.category, self._key(key)):
+            raise KeyError(key)
+        return self.cache.get(self.category, self._key(key))
+
+    def get(self, key, default=None):
+        if not self.cache.peek(self.category, self._key(key)):
+            return default
+        return self.cache.get(self.category, self._key(key))
+
+    def __setitem__(self, key, value):
+        self.cache.put(self.category, self._key(key), value)
+
+    def __delitem__(self, key):
+        self.cache.discard(self.category, self._key(key))
+
+    def keys(self) -> Iterator:
+        with self.cache._lock:
+            found = [k for c, k in self.cache._entries if c == self.category]
+        for key in found:
+            if self.namespace is None:
+                yield key
+            elif isinstance(key, tuple) and len(key) == 2 and key[0] == self.namespace:
+                yield key[1]
+
+    def __iter__(self) -> Iterator:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.keys())
+
+    def pinned(self, key):
+        """Pin one entry of this view for the duration of a block."""
+        return self.cache.pinned(self.category, self._key(key))
+
+
+# Process-wide cache, created on first use
+_asset_cache: Optional[AssetCache] = None
+
+
+def get_asset_cache() -> AssetCache:
+    """Get the shared asset cache."""
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = AssetCache()
+    return _asset_cache
@@ -0,0 +1,280 @@
+"""Memory-mapped asset pack for pre-decoded sprites, renders and audio.
+
+The pack is produced at build time by scripts/build_asset_pack.py and holds
+raw RGBA pixel data and 16-bit PCM samples for every packed asset, plus a
+JSON index. At runtime the file is mapped read-only and surfaces are created
+with pygame.image.frombuffer directly over the mapping, so nothing is decoded
+or copied when an asset is requested.
+
+File layout (all integers little-endian):
+
+    magic      8 bytes   b"EVRPACK\\0"
+    version    uint32
+    index_len  uint32
+    data_off   uint64    offset of the data section from the start of file
+    index      index_len bytes of UTF-8 JSON
+    padding    up to DATA_ALIGN
+    data       blobs, each aligned to DATA_ALIGN
+
+Entry keys are POSIX paths relative to the application root
+(e.g. "assets/eve_renders/archon.png"). Pre-scaled variants append
+"@<width>x<height>" to the key, see entry_key().
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+PACK_MAGIC = b"EVRPACK\x00"
+PACK_VERSION = 1
+PACK_FILENAME = "assets.evpak"
+DATA_ALIGN = 16
+
+_HEADER = struct.Struct("<8sIIQ")
+
+KIND_IMAGE = "image"
+KIND_AUDIO = "audio"
+
+
+class AssetPackError(Exception):
+    """Raised when a pack file is missing, truncated or of the wrong version."""
+
+
+def entry_key(relative_path: str, size: Optional[Tuple[int, int]] = None) -> str:
+    """Build the index key for an asset path and optional pre-scaled size.
+
+    Args:
+        relative_path: Path relative to the application root.
+        size: (width, height) of a pre-scaled variant, or None for native size.
+
+    Returns:
+        Normalized key string.
+    """
+    key = os.path.normpath(relative_path).replace(os.sep, "/")
+    if size is not None:
+        key = f"{key}@{int(size[0])}x{int(size[1])}"
+    return key
+
+
+def _align(offset: int) -> int:
+    return (offset + DATA_ALIGN - 1) // DATA_ALIGN * DATA_ALIGN
+
+
+class AssetPackWriter:
+    """Accumulates decoded assets and writes them as a single pack file."""
+
+    def __init__(self):
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._blobs: Dict[str, bytes] = {}
+
+    def add_image(self, key: str, rgba: bytes, width: int, height: int):
+        """Add raw RGBA pixel data (row-major, 4 bytes per pixel)."""
+        if len(rgba) != width * height * 4:
+            raise ValueError(f"{key}: expected {width * height * 4} bytes, got {len(rgba)}")
+        self.entries[key] = {"kind": KIND_IMAGE, "width": width, "height": height}
+        self._blobs[key] = bytes(rgba)
+
+    def add_surface(self, key: str, surface):
+        """Add a pygame surface, converting it to raw RGBA."""
+        import pygame
+
+        width, height = surface.get_size()
+        self.add_image(key, pygame.image.tobytes(surface, "RGBA"), width, height)
+
+    def add_audio(self, key: str, pcm: bytes, sample_rate: int, channels: int = 2):
+        """Add interleaved signed 16-bit PCM samples."""
+        self.entries[key] = {"kind": KIND_AUDIO, "sample_rate": sample_rate, "channels": channels}
+        self._blobs[key] = bytes(pcm)
+
+    def write(self, path: str) -> int:
+        """Write the pack to disk atomically.
+
+        Returns:
+            Total size of the written file in bytes.
+        """
+        index = {}
+        offset = 0
+        for key in sorted(self._blobs):
+            blob = self._blobs[key]
+            index[key] = dict(self.entries[key], offset=offset, size=len(blob))
+            offset = _align(offset + len(blob))
+
+        index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        data_off = _align(_HEADER.size + len(index_bytes))
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes), data_off))
+            f.write(index_bytes)
+            f.write(b"\0" * (data_off - f.tell()))
+            for key in sorted(self._blobs):
+                f.write(b"\0" * (data_off + index[key]["offset"] - f.tell()))
+                f.write(self._blobs[key])
+            total = f.tell()
+        os.replace(tmp_path, path)
+        return total
+
+
+class AssetPack:
+    """Read-only view over a pack file mapped into memory.
+
+    Surfaces returned by get_surface() share memory with the mapping and
+    must not be drawn onto; copy() them first if they need to be modified.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise AssetPackError(f"{path}: empty pack file") from e
+
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise AssetPackError(f"{path}: truncated header")
+        magic, version, index_len, data_off = _HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise AssetPackError(f"{path}: not an asset pack")
+        if version != PACK_VERSION:
+            self.close()
+            raise AssetPackError(f"{path}: unsupported pack version {version}")
+
+        raw_index = self._mmap[_HEADER.size : _HEADER.size + index_len]
+        self.index: Dict[str, Dict[str, Any]] = json.loads(raw_index.decode("utf-8"))
+        self._data_off = data_off
+        self._view = memoryview(self._mmap)
+
+        end = max((e["offset"] + e["size"] for e in self.index.values()), default=0)
+        if data_off + end > len(self._mmap):
+            self.close()
+            raise AssetPackError(f"{path}: truncated data section")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get_buffer(self, key: str) -> memoryview:
+        """Return a zero-copy view of an entry's raw bytes."""
+        entry = self.index[key]
+        start = self._data_off + entry["offset"]
+        return self._view[start : start + entry["size"]]
+
+    def get_surface(self, key: str):
+        """Create a pygame surface over an image entry without copying.
+
+        Returns:
+            Surface, or None if the key is not an image in this pack.
+        """
+        entry = self.index.get(key)
+        if entry is None or entry["kind"] != KIND_IMAGE:
+            return None
+        import pygame
+
+        return pygame.image.frombuffer(
+            self.get_buffer(key), (entry["width"], entry["height"]), "RGBA"
+        )
+
+    def get_sound(self, key: str):
+        """Create a pygame Sound from an audio entry.
+
+        Returns None if the entry is missing or the mixer is not initialised
+        with the same sample rate and channel count the entry was baked at.
+        """
+        entry = self.index.get(key)
+        if entry is None or entry["kind"] != KIND_AUDIO:
+            return None
+        import pygame
+
+        mixer = pygame.mixer.get_init()
+        if not mixer or mixer[0] != entry["sample_rate"] or mixer[2] != entry["channels"]:
+            return None
+        return pygame.mixer.Sound(buffer=self.get_buffer(key))
+
+    def close(self):
+        """Release the mapping. Surfaces created from it become invalid."""
+        try:
+            view = getattr(self, "_view", None)
+            if view is not None:
+                view.release()
+            self._mmap.close()
+        except BufferError:
+            # Live surfaces still reference the mapping; leave it open
+            return
+        self._file.close()
+
+
+# Process-wide pack, opened lazily on first use
+_pack: Optional[AssetPack] = None
+_pack_checked = False
+
+
+def _default_pack_path() -> str:
+    try:
+        from platform_init import get_resource_path
+
+        return get_resource_path(PACK_FILENAME)
+    except ImportError:
+        return os.path.join(os.path.dirname(os.path.dirname(__file__)), PACK_FILENAME)
+
+
+def get_asset_pack() -> Optional[AssetPack]:
+    """Get the shared asset pack, or None if no pack has been built."""
+    global _pack, _pack_checked
+
+    if not _pack_checked:
+        _pack_checked = True
+        path = os.environ.get("EVE_REBELLION_ASSET_PACK") or _default_pack_path()
+        if os.path.isfile(path):
+            try:
+                _pack = AssetPack(path)
+            except (AssetPackError, OSError) as e:
+                print(f"Warning: Ignoring asset pack {path}: {e}")
+    return _pack
+
+
+def load_image(relative_path: str, size: Optional[Tuple[int, int]] = None):
+    """Load an image from the pack, falling back to decoding it from disk.
+
+    Args:
+        relative_path: Image path relative to the application root.
+        size: Optional (width, height). A pre-scaled pack entry is used when
+            available, otherwise the native image is smoothscaled.
+
+    Returns:
+        Surface, or None if the image exists neither in the pack nor on disk.
+    """
+    import pygame
+
+    pack = get_asset_pack()
+    if pack is not None:
+        if size is not None:
+            surface = pack.get_surface(entry_key(relative_path, size))
+            if surface is not None:
+                return surface
+        surface = pack.get_surface(entry_key(relative_path))
+        if surface is not None:
+            if size is not None and surface.get_size() != tuple(size):
+                surface = pygame.transform.smoothscale(surface, size)
+            return surface
+
+    try:
+        from platform_init import get_resource_path
+
+        path = get_resource_path(relative_path)
+    except ImportError:
+        path = relative_path
+    if not os.path.exists(path):
+        return None
+    surface = pygame.image.load(path)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    if size is not None:
+        surface = pygame.transform.smoothscale(surface, size)
+    return surface
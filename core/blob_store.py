@@ -0,0 +1,111 @@
+"""Content-addressed blob store for downloaded assets.
+
+Many EVE ships share a render (several SHIP_DATABASE names map to the same
+type_id), and the same image is often wanted in several places: the
+asset library, each project, each size directory. BlobStore keeps each
+distinct file once, under blobs/<first two hex digits>/<sha256><suffix>,
+and materializes it wherever it is needed as a hard link. Hard links cost
+no extra disk, and unlike symlinks they survive the store being moved.
+Where hard links are impossible (another filesystem, or a filesystem
+without link support), the blob is copied instead.
+
+Blobs are never modified in place. Writers replace files with
+os.replace, which gives a new inode, so links elsewhere keep the old
+content.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable
+
+HASH_CHUNK = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """sha256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """Files stored once by content hash and hard-linked into place."""
+
+    def __init__(self, root: Path, suffix: str = ".png"):
+        self.root = Path(root)
+        self.suffix = suffix
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, digest: str) -> Path:
+        """Where the blob with this digest lives."""
+        return self.root / digest[:2] / f"{digest}{self.suffix}"
+
+    def has(self, digest: str) -> bool:
+        return self.path(digest).exists()
+
+    def add(self, source: Path) -> str:
+        """
+        Store a file and replace it with a link to its blob.
+
+        Returns:
+            The file's digest.
+        """
+        digest = file_digest(source)
+        blob = self.path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(exist_ok=True)
+            tmp_path = blob.with_name(blob.name + ".tmp")
+            try:
+                os.link(source, tmp_path)
+            except OSError:
+                shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, blob)
+        else:
+            self.materialize(digest, source)
+        return digest
+
+    def materialize(self, digest: str, target: Path) -> bool:
+        """
+        Place a blob at target, as a hard link if possible.
+
+        Returns:
+            True if target is a hard link, False if it had to be copied.
+        """
+        blob = self.path(digest)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists() and os.path.samefile(blob, target):
+            return True
+        tmp_path = target.with_name(target.name + ".tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        try:
+            os.link(blob, tmp_path)
+            linked = True
+        except OSError:
+            shutil.copyfile(blob, tmp_path)
+            linked = False
+        os.replace(tmp_path, target)
+        return linked
+
+    def digests(self) -> Iterable[str]:
+        """Digests of every stored blob."""
+        for blob in self.root.glob(f"??/*{self.suffix}"):
+            yield blob.name[: -len(self.suffix)] if self.suffix else blob.name
+
+    def disk_usage(self) -> int:
+        """Bytes used by the blobs themselves."""
+        return sum(blob.stat().st_size for blob in self.root.glob(f"??/*{self.suffix}"))
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Delete blobs not in keep; returns the number removed."""
+        keep = set(keep)
+        removed = 0
+        for digest in list(self.digests()):
+            if digest not in keep:
+                self.path(digest).unlink()
+                removed += 1
+        return removed
@@ -8,6 +8,8 @@ import json
 import os
 from pathlib import Path
 
+from core.persistence import get_persistence
+
 # Maximum allowed config file size (64KB should be plenty for control bindings)
 MAX_CONFIG_SIZE = 65536
 
@@ -92,13 +94,14 @@ def load_controls(config_path=None):
         config_path = _get_config_path()
 
     try:
-        # Validate file size to prevent memory exhaustion
-        file_size = os.path.getsize(config_path)
-        if file_size > MAX_CONFIG_SIZE:
-            return DEFAULT_CONTROLS.copy()
-
-        with open(config_path, "r", encoding="utf-8") as f:
-            controls = json.load(f)
+        # Validate file size to prevent memory exhaustion (queued saves are ours)
+        persistence = get_persistence()
+        if persistence.read(str(config_path)) is None:
+            file_size = os.path.getsize(config_path)
+            if file_size > MAX_CONFIG_SIZE:
+                return DEFAULT_CONTROLS.copy()
+
+        controls = persistence.read_json(str(config_path))
         # Validate required sections exist
         if not all(key in controls for key in ["keyboard", "mouse", "gamepad"]):
             return DEFAULT_CONTROLS.copy()
@@ -115,7 +118,7 @@ def save_controls(controls, config_path=None):
         config_path: Optional path to config file. If None, uses default location.
 
     Returns:
-        bool: True if save was successful, False otherwise.
+        bool: True once the save is queued, False if the path is not allowed.
     """
     if config_path is None:
         config_path = _get_config_path()
@@ -124,16 +127,8 @@ def save_controls(controls, config_path=None):
     if not _is_safe_path(config_path):
         return False
 
-    try:
-        config_path = Path(config_path)
-        # Ensure config directory exists
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(controls, f, indent=4)
-        return True
-    except (IOError, OSError):
-        return False
+    get_persistence().write_json(str(config_path), controls, indent=4)
+    return True
 
 
 def get_keyboard_keys(controls, action):
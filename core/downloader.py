@@ -0,0 +1,339 @@
+"""Pooled, resumable bulk downloader for EVE Image Server assets.
+
+BulkDownloader fetches many files from a handful of hosts with one pool of
+keep-alive connections: each worker thread keeps a persistent connection
+per host, so a run pays one TCP/TLS handshake per worker rather than one
+per image. Concurrency adapts to the server: it grows by one after a run
+of successes and halves when the server answers 429/503 or a request
+fails, with retries and backoff for those cases.
+
+Files are streamed to "<name>.part" and renamed into place once complete,
+so an interrupted run never leaves a truncated image. Re-running the same
+jobs skips files already on disk, which makes bulk runs resumable. With
+revalidate=True existing files are re-checked with conditional requests
+(If-None-Match / If-Modified-Since) using the validators from the previous
+run, which callers keep in their manifest; a 304 costs no body transfer.
+
+Only the standard library is used, so the game's ShipAssetManager can
+share the engine with the asset scripts without new dependencies.
+"""
+
+import http.client
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = "EVE-Rebellion-Game/1.0"
+CHUNK_SIZE = 64 * 1024
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+THROTTLE_CODES = (429, 502, 503, 504)
+
+# Validators from a previous download, keyed by URL: {"etag": ..., "last_modified": ...}
+Validators = Dict[str, Dict[str, str]]
+
+
+@dataclass
+class DownloadJob:
+    """One file to fetch."""
+
+    url: str
+    path: Path
+
+
+@dataclass
+class DownloadOutcome:
+    """What happened to a job.
+
+    status is "downloaded", "not_modified" (304), "cached" (already on disk,
+    no request made) or "failed".
+    """
+
+    job: DownloadJob
+    status: str
+    error: Optional[str] = None
+    bytes: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+class _Throttled(Exception):
+    """The server asked us to slow down."""
+
+
+class AdaptiveLimit:
+    """Concurrency limit that grows on success and halves on throttling (AIMD)."""
+
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(initial, maximum))
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, throttled: bool = False):
+        with self._cond:
+            self._active -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self.limit = min(self.maximum, self.limit + 1)
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+class BulkDownloader:
+    """Downloads batches of files over pooled keep-alive connections."""
+
+    def __init__(
+        self,
+        validators: Optional[Validators] = None,
+        max_workers: int = 16,
+        initial_workers: int = 4,
+        min_workers: int = 1,
+        timeout: float = 30.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        user_agent: str = USER_AGENT,
+    ):
+        """
+        Args:
+            validators: ETag/Last-Modified per URL from earlier runs. Updated
+                in place as files are downloaded; the caller persists it.
+            max_workers: Upper bound on concurrent requests.
+            initial_workers: Concurrent requests at the start of a run.
+            min_workers: Lower bound when the server throttles us.
+            timeout: Socket timeout in seconds.
+            retries: Extra attempts after a throttled or failed request.
+            backoff: Seconds to wait before the first retry; doubles each time.
+            user_agent: User-Agent header sent with every request.
+        """
+        self.validators: Validators = validators if validators is not None else {}
+        self.max_workers = max_workers
+        self.limit = AdaptiveLimit(initial_workers, min_workers, max_workers)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.user_agent = user_agent
+        self.connections_opened = 0
+        self.requests = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_connections: List[http.client.HTTPConnection] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close every pooled connection."""
+        with self._lock:
+            connections, self._all_connections = self._all_connections, []
+        for connection in connections:
+            connection.close()
+
+    def run(
+        self,
+        jobs: Iterable[DownloadJob],
+        revalidate: bool = False,
+        force: bool = False,
+        progress: Optional[Callable[[DownloadOutcome], None]] = None,
+    ) -> List[DownloadOutcome]:
+        """
+        Download a batch of files.
+
+        Args:
+            jobs: Files to fetch.
+            revalidate: Re-check files already on disk with conditional requests.
+            force: Re-download files already on disk unconditionally.
+            progress: Called on the calling thread as each job finishes.
+
+        Returns:
+            One outcome per job, in job order.
+        """
+        jobs = list(jobs)
+        outcomes: List[Optional[DownloadOutcome]] = [None] * len(jobs)
+        pending = []
+        for index, job in enumerate(jobs):
+            if job.path.exists() and not (revalidate or force):
+                outcomes[index] = DownloadOutcome(job, "cached")
+                if progress:
+                    progress(outcomes[index])  # type: ignore[arg-type]
+            else:
+                pending.append((index, job))
+
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            with ThreadPoolExecutor(workers, thread_name_prefix="download") as pool:
+                futures = {
+                    pool.submit(self._download, job, conditional=not force): index
+                    for index, job in pending
+                }
+                for future in as_completed(futures):
+                    outcome = future.result()
+                    outcomes[futures[future]] = outcome
+                    if progress:
+                        progress(outcome)
+        return outcomes  # type: ignore[return-value]
+
+    def _download(self, job: DownloadJob, conditional: bool) -> DownloadOutcome:
+        error = "no attempts made"
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            self.limit.acquire()
+            throttled = False
+            try:
+                return self._fetch(job, conditional and job.path.exists())
+            except _Throttled as e:
+                throttled = True
+                error = str(e)
+            except (OSError, http.client.HTTPException) as e:
+                throttled = True
+                error = str(e) or type(e).__name__
+                self._drop_connection(job.url)
+            finally:
+                self.limit.release(throttled)
+        return DownloadOutcome(job, "failed", error=error)
+
+    def _fetch(self, job: DownloadJob, conditional: bool) -> DownloadOutcome:
+        url = job.url
+        headers = {"User-Agent": self.user_agent, "Accept-Encoding": "identity"}
+        known = self.validators.get(job.url, {}) if conditional else {}
+        if known.get("etag"):
+            headers["If-None-Match"] = known["etag"]
+        if known.get("last_modified"):
+            headers["If-Modified-Since"] = known["last_modified"]
+
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._request(url, headers)
+            status = response.status
+            if status in REDIRECT_CODES and response.getheader("Location"):
+                response.read()
+                url = urljoin(url, response.getheader("Location"))
+                continue
+            if status == 304:
+                response.read()
+                return DownloadOutcome(job, "not_modified")
+            if status == 200:
+                size = self._stream_to_file(response, job.path)
+                validators = {}
+                if response.getheader("ETag"):
+                    validators["etag"] = response.getheader("ETag")
+                if response.getheader("Last-Modified"):
+                    validators["last_modified"] = response.getheader("Last-Modified")
+                with self._lock:
+                    if validators:
+                        self.validators[job.url] = validators
+                    else:
+                        self.validators.pop(job.url, None)
+                return DownloadOutcome(job, "downloaded", bytes=size)
+            response.read()
+            if status in THROTTLE_CODES:
+                raise _Throttled(f"HTTP {status}")
+            return DownloadOutcome(job, "failed", error=f"HTTP {status}")
+        return DownloadOutcome(job, "failed", error="too many redirects")
+
+    def _request(self, url: str, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        connection, reused = self._connection(parts.scheme, parts.netloc)
+        with self._lock:
+            self.requests += 1
+        try:
+            connection.request("GET", target, headers=headers)
+            return connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection; reconnect once
+            self._drop_connection(url)
+            connection, _ = self._connection(parts.scheme, parts.netloc)
+            connection.request("GET", target, headers=headers)
+            return connection.getresponse()
+
+    def _connection(self, scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool]:
+        """This thread's keep-alive connection to a host, and whether it is reused."""
+        pool = self._pool()
+        connection = pool.get((scheme, netloc))
+        if connection is not None:
+            return connection, True
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        else:
+            connection = http.client.HTTPConnection(netloc, timeout=self.timeout)
+        pool[(scheme, netloc)] = connection
+        with self._lock:
+            self.connections_opened += 1
+            self._all_connections.append(connection)
+        return connection, False
+
+    def _drop_connection(self, url: str):
+        parts = urlsplit(url)
+        connection = self._pool().pop((parts.scheme, parts.netloc), None)
+        if connection is not None:
+            connection.close()
+
+    def _pool(self) -> Dict[Tuple[str, str], http.client.HTTPConnection]:
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = {}
+        return pool
+
+    @staticmethod
+    def _stream_to_file(response: http.client.HTTPResponse, path: Path) -> int:
+        """Write a response body to path via a .part file; returns its size."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = path.with_name(path.name + ".part")
+        size = 0
+        try:
+            with open(part_path, "wb") as f:
+                while True:
+                    chunk = response.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    size += len(chunk)
+            length = response.getheader("Content-Length")
+            if length is not None and int(length) != size:
+                raise http.client.IncompleteRead(b"", int(length) - size)
+            os.replace(part_path, path)
+        except BaseException:
+            if part_path.exists():
+                part_path.unlink()
+            raise
+        return size
+
+
+def download_files(
+    jobs: Iterable[DownloadJob],
+    validators: Optional[Validators] = None,
+    revalidate: bool = False,
+    force: bool = False,
+    progress: Optional[Callable[[DownloadOutcome], None]] = None,
+    **options,
+) -> List[DownloadOutcome]:
+    """Run one batch through a fresh BulkDownloader and close its connections."""
+    with BulkDownloader(validators, **options) as downloader:
+        return downloader.run(jobs, revalidate=revalidate, force=force, progress=progress)
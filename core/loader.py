@@ -4,6 +4,10 @@ Data loader module for loading JSON game data.
 This module provides utilities for loading enemy, stage, and power-up
 definitions from JSON files in the data/ directory structure.
 
+Parsed files are kept in a shared DataStore, so repeated loads during a
+session cost a dictionary copy. Set EVE_REBELLION_HOT_RELOAD to have the
+game poll data/ for edits and re-parse only the files that changed.
+
 Supports both development mode (running from source) and portable/packaged
 mode via the platform_init module.
 """
@@ -11,7 +15,8 @@ mode via the platform_init module.
 import json
 import os
 import sys
-from typing import Any, Dict
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 def get_data_path() -> str:
@@ -73,6 +78,178 @@ def load_all_from_directory(directory: str) -> Dict[str, Dict[str, Any]]:
     return data
 
 
+# Called as callback(category, name, data); data is None when a file is deleted
+DataCallback = Callable[[str, str, Optional[Dict[str, Any]]], None]
+
+
+class DataStore:
+    """
+    Parsed JSON definitions from the data directory, cached per file.
+
+    Each category (a subdirectory such as "enemies") is parsed on first
+    load. refresh() re-stats the files of every loaded category, re-parses
+    only those whose mtime or size changed, drops deleted files and
+    notifies subscribers. start_watching() runs refresh() on a background
+    thread so edits to data/ apply without restarting the game.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Args:
+            root: Data directory, defaults to get_data_path()
+        """
+        self.root = root or get_data_path()
+        self.parses = 0  # Files parsed so far
+        # Files unchanged since the startup snapshot are not parsed at all
+        from core.snapshot import get_snapshot
+
+        self.snapshot = get_snapshot() if root is None else None
+        self._lock = threading.RLock()
+        self._categories: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._stats: Dict[str, Tuple[int, int]] = {}  # path -> (mtime_ns, size)
+        self._subscribers: List[Tuple[Optional[str], DataCallback]] = []
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    def load(self, category: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get every definition in a category.
+
+        Args:
+            category: Subdirectory of the data directory.
+
+        Returns:
+            Dictionary mapping filenames (without extension) to their parsed contents.
+
+        Raises:
+            json.JSONDecodeError: If a file is invalid the first time it is loaded.
+        """
+        with self._lock:
+            if category not in self._categories:
+                self._categories[category] = {}
+                try:
+                    self._scan(category, strict=True)
+                except Exception:
+                    del self._categories[category]
+                    raise
+            return dict(self._categories[category])
+
+    def _scan(self, category: str, strict: bool = False) -> List[Tuple[str, Any]]:
+        """Sync one category with disk, returning (name, data) of each change."""
+        directory = os.path.join(self.root, category)
+        entries = self._categories[category]
+        changes = []
+        seen = set()
+        try:
+            files = [f for f in os.scandir(directory) if f.name.endswith(".json")]
+        except FileNotFoundError:
+            files = []
+
+        for file in files:
+            name = os.path.splitext(file.name)[0]
+            seen.add(name)
+            stat = file.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._stats.get(file.path) == key:
+                continue
+            self._stats[file.path] = key
+            snapshot = self.snapshot.entry(file.path) if self.snapshot else None
+            if snapshot is not None and (snapshot[0], snapshot[1]) == key:
+                data = snapshot[2]
+            else:
+                try:
+                    data = load_json_file(file.path)
+                except (OSError, ValueError) as e:
+                    if strict:
+                        raise
+                    # Keep the last good version while the file is mid-edit
+                    print(f"Warning: Could not reload {file.path}: {e}")
+                    continue
+                self.parses += 1
+            entries[name] = data
+            changes.append((name, data))
+
+        for name in set(entries) - seen:
+            del entries[name]
+            self._stats.pop(os.path.join(directory, f"{name}.json"), None)
+            changes.append((name, None))
+        return changes
+
+    def refresh(self) -> int:
+        """
+        Re-parse changed files in every loaded category and notify subscribers.
+
+        Returns:
+            Number of files added, changed or removed.
+        """
+        with self._lock:
+            changes = [
+                (category, name, data)
+                for category in list(self._categories)
+                for name, data in self._scan(category)
+            ]
+            subscribers = list(self._subscribers)
+
+        for category, name, data in changes:
+            for wanted, callback in subscribers:
+                if wanted is None or wanted == category:
+                    try:
+                        callback(category, name, data)
+                    except Exception as e:
+                        print(f"Warning: Data reload callback failed for {category}/{name}: {e}")
+        return len(changes)
+
+    def subscribe(self, callback: DataCallback, category: Optional[str] = None):
+        """
+        Call callback(category, name, data) whenever a definition changes.
+
+        Callbacks run on the watcher thread when watching is enabled.
+
+        Args:
+            callback: Function to notify.
+            category: Only notify about this category (all when None).
+        """
+        with self._lock:
+            self._subscribers.append((category, callback))
+
+    def unsubscribe(self, callback: DataCallback):
+        """Stop notifying a callback."""
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s[1] is not callback]
+
+    def start_watching(self, interval: float = 1.0):
+        """Poll the data directory for changes on a background thread."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="data-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the background watcher, if running."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _watch(self, interval: float):
+        while not self._stop.wait(interval):
+            self.refresh()
+
+
+_store: Optional[DataStore] = None
+
+
+def get_data_store() -> DataStore:
+    """Get the shared data store for the data directory."""
+    global _store
+    if _store is None:
+        _store = DataStore()
+    return _store
+
+
 def load_enemies() -> Dict[str, Dict[str, Any]]:
     """
     Load all enemy definitions from data/enemies/.
@@ -80,8 +257,7 @@ def load_enemies() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping enemy IDs to their stats and properties.
     """
-    enemies_dir = os.path.join(get_data_path(), "enemies")
-    return load_all_from_directory(enemies_dir)
+    return get_data_store().load("enemies")
 
 
 def load_stages() -> Dict[str, Dict[str, Any]]:
@@ -91,8 +267,7 @@ def load_stages() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping stage IDs to their configuration.
     """
-    stages_dir = os.path.join(get_data_path(), "stages")
-    return load_all_from_directory(stages_dir)
+    return get_data_store().load("stages")
 
 
 def load_powerups() -> Dict[str, Dict[str, Any]]:
@@ -102,8 +277,17 @@ def load_powerups() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping power-up IDs to their effects and properties.
     """
-    powerups_dir = os.path.join(get_data_path(), "powerups")
-    return load_all_from_directory(powerups_dir)
+    return get_data_store().load("powerups")
+
+
+def load_patterns() -> Dict[str, Dict[str, Any]]:
+    """
+    Load all boss bullet patterns from data/patterns/.
+
+    Returns:
+        Dictionary mapping enemy IDs to their bullet pattern scripts.
+    """
+    return get_data_store().load("patterns")
 
 
 def load_all_game_data() -> Dict[str, Dict[str, Dict[str, Any]]]:
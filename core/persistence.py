@@ -0,0 +1,207 @@
+"""Write-behind persistence for save files.
+
+High scores, achievements, control bindings and save games are small JSON
+files rewritten whole. PersistenceService takes those writes off the game
+thread: write_json() serializes the data and queues it, and a background
+writer commits it once the file has been quiet for a short delay, so a
+burst of writes to one file (an unlock per kill, a save per stage)
+coalesces into a single commit.
+
+Each commit writes a temporary file beside the target and renames it over
+the target, so a crash or full disk mid-write leaves the previous version
+intact. read_json() returns queued data that has not reached disk yet, so
+load-modify-save callers always see their own writes.
+
+fsync policy (EVE_REBELLION_FSYNC):
+
+    "none"  rename only; fastest, a power loss may lose recent saves
+    "file"  fsync the temporary file before the rename (default)
+    "full"  also fsync the directory, making the rename itself durable
+
+get_persistence() registers close() with atexit, so queued writes are
+committed when the game exits.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+FSYNC_POLICIES = ("none", "file", "full")
+DEFAULT_DELAY = 0.5  # Seconds a file must be quiet before it is written
+
+
+class PersistenceService:
+    """Queues whole-file writes and commits them on a background thread."""
+
+    def __init__(self, delay: float = DEFAULT_DELAY, fsync: str = "file"):
+        """
+        Args:
+            delay: Seconds to wait for further writes to a file before
+                committing it.
+            fsync: One of FSYNC_POLICIES.
+
+        Raises:
+            ValueError: If fsync is not a known policy.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync!r}, expected one of {FSYNC_POLICIES}")
+        self.delay = delay
+        self.fsync = fsync
+        self.commits = 0  # Files written to disk
+        self.coalesced = 0  # Queued writes replaced before reaching disk
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()  # Serializes commits so the newest data lands last
+        self._pending: Dict[str, Tuple[bytes, float]] = {}  # path -> (content, due)
+        self._writing: Dict[str, bytes] = {}  # Taken off the queue, not yet on disk
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+    def write_json(self, path: str, data: Any, indent: Optional[int] = None):
+        """Queue data to be written to path as JSON.
+
+        The data is serialized immediately, so the caller may keep
+        modifying it.
+        """
+        self.write(path, json.dumps(data, indent=indent).encode("utf-8"))
+
+    def write(self, path: str, content: bytes):
+        """Queue content to replace the file at path."""
+        path = os.path.abspath(path)
+        with self._cond:
+            if path in self._pending:
+                self.coalesced += 1
+            self._pending[path] = (content, time.monotonic() + self.delay)
+            closed = self._closed
+            if not closed:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._run, name="persistence-writer", daemon=True
+                    )
+                    self._writer.start()
+                self._cond.notify()
+        if closed:
+            # Late writes during shutdown are committed synchronously
+            self.flush()
+
+    def read(self, path: str) -> Optional[bytes]:
+        """Content queued for path that may not be on disk yet, or None."""
+        path = os.path.abspath(path)
+        with self._cond:
+            if path in self._pending:
+                return self._pending[path][0]
+            return self._writing.get(path)
+
+    def read_json(self, path: str) -> Any:
+        """Load a JSON file, including writes still queued for it.
+
+        Raises:
+            FileNotFoundError: If nothing is queued and the file does not exist.
+            json.JSONDecodeError: If the file contains invalid JSON.
+        """
+        content = self.read(path)
+        if content is not None:
+            return json.loads(content)
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def flush(self):
+        """Commit every queued write now, on the calling thread."""
+        self._commit_due(force=True)
+
+    def close(self):
+        """Commit queued writes and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._pending:
+                        wait = min(due for _, due in self._pending.values()) - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if self._closed:
+                    return
+            self._commit_due()
+
+    def _commit_due(self, force: bool = False):
+        with self._io_lock:
+            with self._cond:
+                now = time.monotonic()
+                batch = {
+                    path: content
+                    for path, (content, due) in self._pending.items()
+                    if force or due <= now
+                }
+                for path in batch:
+                    del self._pending[path]
+                self._writing.update(batch)
+
+            for path, content in batch.items():
+                self._commit(path, content)
+
+            with self._cond:
+                for path, content in batch.items():
+                    if self._writing.get(path) is content:
+                        del self._writing[path]
+
+    def _commit(self, path: str, content: bytes):
+        """Atomically replace path with content."""
+        directory = os.path.dirname(path)
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(content)
+                    if self.fsync != "none":
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            if self.fsync == "full":
+                _fsync_directory(directory)
+            self.commits += 1
+        except OSError as e:
+            print(f"Warning: Could not save {path}: {e}")
+
+
+def _fsync_directory(directory: str):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Directories cannot be opened on Windows; renames are durable there
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+_service: Optional[PersistenceService] = None
+
+
+def get_persistence() -> PersistenceService:
+    """Get the shared persistence service, flushed automatically at exit."""
+    global _service
+    if _service is None:
+        fsync = os.environ.get("EVE_REBELLION_FSYNC", "file")
+        if fsync not in FSYNC_POLICIES:
+            print(f"Warning: Unknown EVE_REBELLION_FSYNC {fsync!r}, using 'file'")
+            fsync = "file"
+        _service = PersistenceService(fsync=fsync)
+        atexit.register(_service.close)
+    return _service
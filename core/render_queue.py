@@ -0,0 +1,302 @@
+"""Render job queue for long-lived Blender worker sessions.
+
+Rendering a model with a fresh `blender --background --python ...` launch
+pays Blender's startup and scene setup on every ship. RenderQueue starts
+one or more worker sessions once and streams jobs to them instead; the
+worker (scripts/blender_render_worker.py) keeps its camera, lights,
+render settings and materials between jobs.
+
+Protocol: the scheduler writes one JSON job per line to the worker's
+stdin. The worker announces itself and answers each job with a single
+line on stdout that starts with MARKER, followed by JSON. Any other
+output (Blender is chatty) is ignored. serve() implements the worker side,
+so a stand-in worker for tests is a few lines of Python.
+
+Finished jobs are appended to a JSON-lines log keyed by each job's
+parameters. A rerun with the same log skips jobs that already succeeded
+and whose output still exists, so an interrupted batch resumes where it
+stopped.
+
+This module is stdlib-only so Blender's bundled Python can import it.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from typing import IO, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+MARKER = "@@render "
+
+# Matches render_stl_topdown.create_material's dark EVE hull
+DEFAULT_COLOR = (0.08, 0.10, 0.06, 1.0)
+
+
+class RenderJob(NamedTuple):
+    """One model to render."""
+
+    name: str
+    stl: str
+    output: str
+    size: int = 256
+    color: Tuple[float, float, float, float] = DEFAULT_COLOR
+    rotate_180: bool = False
+    # Lay the longest axis along +Y (render_stl_topdown); False keeps the
+    # model's own axes (render_ships)
+    auto_orient: bool = True
+    engine: str = "CYCLES"
+    # Lights and material: "topdown" (render_stl_topdown) or "ships" (render_ships)
+    rig: str = "topdown"
+
+    def key(self) -> str:
+        """Identity of the job's output, for the resume log."""
+        fields = self._asdict()
+        if fields["rig"] == "topdown":
+            # Keys from before rig existed stay valid
+            del fields["rig"]
+        payload = json.dumps(fields, sort_keys=True)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class JobResult(NamedTuple):
+    job: RenderJob
+    status: str  # "rendered", "skipped" or "failed"
+    error: Optional[str] = None
+    seconds: float = 0.0
+    worker: Optional[int] = None  # Worker process id
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+class WorkerDied(Exception):
+    """A worker session exited or broke the protocol."""
+
+
+class WorkerSession:
+    """One running worker process that renders jobs one at a time."""
+
+    def __init__(self, command: Sequence[str]):
+        self.command = list(command)
+        self.pid: Optional[int] = None
+        self.process: Optional[subprocess.Popen] = None
+        self.starts = 0
+
+    def start(self):
+        self.starts += 1
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        hello = self._read_reply()
+        self.pid = hello.get("pid", self.process.pid)
+
+    def _read_reply(self) -> Dict:
+        assert self.process is not None and self.process.stdout is not None
+        for line in self.process.stdout:
+            if line.startswith(MARKER):
+                try:
+                    return json.loads(line[len(MARKER) :])
+                except ValueError as e:
+                    raise WorkerDied(f"bad reply from worker: {e}") from e
+        self.process.wait()
+        raise WorkerDied(f"worker exited with code {self.process.returncode}")
+
+    def render(self, job: RenderJob) -> Dict:
+        """Send a job and wait for its reply."""
+        if self.process is None or self.process.poll() is not None:
+            self.start()
+        assert self.process is not None and self.process.stdin is not None
+        try:
+            self.process.stdin.write(json.dumps(job._asdict()) + "\n")
+            self.process.stdin.flush()
+        except OSError as e:
+            raise WorkerDied(f"worker is gone: {e}") from e
+        return self._read_reply()
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            if self.process.stdin:
+                self.process.stdin.close()
+            self.process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        finally:
+            if self.process.stdout:
+                self.process.stdout.close()
+            self.process = None
+
+
+class JobLog:
+    """Append-only JSON-lines record of finished jobs."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.lock = threading.Lock()
+        self.done: Dict[str, Dict] = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short by an interrupted run
+                        continue
+                    self.done[entry["key"]] = entry
+
+    def is_done(self, job: RenderJob) -> bool:
+        entry = self.done.get(job.key())
+        return bool(entry and entry["status"] == "rendered" and os.path.exists(job.output))
+
+    def record(self, result: JobResult):
+        entry = {
+            "key": result.job.key(),
+            "name": result.job.name,
+            "output": result.job.output,
+            "status": result.status,
+            "error": result.error,
+            "seconds": result.seconds,
+        }
+        with self.lock:
+            self.done[entry["key"]] = entry
+            if self.path:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(entry) + "\n")
+
+
+class RenderQueue:
+    """Schedules render jobs across persistent worker sessions."""
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        workers: int = 1,
+        log_path: Optional[str] = None,
+        retries: int = 1,
+    ):
+        """
+        Args:
+            command: Worker command line, e.g. blender --background --python
+                scripts/blender_render_worker.py
+            workers: Number of sessions rendering in parallel
+            log_path: Resume log; None keeps no log
+            retries: Times a job is resent after its worker dies
+        """
+        self.command = list(command)
+        self.workers = max(1, workers)
+        self.log = JobLog(log_path)
+        self.retries = retries
+        self.sessions: List[WorkerSession] = []
+
+    @property
+    def sessions_started(self) -> int:
+        """Worker processes launched, including restarts."""
+        return sum(session.starts for session in self.sessions)
+
+    def run(
+        self,
+        jobs: Iterable[RenderJob],
+        force: bool = False,
+        progress: Optional[Callable[[JobResult], None]] = None,
+    ) -> List[JobResult]:
+        """
+        Render jobs, skipping ones the log says are already done.
+
+        Returns:
+            One JobResult per job, in input order
+        """
+        jobs = list(jobs)
+        results: List[Optional[JobResult]] = [None] * len(jobs)
+        pending: "queue.Queue[int]" = queue.Queue()
+        for index, job in enumerate(jobs):
+            if not force and self.log.is_done(job):
+                results[index] = JobResult(job, "skipped")
+                if progress:
+                    progress(results[index])
+            else:
+                pending.put(index)
+
+        def work(session: WorkerSession):
+            try:
+                while True:
+                    try:
+                        index = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    result = self._render(session, jobs[index])
+                    results[index] = result
+                    self.log.record(result)
+                    if progress:
+                        progress(result)
+            finally:
+                session.close()
+
+        count = min(self.workers, pending.qsize())
+        sessions = [WorkerSession(self.command) for _ in range(count)]
+        self.sessions.extend(sessions)
+        threads = [threading.Thread(target=work, args=(s,), daemon=True) for s in sessions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return [result for result in results if result is not None]
+
+    def _render(self, session: WorkerSession, job: RenderJob) -> JobResult:
+        started = time.perf_counter()
+        error = None
+        for _ in range(self.retries + 1):
+            try:
+                reply = session.render(job)
+            except (OSError, WorkerDied) as e:
+                error = str(e)
+                session.close()
+                continue
+            seconds = round(time.perf_counter() - started, 3)
+            if reply.get("ok"):
+                return JobResult(job, "rendered", None, seconds, session.pid)
+            return JobResult(job, "failed", reply.get("error"), seconds, session.pid)
+        return JobResult(job, "failed", error, round(time.perf_counter() - started, 3))
+
+
+def send(message: Dict, stdout: IO[str]):
+    """Write one protocol line."""
+    stdout.write(MARKER + json.dumps(message) + "\n")
+    stdout.flush()
+
+
+def serve(
+    render: Callable[[Dict], None],
+    stdin: Optional[IO[str]] = None,
+    stdout: Optional[IO[str]] = None,
+):
+    """
+    Worker side of the protocol: render each job read from stdin.
+
+    render receives the job as a dict (RenderJob fields) and should raise
+    on failure; the error is sent back and the worker carries on.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    send({"ready": True, "pid": os.getpid()}, stdout)
+    for line in stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        started = time.perf_counter()
+        try:
+            render(job)
+        except Exception as e:
+            send({"ok": False, "error": f"{type(e).__name__}: {e}"}, stdout)
+        else:
+            send({"ok": True, "seconds": round(time.perf_counter() - started, 3)}, stdout)
@@ -1,6 +1,7 @@
 """Save/resume system for game state persistence.
 
-Reads/writes game state files in the saves/ directory.
+Reads/writes game state files in the saves/ directory. Writes go through
+the write-behind persistence service, so saving never blocks a frame.
 """
 
 import json
@@ -8,6 +9,8 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+from core.persistence import get_persistence
+
 
 def get_saves_directory():
     """Get the path to the saves directory."""
@@ -25,6 +28,8 @@ def list_saves():
     saves_dir = get_saves_directory()
     saves = []
 
+    # Commit queued saves so they show up in the listing
+    get_persistence().flush()
     if not saves_dir.exists():
         return saves
 
@@ -57,7 +62,7 @@ def save_game(filename, player_state, game_state):
         game_state: Dictionary containing game state data.
 
     Returns:
-        bool: True if save was successful, False otherwise.
+        bool: True once the save is queued; it is written in the background.
 
     Example player_state:
         {
@@ -86,7 +91,6 @@ def save_game(filename, player_state, game_state):
         }
     """
     saves_dir = get_saves_directory()
-    saves_dir.mkdir(parents=True, exist_ok=True)
 
     # Sanitize filename to prevent path traversal
     safe_filename = os.path.basename(filename)
@@ -101,12 +105,8 @@ def save_game(filename, player_state, game_state):
         "timestamp": datetime.utcnow().isoformat() + "Z",
     }
 
-    try:
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=4)
-        return True
-    except IOError:
-        return False
+    get_persistence().write_json(str(save_path), save_data)
+    return True
 
 
 def load_game(filename):
@@ -124,12 +124,8 @@ def load_game(filename):
     safe_filename = os.path.basename(filename)
     save_path = saves_dir / safe_filename
 
-    if not save_path.exists():
-        return None, None
-
     try:
-        with open(save_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = get_persistence().read_json(str(save_path))
 
         player_state = data.get("player", {})
         game_state = data.get("game", {})
@@ -158,6 +154,8 @@ def delete_save(filename):
     safe_filename = os.path.basename(filename)
     save_path = saves_dir / safe_filename
 
+    # A queued write would otherwise recreate the file after deletion
+    get_persistence().flush()
     if not save_path.exists():
         return False
 
@@ -0,0 +1,188 @@
+"""Startup snapshot of static JSON tables.
+
+scripts/build_snapshot.py parses every static JSON table the game reads at
+launch (data/enemies, data/stages, data/powerups, data/patterns, the ship
+roster and the chapter configs) and writes them, with each source file's
+mtime and size, to one marshal-encoded file. At startup the snapshot is
+read with a single read() and shared by the DataStore, ShipRoster and the
+Abyssal Depths config loader instead of each parsing its own files.
+
+Every lookup is checked against the source file's current mtime and size;
+a file edited (or added) after the snapshot was built is parsed from disk
+as before, so a stale snapshot only costs the difference. The tables in
+constants.py are plain literals already served from Python's bytecode
+cache and are not duplicated here.
+
+File format:
+
+    MAGIC (8 bytes) + marshal.dumps({
+        "version": SNAPSHOT_VERSION,
+        "python": [major, minor],
+        "files": {"<path relative to root>": [mtime_ns, size, data], ...},
+    })
+"""
+
+import json
+import marshal
+import os
+import sys
+import time
+from typing import Any, Dict, Optional, Tuple
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = "static_tables.snapshot"
+MAGIC = b"EVSNAP\x00\x01"
+
+# Static tables captured by the snapshot, relative to the application root
+DATA_DIRS = ("data/enemies", "data/stages", "data/powerups", "data/patterns", "config/chapters")
+CONFIG_FILES = ("config/ship_roster_complete.json",)
+
+
+class SnapshotError(Exception):
+    """The snapshot file is missing, corrupt or from another version."""
+
+
+def _app_root() -> str:
+    from core.loader import get_data_path
+
+    return os.path.dirname(os.path.abspath(get_data_path()))
+
+
+def _source_files(root: str):
+    """Relative paths of every static table under root."""
+    for directory in DATA_DIRS:
+        full = os.path.join(root, directory)
+        if os.path.isdir(full):
+            for name in sorted(os.listdir(full)):
+                if name.endswith(".json"):
+                    yield f"{directory}/{name}"
+    for path in CONFIG_FILES:
+        if os.path.isfile(os.path.join(root, path)):
+            yield path
+
+
+def build_snapshot(output: str, root: Optional[str] = None) -> Dict[str, Any]:
+    """Parse every static table under root and write the snapshot.
+
+    Returns:
+        Build stats: files, bytes and build_ms.
+    """
+    start = time.perf_counter()
+    root = root or _app_root()
+    files = {}
+    for relative in _source_files(root):
+        path = os.path.join(root, relative)
+        stat = os.stat(path)
+        with open(path, "r", encoding="utf-8") as f:
+            files[relative] = [stat.st_mtime_ns, stat.st_size, json.load(f)]
+
+    payload = {"version": SNAPSHOT_VERSION, "python": list(sys.version_info[:2]), "files": files}
+    blob = MAGIC + marshal.dumps(payload)
+    tmp_path = output + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(blob)
+    os.replace(tmp_path, output)
+    return {
+        "files": len(files),
+        "bytes": len(blob),
+        "build_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+class StaticSnapshot:
+    """Parsed static tables, checked against their sources on lookup."""
+
+    def __init__(self, path: str, root: Optional[str] = None):
+        """
+        Raises:
+            SnapshotError: If the file is unreadable or was built by another
+                snapshot or Python version.
+        """
+        self.path = path
+        self.root = root or _app_root()
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+        except OSError as e:
+            raise SnapshotError(str(e)) from e
+        if not blob.startswith(MAGIC):
+            raise SnapshotError("not a snapshot file")
+        try:
+            payload = marshal.loads(blob[len(MAGIC) :])
+        except (EOFError, ValueError, TypeError) as e:
+            raise SnapshotError(f"corrupt snapshot: {e}") from e
+        if payload.get("version") != SNAPSHOT_VERSION:
+            raise SnapshotError(f"snapshot version {payload.get('version')}")
+        if payload.get("python") != list(sys.version_info[:2]):
+            raise SnapshotError("built by another Python version")
+        self.files: Dict[str, Any] = payload["files"]
+        self.hits = 0
+        self.misses = 0
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root).replace(os.sep, "/")
+
+    def entry(self, path: str) -> Optional[Tuple[int, int, Any]]:
+        """(mtime_ns, size, data) for a file, without checking it is current."""
+        return self.files.get(self._relative(path))
+
+    def load_json(self, path: str) -> Optional[Any]:
+        """Parsed contents of a JSON file, or None if absent or out of date.
+
+        The returned data is shared; callers must not modify it.
+        """
+        entry = self.entry(path)
+        if entry is not None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == (entry[0], entry[1]):
+                self.hits += 1
+                return entry[2]
+        self.misses += 1
+        return None
+
+
+_snapshot: Optional[StaticSnapshot] = None
+_snapshot_checked = False
+
+
+def _default_snapshot_path() -> str:
+    try:
+        from platform_init import get_resource_path
+
+        return get_resource_path(SNAPSHOT_FILENAME)
+    except ImportError:
+        return os.path.join(os.path.dirname(os.path.dirname(__file__)), SNAPSHOT_FILENAME)
+
+
+def get_snapshot() -> Optional[StaticSnapshot]:
+    """Get the shared static snapshot, or None if none has been built."""
+    global _snapshot, _snapshot_checked
+
+    if not _snapshot_checked:
+        _snapshot_checked = True
+        path = os.environ.get("EVE_REBELLION_SNAPSHOT") or _default_snapshot_path()
+        if os.path.isfile(path):
+            try:
+                _snapshot = StaticSnapshot(path)
+            except SnapshotError as e:
+                print(f"Warning: Ignoring static snapshot {path}: {e}")
+    return _snapshot
+
+
+def load_json_table(path: str) -> Any:
+    """Load a static JSON file from the snapshot, or parse it if stale.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file contains invalid JSON.
+    """
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        data = snapshot.load_json(path)
+        if data is not None:
+            return data
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,299 @@
+"""Texture atlases for static sprite variants.
+
+scripts/bake_sprite_atlas.py renders every static sprite variant (ships,
+bullet and rocket animation frames, explosion stamps, powerup icons) once,
+shelf-packs them into a few large pages and writes the pages plus a JSON
+manifest of sub-rects. At runtime sprites take their image as a subsurface
+of an atlas page instead of drawing a fresh surface, and SpriteBatch draws a
+whole sprite group with one Surface.blits() call keyed by atlas region.
+
+Manifest format (atlas.json):
+
+    {
+        "version": 1,
+        "pages": ["atlas_0.png", ...],
+        "regions": {"<key>": [page, x, y, width, height], ...},
+        "bake_ms": 123.4
+    }
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ATLAS_VERSION = 1
+ATLAS_DIR = "assets/atlas"
+MANIFEST_NAME = "atlas.json"
+DEFAULT_PAGE_SIZE = 1024
+DEFAULT_PADDING = 1
+
+
+def pack_rects(
+    sizes: Sequence[Tuple[int, int]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    padding: int = DEFAULT_PADDING,
+) -> List[Tuple[int, int, int]]:
+    """Shelf-pack rectangles into as few square pages as possible.
+
+    Rectangles are placed tallest first, left to right along shelves. Each
+    rectangle goes on the first shelf (on any page) it fits on; otherwise a
+    new shelf is opened on the first page with vertical room, or a new page.
+
+    Args:
+        sizes: (width, height) of each rectangle.
+        page_size: Width and height of every page.
+        padding: Empty pixels kept around each rectangle to stop bleeding.
+
+    Returns:
+        (page, x, y) for each rectangle, in input order.
+
+    Raises:
+        ValueError: If a rectangle cannot fit on an empty page.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    placements: List[Tuple[int, int, int]] = [(0, 0, 0)] * len(sizes)
+    # Per page: list of shelves [y, height, next_x], and next free y
+    shelves: List[List[List[int]]] = []
+    page_tops: List[int] = []
+
+    for i in order:
+        w = sizes[i][0] + padding * 2
+        h = sizes[i][1] + padding * 2
+        if w > page_size or h > page_size:
+            raise ValueError(f"Sprite {sizes[i]} does not fit on a {page_size}px page")
+
+        placed = False
+        for page, page_shelves in enumerate(shelves):
+            for shelf in page_shelves:
+                if h <= shelf[1] and shelf[2] + w <= page_size:
+                    placements[i] = (page, shelf[2] + padding, shelf[0] + padding)
+                    shelf[2] += w
+                    placed = True
+                    break
+            if placed:
+                break
+        if placed:
+            continue
+
+        for page in range(len(shelves)):
+            if page_tops[page] + h <= page_size:
+                break
+        else:
+            shelves.append([])
+            page_tops.append(0)
+            page = len(shelves) - 1
+
+        shelves[page].append([page_tops[page], h, w])
+        placements[i] = (page, padding, page_tops[page] + padding)
+        page_tops[page] += h
+
+    return placements
+
+
+def bake_atlas(images, page_size=DEFAULT_PAGE_SIZE, padding=DEFAULT_PADDING):
+    """Pack named surfaces into atlas pages.
+
+    Args:
+        images: Mapping of region key to pygame surface.
+
+    Returns:
+        Tuple of (pages, regions) where pages is a list of surfaces and
+        regions maps each key to [page, x, y, width, height].
+    """
+    import pygame
+
+    keys = sorted(images)
+    sizes = [images[k].get_size() for k in keys]
+    placements = pack_rects(sizes, page_size, padding)
+
+    page_heights: Dict[int, int] = {}
+    regions = {}
+    for key, (w, h), (page, x, y) in zip(keys, sizes, placements):
+        regions[key] = [page, x, y, w, h]
+        page_heights[page] = max(page_heights.get(page, 0), y + h + padding)
+
+    pages = [
+        pygame.Surface((page_size, page_heights[p]), pygame.SRCALPHA)
+        for p in range(len(page_heights))
+    ]
+    for key in keys:
+        page, x, y, _, _ = regions[key]
+        pages[page].blit(images[key], (x, y))
+    return pages, regions
+
+
+def save_atlas(directory: str, pages, regions, bake_ms: float = 0.0):
+    """Write atlas pages as PNGs plus the JSON manifest."""
+    import pygame
+
+    os.makedirs(directory, exist_ok=True)
+    names = []
+    for i, page in enumerate(pages):
+        name = f"atlas_{i}.png"
+        pygame.image.save(page, os.path.join(directory, name))
+        names.append(name)
+
+    manifest = {
+        "version": ATLAS_VERSION,
+        "pages": names,
+        "regions": regions,
+        "bake_ms": round(bake_ms, 1),
+    }
+    with open(os.path.join(directory, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+
+
+class SpriteAtlas:
+    """Loaded atlas pages and the sub-rect of every baked sprite."""
+
+    def __init__(self, pages, regions: Dict[str, List[int]]):
+        import pygame
+
+        self.pages = pages
+        self.regions = regions
+        self.load_ms = 0.0
+        self._rects = {k: pygame.Rect(r[1], r[2], r[3], r[4]) for k, r in regions.items()}
+        self._images: Dict[str, object] = {}
+        self._page_ids = {id(p) for p in pages}
+
+    @classmethod
+    def load(cls, directory: str) -> "SpriteAtlas":
+        """Load an atlas written by save_atlas()."""
+        import pygame
+
+        start = time.perf_counter()
+        with open(os.path.join(directory, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != ATLAS_VERSION:
+            raise ValueError(f"Unsupported atlas version {manifest.get('version')}")
+
+        pages = []
+        for name in manifest["pages"]:
+            page = pygame.image.load(os.path.join(directory, name))
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            pages.append(page)
+
+        atlas = cls(pages, manifest["regions"])
+        atlas.load_ms = (time.perf_counter() - start) * 1000
+        return atlas
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.regions
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def image(self, key: str):
+        """Get a baked sprite as a subsurface of its page, or None if not baked.
+
+        The subsurface shares pixels with the page; sprites must treat it as
+        read-only.
+        """
+        image = self._images.get(key)
+        if image is None:
+            region = self.regions.get(key)
+            if region is None:
+                return None
+            image = self.pages[region[0]].subsurface(self._rects[key])
+            self._images[key] = image
+        return image
+
+    def region(self, key: str):
+        """Get (page_surface, area_rect) for a baked sprite."""
+        return self.pages[self.regions[key][0]], self._rects[key]
+
+    def owns(self, surface) -> bool:
+        """Check whether a surface is one of this atlas's pages."""
+        return id(surface) in self._page_ids
+
+
+class SpriteBatch:
+    """Draws sprite groups with a single Surface.blits() call.
+
+    Sprites whose image is an atlas subsurface are blitted from their page
+    with an area rect; any other sprite is blitted from its own surface in
+    the same call, so draw order is preserved exactly.
+    """
+
+    def __init__(self, atlas: Optional[SpriteAtlas] = None):
+        self.atlas = atlas
+        self.frame_sprites = 0
+        self.frame_atlas_sprites = 0
+        self.frame_blit_calls = 0
+
+    def begin_frame(self):
+        """Reset the per-frame counters."""
+        self.frame_sprites = 0
+        self.frame_atlas_sprites = 0
+        self.frame_blit_calls = 0
+
+    def draw(self, target, sprites, exclude=None):
+        """Blit every sprite's image at its rect onto target.
+
+        Args:
+            target: Surface to draw onto.
+            sprites: Iterable of sprites with image and rect attributes.
+            exclude: Optional sprite to skip (e.g. drawn separately on top).
+        """
+        atlas = self.atlas
+        sequence = []
+        atlas_count = 0
+        for sprite in sprites:
+            if sprite is exclude:
+                continue
+            image = sprite.image
+            parent = image.get_parent() if atlas is not None else None
+            if parent is not None and atlas.owns(parent):
+                sequence.append((parent, sprite.rect, image.get_rect(topleft=image.get_offset())))
+                atlas_count += 1
+            else:
+                sequence.append((image, sprite.rect))
+
+        if sequence:
+            target.blits(sequence, doreturn=False)
+            self.frame_blit_calls += 1
+        self.frame_sprites += len(sequence)
+        self.frame_atlas_sprites += atlas_count
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for the current frame."""
+        return {
+            "sprites": self.frame_sprites,
+            "atlas_sprites": self.frame_atlas_sprites,
+            "blit_calls": self.frame_blit_calls,
+        }
+
+
+# Process-wide atlas, loaded lazily on first use
+_atlas: Optional[SpriteAtlas] = None
+_atlas_checked = False
+
+
+def _default_atlas_dir() -> str:
+    try:
+        from platform_init import get_resource_path
+
+        return get_resource_path(ATLAS_DIR)
+    except ImportError:
+        return os.path.join(os.path.dirname(os.path.dirname(__file__)), ATLAS_DIR)
+
+
+def get_sprite_atlas() -> Optional[SpriteAtlas]:
+    """Get the shared sprite atlas, or None if none has been baked."""
+    global _atlas, _atlas_checked
+
+    if not _atlas_checked:
+        _atlas_checked = True
+        directory = os.environ.get("EVE_REBELLION_SPRITE_ATLAS") or _default_atlas_dir()
+        if os.path.isfile(os.path.join(directory, MANIFEST_NAME)):
+            try:
+                _atlas = SpriteAtlas.load(directory)
+                print(
+                    f"Sprite atlas: {len(_atlas)} sprites on {len(_atlas.pages)} pages "
+                    f"loaded in {_atlas.load_ms:.1f}ms"
+                )
+            except Exception as e:
+                print(f"Warning: Ignoring sprite atlas {directory}: {e}")
+    return _atlas
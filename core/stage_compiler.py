@@ -0,0 +1,413 @@
+"""Compiled, validated stage timelines.
+
+Stages come from two places: the built-in STAGES_* tables in constants.py
+and the JSON files in data/stages/. Both used to be interpreted live while
+playing (pick a random enemy type every 45 frames, decide wave sizes on the
+fly). The compiler validates a stage against the stage schema once and
+compiles the deterministic parts into an immutable StagePlan: per wave,
+the enemy pool, the count and any explicit pattern. At the start of a run,
+roll_stage() draws that run's enemy types, industrials and formations
+(pattern, spawn columns and entry order from a WavePatternManager sized to
+the screen) from a run-seeded random.Random. The result is a StageTimeline,
+which the game plays back with a cursor into a sorted tuple.
+
+Compiled plans are cached in memory and in a pickled artifact
+(cache/stages.pickle, override with EVE_REBELLION_STAGE_CACHE). JSON stages
+are keyed by file mtime and size, falling back to a content hash when only
+the mtime changed; built-in stages are keyed by a hash of their definition.
+The whole artifact is dropped when the compiler's inputs change: this
+module, the known enemy types or the wave pattern names.
+
+Stage schema:
+
+    {
+        "name": "Pirate Invasion",                  # required
+        "industrial_chance": 0.1,                   # optional, 0..1
+        # Either a wave count plus an enemy pool...
+        "waves": 5,
+        "enemies": ["executioner", "punisher"],
+        "boss": "machariel" | {"type": "machariel", ...} | null,
+        # ...or explicit waves
+        "waves": [
+            {"enemies": [{"type": "omen", "count": 4}], "pattern": "pincer"},
+            {"boss": "machariel"}
+        ]
+    }
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import random
+from dataclasses import dataclass
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+COMPILER_VERSION = 3
+CACHE_FILENAME = os.path.join("cache", "stages.pickle")
+
+# Spawn cadence and placement, matching the original live spawner
+SPAWN_INTERVAL = 45
+SPAWN_Y = -50
+SPAWN_MARGIN = 50
+
+
+class StageSchemaError(ValueError):
+    """A stage definition does not match the stage schema."""
+
+
+@dataclass(frozen=True)
+class SpawnEvent:
+    """One enemy entering the playfield."""
+
+    frame: int
+    enemy_type: str
+    x: int
+    y: int
+
+
+@dataclass(frozen=True)
+class WaveTimeline:
+    """A compiled wave: either a boss or spawns sorted by frame."""
+
+    spawns: Tuple[SpawnEvent, ...] = ()
+    pattern: Optional[str] = None
+    boss: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StageTimeline:
+    """A stage as played in one run."""
+
+    name: str
+    waves: Tuple[WaveTimeline, ...]
+
+
+@dataclass(frozen=True)
+class WavePlan:
+    """A compiled wave, before this run's enemy types are rolled."""
+
+    boss: Optional[str] = None
+    # Generated waves draw `count` types from pool; explicit waves shuffle it
+    pool: Tuple[str, ...] = ()
+    draw: bool = False
+    count: int = 0
+    # Explicit formation; None lets each run pick one for the wave number
+    pattern: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StagePlan:
+    """A compiled stage."""
+
+    name: str
+    industrial_chance: float
+    stage_index: int
+    waves: Tuple[WavePlan, ...]
+
+
+def _boss_type(boss: Any) -> Optional[str]:
+    return boss.get("type") if isinstance(boss, dict) else boss
+
+
+def _check_enemy(value: Any, where: str, enemy_types: Collection[str]):
+    if not isinstance(value, str) or value not in enemy_types:
+        raise StageSchemaError(f"{where}: unknown enemy type {value!r}")
+
+
+def validate_stage(stage_id: str, data: Any, enemy_types: Collection[str]):
+    """Check a stage definition against the stage schema.
+
+    Args:
+        stage_id: Name used in error messages
+        data: Parsed stage definition
+        enemy_types: Known enemy types (ENEMY_STATS keys)
+
+    Raises:
+        StageSchemaError: Naming the first offending field.
+    """
+    from wave_patterns import WAVE_PATTERNS
+
+    if not isinstance(data, dict):
+        raise StageSchemaError(f"{stage_id}: stage must be an object")
+    if not isinstance(data.get("name"), str) or not data["name"]:
+        raise StageSchemaError(f"{stage_id}.name: required string")
+
+    chance = data.get("industrial_chance", 0.0)
+    if not isinstance(chance, (int, float)) or isinstance(chance, bool) or not 0 <= chance <= 1:
+        raise StageSchemaError(f"{stage_id}.industrial_chance: must be between 0 and 1")
+
+    boss = data.get("boss")
+    if boss is not None:
+        if isinstance(boss, dict) and "type" not in boss:
+            raise StageSchemaError(f"{stage_id}.boss: boss objects need a type")
+        _check_enemy(_boss_type(boss), f"{stage_id}.boss", enemy_types)
+
+    waves = data.get("waves")
+    if isinstance(waves, int) and not isinstance(waves, bool):
+        if waves < 1:
+            raise StageSchemaError(f"{stage_id}.waves: must be at least 1")
+        enemies = data.get("enemies")
+        if not isinstance(enemies, list) or not enemies:
+            raise StageSchemaError(f"{stage_id}.enemies: required non-empty list")
+        for i, enemy in enumerate(enemies):
+            _check_enemy(enemy, f"{stage_id}.enemies[{i}]", enemy_types)
+        return
+
+    if not isinstance(waves, list) or not waves:
+        raise StageSchemaError(f"{stage_id}.waves: must be a wave count or a list of waves")
+    for i, wave in enumerate(waves):
+        where = f"{stage_id}.waves[{i}]"
+        if not isinstance(wave, dict) or ("boss" in wave) == ("enemies" in wave):
+            raise StageSchemaError(f"{where}: wave needs exactly one of enemies or boss")
+        if "boss" in wave:
+            _check_enemy(wave["boss"], f"{where}.boss", enemy_types)
+            continue
+        pattern = wave.get("pattern")
+        if pattern is not None and pattern not in WAVE_PATTERNS:
+            raise StageSchemaError(f"{where}.pattern: unknown wave pattern {pattern!r}")
+        if not isinstance(wave["enemies"], list) or not wave["enemies"]:
+            raise StageSchemaError(f"{where}.enemies: required non-empty list")
+        for j, group in enumerate(wave["enemies"]):
+            if not isinstance(group, dict):
+                raise StageSchemaError(f"{where}.enemies[{j}]: must be {{type, count}}")
+            _check_enemy(group.get("type"), f"{where}.enemies[{j}].type", enemy_types)
+            count = group.get("count", 1)
+            if not isinstance(count, int) or isinstance(count, bool) or count < 1:
+                raise StageSchemaError(f"{where}.enemies[{j}].count: must be at least 1")
+
+
+def _wave_pool(data: Dict[str, Any], wave: int, stage_index: int) -> WavePlan:
+    """Boss, or the enemy pool and count of one wave before industrials."""
+    waves = data["waves"]
+    if isinstance(waves, int):
+        if data.get("boss") and wave == waves - 1:
+            return WavePlan(boss=_boss_type(data["boss"]))
+        return WavePlan(pool=tuple(data["enemies"]), draw=True, count=3 + wave + stage_index)
+
+    spec = waves[wave]
+    if "boss" in spec:
+        return WavePlan(boss=spec["boss"])
+    types = tuple(group["type"] for group in spec["enemies"] for _ in range(group.get("count", 1)))
+    return WavePlan(pool=types, count=len(types), pattern=spec.get("pattern"))
+
+
+def compile_stage(
+    stage_id: str,
+    data: Dict[str, Any],
+    stage_index: int,
+    enemy_types: Collection[str],
+) -> StagePlan:
+    """Validate a stage and compile its waves.
+
+    Only the parts that are the same in every run are compiled; enemy
+    types, industrials and formations are rolled per run by roll_stage().
+
+    Args:
+        stage_id: Name used in error messages
+        data: Stage definition (built-in STAGES entry or parsed JSON)
+        stage_index: Position of the stage in its campaign; later stages
+            get larger generated waves
+        enemy_types: Known enemy types (ENEMY_STATS keys)
+
+    Raises:
+        StageSchemaError: If the stage does not match the schema.
+    """
+    validate_stage(stage_id, data, enemy_types)
+    chance = data.get("industrial_chance", 0.1)
+    num_waves = data["waves"] if isinstance(data["waves"], int) else len(data["waves"])
+
+    waves = tuple(_wave_pool(data, wave, stage_index) for wave in range(num_waves))
+    return StagePlan(data["name"], chance, stage_index, waves)
+
+
+def roll_stage(
+    plan: StagePlan, rng: random.Random, screen_size: Optional[Tuple[int, int]] = None
+) -> StageTimeline:
+    """Roll one run's enemy types, industrials and formations into a spawn timeline.
+
+    Args:
+        plan: Compiled stage
+        rng: The run's random source; the same seed gives the same waves
+        screen_size: Playfield (width, height), defaults to the game screen
+    """
+    from wave_patterns import WavePatternManager
+
+    if screen_size is None:
+        from constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+        screen_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    width = screen_size[0]
+    manager = WavePatternManager(*screen_size, rng=rng)
+
+    waves = []
+    for number, wave in enumerate(plan.waves):
+        if wave.boss:
+            waves.append(WaveTimeline(boss=wave.boss))
+            continue
+
+        if wave.draw:
+            types = [rng.choice(wave.pool) for _ in range(wave.count)]
+        else:
+            types = list(wave.pool)
+            rng.shuffle(types)
+
+        # Industrials: sometimes an extra ship, sometimes the last one is a hauler
+        if rng.random() < plan.industrial_chance:
+            types.append(rng.choice(types))
+        if rng.random() < plan.industrial_chance * 2:
+            types[-1] = "bestower"
+
+        # The formation supplies spawn columns and entry order; enemies
+        # still drop in from the top at the original cadence
+        pattern = wave.pattern or manager.get_pattern_for_wave(number, plan.stage_index)
+        points = manager.generate_wave(pattern, len(types), types)
+        order = sorted(range(len(types)), key=lambda i: points[i].delay)
+        spawns = tuple(
+            SpawnEvent(
+                (rank + 1) * SPAWN_INTERVAL,
+                types[i],
+                min(max(int(points[i].x), SPAWN_MARGIN), width - SPAWN_MARGIN),
+                SPAWN_Y,
+            )
+            for rank, i in enumerate(order)
+        )
+        waves.append(WaveTimeline(spawns, pattern))
+
+    return StageTimeline(plan.name, tuple(waves))
+
+
+def _digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _fingerprint(enemy_types: Collection[str]) -> str:
+    """Digest of everything a plan depends on besides its stage definition."""
+    from wave_patterns import WAVE_PATTERNS
+
+    try:
+        with open(__file__, "rb") as f:
+            source = f.read()
+    except OSError:
+        # Frozen builds ship no source; COMPILER_VERSION still applies
+        source = b""
+    inputs = json.dumps([COMPILER_VERSION, sorted(enemy_types), sorted(WAVE_PATTERNS)])
+    return _digest(inputs.encode("utf-8") + source)
+
+
+def _default_cache_path() -> str:
+    path = os.environ.get("EVE_REBELLION_STAGE_CACHE")
+    if path:
+        return path
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), CACHE_FILENAME)
+
+
+class StageCompiler:
+    """Compiles stages on demand and caches the plans."""
+
+    def __init__(self, cache_path: Optional[str] = None, enemy_types=None):
+        """
+        Args:
+            cache_path: Pickled artifact location ("" disables the artifact)
+            enemy_types: Known enemy types, defaults to ENEMY_STATS
+        """
+        if enemy_types is None:
+            from constants import ENEMY_STATS
+
+            enemy_types = ENEMY_STATS
+        self.enemy_types = enemy_types
+        self.fingerprint = _fingerprint(enemy_types)
+        self.cache_path = _default_cache_path() if cache_path is None else cache_path
+        self.compiled = 0  # Plans compiled (not served from a cache)
+        # entry -> (mtime_ns, size, digest, plan)
+        self._entries: Optional[Dict[str, Tuple[Any, Any, str, StagePlan]]] = None
+
+    def _load_entries(self) -> Dict[str, Tuple[Any, Any, str, StagePlan]]:
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_path and os.path.exists(self.cache_path):
+                try:
+                    with open(self.cache_path, "rb") as f:
+                        artifact = pickle.load(f)
+                    if artifact.get("version") == self.fingerprint:
+                        self._entries = artifact["entries"]
+                except Exception as e:
+                    print(f"Warning: Ignoring stage cache {self.cache_path}: {e}")
+        return self._entries
+
+    def _save_entries(self):
+        if not self.cache_path:
+            return
+        artifact = {"version": self.fingerprint, "entries": self._entries}
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write stage cache {self.cache_path}: {e}")
+
+    def _store(self, entry, mtime, size, digest, plan) -> StagePlan:
+        self._load_entries()[entry] = (mtime, size, digest, plan)
+        self._save_entries()
+        return plan
+
+    def compile_file(self, path: str, stage_index: int = 0) -> StagePlan:
+        """Plan for a data/stages JSON file.
+
+        Raises:
+            StageSchemaError: If the file does not match the stage schema.
+        """
+        stage_id = os.path.splitext(os.path.basename(path))[0]
+        entry = f"file:{stage_id}@{stage_index}"
+        stat = os.stat(path)
+        cached = self._load_entries().get(entry)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[3]
+
+        with open(path, "rb") as f:
+            payload = f.read()
+        digest = _digest(payload)
+        if cached and cached[2] == digest:
+            # Touched but unchanged: keep the plan, refresh the key
+            return self._store(entry, stat.st_mtime_ns, stat.st_size, digest, cached[3])
+
+        data = json.loads(payload.decode("utf-8"))
+        plan = compile_stage(stage_id, data, stage_index, self.enemy_types)
+        self.compiled += 1
+        return self._store(entry, stat.st_mtime_ns, stat.st_size, digest, plan)
+
+    def compile(self, stage: Dict[str, Any], stage_index: int = 0) -> StagePlan:
+        """Plan for a STAGES entry.
+
+        Stages converted from data/stages carry their file id in "source"
+        and are compiled from the JSON file, keeping explicit waves.
+        """
+        source = stage.get("source")
+        if source:
+            from core.loader import get_data_path
+
+            path = os.path.join(get_data_path(), "stages", f"{source}.json")
+            if os.path.exists(path):
+                return self.compile_file(path, stage_index)
+
+        digest = _digest(json.dumps(stage, sort_keys=True, default=str).encode("utf-8"))
+        entry = f"stage:{digest}@{stage_index}"
+        cached = self._load_entries().get(entry)
+        if cached:
+            return cached[3]
+        plan = compile_stage(stage["name"], stage, stage_index, self.enemy_types)
+        self.compiled += 1
+        return self._store(entry, None, None, digest, plan)
+
+
+_compiler: Optional[StageCompiler] = None
+
+
+def get_stage_compiler() -> StageCompiler:
+    """Get the shared stage compiler."""
+    global _compiler
+    if _compiler is None:
+        _compiler = StageCompiler()
+    return _compiler
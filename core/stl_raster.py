@@ -0,0 +1,328 @@
+"""Top-down sprite rasterizer for STL ship models.
+
+scripts/render_stl_topdown.py renders a model by launching Blender, which
+spends seconds starting up per ship. For the flat top-down sprites the game
+uses, this module does the same job in NumPy:
+
+    - parse binary or ASCII STL into an (N, 3, 3) triangle array
+    - centre the model and lay it along +Y with the longest-axis rules of
+      render_stl_topdown.setup_object
+    - rasterize an orthographic view from above with a z-buffer, two-sided
+      Lambert shading from a fixed key light, and an alpha mask
+    - supersample and box-filter for anti-aliased edges
+
+Triangles are rasterized in bulk rather than one at a time: they are
+bucketed by the size of their screen bounding box, and each bucket tests
+every candidate pixel of every triangle in one vectorized step. The depth
+test uses np.maximum.at, so overlapping triangles resolve to the one
+nearest the camera without a Python loop.
+
+render_directory() renders a whole model tree across a process pool.
+"""
+
+import multiprocessing
+import os
+import re
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_SIZE = 256
+DEFAULT_SUPERSAMPLE = 2
+# Camera ortho scale is the model's largest extent times this (as in Blender)
+PADDING = 1.2
+# Grey with a faint olive tint, close to the Blender material under its lights
+DEFAULT_COLOR = (0.55, 0.58, 0.5)
+# Key light from above-front-right, as in render_stl_topdown.setup_lighting
+LIGHT_DIRECTION = (0.35, -0.35, 0.87)
+AMBIENT = 0.25
+# Candidate pixels evaluated per vectorized step; bounds peak memory
+CHUNK_PIXELS = 1 << 21
+
+_BINARY_RECORD = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")])
+_ASCII_VERTEX = re.compile(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)")
+
+
+def load_stl(path: str) -> np.ndarray:
+    """Read an STL file into a float64 array of shape (triangles, 3, 3).
+
+    Binary files are recognised by their length (84 + 50 bytes per
+    triangle), since many binary exporters also begin the header with
+    "solid". Anything else is parsed as ASCII.
+
+    Raises:
+        ValueError: If the file holds no triangles.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) >= 84:
+        (count,) = struct.unpack_from("<I", data, 80)
+        if len(data) == 84 + count * _BINARY_RECORD.itemsize:
+            records = np.frombuffer(data, dtype=_BINARY_RECORD, count=count, offset=84)
+            return records["vertices"].astype(np.float64)
+
+    vertices = _ASCII_VERTEX.findall(data)
+    if not vertices or len(vertices) % 3:
+        raise ValueError(f"{path}: not a valid STL file")
+    return np.array(vertices, dtype=np.float64).reshape(-1, 3, 3)
+
+
+def orient(triangles: np.ndarray, rotate_180: bool = False) -> np.ndarray:
+    """Centre a model on the origin and point its longest axis along +Y.
+
+    Mirrors render_stl_topdown.setup_object: a model standing along Z is
+    rotated 90 degrees about X, one lying along X is rotated 90 degrees
+    about Z, and rotate_180 adds a half turn about Z for nose-down models.
+    """
+    points = triangles.reshape(-1, 3)
+    low, high = points.min(axis=0), points.max(axis=0)
+    points = points - (low + high) / 2
+    width, depth, height = high - low
+
+    x, y, z = points.T
+    if height > width and height > depth:
+        # (x, y, z) -> (x, -z, y)
+        x, y, z = x, -z, y
+    elif width > depth and width > height:
+        # (x, y, z) -> (-y, x, z)
+        x, y, z = -y, x, z
+    if rotate_180:
+        x, y = -x, -y
+    return np.stack([x, y, z], axis=-1).reshape(-1, 3, 3)
+
+
+def shade(triangles: np.ndarray, light: Sequence[float] = LIGHT_DIRECTION) -> np.ndarray:
+    """Two-sided Lambert intensity of each triangle, between AMBIENT and 1."""
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    lengths[lengths == 0] = 1.0
+    light = np.asarray(light, dtype=np.float64)
+    light = light / np.linalg.norm(light)
+    # STL winding is unreliable, so light both faces of every triangle
+    diffuse = np.abs(normals @ light) / lengths
+    return AMBIENT + (1.0 - AMBIENT) * diffuse
+
+
+def rasterize(
+    triangles: np.ndarray, size: int, intensity: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Z-buffered orthographic rasterization of screen-space triangles.
+
+    Args:
+        triangles: (N, 3, 3) with x, y in pixels (y down) and z towards the
+            camera.
+        size: Width and height of the image.
+        intensity: Shade of each triangle.
+
+    Returns:
+        (coverage, image): a bool mask and the per-pixel shade, both
+        (size, size).
+    """
+    depth = np.full(size * size, -np.inf)
+    image = np.zeros(size * size)
+
+    xy = triangles[:, :, :2]
+    # Pixel centres sit at +0.5; a triangle covers pixels whose centre it contains
+    low = np.clip(np.ceil(xy.min(axis=1) - 0.5), 0, size).astype(np.int64)
+    high = np.clip(np.floor(xy.max(axis=1) - 0.5), -1, size - 1).astype(np.int64)
+    spans = high - low + 1
+    extent = spans.max(axis=1)
+
+    (x0, y0), (x1, y1), (x2, y2) = xy[:, 0].T, xy[:, 1].T, xy[:, 2].T
+    area = (x1 - x0) * (y2 - y0) - (x2 - x0) * (y1 - y0)
+    visible = (spans.min(axis=1) > 0) & (np.abs(area) > 1e-12)
+
+    # Bucket by power-of-two bounding box so each bucket has a fixed pixel grid
+    buckets = np.zeros(len(triangles), dtype=np.int64)
+    buckets[visible] = np.ceil(np.log2(extent[visible])).astype(np.int64)
+    for bucket in np.unique(buckets[visible]):
+        span = 1 << int(bucket)
+        grid = np.arange(span)
+        members = np.flatnonzero(visible & (buckets == bucket))
+        step = max(1, CHUNK_PIXELS // (span * span))
+        for start in range(0, len(members), step):
+            index = members[start : start + step]
+            px = low[index, 0, None, None] + grid[None, None, :]
+            py = low[index, 1, None, None] + grid[None, :, None]
+            cx, cy = px + 0.5, py + 0.5
+
+            tx0, ty0 = x0[index, None, None], y0[index, None, None]
+            tx1, ty1 = x1[index, None, None], y1[index, None, None]
+            tx2, ty2 = x2[index, None, None], y2[index, None, None]
+            inv_area = 1.0 / area[index, None, None]
+            w1 = ((cx - tx0) * (ty2 - ty0) - (tx2 - tx0) * (cy - ty0)) * inv_area
+            w2 = ((tx1 - tx0) * (cy - ty0) - (cx - tx0) * (ty1 - ty0)) * inv_area
+            w0 = 1.0 - w1 - w2
+
+            inside = (
+                (w0 >= 0)
+                & (w1 >= 0)
+                & (w2 >= 0)
+                & (px <= high[index, 0, None, None])
+                & (py <= high[index, 1, None, None])
+            )
+            if not inside.any():
+                continue
+
+            z = triangles[index, :, 2]
+            z = w0 * z[:, 0, None, None] + w1 * z[:, 1, None, None] + w2 * z[:, 2, None, None]
+            pixel = (py * size + px)[inside]
+            z = z[inside]
+            shades = np.broadcast_to(intensity[index, None, None], inside.shape)[inside]
+
+            # Depth test: later chunks overwrite wherever they are nearer
+            np.maximum.at(depth, pixel, z)
+            nearest = z >= depth[pixel]
+            image[pixel[nearest]] = shades[nearest]
+
+    coverage = np.isfinite(depth)
+    return coverage.reshape(size, size), image.reshape(size, size)
+
+
+def render_topdown(
+    triangles: np.ndarray,
+    size: int = DEFAULT_SIZE,
+    color: Sequence[float] = DEFAULT_COLOR,
+    supersample: int = DEFAULT_SUPERSAMPLE,
+) -> np.ndarray:
+    """Render oriented triangles seen from above as an RGBA uint8 image.
+
+    The model is scaled so its largest X/Y extent times PADDING fills the
+    image, and +Y points up.
+
+    Returns:
+        (size, size, 4) uint8 array.
+    """
+    points = triangles.reshape(-1, 3)
+    extent = float(np.max(points[:, :2].max(axis=0) - points[:, :2].min(axis=0)))
+    scale = extent * PADDING or 1.0
+    full = size * supersample
+
+    screen = np.empty_like(triangles)
+    screen[..., 0] = (triangles[..., 0] / scale + 0.5) * full
+    screen[..., 1] = (0.5 - triangles[..., 1] / scale) * full
+    screen[..., 2] = triangles[..., 2]
+    coverage, image = rasterize(screen, full, shade(triangles))
+
+    # Box filter down to the output size; alpha is the covered fraction
+    shape = (size, supersample, size, supersample)
+    alpha = coverage.reshape(shape).mean(axis=(1, 3))
+    lit = image.reshape(shape).sum(axis=(1, 3))
+    hits = coverage.reshape(shape).sum(axis=(1, 3))
+    lit = np.divide(lit, hits, out=np.zeros_like(lit), where=hits > 0)
+
+    rgba = np.empty((size, size, 4))
+    rgba[..., :3] = lit[..., None] * np.asarray(color, dtype=np.float64)
+    rgba[..., 3] = alpha
+    return np.round(np.clip(rgba, 0.0, 1.0) * 255).astype(np.uint8)
+
+
+def write_png(path: str, rgba: np.ndarray):
+    """Write an (height, width, 4) uint8 array as an RGBA PNG."""
+
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(body))
+            + kind
+            + body
+            + struct.pack(">I", zlib.crc32(kind + body) & 0xFFFFFFFF)
+        )
+
+    height, width = rgba.shape[:2]
+    # Filter type 0 (none) at the start of each row
+    rows = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    rows[:, 1:] = rgba.reshape(height, width * 4)
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", header))
+        f.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b"IEND", b""))
+    os.replace(tmp_path, path)
+
+
+def render_stl(
+    input_path: str,
+    output_path: str,
+    size: int = DEFAULT_SIZE,
+    rotate_180: bool = False,
+    color: Sequence[float] = DEFAULT_COLOR,
+    supersample: int = DEFAULT_SUPERSAMPLE,
+) -> Dict:
+    """Render one STL file to a top-down PNG sprite.
+
+    Returns:
+        Dict with "input", "output", "triangles" and "seconds".
+    """
+    started = time.perf_counter()
+    triangles = orient(load_stl(input_path), rotate_180=rotate_180)
+    rgba = render_topdown(triangles, size, color, supersample)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    write_png(output_path, rgba)
+    return {
+        "input": input_path,
+        "output": output_path,
+        "triangles": len(triangles),
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+
+
+def _render_job(job: Dict) -> Dict:
+    try:
+        return render_stl(**job)
+    except (OSError, ValueError) as e:
+        return {"input": job["input_path"], "output": job["output_path"], "error": str(e)}
+
+
+def render_directory(
+    input_dir: str,
+    output_dir: str,
+    size: int = DEFAULT_SIZE,
+    workers: Optional[int] = None,
+    flip: Sequence[str] = (),
+    **options,
+) -> List[Dict]:
+    """Render every .stl under input_dir, keeping the folder layout.
+
+    assets/stl_models/caldari/drake.stl becomes <output_dir>/caldari/drake.png.
+
+    Args:
+        flip: Model names (file stems) to render with rotate_180.
+        workers: Pool size (default: CPU count); 1 renders in this process.
+        **options: Passed through to render_stl (color, supersample).
+
+    Returns:
+        One result dict per model, as from render_stl, or with "error".
+    """
+    jobs = []
+    for root, _, files in os.walk(input_dir):
+        for name in sorted(files):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() != ".stl":
+                continue
+            relative = os.path.relpath(os.path.join(root, stem + ".png"), input_dir)
+            jobs.append(
+                {
+                    "input_path": os.path.join(root, name),
+                    "output_path": os.path.join(output_dir, relative),
+                    "size": size,
+                    "rotate_180": stem in flip,
+                    **options,
+                }
+            )
+    jobs.sort(key=lambda job: job["input_path"])
+
+    if workers == 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(workers or os.cpu_count() or 1, len(jobs)), mp_context=context
+    ) as pool:
+        return list(pool.map(_render_job, jobs))
@@ -0,0 +1,437 @@
+"""
+Vectorized movement kernel for sprites.Enemy patterns
+
+Enemy.update moves one enemy per call, dispatching to _move_drift,
+_move_sine, _move_zigzag, _move_circle, _move_swoop or _move_flank. The
+kernel groups tracked enemies by movement pattern; each group keeps its
+pattern state in contiguous NumPy columns, advances every member in one
+vectorized step per frame and writes the new positions back to the
+sprites' rects in a single pass.
+
+The rules (including pygame's round-half-away-from-zero when a float is
+stored in a Rect) match Enemy.update exactly, so an enemy can move between
+the kernel and its own update() at any time. While tracked, the kernel
+owns the enemy's position: remove() it before moving its rect by hand.
+Bosses and Enemy subclasses that override update() (e.g. CapitalShipEnemy)
+always update themselves.
+
+Usage:
+
+    movement = EnemyMovementKernel()
+
+    # Each frame - batches the group once it is large enough to pay off
+    movement.update_group(enemies, player.rect)
+"""
+
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# Pattern ids (same values as Enemy.PATTERN_*)
+PATTERN_DRIFT = 0
+PATTERN_SINE = 1
+PATTERN_ZIGZAG = 2
+PATTERN_CIRCLE = 3
+PATTERN_SWOOP = 4
+PATTERN_FLANK = 5
+
+# Swoop states, indexed by their column value
+SWOOP_STATES = ("enter", "aim", "dive", "retreat")
+SWOOP_ENTER, SWOOP_AIM, SWOOP_DIVE, SWOOP_RETREAT = range(4)
+
+
+def to_rect_int(values):
+    """Round like pygame does when a float is stored in a Rect."""
+    return np.trunc(values + np.copysign(0.5, values))
+
+
+def clamp(values, limit):
+    """Clamp values to [-limit, limit] (np.clip is slow on small arrays)."""
+    return np.minimum(np.maximum(values, -limit), limit)
+
+
+def supports(enemy: Any) -> bool:
+    """Check whether an enemy moves by the stock Enemy.update rules."""
+    from sprites import Enemy
+
+    return type(enemy).update is Enemy.update and not enemy.is_boss
+
+
+def _commit(column, values, active):
+    """Store new state values for the active rows only."""
+    column[:] = values if active is None else np.where(active, values, column)
+
+
+class _PatternGroup:
+    """Enemies sharing one movement pattern, with state stored column-wise."""
+
+    pattern = PATTERN_DRIFT
+    # Extra sprite attribute -> column pairs for this pattern's state
+    fields: Dict[str, str] = {}
+
+    def __init__(self, kernel: "EnemyMovementKernel", capacity: int = 16):
+        self.kernel = kernel
+        self.sprites: List[Any] = []
+        self.rects: List[Any] = []
+        self.attributes = {
+            "speed": "speed",
+            "pattern_timer": "timer",
+            "target_y": "target_y",
+            "entered": "entered",
+        }
+        self.attributes.update(self.fields)
+        names = ("x", "y", "w", "half_w", "half_h") + tuple(self.attributes.values())
+        self.arrays = {name: np.zeros(capacity) for name in names}
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def add(self, enemy: Any) -> int:
+        slot = len(self.sprites)
+        if slot == len(self.arrays["x"]):
+            for name, column in self.arrays.items():
+                grown = np.zeros(slot * 2)
+                grown[:slot] = column
+                self.arrays[name] = grown
+        rect = enemy.rect
+        self.arrays["x"][slot] = rect.x
+        self.arrays["y"][slot] = rect.y
+        self.arrays["w"][slot] = rect.width
+        self.arrays["half_w"][slot] = rect.width // 2
+        self.arrays["half_h"][slot] = rect.height // 2
+        for attr, name in self.attributes.items():
+            self.arrays[name][slot] = self.load(attr, getattr(enemy, attr, 0))
+        self.sprites.append(enemy)
+        self.rects.append(rect)
+        return slot
+
+    def load(self, attr: str, value: Any) -> float:
+        """Convert a sprite attribute to its column value."""
+        return float(value)
+
+    def store(self, attr: str, value: float) -> Any:
+        """Convert a column value back to the sprite attribute."""
+        return bool(value) if attr == "entered" else value
+
+    def remove(self, slot: int) -> Optional[Any]:
+        """Swap-remove a member, copying its state back to the sprite.
+
+        Returns:
+            The sprite moved into the freed slot, if any
+        """
+        enemy = self.sprites[slot]
+        for attr, name in self.attributes.items():
+            setattr(enemy, attr, self.store(attr, self.arrays[name][slot].item()))
+
+        last = len(self.sprites) - 1
+        moved = None
+        if slot != last:
+            for column in self.arrays.values():
+                column[slot] = column[last]
+            moved = self.sprites[slot] = self.sprites[last]
+            self.rects[slot] = self.rects[last]
+        self.sprites.pop()
+        self.rects.pop()
+        return moved
+
+    def step(self, player_rect):
+        """Advance every member one frame and write back their rects."""
+        n = len(self.sprites)
+        if n == 0:
+            return
+        cols = {name: column[:n] for name, column in self.arrays.items()}
+        x, y, entered = cols["x"], cols["y"], cols["entered"]
+        cols["timer"] += 0.05
+
+        # Enter phase - move to target Y first; these rows skip the pattern
+        active = None
+        if not entered.all():
+            active = entered != 0
+            descending = ~active & (y + cols["half_h"] < cols["target_y"])
+            entered[~active & ~descending] = 1
+            entry_y = np.where(descending, to_rect_int(y + cols["speed"] * 1.5), y)
+
+        new_x, new_y = self.move(cols, active, player_rect)
+
+        # Keep on screen horizontally
+        right = self.kernel.screen_width - 10 - cols["w"]
+        new_x = np.where(new_x < 10, 10, np.where(new_x > right, right, new_x))
+
+        if active is None:
+            x[:] = new_x
+            y[:] = new_y
+        else:
+            x[:] = np.where(active, new_x, x)
+            y[:] = np.where(active, new_y, entry_y)
+
+        xs = x.astype(int).tolist()
+        ys = y.astype(int).tolist()
+        for rect, topleft in zip(self.rects, zip(xs, ys)):
+            rect.topleft = topleft
+
+    def move(self, cols, active, player_rect):
+        """Return every member's new (x, y) under this pattern.
+
+        State columns may only change where ``active`` is set (None means
+        every row is active).
+        """
+        raise NotImplementedError
+
+
+class _DriftGroup(_PatternGroup):
+    pattern = PATTERN_DRIFT
+
+    def move(self, cols, active, player_rect):
+        """Basic side-to-side drift"""
+        x, y, speed = cols["x"], cols["y"], cols["speed"]
+        new_x = to_rect_int(x + np.sin(cols["timer"]) * speed)
+        # Slow vertical drift
+        low = y + cols["half_h"] < cols["target_y"]
+        new_y = np.where(low, to_rect_int(y + speed * 0.3), y)
+        return new_x, new_y
+
+
+class _SineGroup(_PatternGroup):
+    pattern = PATTERN_SINE
+
+    def move(self, cols, active, player_rect):
+        """Smooth sine wave movement"""
+        timer = cols["timer"]
+        amplitude = 80 + 40 * np.sin(timer * 0.3)
+        center_x = self.kernel.screen_width // 2 + np.sin(timer * 1.5) * amplitude
+        # Gentle vertical oscillation
+        center_y = cols["target_y"] + np.sin(timer * 0.8) * 30
+        return to_rect_int(center_x) - cols["half_w"], to_rect_int(center_y) - cols["half_h"]
+
+
+class _ZigzagGroup(_PatternGroup):
+    pattern = PATTERN_ZIGZAG
+
+    def move(self, cols, active, player_rect):
+        """Sharp zigzag pattern"""
+        x, y, speed, timer = cols["x"], cols["y"], cols["speed"], cols["timer"]
+        # Change direction every ~60 frames
+        step = np.where(np.floor(timer * 2) % 2 == 0, 2.0, -2.0) * speed
+        new_x = to_rect_int(x + step)
+        # Slight downward movement on direction change
+        turning = np.abs(np.sin(timer * 2)) < 0.1
+        new_y = np.where(turning, to_rect_int(y + speed), y)
+        return new_x, new_y
+
+
+class _CircleGroup(_PatternGroup):
+    pattern = PATTERN_CIRCLE
+    fields = {"circle_center_x": "center_x", "circle_radius": "radius"}
+
+    def store(self, attr, value):
+        return int(value) if attr == "circle_radius" else super().store(attr, value)
+
+    def move(self, cols, active, player_rect):
+        """Circular strafing pattern"""
+        timer, center_x, radius = cols["timer"], cols["center_x"], cols["radius"]
+        new_x = to_rect_int(center_x + np.cos(timer) * radius) - cols["half_w"]
+        new_y = to_rect_int(cols["target_y"] + np.sin(timer) * (radius * 0.5)) - cols["half_h"]
+        # Slowly drift the center
+        drifted = center_x + np.sin(timer * 0.2) * 0.5
+        sw = self.kernel.screen_width
+        _commit(center_x, np.minimum(np.maximum(drifted, 100), sw - 100), active)
+        return new_x, new_y
+
+
+class _SwoopGroup(_PatternGroup):
+    pattern = PATTERN_SWOOP
+    fields = {"swoop_state": "state", "swoop_target_x": "target_x"}
+
+    def load(self, attr, value):
+        if attr == "swoop_state":
+            return float(SWOOP_STATES.index(value))
+        return super().load(attr, value)
+
+    def store(self, attr, value):
+        if attr == "swoop_state":
+            return SWOOP_STATES[int(value)]
+        return super().store(attr, value)
+
+    def move(self, cols, active, player_rect):
+        """Dive toward player then retreat"""
+        x, y, speed, timer = cols["x"], cols["y"], cols["speed"], cols["timer"]
+        state, target_x, target_y = cols["state"], cols["target_x"], cols["target_y"]
+        dive = state == SWOOP_DIVE
+        retreat = state == SWOOP_RETREAT
+
+        # Wait and aim at player
+        start = (state == SWOOP_AIM) & (timer % (math.pi * 2) < 0.1)
+        if active is not None:
+            start &= active
+        if start.any():
+            sw = self.kernel.screen_width
+            target_x[start] = player_rect.centerx if player_rect else sw // 2
+
+        # Dive toward player position, or retreat back up
+        limit = speed * 2
+        dive_x = to_rect_int(x + clamp((target_x - (x + cols["half_w"])) * 0.1, limit))
+        new_x = np.where(dive, dive_x, x)
+        new_y = np.where(
+            dive, to_rect_int(y + speed * 3), np.where(retreat, to_rect_int(y - speed * 2), y)
+        )
+
+        # State changes depend on the state at the start of the frame
+        center_y = new_y + cols["half_h"]
+        to_aim = ((state == SWOOP_ENTER) & (center_y >= target_y)) | (
+            retreat & (center_y < target_y)
+        )
+        to_retreat = dive & (center_y > self.kernel.screen_height * 0.6)
+        new_state = np.where(
+            to_aim,
+            SWOOP_AIM,
+            np.where(start, SWOOP_DIVE, np.where(to_retreat, SWOOP_RETREAT, state)),
+        )
+        _commit(state, new_state, active)
+
+        # Horizontal drift while aiming
+        aiming = new_state == SWOOP_AIM
+        new_x = np.where(aiming, to_rect_int(new_x + np.sin(timer * 2) * speed), new_x)
+        return new_x, new_y
+
+
+class _FlankGroup(_PatternGroup):
+    pattern = PATTERN_FLANK
+    fields = {"flank_side": "side"}
+
+    def store(self, attr, value):
+        return int(value) if attr == "flank_side" else super().store(attr, value)
+
+    def move(self, cols, active, player_rect):
+        """Move to screen edge then track player"""
+        x, y, speed, side = cols["x"], cols["y"], cols["speed"], cols["side"]
+        sw = self.kernel.screen_width
+
+        # Move to flanking position
+        dx = np.where(side < 0, 80, sw - 80) - (x + cols["half_w"])
+        new_x = np.where(np.abs(dx) > 5, to_rect_int(x + clamp(dx * 0.05, speed)), x)
+
+        # Track player Y position loosely
+        new_y = y
+        if player_rect:
+            target_y = max(80, min(player_rect.centery - 200, 250))
+            dy = target_y - (y + cols["half_h"])
+            new_y = to_rect_int(y + clamp(dy * 0.02, speed * 0.5))
+
+        # Occasionally switch sides
+        switch = self.kernel.rng.random(len(side)) < 0.002
+        if active is not None:
+            switch &= active
+        side[switch] *= -1
+        return new_x, new_y
+
+
+PATTERN_GROUPS = {
+    PATTERN_DRIFT: _DriftGroup,
+    PATTERN_SINE: _SineGroup,
+    PATTERN_ZIGZAG: _ZigzagGroup,
+    PATTERN_CIRCLE: _CircleGroup,
+    PATTERN_SWOOP: _SwoopGroup,
+    PATTERN_FLANK: _FlankGroup,
+}
+
+
+class EnemyMovementKernel:
+    """Moves every tracked enemy in one vectorized pass per pattern."""
+
+    # Group size at which batched steps beat per-enemy updates
+    BATCH_THRESHOLD = 320
+
+    def __init__(
+        self,
+        screen_width: int = SCREEN_WIDTH,
+        screen_height: int = SCREEN_HEIGHT,
+        seed: Optional[int] = None,
+    ):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.rng = np.random.default_rng(seed)
+        self.groups = {pattern: group(self) for pattern, group in PATTERN_GROUPS.items()}
+        # id(enemy) -> (group, slot)
+        self._slots: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, enemy) -> bool:
+        return id(enemy) in self._slots
+
+    def track(self, enemy) -> bool:
+        """Add an enemy if the kernel can move it.
+
+        Returns:
+            True if the enemy is now moved by the kernel
+        """
+        if id(enemy) not in self._slots:
+            if not supports(enemy):
+                return False
+            self.add(enemy)
+        return True
+
+    def add(self, enemy):
+        """Copy an enemy's pattern state into its pattern group."""
+        group = self.groups[enemy.pattern]
+        self._slots[id(enemy)] = (group, group.add(enemy))
+
+    def remove(self, enemy):
+        """Stop moving an enemy, copying its pattern state back to the sprite."""
+        entry = self._slots.pop(id(enemy), None)
+        if entry is None:
+            return
+        group, slot = entry
+        moved = group.remove(slot)
+        if moved is not None:
+            self._slots[id(moved)] = (group, slot)
+
+    def release_all(self):
+        """Hand every tracked enemy back to its own update()."""
+        for group in self.groups.values():
+            for enemy in list(group.sprites):
+                self.remove(enemy)
+
+    def prune(self):
+        """Drop enemies whose sprite has been killed."""
+        for group in self.groups.values():
+            for enemy in [s for s in group.sprites if not s.alive()]:
+                self.remove(enemy)
+
+    def update(self, player_rect=None):
+        """Advance every tracked enemy one frame."""
+        self.prune()
+        for group in self.groups.values():
+            group.step(player_rect)
+
+    def update_group(self, enemies, player_rect=None):
+        """Move a group of enemies for one frame.
+
+        Small groups are cheaper to move one by one, so enemies are only
+        batched once the group reaches BATCH_THRESHOLD, and handed back
+        when it shrinks below half of that.
+
+        Args:
+            enemies: Sized iterable of enemies, e.g. the game's sprite group
+            player_rect: Player rect for the swoop and flank patterns
+        """
+        count = len(enemies)
+        batched = count >= self.BATCH_THRESHOLD or (
+            bool(self._slots) and count >= self.BATCH_THRESHOLD // 2
+        )
+        if not batched:
+            if self._slots:
+                self.release_all()
+            for enemy in enemies:
+                enemy.update(player_rect)
+            return
+
+        slots = self._slots
+        for enemy in [e for e in enemies if id(e) not in slots]:
+            if not self.track(enemy):
+                enemy.update(player_rect)
+        self.update(player_rect)
@@ -14,6 +14,7 @@ import random
 
 import pygame
 
+from asteroid_sprites import get_asteroid_library
 from constants import SCREEN_HEIGHT, SCREEN_WIDTH
 
 
@@ -33,9 +34,17 @@ class Asteroid(pygame.sprite.Sprite):
         min_r, max_r, self.damage = sizes.get(size, sizes["medium"])
         self.radius = random.randint(min_r, max_r)
 
-        # Create asteroid visual
-        surf_size = self.radius * 2 + 10
-        self.image = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
+        # Visual comes from the shared asteroid library
+        self.library = get_asteroid_library()
+        self.shape = self.library.pick_shape()
+        self.base_color = random.choice(
+            [
+                (80, 70, 60),  # Brown
+                (70, 70, 75),  # Gray
+                (60, 55, 50),  # Dark brown
+            ]
+        )
+        self.angle = random.uniform(0, 360)
         self._draw_asteroid()
 
         self.rect = self.image.get_rect(center=(x, y))
@@ -44,67 +53,21 @@ class Asteroid(pygame.sprite.Sprite):
         self.vy = random.uniform(0.8, 1.5)
         self.vx = random.uniform(-0.3, 0.3)
         self.rotation = random.uniform(-0.5, 0.5)
-        self.angle = random.uniform(0, 360)
 
         # For smooth position
         self.x = float(x)
         self.y = float(y)
 
     def _draw_asteroid(self):
-        """Draw procedural asteroid"""
-        cx, cy = self.image.get_width() // 2, self.image.get_height() // 2
-
-        # Base color - gray/brown rock
-        base_color = random.choice(
-            [
-                (80, 70, 60),  # Brown
-                (70, 70, 75),  # Gray
-                (60, 55, 50),  # Dark brown
-            ]
-        )
-
-        # Draw irregular polygon for asteroid shape
-        num_points = random.randint(7, 12)
-        points = []
-        for i in range(num_points):
-            angle = (i / num_points) * math.pi * 2
-            # Vary radius for irregular shape
-            r = self.radius * random.uniform(0.7, 1.0)
-            px = cx + int(math.cos(angle) * r)
-            py = cy + int(math.sin(angle) * r)
-            points.append((px, py))
-
-        # Draw filled polygon
-        pygame.draw.polygon(self.image, base_color, points)
-
-        # Add highlight on top-left
-        highlight_color = tuple(min(255, c + 40) for c in base_color)
-        for i in range(3):
-            offset = i * 3
-            pygame.draw.circle(
-                self.image,
-                (*highlight_color, 80 - i * 20),
-                (cx - self.radius // 3 + offset, cy - self.radius // 3 + offset),
-                self.radius // 4 - i * 2,
-            )
-
-        # Add craters
-        num_craters = random.randint(2, 5)
-        for _ in range(num_craters):
-            crater_x = cx + random.randint(-self.radius // 2, self.radius // 2)
-            crater_y = cy + random.randint(-self.radius // 2, self.radius // 2)
-            crater_r = random.randint(3, self.radius // 4)
-            crater_color = tuple(max(0, c - 30) for c in base_color)
-            pygame.draw.circle(self.image, crater_color, (crater_x, crater_y), crater_r)
-
-        # Outline
-        pygame.draw.polygon(self.image, (40, 35, 30), points, 2)
+        """Pick the library rotation frame for the current angle"""
+        self.image = self.library.frame(self.radius, self.shape, self.angle, self.base_color)
 
     def update(self):
         """Update asteroid position"""
         self.x += self.vx
         self.y += self.vy
         self.angle += self.rotation
+        self._draw_asteroid()
 
         self.rect.centerx = int(self.x)
         self.rect.centery = int(self.y)
@@ -12,12 +12,18 @@ Usage:
 """
 
 import argparse
+import bisect
+import mmap
+import multiprocessing
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 
 class Severity(Enum):
@@ -101,22 +107,149 @@ PATTERNS = {
 }
 
 
-def scan_file(filepath: Path) -> List[Finding]:
-    """Scan a single file for compliance issues."""
-    findings = []
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+# Below this many files, starting a process pool costs more than it saves
+MIN_PARALLEL_FILES = 1000
+
+# File extensions to scan
+SCAN_EXTENSIONS = {".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".cs", ".go", ".rs", ".rb", ".php"}
+
+# Also check config files
+CONFIG_FILES = {"package.json", "requirements.txt", "Cargo.toml", "go.mod", "pom.xml"}
+
+
+def _byte_pattern(
+    pattern: "re.Pattern[str]",
+) -> Tuple["re.Pattern[bytes]", Optional["re.Pattern[bytes]"]]:
+    """
+    A bytes version of a pattern, and a lowercased one if it ignores case.
+
+    re.IGNORECASE is several times slower than a case-sensitive search, so
+    ignore-case patterns are also lowercased to run against lowercased bytes.
+    bytes.lower() only changes ASCII letters, so offsets and line numbers
+    are unchanged. Patterns with uppercase escapes such as \\S would change
+    meaning when lowercased and get no lowercased version.
+    """
+    source = pattern.pattern.encode()
+    exact = re.compile(source, pattern.flags & ~re.UNICODE)
+    if pattern.flags & re.IGNORECASE and not re.search(rb"\\[A-Z]", source):
+        return exact, re.compile(source.lower())
+    return exact, None
 
-    try:
-        content = filepath.read_text(encoding="utf-8", errors="ignore")
-        lines = content.split("\n")
-    except Exception as e:
-        return [Finding(Severity.INFO, f"Could not read file: {e}", filepath)]
 
-    # Check for ESI usage
-    if not PATTERNS["esi_url"].search(content):
-        return []  # No ESI usage in this file
+# Byte versions of PATTERNS, so files are scanned without decoding them
+BYTE_PATTERNS = {name: _byte_pattern(pattern) for name, pattern in PATTERNS.items()}
+
+# Checks reported once per matching line, in the order they are listed
+LINE_CHECKS = [
+    (
+        "discovery_loop",
+        Severity.CRITICAL,
+        "Potential discovery abuse pattern detected",
+        "Iterating over IDs to discover entities is against TOS",
+    ),
+    (
+        "search_abuse",
+        Severity.CRITICAL,
+        "Potential search endpoint abuse",
+        "Using search to discover entities is bannable",
+    ),
+    (
+        "hardcoded_secret",
+        Severity.CRITICAL,
+        "Hardcoded client secret detected",
+        "Move secrets to environment variables",
+    ),
+    (
+        "plaintext_token",
+        Severity.WARNING,
+        "Potential plaintext token storage",
+        "Consider encrypting stored tokens",
+    ),
+]
+
+
+@contextmanager
+def _file_bytes(filepath: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """A file's contents, memory-mapped if it is large."""
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+class _LineIndex:
+    """Line numbers for byte offsets, built only when a finding needs one."""
+
+    def __init__(self, data: Union[bytes, mmap.mmap]):
+        self.data = data
+        self._starts: Optional[List[int]] = None
+
+    def line(self, offset: int) -> int:
+        if self._starts is None:
+            self._starts = [m.end() for m in re.finditer(b"\n", self.data)]
+        return bisect.bisect_right(self._starts, offset) + 1
+
+
+def _matching_lines(pattern: "re.Pattern[bytes]", data: Union[bytes, mmap.mmap]) -> Iterator[int]:
+    """
+    Start offset of each line that pattern matches on its own.
+
+    The whole buffer is searched at once rather than line by line. A hit is
+    confirmed against its own line, since patterns using \\s or negated
+    classes could otherwise match across a newline.
+    """
+    pos = 0
+    end = len(data)
+    while pos < end:
+        match = pattern.search(data, pos)
+        if match is None:
+            return
+        line_start = data.rfind(b"\n", 0, match.start()) + 1
+        line_end = data.find(b"\n", match.start())
+        if line_end == -1:
+            line_end = end
+        if pattern.search(data, line_start, line_end):
+            yield line_start
+        pos = line_end + 1
+
+
+class _Contents:
+    """
+    A file's bytes, and the lowercased copy the folded patterns run against.
+
+    The copy is made the first time a pattern needs it. Memory-mapped files
+    are never copied; they are searched with the re.IGNORECASE patterns.
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap]):
+        self.data = data
+        self._folded: Optional[bytes] = None
+
+    def target(self, name: str) -> Tuple["re.Pattern[bytes]", Union[bytes, mmap.mmap]]:
+        """The pattern to run for PATTERNS[name], and the bytes to run it on."""
+        exact, folded = BYTE_PATTERNS[name]
+        if folded is None or isinstance(self.data, mmap.mmap):
+            return exact, self.data
+        if self._folded is None:
+            self._folded = self.data.lower()
+        return folded, self._folded
+
+    def search(self, name: str) -> bool:
+        pattern, data = self.target(name)
+        return pattern.search(data) is not None
+
+
+def _esi_findings(contents: _Contents, filepath: Path) -> List[Finding]:
+    """Findings for a file already known to use ESI."""
+    findings = []
 
     # Check for User-Agent header
-    if not PATTERNS["user_agent_set"].search(content):
+    if not contents.search("user_agent_set"):
         findings.append(
             Finding(
                 Severity.WARNING,
@@ -127,7 +260,7 @@ def scan_file(filepath: Path) -> List[Finding]:
         )
 
     # Check for cache header handling
-    if not PATTERNS["cache_handling"].search(content):
+    if not contents.search("cache_handling"):
         findings.append(
             Finding(
                 Severity.WARNING,
@@ -138,7 +271,7 @@ def scan_file(filepath: Path) -> List[Finding]:
         )
 
     # Check for error limit handling
-    if not PATTERNS["error_limit"].search(content):
+    if not contents.search("error_limit"):
         findings.append(
             Finding(
                 Severity.WARNING,
@@ -148,54 +281,19 @@ def scan_file(filepath: Path) -> List[Finding]:
             )
         )
 
-    # Check for discovery abuse patterns
-    for i, line in enumerate(lines, 1):
-        if PATTERNS["discovery_loop"].search(line):
-            findings.append(
-                Finding(
-                    Severity.CRITICAL,
-                    "Potential discovery abuse pattern detected",
-                    filepath,
-                    i,
-                    "Iterating over IDs to discover entities is against TOS",
-                )
-            )
-
-        if PATTERNS["search_abuse"].search(line):
-            findings.append(
-                Finding(
-                    Severity.CRITICAL,
-                    "Potential search endpoint abuse",
-                    filepath,
-                    i,
-                    "Using search to discover entities is bannable",
-                )
-            )
-
-        if PATTERNS["hardcoded_secret"].search(line):
-            findings.append(
-                Finding(
-                    Severity.CRITICAL,
-                    "Hardcoded client secret detected",
-                    filepath,
-                    i,
-                    "Move secrets to environment variables",
-                )
-            )
-
-        if PATTERNS["plaintext_token"].search(line):
-            findings.append(
-                Finding(
-                    Severity.WARNING,
-                    "Potential plaintext token storage",
-                    filepath,
-                    i,
-                    "Consider encrypting stored tokens",
-                )
+    # Check for discovery abuse, secrets and tokens, reported by line
+    lines = _LineIndex(contents.data)
+    line_findings = []
+    for order, (name, severity, message, suggestion) in enumerate(LINE_CHECKS):
+        for line_start in _matching_lines(*contents.target(name)):
+            line = lines.line(line_start)
+            line_findings.append(
+                (line, order, Finding(severity, message, filepath, line, suggestion))
             )
+    findings.extend(finding for _, _, finding in sorted(line_findings, key=lambda f: f[:2]))
 
     # Check for rate limiting
-    if not PATTERNS["rate_limit"].search(content):
+    if not contents.search("rate_limit"):
         findings.append(
             Finding(
                 Severity.INFO,
@@ -206,9 +304,7 @@ def scan_file(filepath: Path) -> List[Finding]:
         )
 
     # Check for versioned endpoints
-    if PATTERNS["unversioned_endpoint"].search(content) and not PATTERNS[
-        "versioned_endpoint"
-    ].search(content):
+    if contents.search("unversioned_endpoint") and not contents.search("versioned_endpoint"):
         findings.append(
             Finding(
                 Severity.WARNING,
@@ -221,40 +317,87 @@ def scan_file(filepath: Path) -> List[Finding]:
     return findings
 
 
-def scan_project(project_path: Path, verbose: bool = False) -> ComplianceReport:
-    """Scan entire project for ESI compliance."""
-    report = ComplianceReport()
+def scan_file(filepath: Path) -> List[Finding]:
+    """Scan a single file for compliance issues."""
+    try:
+        with _file_bytes(filepath) as data:
+            contents = _Contents(data)
+            # Check for ESI usage
+            if not contents.search("esi_url"):
+                return []  # No ESI usage in this file
+            return _esi_findings(contents, filepath)
+    except Exception as e:
+        return [Finding(Severity.INFO, f"Could not read file: {e}", filepath)]
+
+
+class FileScan(NamedTuple):
+    """What scan_project learns from one file."""
+
+    readable: bool
+    esi_usage: bool = False
+    image_server_usage: bool = False
+    sso_usage: bool = False
+    findings: List[Finding] = []
+
+
+def _scan_path(filepath: Path) -> FileScan:
+    """Read a file once for both usage detection and findings."""
+    try:
+        with _file_bytes(filepath) as data:
+            contents = _Contents(data)
+            esi = contents.search("esi_url")
+            return FileScan(
+                True,
+                esi,
+                contents.search("image_server"),
+                contents.search("sso_url"),
+                _esi_findings(contents, filepath) if esi else [],
+            )
+    except Exception:
+        return FileScan(False)
 
-    # File extensions to scan
-    extensions = {".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".cs", ".go", ".rs", ".rb", ".php"}
 
-    # Also check config files
-    config_files = {"package.json", "requirements.txt", "Cargo.toml", "go.mod", "pom.xml"}
+def scan_project(
+    project_path: Path, verbose: bool = False, workers: Optional[int] = None
+) -> ComplianceReport:
+    """
+    Scan entire project for ESI compliance.
 
+    Each file is read once (memory-mapped if large). Most files have no
+    ESI URL, so they cost three literal searches. Large projects are split
+    across a process pool.
+    """
+    report = ComplianceReport()
+
+    paths = []
     for filepath in project_path.rglob("*"):
         if filepath.is_file():
-            if filepath.suffix in extensions or filepath.name in config_files:
+            if filepath.suffix in SCAN_EXTENSIONS or filepath.name in CONFIG_FILES:
                 if verbose:
                     print(f"Scanning: {filepath}")
+                paths.append(filepath)
+    report.files_scanned = len(paths)
 
-                report.files_scanned += 1
-
-                try:
-                    content = filepath.read_text(encoding="utf-8", errors="ignore")
-                except Exception:
-                    continue
-
-                # Detect usage types
-                if PATTERNS["esi_url"].search(content):
-                    report.esi_usage_detected = True
-                if PATTERNS["image_server"].search(content):
-                    report.image_server_usage = True
-                if PATTERNS["sso_url"].search(content):
-                    report.sso_usage = True
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < MIN_PARALLEL_FILES:
+        scans: Iterable[FileScan] = map(_scan_path, paths)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        scans = pool.map(_scan_path, paths, chunksize=max(1, len(paths) // (workers * 4)))
 
-                # Get findings
-                findings = scan_file(filepath)
-                report.findings.extend(findings)
+    try:
+        for scan in scans:
+            if not scan.readable:
+                continue
+            # Detect usage types
+            report.esi_usage_detected |= scan.esi_usage
+            report.image_server_usage |= scan.image_server_usage
+            report.sso_usage |= scan.sso_usage
+            report.findings.extend(scan.findings)
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     return report
 
@@ -321,6 +464,7 @@ def main():
     parser.add_argument("path", type=Path, help="Project directory to scan")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show files being scanned")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--workers", type=int, help="Scan processes (default: CPU count)")
 
     args = parser.parse_args()
 
@@ -328,7 +472,7 @@ def main():
         print(f"Error: Path does not exist: {args.path}")
         sys.exit(1)
 
-    report = scan_project(args.path, args.verbose)
+    report = scan_project(args.path, args.verbose, args.workers)
 
     if args.json:
         import json
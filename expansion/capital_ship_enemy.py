@@ -21,7 +21,7 @@ import random
 
 import pygame
 
-from sprites import Enemy, EnemyBullet
+from sprites import Enemy
 
 
 class CapitalShipEnemy(Enemy):
@@ -51,6 +51,8 @@ class CapitalShipEnemy(Enemy):
         Milliseconds between turret salvos.
     last_salvo : int
         Timestamp (in pygame ticks) of the last salvo fired.
+    pending_shots : list[tuple[float, float, float, float, int]]
+        Turret shots (x, y, dx, dy, damage) not yet handed to the game.
     """
 
     def __init__(self, x: int, difficulty: dict[str, float] | None = None) -> None:
@@ -69,6 +71,8 @@ class CapitalShipEnemy(Enemy):
         # Control firing cadence for salvos
         self.salvo_interval: int = self.fire_rate  # Use base fire rate as interval
         self.last_salvo: int = pygame.time.get_ticks()
+        # Turret shots waiting for the next aim() call
+        self.pending_shots: list[tuple[float, float, float, float, int]] = []
 
     def update(self, *args, **kwargs) -> None:
         """
@@ -91,21 +95,13 @@ class CapitalShipEnemy(Enemy):
             self._fire_turret_salvo()
 
     def _fire_turret_salvo(self) -> None:
-        """Spawn bullets from each turret.
+        """Queue a shot from each turret.
 
-        Creates ``EnemyBullet`` objects for each turret and adds them to the
-        same sprite group as the capital ship (``self.groups()[0]``) so
-        they are updated and drawn automatically by Pygame.  Bullets
-        inherit damage from the ``Enemy`` class.
+        Turret shots are held in ``pending_shots`` and handed out by the
+        next :meth:`aim` call, so they reach the game through the same
+        ``fire``/``shoot`` path as the base enemy's own fire (and end up in
+        the game's ``EnemyBulletEngine``).
         """
-        # Determine the parent sprite group to insert bullets into.
-        # If this enemy is not added to any group yet, bail out.
-        groups = self.groups()
-        if not groups:
-            return
-        group = groups[0]
-
-        # Loop through turret offsets and spawn bullets
         for offset in self.turret_offsets:
             # Compute absolute position for bullet spawn
             bx = self.rect.centerx + offset[0]
@@ -115,7 +111,10 @@ class CapitalShipEnemy(Enemy):
             dx = random.uniform(-1.0, 1.0)
             dy = 3.0  # constant downward speed
 
-            bullet = EnemyBullet(bx, by, dx, dy, damage=20)  # Capital ship turret damage
-            group.add(bullet)
+            self.pending_shots.append((bx, by, dx, dy, 20))  # Capital ship turret damage
 
-        # Optionally play a sound effect here (requires sound manager)
+    def aim(self, player_rect) -> list[tuple[float, float, float, float, int]]:
+        """Aimed fire from the base class plus any queued turret salvo."""
+        shots = super().aim(player_rect) + self.pending_shots
+        self.pending_shots = []
+        return shots
@@ -4,6 +4,10 @@ EVE Ship Render Bulk Downloader
 
 Downloads ship renders and icons from the EVE Image Server for local use.
 
+Files already in the output directory are skipped, so an interrupted run
+resumes where it stopped; --revalidate re-checks them against the ETags
+saved in manifest.json.
+
 Usage:
     python fetch_ship_renders.py --output ./assets/ships
     python fetch_ship_renders.py --ships 587,593,621 --sizes 64,256
@@ -11,12 +15,11 @@ Usage:
 """
 
 import argparse
-import asyncio
 import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import httpx
+from core.downloader import DownloadJob, DownloadOutcome, download_files
 
 # Common ship type IDs organized by class
 SHIP_CLASSES = {
@@ -119,49 +122,36 @@ IMAGE_SERVER = "https://images.evetech.net"
 VALID_SIZES = [32, 64, 128, 256, 512, 1024]
 
 
-async def download_image(
-    client: httpx.AsyncClient,
-    type_id: int,
-    variation: str,
-    size: int,
-    output_dir: Path,
-    name: Optional[str] = None,
-) -> bool:
-    """Download a single image from the EVE Image Server."""
-    url = f"{IMAGE_SERVER}/types/{type_id}/{variation}?size={size}"
+def image_job(
+    type_id: int, variation: str, size: int, output_dir: Path, name: Optional[str] = None
+) -> DownloadJob:
+    """The download job for one image from the EVE Image Server."""
+    return DownloadJob(
+        f"{IMAGE_SERVER}/types/{type_id}/{variation}?size={size}",
+        output_dir / f"{name or type_id}_{variation}_{size}.png",
+    )
 
-    filename = f"{name or type_id}_{variation}_{size}.png"
-    output_path = output_dir / filename
 
-    if output_path.exists():
+def report_outcome(outcome: DownloadOutcome):
+    """Print one line per finished image."""
+    filename = outcome.job.path.name
+    if outcome.status == "cached":
         print(f"  ⏭️  Skipped (exists): {filename}")
-        return True
-
-    try:
-        response = await client.get(url, follow_redirects=True)
-
-        if response.status_code == 200:
-            output_path.write_bytes(response.content)
-            print(f"  ✅ Downloaded: {filename}")
-            return True
-        elif response.status_code == 302:
-            print(f"  ⚠️  Not found (placeholder returned): {filename}")
-            return False
-        else:
-            print(f"  ❌ Failed ({response.status_code}): {filename}")
-            return False
+    elif outcome.status == "not_modified":
+        print(f"  ⏭️  Unchanged: {filename}")
+    elif outcome.ok:
+        print(f"  ✅ Downloaded: {filename}")
+    else:
+        print(f"  ❌ Failed ({outcome.error}): {filename}")
 
-    except Exception as e:
-        print(f"  ❌ Error: {filename} - {e}")
-        return False
 
-
-async def download_ship_set(
+def download_ship_set(
     ship_ids: List[int],
     sizes: List[int],
     variations: List[str],
     output_dir: Path,
     names: Optional[Dict[int, str]] = None,
+    revalidate: bool = False,
 ):
     """Download images for multiple ships."""
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -171,24 +161,26 @@ async def download_ship_set(
     print(f"   Variations: {variations}")
     print("-" * 40)
 
-    total = len(ship_ids) * len(sizes) * len(variations)
-    success = 0
-    failed = 0
+    jobs = [
+        image_job(ship_id, variation, size, output_dir, names.get(ship_id) if names else None)
+        for ship_id in ship_ids
+        for variation in variations
+        for size in sizes
+    ]
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for ship_id in ship_ids:
-            name = names.get(ship_id) if names else None
-            print(f"\n🚀 {name or ship_id}:")
+    # ETags from earlier runs into this directory
+    manifest_path = output_dir / "manifest.json"
+    try:
+        validators = json.loads(manifest_path.read_text()).get("validators", {})
+    except (OSError, ValueError, AttributeError):
+        validators = {}
 
-            for variation in variations:
-                for size in sizes:
-                    if await download_image(client, ship_id, variation, size, output_dir, name):
-                        success += 1
-                    else:
-                        failed += 1
+    outcomes = download_files(jobs, validators, revalidate=revalidate, progress=report_outcome)
+    success = sum(1 for outcome in outcomes if outcome.ok)
+    failed = len(outcomes) - success
 
     print("\n" + "=" * 40)
-    print(f"📊 Results: {success} downloaded, {failed} failed, {total} total")
+    print(f"📊 Results: {success} downloaded, {failed} failed, {len(jobs)} total")
 
     # Save manifest
     manifest = {
@@ -196,8 +188,8 @@ async def download_ship_set(
         "sizes": sizes,
         "variations": variations,
         "total_files": success,
+        "validators": validators,
     }
-    manifest_path = output_dir / "manifest.json"
     manifest_path.write_text(json.dumps(manifest, indent=2))
     print(f"📝 Manifest saved: {manifest_path}")
 
@@ -260,6 +252,11 @@ Available ship classes: frigates, destroyers, cruisers, battlecruisers,
         default="render",
         help="Comma-separated variations: render,icon,bp (default: render)",
     )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-check existing files with conditional requests",
+    )
     parser.add_argument("--list", action="store_true", help="List available ships and exit")
 
     args = parser.parse_args()
@@ -308,7 +305,7 @@ Available ship classes: frigates, destroyers, cruisers, battlecruisers,
         return
 
     # Run download
-    asyncio.run(download_ship_set(ship_ids, sizes, variations, args.output, names))
+    download_ship_set(ship_ids, sizes, variations, args.output, names, args.revalidate)
 
 
 if __name__ == "__main__":
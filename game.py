@@ -5,16 +5,33 @@ from platform_init import init_platform
 
 init_platform()
 
+import os
 import random
 
 import pygame
 
+from bullet_engine import EnemyBulletEngine
 from constants import *
 from controller_input import ControllerInput, XboxButton
+from core.asset_cache import get_asset_cache
+from core.loader import get_data_store
+from core.persistence import get_persistence
+from core.sprite_atlas import SpriteBatch, get_sprite_atlas
+from core.stage_compiler import get_stage_compiler, roll_stage
+from enemy_movement import EnemyMovementKernel
 from high_scores import AchievementManager, HighScoreManager
 from sounds import get_music_manager, get_sound_manager
 from space_background import SpaceBackground
-from sprites import Enemy, Explosion, Player, Powerup, PowerupPickupEffect, RefugeePod, Star
+from sprites import (
+    Enemy,
+    Explosion,
+    Player,
+    Powerup,
+    PowerupPickupEffect,
+    RefugeePod,
+    Star,
+    enemy_bullet_image,
+)
 from visual_effects import ParticleSystem
 
 
@@ -43,6 +60,24 @@ class ScreenShake:
         return self.offset_x, self.offset_y
 
 
+class StaticScreenCache:
+    """Last composed frame of a screen that only changes when its inputs do.
+
+    Used for dirty-rect rendering: while the inputs key is unchanged the
+    display is left alone except for small per-frame regions (debug overlay).
+    """
+
+    def __init__(self, size):
+        self.surface = pygame.Surface(size)
+        self.key = None
+        self.overlay_rect = None
+
+    def invalidate(self):
+        """Force the next static frame to be composed from scratch"""
+        self.key = None
+        self.overlay_rect = None
+
+
 class Game:
     """Main game class"""
 
@@ -59,6 +94,16 @@ class Game:
         self.font_large = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 22)
 
+        # Batched sprite drawing (uses the baked sprite atlas when present)
+        self.sprite_batch = SpriteBatch(get_sprite_atlas())
+        self.show_debug = bool(os.environ.get("EVE_REBELLION_DEBUG"))
+        # Pick up edits to data/ (patterns, stages) without restarting
+        if os.environ.get("EVE_REBELLION_HOT_RELOAD"):
+            get_data_store().start_watching()
+
+        # Dirty-rect rendering for menus and other static screens
+        self.static_screen = StaticScreenCache((SCREEN_WIDTH, SCREEN_HEIGHT))
+
         # Controller (optional)
         self.controller = ControllerInput()
         # Initialize sound
@@ -108,8 +153,10 @@ class Game:
         # Sprite groups
         self.all_sprites = pygame.sprite.Group()
         self.player_bullets = pygame.sprite.Group()
-        self.enemy_bullets = pygame.sprite.Group()
+        self.enemy_bullets = EnemyBulletEngine()
+        self.enemy_bullets.add_stamp("laser", enemy_bullet_image())
         self.enemies = pygame.sprite.Group()
+        self.enemy_movement = EnemyMovementKernel()
         self.pods = pygame.sprite.Group()
         self.powerups = pygame.sprite.Group()
         self.effects = pygame.sprite.Group()
@@ -123,13 +170,21 @@ class Game:
         self.current_wave = 0
         self.wave_enemies = 0
         self.wave_spawned = 0
-        self.spawn_timer = 0
+        self.wave_frame = 0
         self.wave_delay = 0
         self.stage_complete = False
+        self._stage_timeline = None
+        # Enemy types and industrials are rolled from this per run
+        self.run_seed = random.randrange(2**32)
+        self.run_rng = random.Random(self.run_seed)
 
         # Messages
         self.message = ""
         self.message_timer = 0
+        self.achievement_announcements = []
+
+        # Achievements are unlocked live from this run's events
+        self.run_achievements = self.achievements.start_run(difficulty=self.difficulty)
 
         # Clear particle effects on reset
         self.particle_system.clear()
@@ -139,17 +194,29 @@ class Game:
         self.message = text
         self.message_timer = duration
 
-    def spawn_wave(self):
-        """Spawn enemies for current wave"""
+    def announce_achievements(self, unlocked):
+        """Queue an on-screen notice for each achievement unlocked mid-run"""
+        for achievement_id in unlocked:
+            info = self.achievements.get_achievement_info(achievement_id)
+            self.achievement_announcements.append(f"ACHIEVEMENT UNLOCKED: {info['name']}")
+
+    def stage_timeline(self):
+        """Spawn timeline for the current stage, rolled for this run"""
         stage = self.current_stages[self.current_stage]
+        cached = self._stage_timeline
+        if cached is None or cached[0] is not stage or cached[1] != self.current_stage:
+            plan = get_stage_compiler().compile(stage, self.current_stage)
+            timeline = roll_stage(plan, self.run_rng)
+            cached = self._stage_timeline = (stage, self.current_stage, timeline)
+        return cached[2]
 
-        # Determine wave composition
-        num_enemies = 3 + self.current_wave + self.current_stage
+    def spawn_wave(self):
+        """Spawn enemies for current wave"""
+        wave = self.stage_timeline().waves[self.current_wave]
 
         # Check for boss wave
-        if stage["boss"] and self.current_wave == stage["waves"] - 1:
-            # Boss wave
-            boss_type = stage["boss"]
+        if wave.boss:
+            boss_type = wave.boss
 
             # Use specialized CapitalShipEnemy class for amarr_capital
             if boss_type == "amarr_capital":
@@ -165,34 +232,18 @@ class Game:
             self.play_sound("warning")
             return
 
-        # Regular wave
-        self.wave_enemies = num_enemies
+        # Regular wave, played back from the compiled timeline
+        self.wave_enemies = len(wave.spawns)
         self.wave_spawned = 0
-
-        # Maybe spawn industrial
-        if random.random() < stage["industrial_chance"]:
-            self.wave_enemies += 1
+        self.wave_frame = 0
 
     def spawn_enemy(self):
-        """Spawn a single enemy"""
+        """Spawn the next enemy of the current wave"""
         if self.wave_spawned >= self.wave_enemies:
             return
 
-        stage = self.current_stages[self.current_stage]
-
-        # Chance for industrial
-        if (
-            self.wave_spawned == self.wave_enemies - 1
-            and random.random() < stage["industrial_chance"] * 2
-        ):
-            enemy_type = "bestower"
-        else:
-            enemy_type = random.choice(stage["enemies"])
-
-        x = random.randint(50, SCREEN_WIDTH - 50)
-        y = -50
-
-        enemy = Enemy(enemy_type, x, y, self.difficulty_settings)
+        spawn = self.stage_timeline().waves[self.current_wave].spawns[self.wave_spawned]
+        enemy = Enemy(spawn.enemy_type, spawn.x, spawn.y, self.difficulty_settings)
         self.enemies.add(enemy)
         self.all_sprites.add(enemy)
         self.wave_spawned += 1
@@ -221,6 +272,10 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            # Window contents may be lost while hidden - redraw everything
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                self.static_screen.invalidate()
+
             if event.type == pygame.KEYDOWN:
                 # F5 to rescan for controllers (works in any state)
                 if event.key == pygame.K_F5:
@@ -491,16 +546,12 @@ class Game:
         self.last_score_rank = rank
         self.is_new_high_score = is_new
 
-        # Check achievements
-        game_stats = {
-            "score": self.player.score,
-            "refugees": self.player.total_refugees,
-            "stage": self.current_stage + 1,
-            "victory": victory,
-            "ship": ship_type,
-            "difficulty": self.difficulty,
-        }
-        self.achievements.check_achievements(game_stats)
+        # Settle the run's achievements and save them with its stats
+        tracker = self.run_achievements
+        tracker.record_score(self.player.score)
+        tracker.record_refugees(self.player.total_refugees)
+        tracker.record_stage(self.current_stage + 1)
+        tracker.finish(victory, ship=ship_type)
 
     def handle_shop_input(self, key):
         """Handle shop menu input"""
@@ -610,13 +661,13 @@ class Game:
         if self.menu_cooldown > 0:
             self.menu_cooldown -= 1
 
-        # Update scrolling background
-        if hasattr(self, "space_background"):
-            self.space_background.update(2.0)
-
         if self.state != "playing":
             return
 
+        # Update scrolling background (frozen behind pause/game over screens)
+        if hasattr(self, "space_background"):
+            self.space_background.update(2.0)
+
         keys = pygame.key.get_pressed()
         # Update player
         self.player.update(keys)
@@ -675,9 +726,8 @@ class Game:
         self.player_bullets.update()
         self.enemy_bullets.update()
 
-        # Update enemies with player position for AI
-        for enemy in self.enemies:
-            enemy.update(self.player.rect)
+        # Update enemies with player position for AI (batched for big waves)
+        self.enemy_movement.update_group(self.enemies, self.player.rect)
 
         self.pods.update()
         # Update powerups with player position for LOD
@@ -694,12 +744,8 @@ class Game:
 
         # Enemy shooting
         for enemy in self.enemies:
-            bullets = enemy.shoot(self.player.rect)
-            if bullets:
+            if enemy.fire(self.player.rect, self.enemy_bullets):
                 self.play_sound("laser", 0.2)
-            for bullet in bullets:
-                self.enemy_bullets.add(bullet)
-                self.all_sprites.add(bullet)
 
         # Check collisions - player bullets vs enemies
         for bullet in self.player_bullets:
@@ -718,6 +764,10 @@ class Game:
                 if enemy.take_damage(bullet):
                     # Enemy destroyed
                     self.player.score += enemy.score
+                    self.announce_achievements(
+                        self.run_achievements.record_kill()
+                        + self.run_achievements.record_score(self.player.score)
+                    )
 
                     # Screen shake based on enemy size
                     if enemy.is_boss:
@@ -758,12 +808,13 @@ class Game:
                 break
 
         # Enemy bullets vs player
-        hits = pygame.sprite.spritecollide(self.player, self.enemy_bullets, True)
-        for bullet in hits:
-            damage = int(bullet.damage * self.difficulty_settings["enemy_damage_mult"])
+        hits = self.enemy_bullets.collide(
+            self.player.rect.centerx, self.player.rect.centery, PLAYER_HITBOX_RADIUS
+        )
+        for hit_x, hit_y, bullet_damage in hits:
+            damage = int(bullet_damage * self.difficulty_settings["enemy_damage_mult"])
 
             # Emit hit particles based on which layer will take damage
-            hit_x, hit_y = bullet.rect.centerx, bullet.rect.centery
             if self.player.shields > 0:
                 self.particle_system.emit_shield_impact(hit_x, hit_y, radius=20)
                 self.play_sound("shield_hit", 0.5)
@@ -807,6 +858,10 @@ class Game:
         hits = pygame.sprite.spritecollide(self.player, self.pods, True)
         for pod in hits:
             self.player.collect_refugee(pod.count)
+            self.announce_achievements(
+                self.run_achievements.record_refugees(self.player.total_refugees)
+                + self.run_achievements.record_score(self.player.score)
+            )
             self.play_sound("pickup_refugee", 0.5)
 
         # Collect powerups
@@ -833,6 +888,8 @@ class Game:
         # Update message timer
         if self.message_timer > 0:
             self.message_timer -= 1
+        elif self.achievement_announcements:
+            self.show_message(self.achievement_announcements.pop(0), 120)
 
     def apply_powerup(self, powerup):
         """Apply powerup effect to player"""
@@ -874,7 +931,7 @@ class Game:
 
     def update_waves(self):
         """Handle wave progression"""
-        stage = self.current_stages[self.current_stage]
+        waves = self.stage_timeline().waves
 
         # Wave delay
         if self.wave_delay > 0:
@@ -883,16 +940,18 @@ class Game:
 
         # Need to spawn wave?
         if self.wave_enemies == 0 and not self.stage_complete:
-            if self.current_wave < stage["waves"]:
+            if self.current_wave < len(waves):
                 self.spawn_wave()
-                if not (stage["boss"] and self.current_wave == stage["waves"] - 1):
-                    self.show_message(f"Wave {self.current_wave + 1}/{stage['waves']}", 90)
+                if not waves[self.current_wave].boss:
+                    self.show_message(f"Wave {self.current_wave + 1}/{len(waves)}", 90)
                     self.play_sound("wave_start", 0.4)
 
-        # Spawn enemies gradually
-        self.spawn_timer += 1
-        if self.spawn_timer >= 45 and self.wave_spawned < self.wave_enemies:
-            self.spawn_timer = 0
+        # Spawn enemies as their timeline frames come due
+        self.wave_frame += 1
+        while (
+            self.wave_spawned < self.wave_enemies
+            and waves[self.current_wave].spawns[self.wave_spawned].frame <= self.wave_frame
+        ):
             self.spawn_enemy()
 
         # Wave complete?
@@ -907,10 +966,13 @@ class Game:
             self.wave_delay = 90
 
             # Stage complete?
-            if self.current_wave >= stage["waves"]:
+            if self.current_wave >= len(waves):
                 self.stage_complete = True
                 self.wave_delay = 120
                 self.show_message("STAGE COMPLETE!", 120)
+                self.announce_achievements(
+                    self.run_achievements.record_stage(self.current_stage + 1)
+                )
                 self.play_sound("stage_complete")
                 # Go to shop after delay
                 pygame.time.set_timer(pygame.USEREVENT + 1, 2000, 1)
@@ -920,8 +982,82 @@ class Game:
             if self.stage_complete:
                 self.state = "shop"
 
+    def static_screen_key(self):
+        """Everything a non-gameplay screen shows, or None if it must redraw every frame.
+
+        Outside "playing" nothing moves (sprites, stars and background only
+        update during gameplay), so these screens only change with this key.
+        """
+        if self.state == "playing" or self.shake.intensity > 0:
+            return None
+        player = self.player
+        return (
+            self.state,
+            bool(self.controller and self.controller.connected),
+            self.menu_selection,
+            self.selected_chapter,
+            self.difficulty,
+            self.sound_enabled,
+            self.music_enabled,
+            self.last_score_rank,
+            self.is_new_high_score,
+            len(self.high_scores.scores),
+            player.score,
+            player.refugees,
+            player.total_refugees,
+            player.is_wolf,
+            player.has_gyro,
+            player.has_tracking,
+            tuple(player.unlocked_ammo),
+        )
+
     def draw(self):
         """Render everything"""
+        self.sprite_batch.begin_frame()
+
+        key = self.static_screen_key()
+        if key is not None:
+            self.draw_static_screen(key)
+            return
+        self.static_screen.invalidate()
+
+        self.compose_frame()
+        if self.show_debug:
+            self.draw_debug_overlay(self.render_surface)
+
+        # Apply screen shake
+        shake_x, shake_y = self.shake.offset_x, self.shake.offset_y
+        self.screen.blit(self.render_surface, (shake_x, shake_y))
+
+        pygame.display.flip()
+
+    def draw_static_screen(self, key):
+        """Dirty-rect rendering for screens that only change with their inputs"""
+        cache = self.static_screen
+        if key != cache.key:
+            # Inputs changed - compose once and push the whole frame
+            self.compose_frame()
+            cache.surface.blit(self.render_surface, (0, 0))
+            cache.key = key
+            cache.overlay_rect = None
+            self.screen.blit(cache.surface, (0, 0))
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = []
+
+        if self.show_debug:
+            # Restore what was under last frame's overlay, then redraw it
+            if cache.overlay_rect is not None:
+                self.screen.blit(cache.surface, cache.overlay_rect, cache.overlay_rect)
+                dirty.append(cache.overlay_rect)
+            cache.overlay_rect = self.draw_debug_overlay(self.screen)
+            dirty.append(cache.overlay_rect)
+
+        if dirty:
+            pygame.display.update(dirty)
+
+    def compose_frame(self):
+        """Draw the current state's screen onto the render surface"""
         # Draw to render surface first (for screen shake)
         self.render_surface.fill((10, 10, 20))
 
@@ -950,11 +1086,28 @@ class Game:
         elif self.state == "leaderboard":
             self.draw_leaderboard()
 
-        # Apply screen shake
-        shake_x, shake_y = self.shake.offset_x, self.shake.offset_y
-        self.screen.blit(self.render_surface, (shake_x, shake_y))
-
-        pygame.display.flip()
+    def draw_debug_overlay(self, surface):
+        """Draw frame timing and render stats (EVE_REBELLION_DEBUG)
+
+        Returns:
+            The rect covered by the overlay text.
+        """
+        batch = self.sprite_batch.stats()
+        cache = get_asset_cache().stats()
+        lines = [
+            f"FPS {self.clock.get_fps():.0f}",
+            f"sprites {batch['sprites']} (atlas {batch['atlas_sprites']}) "
+            f"blit calls {batch['blit_calls']} enemy bullets {len(self.enemy_bullets)}",
+            f"asset cache {cache['entries']} / {cache['bytes'] / (1024 * 1024):.1f}MB "
+            f"hit {100 * cache['hit_rate']:.0f}%",
+        ]
+        y = 8
+        covered = pygame.Rect(SCREEN_WIDTH - 10, y, 0, 0)
+        for line in lines:
+            text = self.font_small.render(line, True, (120, 255, 120))
+            covered.union_ip(surface.blit(text, (SCREEN_WIDTH - text.get_width() - 10, y)))
+            y += 18
+        return covered
 
     def draw_difficulty(self):
         """Draw difficulty selection screen"""
@@ -1036,9 +1189,8 @@ class Game:
                 bullet.draw_trail(self.render_surface)
 
         # Draw sprites
-        for sprite in self.all_sprites:
-            if sprite != self.player:
-                self.render_surface.blit(sprite.image, sprite.rect)
+        self.sprite_batch.draw(self.render_surface, self.all_sprites, exclude=self.player)
+        self.enemy_bullets.draw(self.render_surface)
 
         # Draw player last (on top)
         self.render_surface.blit(self.player.image, self.player.rect)
@@ -1567,6 +1719,8 @@ class Game:
             self.update()
             self.draw()
 
+        self.achievements.flush()
+        get_persistence().close()
         pygame.quit()
 
 
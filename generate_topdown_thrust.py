@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 """
 Generate thrust effects for top-down orthographic ship sprites.
+
+Each ship's animation is written as one horizontal sprite strip,
+<ship>_topdown_thrust.png, so the game decodes one image per ship rather
+than one per frame. topdown_thrust.json records each strip's frame layout,
+plus the recipe and source sprite mtime it was built from. A run rebuilds
+only strips that are missing or out of date, in parallel across ships.
 """
 
+import argparse
+import json
 import math
+import multiprocessing
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 import pygame
 
@@ -102,6 +113,12 @@ GALLENTE_SHIPS = [
 
 SPRITE_DIR = os.path.join(os.path.dirname(__file__), "assets", "ship_sprites")
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "assets", "ships", "effects")
+MANIFEST_NAME = "topdown_thrust.json"
+
+# Bump RECIPE_VERSION when the drawing code changes so every strip rebuilds
+RECIPE_VERSION = 1
+FRAMES = 6
+THRUST_EXTENT = 50  # Extra pixels below the ship for the plume
 
 
 def get_thrust_colors(ship_name):
@@ -156,24 +173,23 @@ def draw_glow_circle(surface, x, y, radius, color, alpha):
     surface.blit(glow, (x - radius, y - radius), special_flags=pygame.BLEND_RGBA_ADD)
 
 
-def generate_thrust_frames(ship_name, frames=6):
-    """Generate thrust effect frames for a ship sprite."""
-    sprite_path = os.path.join(SPRITE_DIR, f"{ship_name}.png")
-
-    if not os.path.exists(sprite_path):
-        print(f"  [SKIP] {ship_name} - sprite not found")
-        return []
+def render_thrust_frames(base_surface, thrust_colors, frames=6, target=None):
+    """
+    Draw thrust animation frames for a ship surface.
 
-    # Load the sprite
-    base_surface = pygame.image.load(sprite_path).convert_alpha()
+    Frames are drawn straight into target, a strip of frames laid out left
+    to right, if one is given; otherwise each frame gets its own surface.
+    """
     width, height = base_surface.get_size()
-
-    thrust_colors = get_thrust_colors(ship_name)
+    frame_height = height + THRUST_EXTENT
     thrust_frames = []
 
     for i in range(frames):
         # Create surface with extra space for thrust
-        thrust = pygame.Surface((width, height + 50), pygame.SRCALPHA)
+        if target is not None:
+            thrust = target.subsurface((i * width, 0, width, frame_height))
+        else:
+            thrust = pygame.Surface((width, frame_height), pygame.SRCALPHA)
 
         # Copy ship (thrust extends below)
         thrust.blit(base_surface, (0, 0))
@@ -209,61 +225,259 @@ def generate_thrust_frames(ship_name, frames=6):
     return thrust_frames
 
 
-def save_thrust_frames(ship_name, frames):
-    """Save thrust frames to disk."""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def generate_thrust_frames(ship_name, frames=6):
+    """Generate thrust effect frames for a ship sprite."""
+    sprite_path = os.path.join(SPRITE_DIR, f"{ship_name}.png")
+
+    if not os.path.exists(sprite_path):
+        print(f"  [SKIP] {ship_name} - sprite not found")
+        return []
+
+    base_surface = pygame.image.load(sprite_path).convert_alpha()
+    return render_thrust_frames(base_surface, get_thrust_colors(ship_name), frames)
+
+
+def strip_path(ship_name, output_dir=OUTPUT_DIR):
+    """Where a ship's thrust sprite strip is written."""
+    return os.path.join(output_dir, f"{ship_name}_topdown_thrust.png")
+
+
+def thrust_recipe(ship_name, frames=FRAMES):
+    """Everything besides the source sprite that decides a ship's strip."""
+    return {
+        "version": RECIPE_VERSION,
+        "frames": frames,
+        "colors": [list(color) for color in get_thrust_colors(ship_name)],
+    }
+
+
+def load_manifest(output_dir=OUTPUT_DIR):
+    """Read the strip manifest, or an empty one if missing or unreadable."""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {"ships": {}}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read {path}: {e}")
+        return {"ships": {}}
+    manifest.setdefault("ships", {})
+    return manifest
+
+
+def save_manifest(manifest, output_dir=OUTPUT_DIR):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_stale(entry, recipe, source_mtime, output_dir=OUTPUT_DIR):
+    """Whether a ship's strip must be rebuilt for this recipe and source."""
+    return (
+        entry is None
+        or entry.get("recipe") != recipe
+        or entry.get("source_mtime") != source_mtime
+        or not os.path.exists(os.path.join(output_dir, entry.get("strip", "")))
+    )
+
+
+def build_strip(job):
+    """
+    Render one ship's thrust strip and save it.
+
+    Runs in a pool worker: takes and returns plain dicts so it can be
+    pickled, and never needs a display.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    started = time.perf_counter()
+    try:
+        base_surface = pygame.image.load(job["sprite"])
+        if pygame.display.get_surface() is not None:
+            base_surface = base_surface.convert_alpha()
+        width, height = base_surface.get_size()
+        frames = job["recipe"]["frames"]
+        strip = pygame.Surface((width * frames, height + THRUST_EXTENT), pygame.SRCALPHA)
+        colors = [tuple(color) for color in job["recipe"]["colors"]]
+        render_thrust_frames(base_surface, colors, frames, target=strip)
+
+        tmp_path = job["strip"] + ".tmp.png"
+        pygame.image.save(strip, tmp_path)
+        os.replace(tmp_path, job["strip"])
+    except Exception as e:
+        return {"ship": job["ship"], "error": str(e)}
+
+    return {
+        "ship": job["ship"],
+        "entry": {
+            "strip": os.path.basename(job["strip"]),
+            "frames": frames,
+            "frame_size": [width, height + THRUST_EXTENT],
+            "recipe": job["recipe"],
+            "source_mtime": job["source_mtime"],
+        },
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+
+
+def remove_frame_files(ship_name, output_dir=OUTPUT_DIR):
+    """Delete the one-file-per-frame output of older versions of this script."""
+    prefix = f"{ship_name}_topdown_thrust_"
+    for name in os.listdir(output_dir):
+        if name.startswith(prefix) and name[len(prefix) : -4].isdigit() and name.endswith(".png"):
+            os.remove(os.path.join(output_dir, name))
+
+
+def build_thrust_strips(
+    ships,
+    sprite_dir=SPRITE_DIR,
+    output_dir=OUTPUT_DIR,
+    frames=FRAMES,
+    workers=None,
+    force=False,
+):
+    """
+    Rebuild the thrust strips that are missing or out of date.
+
+    A strip is current when the manifest records the same recipe (frame
+    count and colours) and the same source sprite mtime, and the strip is
+    still on disk. Stale ships are rendered in parallel, one per task.
+
+    Returns:
+        Dict with the "built", "skipped", "missing" and "failed" ship names
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    report = {"built": [], "skipped": [], "missing": [], "failed": []}
+
+    jobs = []
+    for ship in ships:
+        sprite = os.path.join(sprite_dir, f"{ship}.png")
+        if not os.path.exists(sprite):
+            report["missing"].append(ship)
+            continue
+        recipe = thrust_recipe(ship, frames)
+        source_mtime = os.stat(sprite).st_mtime_ns
+        if not force and not is_stale(
+            manifest["ships"].get(ship), recipe, source_mtime, output_dir
+        ):
+            report["skipped"].append(ship)
+            continue
+        jobs.append(
+            {
+                "ship": ship,
+                "sprite": sprite,
+                "strip": strip_path(ship, output_dir),
+                "recipe": recipe,
+                "source_mtime": source_mtime,
+            }
+        )
+
+    if not jobs:
+        results = []
+    elif workers == 1:
+        results = [build_strip(job) for job in jobs]
+    else:
+        # Spawned workers start with a fresh, headless SDL
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(workers or os.cpu_count() or 1, len(jobs)), mp_context=context
+        ) as pool:
+            results = list(pool.map(build_strip, jobs))
+
+    for result in results:
+        ship = result["ship"]
+        if "error" in result:
+            manifest["ships"].pop(ship, None)
+            report["failed"].append(ship)
+            print(f"  [FAIL] {ship} - {result['error']}")
+            continue
+        manifest["ships"][ship] = result["entry"]
+        remove_frame_files(ship, output_dir)
+        report["built"].append(ship)
+
+    manifest["version"] = RECIPE_VERSION
+    save_manifest(manifest, output_dir)
+    return report
+
+
+def load_thrust_animation(ship_name, output_dir=OUTPUT_DIR):
+    """
+    Load a ship's thrust animation with a single image decode.
+
+    Returns:
+        The frames as subsurfaces of the strip, or [] if it was never built
+    """
+    entry = load_manifest(output_dir)["ships"].get(ship_name)
+    if entry is None:
+        return []
+    path = os.path.join(output_dir, entry["strip"])
+    if not os.path.exists(path):
+        return []
+    strip = pygame.image.load(path)
+    if pygame.display.get_surface() is not None:
+        strip = strip.convert_alpha()
+    width, height = entry["frame_size"]
+    return [strip.subsurface((i * width, 0, width, height)) for i in range(entry["frames"])]
+
 
-    for i, frame in enumerate(frames):
-        output_path = os.path.join(OUTPUT_DIR, f"{ship_name}_topdown_thrust_{i}.png")
-        pygame.image.save(frame, output_path)
+# Ships to generate effects for
+DEFAULT_SHIPS = [
+    # Player ships (Minmatar)
+    "rifter",
+    "wolf",
+    "jaguar",
+    # Enemy ships (Amarr)
+    "executioner",
+    "punisher",
+    "omen",
+    "maller",
+    # Industrial
+    "bestower",
+    "sigil",
+    # Bosses
+    "apocalypse",
+    "abaddon",
+    # Extra ships
+    "condor",
+    "tristan",
+    "hurricane",
+    "tempest",
+    "dominix",
+    "megathron",
+    "raven",
+    "rokh",
+]
 
 
 def main():
-    # Initialize pygame
+    parser = argparse.ArgumentParser(description="Generate top-down thrust sprite strips")
+    parser.add_argument("ships", nargs="*", help="Ships to build (default: the game's ships)")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="Frames per strip")
+    parser.add_argument("--workers", type=int, help="Parallel workers (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild up-to-date strips too")
+    args = parser.parse_args()
+
     os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-    pygame.init()
-    pygame.display.set_mode((1, 1))
-
-    # Ships to generate effects for
-    ships = [
-        # Player ships (Minmatar)
-        "rifter",
-        "wolf",
-        "jaguar",
-        # Enemy ships (Amarr)
-        "executioner",
-        "punisher",
-        "omen",
-        "maller",
-        # Industrial
-        "bestower",
-        "sigil",
-        # Bosses
-        "apocalypse",
-        "abaddon",
-        # Extra ships
-        "condor",
-        "tristan",
-        "hurricane",
-        "tempest",
-        "dominix",
-        "megathron",
-        "raven",
-        "rokh",
-    ]
 
     print("Generating top-down thrust effects...\n")
 
-    success = 0
-    for ship in ships:
-        print(f"Processing {ship}...")
-        frames = generate_thrust_frames(ship)
-        if frames:
-            save_thrust_frames(ship, frames)
-            print(f"  ✓ Generated {len(frames)} frames")
-            success += 1
-
-    print(f"\nDone! Generated effects for {success} ships")
+    started = time.perf_counter()
+    report = build_thrust_strips(
+        args.ships or DEFAULT_SHIPS, frames=args.frames, workers=args.workers, force=args.force
+    )
+    for ship in report["missing"]:
+        print(f"  [SKIP] {ship} - sprite not found")
+    for ship in report["built"]:
+        print(f"  ✓ {ship}: {args.frames} frames")
+
+    print(
+        f"\nDone! Built {len(report['built'])} strips, "
+        f"{len(report['skipped'])} up to date, {len(report['failed'])} failed "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
     print(f"Output: {OUTPUT_DIR}")
 
 
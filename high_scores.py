@@ -4,8 +4,10 @@ Persistent score tracking with leaderboard
 """
 
 import json
-import os
 from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from core.persistence import get_persistence
 
 
 class HighScoreManager:
@@ -21,20 +23,16 @@ class HighScoreManager:
     def load(self):
         """Load high scores from file"""
         try:
-            if os.path.exists(self.SAVE_FILE):
-                with open(self.SAVE_FILE, "r") as f:
-                    data = json.load(f)
-                    self.scores = data.get("scores", [])
+            data = get_persistence().read_json(self.SAVE_FILE)
+            self.scores = data.get("scores", [])
+        except FileNotFoundError:
+            pass
         except (json.JSONDecodeError, IOError):
             self.scores = []
 
     def save(self):
-        """Save high scores to file"""
-        try:
-            with open(self.SAVE_FILE, "w") as f:
-                json.dump({"scores": self.scores}, f, indent=2)
-        except IOError:
-            pass
+        """Queue the high scores to be written in the background"""
+        get_persistence().write_json(self.SAVE_FILE, {"scores": self.scores}, indent=2)
 
     def add_score(self, score, refugees, stage, wave, ship, difficulty, berserk_stats=None):
         """
@@ -277,33 +275,39 @@ class AchievementManager:
         self.unlocked = set()
         self.stats = {"total_kills": 0, "total_refugees": 0, "games_played": 0, "victories": 0}
         self.pending_unlocks = []  # Achievements unlocked this session
+        self._dirty = False  # Unlocks not yet written to SAVE_FILE
         self.load()
 
     def load(self):
         """Load achievements from file"""
         try:
-            if os.path.exists(self.SAVE_FILE):
-                with open(self.SAVE_FILE, "r") as f:
-                    data = json.load(f)
-                    self.unlocked = set(data.get("unlocked", []))
-                    self.stats = data.get("stats", self.stats)
+            data = get_persistence().read_json(self.SAVE_FILE)
+            self.unlocked = set(data.get("unlocked", []))
+            self.stats = data.get("stats", self.stats)
         except (json.JSONDecodeError, IOError):
             pass
 
     def save(self):
-        """Save achievements to file"""
-        try:
-            with open(self.SAVE_FILE, "w") as f:
-                json.dump({"unlocked": list(self.unlocked), "stats": self.stats}, f, indent=2)
-        except IOError:
-            pass
+        """Queue the achievements to be written in the background"""
+        get_persistence().write_json(
+            self.SAVE_FILE, {"unlocked": list(self.unlocked), "stats": self.stats}, indent=2
+        )
+
+    def flush(self):
+        """Save if anything changed since the last save"""
+        if self._dirty:
+            self._dirty = False
+            self.save()
 
     def unlock(self, achievement_id):
-        """Unlock an achievement. Returns True if newly unlocked."""
+        """Unlock an achievement. Returns True if newly unlocked.
+
+        Saving is deferred to flush(), so unlocks during a run cost no I/O.
+        """
         if achievement_id in self.ACHIEVEMENTS and achievement_id not in self.unlocked:
             self.unlocked.add(achievement_id)
             self.pending_unlocks.append(achievement_id)
-            self.save()
+            self._dirty = True
             return True
         return False
 
@@ -317,130 +321,41 @@ class AchievementManager:
         self.pending_unlocks.clear()
         return pending
 
-    def check_achievements(self, game_stats):
-        """Check and unlock achievements based on game stats"""
-        newly_unlocked = []
-
-        kills = game_stats.get("total_kills", 0)
-        refugees = game_stats.get("refugees", 0)
-        score = game_stats.get("score", 0)
-        stage = game_stats.get("stage", 0)
-        victory = game_stats.get("victory", False)
-        ship = game_stats.get("ship", "Rifter")
-        difficulty = game_stats.get("difficulty", "normal")
-        berserk = game_stats.get("berserk", {})
+    def start_run(self, ship="Rifter", difficulty="normal", game_mode="campaign"):
+        """Start tracking a run; feed its events to the returned tracker"""
+        return AchievementTracker(self, ship=ship, difficulty=difficulty, game_mode=game_mode)
 
-        extreme_kills = berserk.get("kills_by_range", {}).get("EXTREME", 0)
-        avg_mult = berserk.get("avg_multiplier", 1.0)
-
-        # Combat achievements
-        if kills >= 1:
-            if self.unlock("first_blood"):
-                newly_unlocked.append("first_blood")
-        if kills >= 100:
-            if self.unlock("centurion"):
-                newly_unlocked.append("centurion")
-        if kills >= 500:
-            if self.unlock("exterminator"):
-                newly_unlocked.append("exterminator")
-
-        # Berserk achievements
-        if extreme_kills >= 10:
-            if self.unlock("up_close"):
-                newly_unlocked.append("up_close")
-        if extreme_kills >= 50:
-            if self.unlock("death_wish"):
-                newly_unlocked.append("death_wish")
-        if avg_mult >= 3.0 and kills >= 20:
-            if self.unlock("berserker"):
-                newly_unlocked.append("berserker")
-
-        # Refugee achievements
-        if refugees >= 50:
-            if self.unlock("liberator"):
-                newly_unlocked.append("liberator")
-        if refugees >= 200:
-            if self.unlock("freedom_fighter"):
-                newly_unlocked.append("freedom_fighter")
-
-        # Progression achievements
-        if stage >= 1:
-            if self.unlock("survivor"):
-                newly_unlocked.append("survivor")
-        if stage >= 3:
-            if self.unlock("veteran"):
-                newly_unlocked.append("veteran")
-
-        # Victory achievements
-        if victory:
-            if difficulty in ["normal", "hard", "nightmare"]:
-                if self.unlock("rebel_hero"):
-                    newly_unlocked.append("rebel_hero")
-            if difficulty == "nightmare":
-                if self.unlock("triglavian_slayer"):
-                    newly_unlocked.append("triglavian_slayer")
-            if ship == "Wolf":
-                if self.unlock("wolf_pack"):
-                    newly_unlocked.append("wolf_pack")
-            if ship == "Jaguar":
-                if self.unlock("speed_demon"):
-                    newly_unlocked.append("speed_demon")
-
-        # Score achievements
-        if score >= 50000:
-            if self.unlock("high_roller"):
-                newly_unlocked.append("high_roller")
-        if score >= 100000:
-            if self.unlock("score_master"):
-                newly_unlocked.append("score_master")
-
-        # Endless mode achievements
-        endless_wave = game_stats.get("endless_wave", 0)
-        endless_time = game_stats.get("endless_time", 0)
-        is_endless = game_stats.get("game_mode") == "endless"
-
-        if is_endless:
-            # Wave achievements
-            if endless_wave >= 5:
-                if self.unlock("endless_initiate"):
-                    newly_unlocked.append("endless_initiate")
-            if endless_wave >= 10:
-                if self.unlock("endless_warrior"):
-                    newly_unlocked.append("endless_warrior")
-            if endless_wave >= 20:
-                if self.unlock("endless_champion"):
-                    newly_unlocked.append("endless_champion")
-            if endless_wave >= 30:
-                if self.unlock("endless_legend"):
-                    newly_unlocked.append("endless_legend")
-            if endless_wave >= 50:
-                if self.unlock("endless_god"):
-                    newly_unlocked.append("endless_god")
-
-            # Time-based achievements (time in seconds)
-            if endless_time >= 300:  # 5 minutes
-                if self.unlock("endless_survivor"):
-                    newly_unlocked.append("endless_survivor")
-            if endless_time >= 600:  # 10 minutes
-                if self.unlock("endless_endurance"):
-                    newly_unlocked.append("endless_endurance")
-
-            # Endless score achievements
-            if score >= 50000:
-                if self.unlock("endless_score_50k"):
-                    newly_unlocked.append("endless_score_50k")
-            if score >= 100000:
-                if self.unlock("endless_score_100k"):
-                    newly_unlocked.append("endless_score_100k")
-
-        # Update persistent stats
-        self.stats["total_kills"] += kills
-        self.stats["total_refugees"] += refugees
+    def finish_run(self, tracker):
+        """Add a finished run to the persistent stats and save"""
+        counters = tracker.counters
+        self.stats["total_kills"] += counters["kills"]
+        self.stats["total_refugees"] += counters["refugees"]
         self.stats["games_played"] += 1
-        if victory:
+        if counters["victory"]:
             self.stats["victories"] += 1
-        self.save()
+        self._dirty = True
+        self.flush()
 
+    def check_achievements(self, game_stats):
+        """Check and unlock achievements based on end-of-run game stats"""
+        tracker = self.start_run(
+            ship=game_stats.get("ship", "Rifter"),
+            difficulty=game_stats.get("difficulty", "normal"),
+            game_mode=game_stats.get("game_mode", "campaign"),
+        )
+        berserk = game_stats.get("berserk", {})
+        newly_unlocked = tracker.record_kills(
+            game_stats.get("total_kills", 0),
+            berserk.get("kills_by_range", {}).get("EXTREME", 0),
+        )
+        newly_unlocked += tracker.record_berserk(berserk.get("avg_multiplier", 1.0))
+        newly_unlocked += tracker.record_refugees(game_stats.get("refugees", 0))
+        newly_unlocked += tracker.record_stage(game_stats.get("stage", 0))
+        newly_unlocked += tracker.record_score(game_stats.get("score", 0))
+        newly_unlocked += tracker.record_endless(
+            game_stats.get("endless_wave", 0), game_stats.get("endless_time", 0)
+        )
+        newly_unlocked += tracker.finish(game_stats.get("victory", False))
         return newly_unlocked
 
     def get_achievement_info(self, achievement_id):
@@ -461,3 +376,171 @@ class AchievementManager:
         total = len([a for a in self.ACHIEVEMENTS.values() if not a.get("hidden")])
         unlocked = len([a for a in self.unlocked if not self.ACHIEVEMENTS.get(a, {}).get("hidden")])
         return unlocked, total
+
+
+class AchievementRule(NamedTuple):
+    """Unlocks an achievement once its condition holds for a run.
+
+    The condition is only evaluated when one of the watched counters changes.
+    """
+
+    achievement_id: str
+    watches: Tuple[str, ...]
+    condition: Callable[[Dict[str, Any]], bool]
+
+
+def _at_least(achievement_id, counter, threshold, game_mode=None):
+    if game_mode is None:
+        return AchievementRule(achievement_id, (counter,), lambda c: c[counter] >= threshold)
+    return AchievementRule(
+        achievement_id,
+        (counter,),
+        lambda c: c["game_mode"] == game_mode and c[counter] >= threshold,
+    )
+
+
+def _on_victory(achievement_id, condition):
+    return AchievementRule(achievement_id, ("victory",), lambda c: c["victory"] and condition(c))
+
+
+ACHIEVEMENT_RULES = (
+    # Combat achievements
+    _at_least("first_blood", "kills", 1),
+    _at_least("centurion", "kills", 100),
+    _at_least("exterminator", "kills", 500),
+    # Berserk achievements
+    _at_least("up_close", "extreme_kills", 10),
+    _at_least("death_wish", "extreme_kills", 50),
+    AchievementRule(
+        "berserker",
+        ("avg_multiplier", "kills"),
+        lambda c: c["avg_multiplier"] >= 3.0 and c["kills"] >= 20,
+    ),
+    # Refugee achievements
+    _at_least("liberator", "refugees", 50),
+    _at_least("freedom_fighter", "refugees", 200),
+    # Progression achievements
+    _at_least("survivor", "stage", 1),
+    _at_least("veteran", "stage", 3),
+    # Victory achievements
+    _on_victory("rebel_hero", lambda c: c["difficulty"] in ("normal", "hard", "nightmare")),
+    _on_victory("triglavian_slayer", lambda c: c["difficulty"] == "nightmare"),
+    _on_victory("wolf_pack", lambda c: c["ship"] == "Wolf"),
+    _on_victory("speed_demon", lambda c: c["ship"] == "Jaguar"),
+    # Score achievements
+    _at_least("high_roller", "score", 50000),
+    _at_least("score_master", "score", 100000),
+    # Endless mode achievements (time in seconds)
+    _at_least("endless_initiate", "endless_wave", 5, "endless"),
+    _at_least("endless_warrior", "endless_wave", 10, "endless"),
+    _at_least("endless_champion", "endless_wave", 20, "endless"),
+    _at_least("endless_legend", "endless_wave", 30, "endless"),
+    _at_least("endless_god", "endless_wave", 50, "endless"),
+    _at_least("endless_survivor", "endless_time", 300, "endless"),
+    _at_least("endless_endurance", "endless_time", 600, "endless"),
+    _at_least("endless_score_50k", "score", 50000, "endless"),
+    _at_least("endless_score_100k", "score", 100000, "endless"),
+)
+
+
+class AchievementTracker:
+    """
+    Per-run achievement counters, updated from game events.
+
+    Rules are indexed by the counters they watch, so an event only
+    evaluates the rules that could have changed, and a rule is dropped
+    once its achievement is unlocked. Achievements unlock the moment an
+    event satisfies them; each record_* method returns the newly unlocked
+    IDs so the game can announce them mid-run. Unlocks are saved when the
+    run finishes (or on AchievementManager.flush()).
+    """
+
+    def __init__(self, manager, ship="Rifter", difficulty="normal", game_mode="campaign"):
+        self.manager = manager
+        self.counters: Dict[str, Any] = {
+            "kills": 0,
+            "extreme_kills": 0,
+            "refugees": 0,
+            "score": 0,
+            "stage": 0,
+            "avg_multiplier": 1.0,
+            "endless_wave": 0,
+            "endless_time": 0,
+            "victory": False,
+            "ship": ship,
+            "difficulty": difficulty,
+            "game_mode": game_mode,
+        }
+        self._watchers: Dict[str, List[AchievementRule]] = {}
+        for rule in ACHIEVEMENT_RULES:
+            if not manager.is_unlocked(rule.achievement_id):
+                for counter in rule.watches:
+                    self._watchers.setdefault(counter, []).append(rule)
+
+    def set(self, counter, value):
+        """Set a counter and evaluate the rules watching it.
+
+        Returns:
+            List of newly unlocked achievement IDs.
+        """
+        if self.counters[counter] == value:
+            return []
+        self.counters[counter] = value
+        rules = self._watchers.get(counter)
+        if not rules:
+            return []
+
+        newly_unlocked = []
+        for rule in [r for r in rules if r.condition(self.counters)]:
+            for watched in rule.watches:
+                self._watchers[watched].remove(rule)
+            if self.manager.unlock(rule.achievement_id):
+                newly_unlocked.append(rule.achievement_id)
+        return newly_unlocked
+
+    def record_kill(self, range_name=None):
+        """An enemy was destroyed, at a berserk range name such as "EXTREME"."""
+        newly_unlocked = self.set("kills", self.counters["kills"] + 1)
+        if range_name == "EXTREME":
+            newly_unlocked += self.set("extreme_kills", self.counters["extreme_kills"] + 1)
+        return newly_unlocked
+
+    def record_kills(self, total, extreme=0):
+        """Set the run's kill totals."""
+        return self.set("kills", total) + self.set("extreme_kills", extreme)
+
+    def record_berserk(self, avg_multiplier):
+        """The run's average berserk multiplier changed."""
+        return self.set("avg_multiplier", avg_multiplier)
+
+    def record_refugees(self, total):
+        """Refugees were rescued; total is the run's total so far."""
+        return self.set("refugees", total)
+
+    def record_score(self, score):
+        """The player's score changed."""
+        return self.set("score", score)
+
+    def record_stage(self, stage):
+        """The player reached a stage (1-indexed)."""
+        return self.set("stage", max(stage, self.counters["stage"]))
+
+    def record_endless(self, wave, seconds):
+        """Endless mode progress: current wave and seconds survived."""
+        return self.set("endless_wave", wave) + self.set("endless_time", seconds)
+
+    def finish(self, victory=False, ship=None):
+        """End the run, updating persistent stats and saving.
+
+        Args:
+            victory: Whether the run was won.
+            ship: The ship the run ended in, if it changed since the start.
+
+        Returns:
+            List of achievement IDs unlocked by the run's outcome.
+        """
+        if ship is not None:
+            self.counters["ship"] = ship
+        newly_unlocked = self.set("victory", victory)
+        self.manager.finish_run(self)
+        return newly_unlocked
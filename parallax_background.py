@@ -10,8 +10,19 @@ from typing import List, Optional, Tuple
 
 import pygame
 
-# Cache for loaded ship images
-_carrier_image_cache = {}
+from asteroid_sprites import ICE, METALLIC, ROCK, get_asteroid_library
+from core.asset_cache import get_asset_cache
+from core.asset_pack import load_image
+
+# Carriers sit far back in the parallax field; depth range and size formula
+# are shared with scripts/build_asset_pack.py, which pre-scales carrier art
+CARRIER_DEPTH_RANGE = (0.12, 0.22)
+
+
+def _carrier_size(depth: float) -> int:
+    """Base sprite size for a carrier at the given depth"""
+    return int(80 + depth * 60)  # Large even at distance
+
 
 # Carrier definitions: Amarr and Minmatar only
 CARRIER_TYPES = {
@@ -26,6 +37,11 @@ CARRIER_TYPES = {
 }
 
 
+def _carrier_image_size(size: int) -> Tuple[int, int]:
+    """Scaled carrier image dimensions for a base size (carriers are large)"""
+    return size * 5, size * 3
+
+
 def _load_carrier_image(size: int, faction: str = None) -> Tuple[Optional[pygame.Surface], str]:
     """Load and cache a carrier image at the specified size.
 
@@ -43,29 +59,27 @@ def _load_carrier_image(size: int, faction: str = None) -> Tuple[Optional[pygame
     carrier_info = CARRIER_TYPES.get(faction, CARRIER_TYPES["amarr"])
     ship_name = carrier_info["name"]
 
+    cache = get_asset_cache()
     cache_key = f"{faction}_{size}"
-    if cache_key in _carrier_image_cache:
-        return _carrier_image_cache[cache_key], faction
+    cached = cache.get("carriers", cache_key)
+    if cached is not None:
+        return cached, faction
 
-    # Try to load carrier image
-    base_dir = os.path.dirname(__file__)
+    # Try to load carrier image (asset pack first, then loose files)
     image_paths = [
-        os.path.join(base_dir, "assets", "ship_sprites", f"{ship_name}.png"),
-        os.path.join(base_dir, "assets", "eve_renders", f"{ship_name}.png"),
+        f"assets/ship_sprites/{ship_name}.png",
+        f"assets/eve_renders/{ship_name}.png",
     ]
 
+    target_size = _carrier_image_size(size)
     for path in image_paths:
-        if os.path.exists(path):
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                # Scale to appropriate size (carriers are large)
-                target_width = size * 5
-                target_height = size * 3
-                img = pygame.transform.smoothscale(img, (target_width, target_height))
-                _carrier_image_cache[cache_key] = img
-                return img, faction
-            except pygame.error:
-                pass
+        try:
+            img = load_image(path, target_size)
+        except pygame.error:
+            continue
+        if img is not None:
+            cache.put("carriers", cache_key, img)
+            return img, faction
 
     return None, faction
 
@@ -322,9 +336,9 @@ class AmbientShip:
 
         # Carriers are always very far back (distant, imposing silhouettes)
         if self.ship_type == "carrier":
-            self.depth = random.uniform(0.12, 0.22)  # Very far back
+            self.depth = random.uniform(*CARRIER_DEPTH_RANGE)  # Very far back
             self.speed = 0.15 + self.depth * 0.3  # Slow, majestic movement
-            self.size = int(80 + self.depth * 60)  # Large even at distance
+            self.size = _carrier_size(self.depth)
         else:
             self.depth = random.uniform(0.3, 0.8)  # 0 = far, 1 = close
             self.speed = (0.5 + self.depth) * random.uniform(0.8, 1.5)
@@ -806,9 +820,12 @@ class Asteroid:
     """Drifting asteroid for Stage 1 - realistic rocky/metallic appearance"""
 
     # Asteroid composition types
-    ROCK = "rock"
-    METALLIC = "metallic"
-    ICE = "ice"
+    ROCK = ROCK
+    METALLIC = METALLIC
+    ICE = ICE
+
+    # Depth is rounded to this many shades so asteroids share library sprites
+    DEPTH_SHADES = 4
 
     def __init__(self, x: float, y: float, size: int, depth: float):
         self.x = x
@@ -821,199 +838,32 @@ class Asteroid:
         self.drift_y = random.uniform(0.2, 0.8)
         # Random composition
         self.composition = random.choice([self.ROCK, self.ROCK, self.METALLIC, self.ICE])
+        self.library = get_asteroid_library()
+        self.shape = self.library.pick_shape()
+        self.color, self.alpha = self._palette()
         self.sprite = self._create_sprite()
 
-    def _create_sprite(self) -> pygame.Surface:
-        """Create realistic asteroid sprite with baked-in transparency"""
-        size = self.size
-        surf = pygame.Surface((size * 2 + 4, size * 2 + 4), pygame.SRCALPHA)
-        cx, cy = size + 2, size + 2
-
-        # Generate irregular polygon with more natural variation
-        num_points = random.randint(8, 14)
-        points = []
-        base_angles = []
-        for i in range(num_points):
-            angle = (i / num_points) * math.pi * 2 + random.uniform(-0.15, 0.15)
-            base_angles.append(angle)
-            # More irregular radius variation
-            r = size * random.uniform(0.55, 1.0)
-            px = cx + r * math.cos(angle)
-            py = cy + r * math.sin(angle)
-            points.append((px, py))
-
+    def _palette(self) -> Tuple[Tuple[int, int, int], int]:
+        """Base color and baked alpha for this asteroid's composition and depth"""
+        depth = round(self.depth * self.DEPTH_SHADES) / self.DEPTH_SHADES
         # Bake alpha based on depth (50-150 range)
-        alpha = int(50 + self.depth * 100)
+        alpha = int(50 + depth * 100)
 
-        # Color based on composition
         if self.composition == self.METALLIC:
             # Metallic gray with slight golden tint
-            base_val = int(70 + self.depth * 50)
-            color = (
-                base_val + random.randint(0, 20),
-                base_val + random.randint(-5, 15),
-                base_val + random.randint(-15, 5),
-                alpha,
-            )
-        elif self.composition == self.ICE:
+            base_val = int(70 + depth * 50)
+            return (base_val + 10, base_val + 5, base_val - 5), alpha
+        if self.composition == self.ICE:
             # Bluish-white ice
-            base_val = int(80 + self.depth * 60)
-            color = (
-                base_val + random.randint(-10, 5),
-                base_val + random.randint(0, 15),
-                base_val + random.randint(10, 30),
-                alpha,
-            )
-        else:  # ROCK
-            # Brown-gray rock
-            base_val = int(55 + self.depth * 45)
-            color = (
-                base_val + random.randint(-10, 20),
-                base_val + random.randint(-15, 10),
-                base_val + random.randint(-20, 5),
-                alpha,
-            )
-
-        # Draw base shape
-        pygame.draw.polygon(surf, color, points)
-
-        # === LIGHTING GRADIENT ===
-        # Create top-left lighting effect
-        light_angle = -math.pi / 4  # Upper-left light source
-        for i, (px, py) in enumerate(points):
-            # Calculate point's angle from center
-            point_angle = math.atan2(py - cy, px - cx)
-            # Angle difference from light source
-            angle_diff = abs(point_angle - light_angle)
-            if angle_diff > math.pi:
-                angle_diff = 2 * math.pi - angle_diff
-
-            # Points facing light are brighter
-            if angle_diff < math.pi / 2:
-                1.0 - (angle_diff / (math.pi / 2)) * 0.4
-            else:
-                pass
-
-        # === SURFACE TEXTURE ===
-        # Add rocky texture bumps
-        for _ in range(random.randint(3, 8)):
-            bump_angle = random.uniform(0, math.pi * 2)
-            bump_dist = random.uniform(size * 0.2, size * 0.7)
-            bump_x = int(cx + bump_dist * math.cos(bump_angle))
-            bump_y = int(cy + bump_dist * math.sin(bump_angle))
-            bump_r = random.randint(max(2, size // 10), max(3, size // 5))
-
-            # Bumps can be lighter or darker
-            if random.random() > 0.5:
-                bump_color = (
-                    max(0, color[0] - 15),
-                    max(0, color[1] - 15),
-                    max(0, color[2] - 12),
-                    alpha,
-                )
-            else:
-                bump_color = (
-                    min(255, color[0] + 12),
-                    min(255, color[1] + 10),
-                    min(255, color[2] + 8),
-                    alpha,
-                )
-            pygame.draw.circle(surf, bump_color, (bump_x, bump_y), bump_r)
-
-        # === CRATERS ===
-        for _ in range(random.randint(1, 4)):
-            crater_angle = random.uniform(0, math.pi * 2)
-            crater_dist = random.uniform(0, size * 0.5)
-            crater_x = int(cx + crater_dist * math.cos(crater_angle))
-            crater_y = int(cy + crater_dist * math.sin(crater_angle))
-            crater_r = random.randint(max(2, size // 8), max(4, size // 4))
-
-            # Dark crater interior
-            crater_color = (
-                max(0, color[0] - 30),
-                max(0, color[1] - 28),
-                max(0, color[2] - 25),
-                alpha,
-            )
-            pygame.draw.circle(surf, crater_color, (crater_x, crater_y), crater_r)
-
-            # Light rim on upper-left (facing light)
-            rim_color = (
-                min(255, color[0] + 20),
-                min(255, color[1] + 18),
-                min(255, color[2] + 15),
-                min(255, alpha + 10),
-            )
-            pygame.draw.arc(
-                surf,
-                rim_color,
-                (crater_x - crater_r, crater_y - crater_r, crater_r * 2, crater_r * 2),
-                math.pi * 0.75,
-                math.pi * 1.75,
-                1,
-            )
+            base_val = int(80 + depth * 60)
+            return (base_val - 2, base_val + 7, base_val + 20), alpha
+        # Brown-gray rock
+        base_val = int(55 + depth * 45)
+        return (base_val + 5, base_val - 2, base_val - 7), alpha
 
-        # === METALLIC ORE VEINS ===
-        if self.composition == self.METALLIC and size > 20:
-            num_veins = random.randint(1, 3)
-            for _ in range(num_veins):
-                vein_start_angle = random.uniform(0, math.pi * 2)
-                vein_end_angle = vein_start_angle + random.uniform(0.5, 1.5)
-                vein_dist = random.uniform(size * 0.3, size * 0.7)
-
-                vein_color = random.choice(
-                    [
-                        (180, 150, 80, min(255, alpha + 30)),  # Gold
-                        (120, 180, 200, min(255, alpha + 30)),  # Platinum
-                        (160, 100, 60, min(255, alpha + 30)),  # Copper
-                    ]
-                )
-
-                vein_points = []
-                for t in range(6):
-                    a = vein_start_angle + (vein_end_angle - vein_start_angle) * t / 5
-                    d = vein_dist + random.uniform(-size * 0.1, size * 0.1)
-                    vein_points.append((int(cx + d * math.cos(a)), int(cy + d * math.sin(a))))
-
-                if len(vein_points) >= 2:
-                    pygame.draw.lines(surf, vein_color, False, vein_points, 2)
-
-        # === ICE CRYSTALS ===
-        if self.composition == self.ICE and size > 15:
-            for _ in range(random.randint(2, 5)):
-                crystal_angle = random.uniform(0, math.pi * 2)
-                crystal_dist = random.uniform(size * 0.2, size * 0.6)
-                crystal_x = int(cx + crystal_dist * math.cos(crystal_angle))
-                crystal_y = int(cy + crystal_dist * math.sin(crystal_angle))
-                crystal_r = random.randint(2, max(3, size // 6))
-
-                # Bright icy sparkle
-                ice_color = (200, 230, 255, min(255, alpha + 40))
-                pygame.draw.circle(surf, ice_color, (crystal_x, crystal_y), crystal_r)
-
-        # === EDGE HIGHLIGHT ===
-        # Draw lit edge (upper-left quadrant)
-        highlight = (
-            min(255, color[0] + 35),
-            min(255, color[1] + 32),
-            min(255, color[2] + 28),
-            min(255, alpha + 25),
-        )
-        shadow = (max(0, color[0] - 20), max(0, color[1] - 18), max(0, color[2] - 15), alpha)
-
-        # Draw partial outline for 3D effect
-        for i in range(len(points)):
-            p1 = points[i]
-            p2 = points[(i + 1) % len(points)]
-            # Get midpoint angle
-            mid_angle = math.atan2((p1[1] + p2[1]) / 2 - cy, (p1[0] + p2[0]) / 2 - cx)
-            # Upper-left edges get highlight
-            if -math.pi < mid_angle < 0:
-                pygame.draw.line(surf, highlight, p1, p2, 1)
-            else:
-                pygame.draw.line(surf, shadow, p1, p2, 1)
-
-        return surf
+    def _create_sprite(self) -> pygame.Surface:
+        """Get the unrotated asteroid sprite (alpha baked in) from the shared library"""
+        return self.library.sprite(self.size, self.shape, self.color, self.alpha, self.composition)
 
     def update(self, scroll_speed: float = 1.0):
         self.x += self.drift_x * self.depth
@@ -1021,7 +871,9 @@ class Asteroid:
         self.rotation += self.rot_speed
 
     def draw(self, surface: pygame.Surface):
-        rotated = pygame.transform.rotate(self.sprite, self.rotation)
+        rotated = self.library.frame(
+            self.size, self.shape, self.rotation, self.color, self.alpha, self.composition
+        )
         # Alpha is baked into sprite - no set_alpha needed
         rect = rotated.get_rect(center=(int(self.x), int(self.y)))
         surface.blit(rotated, rect)
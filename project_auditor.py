@@ -11,14 +11,19 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import multiprocessing
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 
 class ProjectType(Enum):
@@ -130,35 +135,244 @@ PATTERNS = {
 }
 
 
-def detect_project_type(project_path: Path) -> ProjectType:
-    """Detect the type of EVE project."""
-    all_content = ""
+# File types read by each part of the audit
+JS_EXTENSIONS = {".js", ".jsx", ".ts", ".tsx"}
+DETECT_EXTENSIONS = {".py", ".json"} | JS_EXTENSIONS
+PATTERN_EXTENSIONS = {".py", ".md"} | JS_EXTENSIONS
+LINE_EXTENSIONS = {".py"} | JS_EXTENSIONS
+READ_EXTENSIONS = DETECT_EXTENSIONS | PATTERN_EXTENSIONS
+SKIP_PARTS = ("node_modules", ".git")
+
+SCAN_CACHE_VERSION = 1
+DEFAULT_SCAN_CACHE = Path.home() / ".cache" / "eve_project_auditor" / "scan_cache.json"
+# Below this many files to read, starting a process pool costs more than it saves
+MIN_PARALLEL_FILES = 1000
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_searches() -> List[Tuple[str, "re.Pattern[str]", bool]]:
+    """
+    (name, pattern, folded) for every entry in PATTERNS.
+
+    re.IGNORECASE searches are several times slower than case-sensitive
+    ones, so each ignore-case pattern is lowercased and run against the
+    lowercased text instead (folded=True). Patterns with uppercase escapes
+    such as \\S would change meaning when lowercased and are left alone.
+    """
+    searches = []
+    for name, pattern in PATTERNS.items():
+        if pattern.flags & re.IGNORECASE and not re.search(r"\\[A-Z]", pattern.pattern):
+            searches.append((name, re.compile(pattern.pattern.lower()), True))
+        else:
+            searches.append((name, pattern, False))
+    return searches
+
+
+def match_patterns(content: str) -> List[str]:
+    """Names of every pattern in PATTERNS that occurs in content."""
+    lowered = content.lower()
+    return sorted(
+        name
+        for name, pattern, folded in _compiled_searches()
+        if pattern.search(lowered if folded else content)
+    )
+
+
+def scan_file(path: str) -> Dict:
+    """Read one file once: its line count and the patterns it contains."""
+    try:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+    except OSError:
+        return {"lines": 0, "matches": []}
+    return {"lines": content.count("\n") + 1, "matches": match_patterns(content)}
+
+
+def _patterns_signature() -> str:
+    text = json.dumps({name: [p.pattern, p.flags] for name, p in PATTERNS.items()}, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()
 
-    for ext in ["*.py", "*.js", "*.jsx", "*.ts", "*.tsx", "*.json"]:
-        for f in project_path.rglob(ext):
-            if "node_modules" in str(f) or ".git" in str(f):
+
+@dataclass
+class ProjectScan:
+    """Everything the audit needs from a project's files."""
+
+    python_files: int = 0
+    js_files: int = 0
+    json_files: int = 0
+    total_lines: int = 0
+    svg_files: int = 0
+    png_files: int = 0
+    # Patterns found in source and JSON files, for project type detection
+    detected: Set[str] = field(default_factory=set)
+    # Patterns found in source and Markdown files, for compliance checks
+    patterns: Dict[str, bool] = field(default_factory=dict)
+
+
+class ProjectScanner:
+    """
+    Walks each project once and reads each file once.
+
+    Per-file results are cached by (size, mtime), so auditing the same
+    projects again only reads files that changed. The cache is dropped
+    whenever PATTERNS changes. Files that do need reading are spread across
+    a process pool when there are enough of them to pay for it.
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = None,
+        workers: Optional[int] = None,
+        min_parallel: int = MIN_PARALLEL_FILES,
+    ):
+        self.cache_path = cache_path
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        self.files_read = 0
+        self.cache_hits = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._signature = _patterns_signature()
+        self._cache: Dict[str, list] = self._load_cache()
+        self._scanned_roots: List[str] = []
+        self._seen: Set[str] = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _load_cache(self) -> Dict[str, list]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read scan cache: {e}", file=sys.stderr)
+            return {}
+        if data.get("version") != SCAN_CACHE_VERSION or data.get("patterns") != self._signature:
+            return {}
+        return data.get("files", {})
+
+    def save(self):
+        """Write the cache, forgetting files that are gone from scanned projects."""
+        if not self.cache_path:
+            return
+        files = {
+            path: entry
+            for path, entry in self._cache.items()
+            if path in self._seen
+            or not any(path.startswith(root + os.sep) for root in self._scanned_roots)
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": SCAN_CACHE_VERSION, "patterns": self._signature, "files": files})
+        )
+        os.replace(tmp_path, self.cache_path)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _walk(self, project_path: Path) -> Iterator[str]:
+        for root, dirs, files in os.walk(project_path):
+            # Same rule as the old rglob filters: skip any path mentioning these
+            dirs[:] = [d for d in dirs if not any(p in os.path.join(root, d) for p in SKIP_PARTS)]
+            for name in files:
+                path = os.path.join(root, name)
+                if not any(p in path for p in SKIP_PARTS):
+                    yield path
+
+    def _read_all(self, paths: List[str]) -> List[Dict]:
+        if self.workers == 1 or len(paths) < self.min_parallel:
+            return [scan_file(path) for path in paths]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        chunksize = max(1, len(paths) // (self.workers * 4))
+        return list(self._pool.map(scan_file, paths, chunksize=chunksize))
+
+    def scan(self, project_path: Path) -> ProjectScan:
+        """Scan one project, reading only files not already cached."""
+        root = os.path.abspath(project_path)
+        self._scanned_roots.append(root)
+        scan = ProjectScan(patterns={name: False for name in PATTERNS})
+
+        results: Dict[str, Dict] = {}
+        to_read: List[Tuple[str, list]] = []
+        suffixes: Dict[str, str] = {}
+        for path in self._walk(Path(root)):
+            suffix = os.path.splitext(path)[1]
+            suffixes[path] = suffix
+            if suffix not in READ_EXTENSIONS:
                 continue
             try:
-                all_content += f.read_text(errors="ignore")
-            except Exception:
-                pass
+                stat = os.stat(path)
+            except OSError:
+                continue
+            key = [stat.st_size, stat.st_mtime_ns]
+            self._seen.add(path)
+            entry = self._cache.get(path)
+            if entry is not None and entry[:2] == key:
+                results[path] = entry[2]
+                self.cache_hits += 1
+            else:
+                to_read.append((path, key))
+
+        read = self._read_all([path for path, _ in to_read])
+        self.files_read += len(read)
+        for (path, key), result in zip(to_read, read):
+            self._cache[path] = [*key, result]
+            results[path] = result
+
+        for path, suffix in suffixes.items():
+            if suffix == ".svg":
+                scan.svg_files += 1
+            elif suffix == ".png":
+                scan.png_files += 1
+            elif suffix == ".json":
+                scan.json_files += 1
+            if suffix == ".py":
+                scan.python_files += 1
+            elif suffix in JS_EXTENSIONS:
+                scan.js_files += 1
+
+            result = results.get(path)
+            if result is None:
+                continue
+            if suffix in LINE_EXTENSIONS:
+                scan.total_lines += result["lines"]
+            if suffix in DETECT_EXTENSIONS:
+                scan.detected.update(result["matches"])
+            if suffix in PATTERN_EXTENSIONS:
+                for name in result["matches"]:
+                    scan.patterns[name] = True
+        return scan
+
+
+def detect_project_type(project_path: Path, scan: Optional[ProjectScan] = None) -> ProjectType:
+    """Detect the type of EVE project."""
+    if scan is None:
+        scan = ProjectScanner().scan(project_path)
+    detected = scan.detected
 
     # Check for game frameworks
-    if PATTERNS["pygame"].search(all_content):
+    if "pygame" in detected:
         return ProjectType.GAME
 
     # Check for API frameworks
-    if PATTERNS["fastapi"].search(all_content) or PATTERNS["flask"].search(all_content):
+    if "fastapi" in detected or "flask" in detected:
         return ProjectType.API
 
     # Check for web frameworks
-    if PATTERNS["react"].search(all_content) or PATTERNS["express"].search(all_content):
+    if "react" in detected or "express" in detected:
         return ProjectType.WEB
 
     # Check for asset collections
-    svg_count = len(list(project_path.rglob("*.svg")))
-    png_count = len(list(project_path.rglob("*.png")))
-    if svg_count > 10 or png_count > 20:
+    if scan.svg_files > 10 or scan.png_files > 20:
         return ProjectType.ASSETS
 
     # Check for library patterns
@@ -170,44 +384,13 @@ def detect_project_type(project_path: Path) -> ProjectType:
 
 def count_files(project_path: Path) -> Tuple[int, int, int, int]:
     """Count files and lines in project."""
-    py_files = js_files = json_files = total_lines = 0
-
-    for f in project_path.rglob("*"):
-        if "node_modules" in str(f) or ".git" in str(f) or not f.is_file():
-            continue
-
-        try:
-            if f.suffix == ".py":
-                py_files += 1
-                total_lines += len(f.read_text(errors="ignore").split("\n"))
-            elif f.suffix in [".js", ".jsx", ".ts", ".tsx"]:
-                js_files += 1
-                total_lines += len(f.read_text(errors="ignore").split("\n"))
-            elif f.suffix == ".json":
-                json_files += 1
-        except Exception:
-            pass
-
-    return py_files, js_files, json_files, total_lines
+    scan = ProjectScanner().scan(project_path)
+    return scan.python_files, scan.js_files, scan.json_files, scan.total_lines
 
 
 def scan_for_patterns(project_path: Path) -> Dict[str, bool]:
     """Scan project for various patterns."""
-    results = {key: False for key in PATTERNS.keys()}
-
-    for ext in ["*.py", "*.js", "*.jsx", "*.ts", "*.tsx", "*.md"]:
-        for f in project_path.rglob(ext):
-            if "node_modules" in str(f) or ".git" in str(f):
-                continue
-            try:
-                content = f.read_text(errors="ignore")
-                for name, pattern in PATTERNS.items():
-                    if pattern.search(content):
-                        results[name] = True
-            except Exception:
-                pass
-
-    return results
+    return ProjectScanner().scan(project_path).patterns
 
 
 def run_compliance_checks(
@@ -503,21 +686,24 @@ def calculate_score(checks: List[ComplianceCheck], has_esi: bool) -> int:
     return max(0, min(100, int(earned / max_score * 100) if max_score > 0 else 100))
 
 
-def audit_project(project_path: Path) -> ProjectAudit:
+def audit_project(project_path: Path, scanner: Optional[ProjectScanner] = None) -> ProjectAudit:
     """Perform full audit of a project."""
+    # One walk and one read per file covers type detection, counts and patterns
+    scan = (scanner or ProjectScanner()).scan(project_path)
     audit = ProjectAudit(
         name=project_path.name,
         path=str(project_path),
-        project_type=detect_project_type(project_path),
+        project_type=detect_project_type(project_path, scan),
     )
 
     # Count files
-    audit.python_files, audit.js_files, audit.json_files, audit.total_lines = count_files(
-        project_path
-    )
+    audit.python_files = scan.python_files
+    audit.js_files = scan.js_files
+    audit.json_files = scan.json_files
+    audit.total_lines = scan.total_lines
 
     # Scan patterns
-    patterns = scan_for_patterns(project_path)
+    patterns = scan.patterns
     audit.has_esi = patterns["esi_url"]
     audit.has_image_server = patterns["image_server"]
     audit.has_sso = patterns["sso_url"]
@@ -626,6 +812,14 @@ def main():
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--report", action="store_true", help="Generate detailed report")
     parser.add_argument("--output", "-o", type=Path, help="Save report to file")
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_SCAN_CACHE,
+        help="Per-file scan cache, so re-audits only read changed files",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Read every file again")
+    parser.add_argument("--workers", type=int, help="Scan processes (default: CPU count)")
 
     args = parser.parse_args()
 
@@ -657,7 +851,9 @@ def main():
         sys.exit(1)
 
     # Run audits
-    audits = [audit_project(p) for p in projects]
+    with ProjectScanner(None if args.no_cache else args.cache, args.workers) as scanner:
+        audits = [audit_project(p, scanner) for p in projects]
+        scanner.save()
 
     if args.json:
         output = {
@@ -36,19 +36,80 @@ A compliant ESI API client following CCP's best practices.
 """
 
 import asyncio
-from datetime import datetime, timezone
-from typing import Dict, Optional, Any
+import hashlib
+import json
+import os
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
 import httpx
 
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Allows bursts of up to `burst` requests and `rate` requests per second
+    on average. update_budget() slows it down as the ESI error budget runs
+    low and pauses it when the budget is nearly spent.
+    """
+
+    def __init__(self, rate: float = 20.0, burst: int = 20):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        while True:
+            now = time.monotonic()
+            wait = self.paused_until - now
+            if wait <= 0:
+                self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    def update_budget(self, remain: int, reset: int) -> None:
+        """Adjust to the X-ESI-Error-Limit-Remain/Reset headers."""
+        if remain < 5:
+            # Stop until the error window resets rather than risk a ban
+            self.paused_until = time.monotonic() + reset
+            self.tokens = 0.0
+        elif remain < 20:
+            # Even if every request failed, stay within the budget
+            self.rate = min(self.base_rate, remain / max(reset, 1))
+        else:
+            self.rate = self.base_rate
+
+
+def _expires(headers: httpx.Headers) -> float:
+    """Expires header as a Unix timestamp, 0 if missing or invalid."""
+    try:
+        return parsedate_to_datetime(headers["Expires"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
 class ESIClient:
     """
     EVE Online ESI API Client
 
     Features:
     - User-Agent header (required by CCP)
-    - Response caching based on Expires header
+    - One pooled connection shared by every request
+    - Identical requests in flight at the same time share one call
+    - On-disk response cache based on Expires, revalidated with ETag
     - Error limit monitoring (100 errors/60s = ban)
-    - Rate limiting for bulk operations
+    - Token-bucket rate limiting that backs off as the error budget drops
     """
 
     BASE_URL = "https://esi.evetech.net/latest"
@@ -58,22 +119,88 @@ class ESIClient:
         self,
         app_name: str = "{project_name}",
         contact_email: str = "developer@example.com",
-        datasource: str = "tranquility"
+        datasource: str = "tranquility",
+        cache_dir: Optional[str] = ".esi_cache",
+        base_url: Optional[str] = None,
+        rate: float = 20.0,
+        max_connections: int = 20,
     ):
+        """
+        Args:
+            cache_dir: Directory for cached responses; None caches in memory only
+            base_url: ESI root, BASE_URL unless testing against another server
+            rate: Average requests per second
+            max_connections: Size of the connection pool
+        """
         self.app_name = app_name
         self.contact_email = contact_email
         self.datasource = datasource
+        self.base_url = base_url or self.BASE_URL
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_connections = max_connections
 
         self.headers = {{
             "User-Agent": f"{{app_name}}/1.0 ({{contact_email}})",
-            "Accept": "application/json"
+            "Accept": "application/json",
         }}
 
         self._cache: Dict[str, Dict] = {{}}
+        self._inflight: Dict[str, asyncio.Future] = {{}}
+        self._limiter = TokenBucket(rate)
+        self._http: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closer: Optional[asyncio.Task] = None
         self._error_count = 0
-        self._error_reset: Optional[datetime] = None
+        self.requests_sent = 0
+
+    async def __aenter__(self) -> "ESIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled connection."""
+        if self._http is not None:
+            if self._loop is asyncio.get_running_loop():
+                self._closer.cancel()
+                await self._http.aclose()
+            # Otherwise the client's loop has shut down and closed it already
+            self._http = None
+
+    def _session(self) -> httpx.AsyncClient:
+        """The shared HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._loop is not loop:
+            # A client can't outlive its event loop (e.g. across asyncio.run
+            # calls), so each loop gets its own, closed when the loop shuts down
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+            self._loop = loop
+            self._inflight = {{}}
+            self._closer = loop.create_task(self._close_on_shutdown(self._http))
+        return self._http
+
+    @staticmethod
+    async def _close_on_shutdown(http: httpx.AsyncClient) -> None:
+        """
+        Close `http` on its own loop once cancelled.
+
+        asyncio.run cancels leftover tasks before closing the loop, so this
+        runs even if close() is never called; closing the client later from
+        another loop would fail and leak its sockets.
+        """
+        try:
+            await asyncio.Future()
+        finally:
+            await http.aclose()
 
-    def _check_error_budget(self, headers: Dict) -> None:
+    def _check_error_budget(self, headers: httpx.Headers) -> None:
         """Monitor error limit headers."""
         if "X-ESI-Error-Limit-Remain" in headers:
             remain = int(headers["X-ESI-Error-Limit-Remain"])
@@ -82,27 +209,49 @@ class ESIClient:
             if remain < 20:
                 print(f"⚠️ ESI error budget low: {{remain}} remaining, resets in {{reset}}s")
 
-            if remain < 5:
-                raise Exception(f"ESI error budget critical: {{remain}} remaining. Pausing requests.")
+            self._limiter.update_budget(remain, reset)
 
     def _get_cache_key(self, endpoint: str, params: Optional[Dict]) -> str:
         """Generate cache key for request."""
         param_str = json.dumps(params, sort_keys=True) if params else ""
         return f"{{endpoint}}:{{param_str}}"
 
+    def _cache_path(self, cache_key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / (hashlib.sha1(cache_key.encode()).hexdigest() + ".json")
+
+    def _load_cached(self, cache_key: str) -> Optional[Dict]:
+        """Cached entry from memory, or from disk on first use."""
+        entry = self._cache.get(cache_key)
+        path = self._cache_path(cache_key)
+        if entry is None and path is not None:
+            try:
+                entry = json.loads(path.read_text())
+            except (OSError, ValueError):
+                return None
+            self._cache[cache_key] = entry
+        return entry
+
+    def _store(self, cache_key: str, entry: Dict) -> None:
+        self._cache[cache_key] = entry
+        path = self._cache_path(cache_key)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entry))
+            os.replace(tmp, path)
+
     def _is_cached(self, cache_key: str) -> bool:
         """Check if response is cached and valid."""
-        if cache_key not in self._cache:
-            return False
-
-        cached = self._cache[cache_key]
-        return datetime.now(timezone.utc) < cached["expires"]
+        entry = self._load_cached(cache_key)
+        return entry is not None and time.time() < entry["expires"]
 
     async def get(
         self,
         endpoint: str,
         params: Optional[Dict] = None,
-        skip_cache: bool = False
+        skip_cache: bool = False,
     ) -> Any:
         """
         Make a GET request to ESI.
@@ -121,8 +270,27 @@ class ESIClient:
         if not skip_cache and self._is_cached(cache_key):
             return self._cache[cache_key]["data"]
 
-        # Build request
-        url = f"{{self.BASE_URL}}{{endpoint}}"
+        # Join an identical request that is already on its way
+        self._session()
+        pending = self._inflight.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(endpoint, params, cache_key, skip_cache))
+            self._inflight[cache_key] = pending
+            pending.add_done_callback(lambda done: self._finish(cache_key, done))
+        # One caller giving up doesn't cancel the request for the others
+        return await asyncio.shield(pending)
+
+    def _finish(self, cache_key: str, done: asyncio.Future) -> None:
+        if self._inflight.get(cache_key) is done:
+            del self._inflight[cache_key]
+        if not done.cancelled():
+            done.exception()  # Waiters get the error; don't log it as unretrieved
+
+    async def _fetch(
+        self, endpoint: str, params: Optional[Dict], cache_key: str, skip_cache: bool
+    ) -> Any:
+        """Send one request, revalidating a stale cache entry if it has an ETag."""
+        url = f"{{self.base_url}}{{endpoint}}"
         if not url.endswith("/"):
             url += "/"
 
@@ -130,40 +298,36 @@ class ESIClient:
         if params:
             request_params.update(params)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                url,
-                headers=self.headers,
-                params=request_params
-            )
+        headers = dict(self.headers)
+        cached = None if skip_cache else self._load_cached(cache_key)
+        if cached is not None and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
 
-            # Check error budget
-            self._check_error_budget(dict(response.headers))
+        await self._limiter.acquire()
+        response = await self._session().get(url, headers=headers, params=request_params)
+        self.requests_sent += 1
 
+        # Check error budget
+        self._check_error_budget(response.headers)
+
+        if response.status_code == 304 and cached is not None:
+            # Not modified: keep the cached data, take the new expiry
+            data = cached["data"]
+            etag = response.headers.get("ETag", cached.get("etag"))
+        else:
             # Handle errors
             if response.status_code >= 400:
                 self._error_count += 1
                 response.raise_for_status()
-
-            # Parse response
             data = response.json()
+            etag = response.headers.get("ETag")
 
-            # Cache based on Expires header
-            if "Expires" in response.headers:
-                try:
-                    expires = datetime.strptime(
-                        response.headers["Expires"],
-                        "%a, %d %b %Y %H:%M:%S %Z"
-                    ).replace(tzinfo=timezone.utc)
-
-                    self._cache[cache_key] = {{
-                        "data": data,
-                        "expires": expires
-                    }}
-                except ValueError:
-                    pass  # Ignore invalid date format
+        # Cache based on Expires header, keeping the ETag for revalidation
+        expires = _expires(response.headers)
+        if expires or etag:
+            self._store(cache_key, {{"data": data, "expires": expires, "etag": etag}})
 
-            return data
+        return data
 
     async def get_system(self, system_id: int) -> Dict:
         """Get solar system information."""
@@ -242,19 +406,63 @@ Loads ship sprites from EVE Image Server with caching.
 """
 
 import asyncio
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import pygame
 import httpx
 
+# (width, height), RGBA pixels
+Decoded = Tuple[Tuple[int, int], bytes]
+
+
+def _decode_rgba(source: Union[str, bytes]) -> Decoded:
+    """
+    Decode a PNG to raw RGBA. Runs on a worker thread.
+
+    convert_alpha() needs the display, so it is left to the main thread;
+    turning these bytes into a surface there is a cheap copy.
+    """
+    image = pygame.image.load(io.BytesIO(source) if isinstance(source, bytes) else source)
+    return image.get_size(), pygame.image.tobytes(image, "RGBA")
+
+
+class PreloadProgress:
+    """How far a preload has got, for drawing a loading bar."""
+
+    def __init__(self, requests: List[Tuple[Tuple[int, int], Future]]):
+        self.total = len(requests)
+        self.loaded = 0
+        self.failed: List[int] = []
+        self._pending = requests
+
+    @property
+    def fraction(self) -> float:
+        """Share of sprites finished (loaded or failed), 0.0 to 1.0."""
+        if not self.total:
+            return 1.0
+        return (self.loaded + len(self.failed)) / self.total
+
+    @property
+    def done(self) -> bool:
+        return not self._pending
+
+
 class ShipSprites:
     """
     Manages ship sprite loading from EVE Image Server.
 
     Features:
-    - Async downloading
+    - Downloads and PNG decoding in the background, many at once
     - Local caching
-    - Pygame surface conversion
+    - Pygame surface conversion, the only step on the main thread
+    - Observable preload progress
+
+    Downloads run on a background event loop that lives as long as the
+    manager; decoding runs on a thread pool. Call poll() once per frame so
+    finished sprites become surfaces, or close() when done with the manager.
     """
 
     IMAGE_SERVER = "https://images.evetech.net"
@@ -277,10 +485,36 @@ class ShipSprites:
         "nyx": 23913,
     }}
 
-    def __init__(self, cache_dir: str = "assets/ships"):
+    def __init__(self, cache_dir: str = "assets/ships", decode_workers: int = 4):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._surfaces: Dict[int, pygame.Surface] = {{}}
+        self._surfaces: Dict[Tuple[int, int], pygame.Surface] = {{}}
+        self._pending: Dict[Tuple[int, int], Future] = {{}}
+        self._preloads: List[PreloadProgress] = []
+        self._lock = threading.RLock()
+
+        self._decoder = ThreadPoolExecutor(decode_workers, thread_name_prefix="sprite-decode")
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="sprite-loader", daemon=True
+        )
+        self._thread.start()
+        self._http: Optional[httpx.AsyncClient] = None
+
+    def close(self) -> None:
+        """Stop the background loop and decoder threads."""
+        if self._loop.is_closed():
+            return
+
+        async def shutdown():
+            if self._http is not None:
+                await self._http.aclose()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._decoder.shutdown(cancel_futures=True)
 
     def _get_cache_path(self, type_id: int, size: int) -> Path:
         """Get local cache path for sprite."""
@@ -290,10 +524,71 @@ class ShipSprites:
         """Download sprite from Image Server."""
         url = f"{{self.IMAGE_SERVER}}/types/{{type_id}}/render?size={{size}}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
-            return response.content
+        if self._http is None:
+            # One client for every download, so connections are reused
+            self._http = httpx.AsyncClient(follow_redirects=True)
+        response = await self._http.get(url)
+        response.raise_for_status()
+        return response.content
+
+    def _save_and_decode(self, cache_path: Path, image_data: bytes) -> Decoded:
+        cache_path.write_bytes(image_data)
+        return _decode_rgba(image_data)
+
+    async def _fetch(self, type_id: int, size: int, use_cache: bool) -> Decoded:
+        """Find or download a sprite and decode it. Runs on the background loop."""
+        cache_path = self._get_cache_path(type_id, size)
+        loop = asyncio.get_running_loop()
+
+        # Check file cache
+        if use_cache and cache_path.exists():
+            return await loop.run_in_executor(self._decoder, _decode_rgba, str(cache_path))
+
+        # Download
+        print(f"Downloading ship sprite: {{type_id}} @ {{size}}px")
+        image_data = await self._download_sprite(type_id, size)
+
+        # Save to cache
+        return await loop.run_in_executor(
+            self._decoder, self._save_and_decode, cache_path, image_data
+        )
+
+    def request(self, type_id: int, size: int = 256, use_cache: bool = True) -> Future:
+        """
+        Start loading a sprite in the background.
+
+        Returns:
+            Future for the decoded pixels; identical requests share one
+        """
+        cache_key = (type_id, size)
+        with self._lock:
+            future = self._pending.get(cache_key)
+            if future is None:
+                future = asyncio.run_coroutine_threadsafe(
+                    self._fetch(type_id, size, use_cache), self._loop
+                )
+                self._pending[cache_key] = future
+                future.add_done_callback(lambda done: self._forget_failure(cache_key, done))
+            return future
+
+    def _forget_failure(self, cache_key: Tuple[int, int], future: Future) -> None:
+        """Let a failed load be requested again."""
+        if future.cancelled() or future.exception() is not None:
+            with self._lock:
+                if self._pending.get(cache_key) is future:
+                    del self._pending[cache_key]
+
+    def _to_surface(self, cache_key: Tuple[int, int], future: Future) -> pygame.Surface:
+        """Convert decoded pixels to a display surface. Main thread only."""
+        surface = self._surfaces.get(cache_key)
+        if surface is None:
+            size, pixels = future.result()
+            surface = pygame.image.frombuffer(pixels, size, "RGBA").convert_alpha()
+            self._surfaces[cache_key] = surface
+            with self._lock:
+                if self._pending.get(cache_key) is future:
+                    del self._pending[cache_key]
+        return surface
 
     async def load_sprite(
         self,
@@ -318,40 +613,52 @@ class ShipSprites:
         if cache_key in self._surfaces:
             return self._surfaces[cache_key]
 
-        cache_path = self._get_cache_path(type_id, size)
-
-        # Check file cache
-        if use_cache and cache_path.exists():
-            surface = pygame.image.load(str(cache_path)).convert_alpha()
-            self._surfaces[cache_key] = surface
-            return surface
-
-        # Download
-        print(f"Downloading ship sprite: {{type_id}} @ {{size}}px")
-        image_data = await self._download_sprite(type_id, size)
-
-        # Save to cache
-        cache_path.write_bytes(image_data)
+        future = self.request(type_id, size, use_cache)
+        await asyncio.wrap_future(future)
+        return self._to_surface(cache_key, future)
 
-        # Convert to surface
-        import io
-        surface = pygame.image.load(io.BytesIO(image_data)).convert_alpha()
-        self._surfaces[cache_key] = surface
+    def load_sprite_sync(self, type_id: int, size: int = 256) -> pygame.Surface:
+        """Synchronous sprite loading; blocks until the background load finishes."""
+        cache_key = (type_id, size)
+        if cache_key in self._surfaces:
+            return self._surfaces[cache_key]
+        return self._to_surface(cache_key, self.request(type_id, size))
 
-        return surface
+    def preload(self, type_ids: List[int], size: int = 256) -> PreloadProgress:
+        """
+        Start loading sprites without blocking.
 
-    def load_sprite_sync(self, type_id: int, size: int = 256) -> pygame.Surface:
-        """Synchronous sprite loading (uses asyncio.run internally)."""
-        return asyncio.run(self.load_sprite(type_id, size))
-
-    async def preload_common_ships(self, size: int = 256) -> None:
-        """Preload all common ship sprites."""
-        tasks = [
-            self.load_sprite(type_id, size)
-            for type_id in self.SHIPS.values()
-        ]
-        await asyncio.gather(*tasks)
-        print(f"Preloaded {{len(self.SHIPS)}} ship sprites")
+        Call poll() every frame until the returned progress is done.
+        """
+        progress = PreloadProgress(
+            [((type_id, size), self.request(type_id, size)) for type_id in type_ids]
+        )
+        self._preloads.append(progress)
+        return progress
+
+    def preload_common_ships(self, size: int = 256) -> PreloadProgress:
+        """Start preloading all common ship sprites."""
+        return self.preload(list(self.SHIPS.values()), size)
+
+    def poll(self) -> None:
+        """Turn sprites that finished loading into surfaces. Call from the main thread."""
+        for progress in list(self._preloads):
+            waiting = []
+            for cache_key, future in progress._pending:
+                if not future.done():
+                    waiting.append((cache_key, future))
+                    continue
+                try:
+                    self._to_surface(cache_key, future)
+                except Exception as e:
+                    print(f"Warning: Could not load ship sprite {{cache_key[0]}}: {{e}}")
+                    progress.failed.append(cache_key[0])
+                else:
+                    progress.loaded += 1
+            progress._pending = waiting
+            if not waiting:
+                self._preloads.remove(progress)
+                print(f"Preloaded {{progress.loaded}}/{{progress.total}} ship sprites")
 
     def get_by_name(self, name: str, size: int = 256) -> Optional[pygame.Surface]:
         """Get sprite by ship name."""
@@ -363,13 +670,16 @@ class ShipSprites:
 
 # Usage example:
 # sprites = ShipSprites()
-# await sprites.preload_common_ships()
+# progress = sprites.preload_common_ships()
+# while not progress.done:
+#     sprites.poll()
+#     draw_loading_bar(progress.fraction)
 # rifter_surface = sprites.get_by_name("rifter")
 '''
 
 REQUIREMENTS_ADDITIONS = {
     "esi_client": ["httpx>=0.25.0"],
-    "ship_sprites": ["httpx>=0.25.0", "pygame>=2.0.0"],
+    "ship_sprites": ["httpx>=0.25.0", "pygame>=2.1.3"],
     "sso": ["httpx>=0.25.0", "pyjwt>=2.8.0"],
 }
 
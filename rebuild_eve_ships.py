@@ -12,14 +12,13 @@ Usage:
 """
 
 import argparse
-import asyncio
 import json
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-import httpx
+from core.downloader import DownloadJob, Validators, download_files
 
 # ============================================================================
 # COMPLETE EVE SHIP DATABASE
@@ -307,35 +306,21 @@ Repository structure and scripts: MIT License
 """
 
 
-async def download_image(
-    client: httpx.AsyncClient, type_id: int, name: str, size: int, variation: str, output_dir: Path
-) -> bool:
-    """Download a single image."""
-    url = f"{IMAGE_SERVER}/types/{type_id}/{variation}?size={size}"
-    filename = f"{name}_{type_id}.png"
-    output_path = output_dir / filename
-
-    if output_path.exists():
-        return True  # Already have it
-
-    try:
-        response = await client.get(url, follow_redirects=True)
-        if response.status_code == 200:
-            output_path.write_bytes(response.content)
-            return True
-    except Exception as e:
-        print(f"  ❌ Failed: {name} - {e}")
-
-    return False
+def image_job(type_id: int, name: str, size: int, variation: str, output_dir: Path) -> DownloadJob:
+    """The download job for one image."""
+    return DownloadJob(
+        f"{IMAGE_SERVER}/types/{type_id}/{variation}?size={size}",
+        output_dir / f"{name}_{type_id}.png",
+    )
 
 
-async def download_all_ships(
+def download_all_ships(
     output_dir: Path,
     sizes: List[int] = [256, 512],
     include_icons: bool = False,
-    progress_callback=None,
-):
-    """Download all ships."""
+    validators: Optional[Validators] = None,
+) -> Tuple[int, int]:
+    """Download all ships in one pooled batch, skipping files already present."""
     renders_dir = output_dir / "renders"
     icons_dir = output_dir / "icons"
 
@@ -353,66 +338,43 @@ async def download_all_ships(
     print(f"   Total images: {total_downloads}")
     print("-" * 50)
 
+    jobs = []
+    job_classes = []
+    for ship_class, ships in SHIP_DATABASE.items():
+        for name, info in ships.items():
+            type_id = info["type_id"]
+
+            for size in sizes:
+                jobs.append(image_job(type_id, name, size, "render", renders_dir / str(size)))
+                job_classes.append(ship_class)
+
+                if include_icons and size <= 64:
+                    jobs.append(image_job(type_id, name, size, "icon", icons_dir / str(size)))
+                    job_classes.append(ship_class)
+
+    outcomes = download_files(jobs, validators)
+
+    # Report per class, in database order
+    by_class: Dict[str, List[bool]] = {}
+    for ship_class, outcome in zip(job_classes, outcomes):
+        by_class.setdefault(ship_class, []).append(outcome.ok)
+        if not outcome.ok:
+            print(f"  ❌ Failed: {outcome.job.path.name} - {outcome.error}")
+
     completed = 0
     failed = 0
-
-    semaphore = asyncio.Semaphore(10)  # Limit concurrent downloads
-
-    async def bounded_download(client, type_id, name, size, variation, out_dir):
-        async with semaphore:
-            return await download_image(client, type_id, name, size, variation, out_dir)
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for ship_class, ships in SHIP_DATABASE.items():
-            print(f"\n🚀 {ship_class.upper()} ({len(ships)} ships)")
-
-            tasks = []
-            for name, info in ships.items():
-                type_id = info["type_id"]
-
-                for size in sizes:
-                    # Render
-                    tasks.append(
-                        (
-                            bounded_download(
-                                client, type_id, name, size, "render", renders_dir / str(size)
-                            ),
-                            name,
-                            "render",
-                        )
-                    )
-
-                    # Icon
-                    if include_icons and size <= 64:
-                        tasks.append(
-                            (
-                                bounded_download(
-                                    client, type_id, name, size, "icon", icons_dir / str(size)
-                                ),
-                                name,
-                                "icon",
-                            )
-                        )
-
-            # Execute tasks
-            results = await asyncio.gather(*[t[0] for t in tasks])
-
-            for result, (_, name, var) in zip(results, tasks):
-                if result:
-                    completed += 1
-                else:
-                    failed += 1
-
-            success_rate = (
-                (completed / (completed + failed)) * 100 if (completed + failed) > 0 else 0
-            )
-            print(f"   ✅ {completed} downloaded, ❌ {failed} failed ({success_rate:.0f}%)")
+    for ship_class, results in by_class.items():
+        completed += sum(results)
+        failed += len(results) - sum(results)
+        success_rate = (completed / (completed + failed)) * 100
+        print(f"\n🚀 {ship_class.upper()} ({len(SHIP_DATABASE[ship_class])} ships)")
+        print(f"   ✅ {completed} downloaded, ❌ {failed} failed ({success_rate:.0f}%)")
 
     return completed, failed
 
 
-def create_manifest(output_dir: Path):
-    """Create manifest.json with all ship data."""
+def create_manifest(output_dir: Path, validators: Optional[Validators] = None):
+    """Create manifest.json with all ship data and the downloads' ETags."""
     manifest = {
         "generated": datetime.now().isoformat(),
         "source": "EVE Image Server (images.evetech.net)",
@@ -421,6 +383,7 @@ def create_manifest(output_dir: Path):
         "by_type_id": {},
         "by_faction": {},
         "by_class": {},
+        "validators": validators or {},
     }
 
     for ship_class, ships in SHIP_DATABASE.items():
@@ -547,7 +510,7 @@ __pycache__/
     print("✅ Created .gitignore")
 
 
-async def rebuild_repository(
+def rebuild_repository(
     output_dir: Path,
     sizes: List[int] = [256, 512],
     include_icons: bool = False,
@@ -570,14 +533,20 @@ async def rebuild_repository(
     # Create fresh directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Resume into an existing directory, keeping its ETags
+    try:
+        validators = json.loads((output_dir / "manifest.json").read_text()).get("validators", {})
+    except (OSError, ValueError, AttributeError):
+        validators = {}
+
     # Download all ships
-    completed, failed = await download_all_ships(
-        output_dir, sizes=sizes, include_icons=include_icons
+    completed, failed = download_all_ships(
+        output_dir, sizes=sizes, include_icons=include_icons, validators=validators
     )
 
     # Create manifest
     print("\n📋 Creating manifest and documentation...")
-    manifest = create_manifest(output_dir)
+    manifest = create_manifest(output_dir, validators)
     create_readme(output_dir, sizes)
     create_gitignore(output_dir)
 
@@ -641,13 +610,11 @@ Examples:
         print(f"Valid sizes: {VALID_SIZES}")
         return
 
-    asyncio.run(
-        rebuild_repository(
-            args.output.expanduser(),
-            sizes=sizes,
-            include_icons=args.include_icons,
-            backup=not args.no_backup,
-        )
+    rebuild_repository(
+        args.output.expanduser(),
+        sizes=sizes,
+        include_icons=args.include_icons,
+        backup=not args.no_backup,
     )
 
 
@@ -6,12 +6,19 @@ Renders STL ship models as top-down sprites for use in the game.
 Run with: blender --background --python render_ships.py
 
 Uses orthographic camera from above to create 2D sprites.
+
+To render the whole list in one Blender session (or several in parallel),
+resuming after interruptions, use scripts/render_batch.py --ships.
 """
 
 import math
 import os
 
-import bpy
+try:
+    import bpy
+except ImportError:
+    # Imported outside Blender for SHIPS_TO_RENDER (scripts/render_batch.py)
+    bpy = None
 
 # Configuration
 OUTPUT_DIR = "/home/arete/EVE_Rebellion/assets/ship_sprites"
@@ -0,0 +1,148 @@
+"""
+Bake the sprite texture atlas for EVE Rebellion.
+
+Renders every static sprite variant - player and enemy ships, player bullet
+pulse frames, rocket exhaust frames, enemy lasers, explosion stamps and
+powerup icons - with the game's own drawing code, shelf-packs them into a
+few large pages and writes assets/atlas/ (PNG pages + atlas.json manifest)
+for core.sprite_atlas to load at runtime.
+
+Run with: python scripts/bake_sprite_atlas.py [--output DIR] [--page-size N] [--max-sprite N]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+# Headless pygame - the bake never opens a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Always render from source, never from a previously baked atlas
+os.environ["EVE_REBELLION_SPRITE_ATLAS"] = os.devnull
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from core.sprite_atlas import (  # noqa: E402
+    ATLAS_DIR,
+    DEFAULT_PAGE_SIZE,
+    SpriteAtlas,
+    bake_atlas,
+    save_atlas,
+)
+
+# Ships larger than this (in either dimension) stay as standalone surfaces;
+# the atlas is for the small sprites drawn in large numbers
+DEFAULT_MAX_SPRITE = 256
+
+
+def collect_projectiles(images):
+    """Player bullets, rockets and enemy lasers."""
+    from constants import AMMO_TYPES
+    from sprites import ATLAS_ANIM_FRAMES, Bullet, EnemyBullet, Rocket
+
+    step = 2 * math.pi / ATLAS_ANIM_FRAMES
+    for ammo in AMMO_TYPES.values():
+        for level in range(4):
+            bullet = Bullet(0, 0, 0, 0, ammo["tracer"], 0, upgrade_level=level)
+            for frame in range(ATLAS_ANIM_FRAMES if level > 0 else 1):
+                bullet.anim_timer = frame * step
+                bullet._update_image()
+                images[bullet._atlas_key()] = bullet.image
+
+    rocket = Rocket(0, 0)
+    for frame in range(ATLAS_ANIM_FRAMES):
+        # Rocket exhaust phase is anim_timer * 0.5
+        rocket.anim_timer = frame * step * 2
+        rocket._update_image()
+        images[f"rocket/{frame}"] = rocket.image
+
+    images["enemy_bullet"] = EnemyBullet(0, 0, 0, 0).image
+
+
+def collect_effects(images):
+    """Explosion stamps and powerup icons."""
+    from constants import POWERUP_TYPES
+    from sprites import ATLAS_EXPLOSIONS, Explosion, Powerup, _color_key
+
+    for size, color in ATLAS_EXPLOSIONS:
+        explosion = Explosion(0, 0, size, color)
+        for frame in range(explosion.max_frames):
+            explosion.frame = frame
+            explosion._update_image()
+            images[f"explosion/{size}/{_color_key(color)}/{frame}"] = explosion.image
+
+    for powerup_type in POWERUP_TYPES:
+        images[f"powerup_icon/{powerup_type}"] = Powerup(0, 0, powerup_type).base_surface
+
+
+def collect_ships(images, max_sprite):
+    """Player ships and every enemy hull/size the game can request."""
+    from build_asset_pack import enemy_sprite_variants
+
+    from sprites import PLAYER_SHIP_SVGS, render_enemy_ship, render_player_ship
+
+    skipped = 0
+    for ship_type in PLAYER_SHIP_SVGS:
+        try:
+            images[f"player/{ship_type}"] = render_player_ship(ship_type)
+        except Exception:
+            skipped += 1
+
+    for svg_rel, (width, height) in enemy_sprite_variants():
+        if max(width, height) > max_sprite:
+            continue
+        ship_name = os.path.splitext(os.path.basename(svg_rel))[0]
+        try:
+            images[f"enemy/{ship_name}@{width}x{height}"] = render_enemy_ship(
+                ship_name, (width, height)
+            )
+        except Exception:
+            skipped += 1
+    if skipped:
+        print(f"  {skipped} ship variants skipped (no asset pack entry and no cairosvg)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake the EVE Rebellion sprite atlas")
+    parser.add_argument("--output", default=os.path.join(ROOT, ATLAS_DIR))
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument(
+        "--max-sprite",
+        type=int,
+        default=DEFAULT_MAX_SPRITE,
+        help="Largest ship sprite dimension to bake (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    start = time.perf_counter()
+
+    images = {}
+    collect_projectiles(images)
+    collect_effects(images)
+    collect_ships(images, args.max_sprite)
+    render_ms = (time.perf_counter() - start) * 1000
+
+    pages, regions = bake_atlas(images, args.page_size)
+    bake_ms = (time.perf_counter() - start) * 1000
+    save_atlas(args.output, pages, regions, bake_ms)
+
+    used = sum(r[3] * r[4] for r in regions.values())
+    total = sum(p.get_width() * p.get_height() for p in pages)
+    print(f"Baked {len(regions)} sprites onto {len(pages)} pages in {bake_ms:.0f}ms")
+    print(f"  render {render_ms:.0f}ms, pack {bake_ms - render_ms:.0f}ms")
+    print(f"  page fill {100 * used / max(1, total):.0f}%")
+
+    atlas = SpriteAtlas.load(args.output)
+    print(f"  reload {atlas.load_ms:.1f}ms -> {args.output}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
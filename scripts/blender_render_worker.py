@@ -0,0 +1,185 @@
+"""
+Persistent Blender worker for core.render_queue.
+
+Sets up the camera, lights and render settings once, then renders every
+job streamed to it on stdin. Between jobs only the ship mesh is swapped;
+the camera is re-framed and materials are reused per colour.
+
+Each job names its rig. "topdown" lights and shades like
+render_stl_topdown.py, and "ships" like render_ships.py: that script's
+three sun lights, emissive hull material, EEVEE settings and framing.
+
+Run by the queue (see scripts/render_batch.py), as:
+    blender --background --python scripts/blender_render_worker.py
+"""
+
+import math
+import os
+import sys
+
+import bpy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from render_stl_topdown import setup_object, setup_render  # noqa: E402
+
+from core.render_queue import serve  # noqa: E402
+from render_ships import create_material as create_ships_material  # noqa: E402
+from render_ships import setup_render_settings as setup_ships_render  # noqa: E402
+
+# render_ships.create_lighting: (name, energy, rotation in degrees)
+SHIPS_LIGHTS = (
+    ("ShipsKeyLight", 3.0, (30, 20, 0)),
+    ("ShipsFillLight", 1.5, (45, -30, 0)),
+    ("ShipsRimLight", 2.0, (60, 0, 0)),
+)
+
+# World colour of Blender's startup scene, which render_ships renders in
+STARTUP_WORLD_COLOR = (0.0509, 0.0509, 0.0509, 1.0)
+
+
+class Studio:
+    """The scene that stays loaded between jobs."""
+
+    def __init__(self):
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        scene = bpy.context.scene
+
+        cam_data = bpy.data.cameras.new(name="TopDownCam")
+        cam_data.type = "ORTHO"
+        self.camera = bpy.data.objects.new("TopDownCam", cam_data)
+        scene.collection.objects.link(self.camera)
+        scene.camera = self.camera
+
+        # Same rig as render_stl_topdown.setup_lighting, sized per job
+        self.lights = [
+            self.add_light(scene, name, energy, color, rotation)
+            for name, energy, color, rotation in (
+                ("KeyLight", 8.0, (1.0, 0.95, 0.9), (45, 30, 0)),
+                ("RimLight", 5.0, (0.7, 0.8, 1.0), (135, -30, 0)),
+                ("FillLight", 3.0, (0.9, 0.9, 1.0), (0, 0, 0)),
+            )
+        ]
+        self.ships_lights = [
+            self.add_light(scene, name, energy, (1.0, 1.0, 1.0), rotation)
+            for name, energy, rotation in SHIPS_LIGHTS
+        ]
+
+        self.materials = {}
+        self.model = None
+        self.settings = None
+
+    @staticmethod
+    def add_light(scene, name, energy, color, rotation):
+        light = bpy.data.lights.new(name=name, type="SUN")
+        light.energy = energy
+        light.color = color
+        light_obj = bpy.data.objects.new(name, light)
+        light_obj.rotation_euler = tuple(math.radians(a) for a in rotation)
+        scene.collection.objects.link(light_obj)
+        return light_obj
+
+    def material(self, color, rig):
+        """Hull material for a colour and rig, created on first use."""
+        key = (rig, tuple(round(c, 4) for c in color))
+        if key not in self.materials:
+            name = f"Ship{len(self.materials)}"
+            if rig == "ships":
+                mat = create_ships_material(name, key[1])
+            else:
+                mat = bpy.data.materials.new(name=name)
+                mat.use_nodes = True
+                bsdf = mat.node_tree.nodes.get("Principled BSDF")
+                bsdf.inputs["Base Color"].default_value = key[1]
+                bsdf.inputs["Metallic"].default_value = 0.9
+                bsdf.inputs["Roughness"].default_value = 0.3
+            self.materials[key] = mat
+        return self.materials[key]
+
+    def configure(self, job):
+        """Apply render settings, only when they differ from the last job."""
+        rig = job.get("rig", "topdown")
+        settings = (rig, job["engine"], job["size"])
+        if settings != self.settings:
+            scene = bpy.context.scene
+            if rig == "ships":
+                setup_ships_render(job["size"])
+                if not scene.world:
+                    scene.world = bpy.data.worlds.new("World")
+                scene.world.use_nodes = True
+                bg = scene.world.node_tree.nodes.get("Background")
+                if bg:
+                    bg.inputs[0].default_value = STARTUP_WORLD_COLOR
+            else:
+                setup_render(job["output"], job["size"])
+                if job["engine"] != "CYCLES":
+                    try:
+                        scene.render.engine = job["engine"]
+                    except TypeError:
+                        # BLENDER_EEVEE_NEXT is only in Blender 4.2+
+                        scene.render.engine = "BLENDER_EEVEE"
+            for light in self.lights:
+                light.hide_render = rig == "ships"
+            for light in self.ships_lights:
+                light.hide_render = rig != "ships"
+            self.settings = settings
+        bpy.context.scene.render.filepath = job["output"]
+
+    def load_model(self, job):
+        """Replace the previous ship with this job's STL."""
+        if self.model is not None:
+            mesh = self.model.data
+            bpy.data.objects.remove(self.model, do_unlink=True)
+            bpy.data.meshes.remove(mesh)
+            self.model = None
+
+        bpy.ops.wm.stl_import(filepath=job["stl"])
+        self.model = bpy.context.selected_objects[0]
+
+        if job["auto_orient"]:
+            obj_size = setup_object(self.model, rotate_180=job["rotate_180"])
+        else:
+            # render_ships keeps the model's axes and only turns it to face up
+            bpy.context.view_layer.objects.active = self.model
+            bpy.ops.object.origin_set(type="ORIGIN_GEOMETRY", center="BOUNDS")
+            self.model.location = (0, 0, 0)
+            self.model.rotation_euler = (0, 0, math.pi if job["rotate_180"] else 0)
+            bpy.context.view_layer.update()
+            obj_size = max(self.model.dimensions.x, self.model.dimensions.y)
+
+        self.model.data.materials.clear()
+        self.model.data.materials.append(self.material(job["color"], job.get("rig", "topdown")))
+        return obj_size
+
+    def frame(self, obj_size, rig="topdown"):
+        """Point the camera and lights at a model of this size."""
+        if rig == "ships":
+            # render_ships.center_and_scale_object; its sun lights stay put
+            self.camera.location = (0, 0, 10)
+            self.camera.data.ortho_scale = obj_size * 1.3
+            return
+        self.camera.location = (0, 0, obj_size * 2)
+        self.camera.data.ortho_scale = obj_size * 1.2
+        key, rim, fill = self.lights
+        key.location = (obj_size, -obj_size, obj_size * 2)
+        rim.location = (-obj_size, obj_size, obj_size)
+        fill.location = (-obj_size, -obj_size, obj_size * 1.5)
+
+    def render(self, job):
+        if not os.path.exists(job["stl"]):
+            raise FileNotFoundError(job["stl"])
+        os.makedirs(os.path.dirname(job["output"]) or ".", exist_ok=True)
+        self.configure(job)
+        self.frame(self.load_model(job), job.get("rig", "topdown"))
+        bpy.ops.render.render(write_still=True)
+
+
+def main():
+    studio = Studio()
+    serve(studio.render)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Build the memory-mapped asset pack (assets.evpak) for EVE Rebellion.
+
+Decodes ship sprites, EVE renders and icons, rasterizes the SVG ship art at
+every size the game requests, renders the procedural sound effects, and
+writes all of it as raw RGBA / PCM into a single pack file that
+core.asset_pack maps at runtime.
+
+Run with: python scripts/build_asset_pack.py [--output PATH] [--max-dim N] [--no-svg] [--no-audio]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Headless pygame - the build never opens a window or plays audio
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame  # noqa: E402
+
+from core.asset_pack import PACK_FILENAME, AssetPackWriter, entry_key  # noqa: E402
+
+# Directories whose PNGs are packed at native size
+PNG_DIRS = [
+    "assets/ship_sprites",
+    "assets/eve_renders",
+    "assets/eve_icons",
+    "assets/eve_icons/powerups",
+]
+
+# Larger PNGs stay loose (ship_sprites ships a *_256 variant of each hull);
+# the ones the game draws big are packed pre-scaled instead
+DEFAULT_MAX_DIM = 256
+
+
+def enemy_sprite_variants():
+    """List (svg_relative_path, size) pairs Enemy._create_image can request.
+
+    Mirrors the hull-class choice in Enemy._create_image across every
+    difficulty's health multiplier.
+    """
+    from constants import DIFFICULTY_SETTINGS, ENEMY_STATS
+    from sprites import (
+        ENEMY_CRUISER_SHIPS,
+        ENEMY_DESTROYER_SHIPS,
+        ENEMY_FRIGATE_SHIPS,
+        SHIP_SVG_DIR,
+    )
+
+    mults = [d.get("enemy_health_mult", 1.0) for d in DIFFICULTY_SETTINGS.values()]
+    variants = set()
+    for stats in ENEMY_STATS.values():
+        size = tuple(stats["size"])
+        if stats.get("boss", False):
+            pools = [ENEMY_CRUISER_SHIPS]
+        else:
+            hulls = [int(stats["hull"] * m) for m in mults]
+            pools = []
+            if stats.get("tough", False) or max(hulls) > 150:
+                pools.append(ENEMY_DESTROYER_SHIPS)
+            if not stats.get("tough", False) and min(hulls) <= 150:
+                pools.append(ENEMY_FRIGATE_SHIPS)
+        for pool in pools:
+            for name in pool:
+                variants.add((f"{SHIP_SVG_DIR}/{name}.svg", size))
+    return sorted(variants)
+
+
+def carrier_image_variants():
+    """List (png_relative_path, size) pairs for the background carriers."""
+    from parallax_background import (
+        CARRIER_DEPTH_RANGE,
+        CARRIER_TYPES,
+        _carrier_image_size,
+        _carrier_size,
+    )
+
+    low, high = (_carrier_size(d) for d in CARRIER_DEPTH_RANGE)
+    variants = []
+    for carrier in CARRIER_TYPES.values():
+        path = f"assets/ship_sprites/{carrier['name']}.png"
+        for size in range(low, high + 1):
+            variants.append((path, _carrier_image_size(size)))
+    return variants
+
+
+def player_sprite_variants():
+    """List (svg_relative_path, size) pairs for the player ships."""
+    from sprites import PLAYER_SHIP_SIZE, PLAYER_SHIP_SVGS
+
+    return [(path, PLAYER_SHIP_SIZE) for path in PLAYER_SHIP_SVGS.values()]
+
+
+def add_png_dirs(writer, max_dim):
+    """Decode every PNG in PNG_DIRS no larger than max_dim into the pack."""
+    count = 0
+    for rel_dir in PNG_DIRS:
+        abs_dir = os.path.join(ROOT, rel_dir)
+        if not os.path.isdir(abs_dir):
+            continue
+        for filename in sorted(os.listdir(abs_dir)):
+            if not filename.lower().endswith(".png"):
+                continue
+            rel_path = f"{rel_dir}/{filename}"
+            try:
+                surface = pygame.image.load(os.path.join(abs_dir, filename))
+            except pygame.error as e:
+                print(f"  skip {rel_path}: {e}")
+                continue
+            if max(surface.get_size()) > max_dim:
+                continue
+            writer.add_surface(entry_key(rel_path), surface.convert_alpha())
+            count += 1
+    return count
+
+
+def add_scaled_pngs(writer, variants):
+    """Decode PNGs and store them pre-scaled to each requested size."""
+    count = 0
+    sources = {}
+    for rel_path, size in variants:
+        abs_path = os.path.join(ROOT, rel_path)
+        if not os.path.exists(abs_path):
+            continue
+        if rel_path not in sources:
+            sources[rel_path] = pygame.image.load(abs_path).convert_alpha()
+        surface = pygame.transform.smoothscale(sources[rel_path], size)
+        writer.add_surface(entry_key(rel_path, size), surface)
+        count += 1
+    return count
+
+
+def add_svg_variants(writer, variants):
+    """Rasterize SVG ship art at each requested size into the pack."""
+    from io import BytesIO
+
+    try:
+        import cairosvg
+    except (ImportError, OSError):
+        print("  cairosvg/libcairo not available - skipping SVG sprites")
+        return 0
+
+    count = 0
+    for rel_path, (width, height) in variants:
+        abs_path = os.path.join(ROOT, rel_path)
+        if not os.path.exists(abs_path):
+            continue
+        png_data = cairosvg.svg2png(url=abs_path, output_width=width, output_height=height)
+        surface = pygame.image.load(BytesIO(png_data)).convert_alpha()
+        writer.add_surface(entry_key(rel_path, (width, height)), surface)
+        count += 1
+    return count
+
+
+def add_sounds(writer):
+    """Render the procedural sound effects into the pack."""
+    from sounds import PACKED_SOUND_PREFIX, SoundGenerator
+
+    generator = SoundGenerator()
+    if not generator.enabled:
+        print("  mixer unavailable - skipping sounds")
+        return 0
+
+    frequency, _, channels = pygame.mixer.get_init()
+    for name, sound in generator.sounds.items():
+        writer.add_audio(PACKED_SOUND_PREFIX + name, sound.get_raw(), frequency, channels)
+    return len(generator.sounds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the EVE Rebellion asset pack")
+    parser.add_argument("--output", default=os.path.join(ROOT, PACK_FILENAME))
+    parser.add_argument(
+        "--max-dim",
+        type=int,
+        default=DEFAULT_MAX_DIM,
+        help="Largest native PNG dimension to pack (default: %(default)s)",
+    )
+    parser.add_argument("--no-svg", action="store_true", help="Skip SVG ship sprites")
+    parser.add_argument("--no-audio", action="store_true", help="Skip sound effects")
+    args = parser.parse_args()
+
+    # Never read from an existing pack while building a new one
+    os.environ["EVE_REBELLION_ASSET_PACK"] = os.devnull
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    writer = AssetPackWriter()
+    start = time.perf_counter()
+
+    print("Packing PNG sprites and renders...")
+    print(f"  {add_png_dirs(writer, args.max_dim)} images")
+    print(f"  {add_scaled_pngs(writer, carrier_image_variants())} pre-scaled carriers")
+    if not args.no_svg:
+        print("Rasterizing SVG ship sprites...")
+        variants = player_sprite_variants() + enemy_sprite_variants()
+        print(f"  {add_svg_variants(writer, variants)} sprite variants")
+    if not args.no_audio:
+        print("Rendering sound effects...")
+        print(f"  {add_sounds(writer)} sounds")
+
+    total = writer.write(args.output)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Wrote {args.output}: {len(writer.entries)} entries, "
+        f"{total / (1024 * 1024):.1f} MB in {elapsed:.1f}s"
+    )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
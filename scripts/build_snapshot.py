@@ -0,0 +1,83 @@
+"""
+Build the static table snapshot (static_tables.snapshot) for EVE Rebellion.
+
+Parses the JSON tables under data/ and config/ once and writes them, with
+their source mtimes, to a single file that core.snapshot loads at startup.
+
+Run with: python scripts/build_snapshot.py [--output PATH] [--bench N]
+
+--bench starts N fresh interpreters that load every static table, with and
+without the snapshot, and reports the median load time of each.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.snapshot import SNAPSHOT_FILENAME, build_snapshot  # noqa: E402
+
+# Loads everything the snapshot covers, the way the game does at launch.
+# Module imports (json, re, ...) are paid by the game either way.
+BENCH_SNIPPET = """
+import time
+from core.loader import load_all_game_data, load_patterns
+from core.snapshot import load_json_table
+from ship_roster import ShipRoster
+start = time.perf_counter()
+load_all_game_data()
+load_patterns()
+ShipRoster()
+load_json_table("config/chapters/abyssal_depths_config.json")
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def time_startup(snapshot_path: str, runs: int) -> float:
+    """Median ms to load the static tables in a fresh interpreter."""
+    env = dict(os.environ, EVE_REBELLION_SNAPSHOT=snapshot_path)
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", BENCH_SNIPPET],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the EVE Rebellion static table snapshot")
+    parser.add_argument("--output", default=os.path.join(ROOT, SNAPSHOT_FILENAME))
+    parser.add_argument(
+        "--bench",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Benchmark table loading over N fresh interpreters",
+    )
+    args = parser.parse_args()
+
+    stats = build_snapshot(args.output, ROOT)
+    print(
+        f"Wrote {args.output}: {stats['files']} tables, "
+        f"{stats['bytes'] / 1024:.1f} KB in {stats['build_ms']:.1f}ms"
+    )
+
+    if args.bench:
+        from_sources = time_startup(os.devnull, args.bench)
+        from_snapshot = time_startup(args.output, args.bench)
+        print(f"Static tables from sources:  {from_sources:.1f}ms")
+        print(f"Static tables from snapshot: {from_snapshot:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Render STL ship models as top-down sprites without Blender.
+
+Uses core.stl_raster to rasterize every model under the input directory in
+parallel, keeping the faction folders: assets/stl_models/caldari/drake.stl
+becomes <output>/caldari/drake.png. For a single model, or for Blender's
+lit and path-traced look, use render_stl_topdown.py instead.
+
+Run with: python scripts/rasterize_stl.py [--input DIR] [--output DIR] [--size N]
+          [--workers N] [--supersample N] [--flip NAME ...]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.stl_raster import DEFAULT_SIZE, DEFAULT_SUPERSAMPLE, render_directory  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rasterize STL models as top-down sprites")
+    parser.add_argument("--input", default=os.path.join(ROOT, "assets", "stl_models"))
+    parser.add_argument("--output", default=os.path.join(ROOT, "assets", "stl_sprites"))
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    parser.add_argument("--supersample", type=int, default=DEFAULT_SUPERSAMPLE)
+    parser.add_argument("--workers", type=int, help="Parallel workers (default: CPU count)")
+    parser.add_argument(
+        "--flip", nargs="*", default=[], help="Models to turn 180 degrees (nose-down renders)"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = render_directory(
+        args.input,
+        args.output,
+        size=args.size,
+        workers=args.workers,
+        flip=args.flip,
+        supersample=args.supersample,
+    )
+
+    failed = 0
+    for result in results:
+        name = os.path.relpath(result["input"], args.input)
+        if "error" in result:
+            failed += 1
+            print(f"  [ERROR] {name}: {result['error']}")
+        else:
+            print(f"  [OK] {name}: {result['triangles']} triangles in {result['seconds']:.2f}s")
+
+    elapsed = time.perf_counter() - started
+    print(f"\nRendered {len(results) - failed}/{len(results)} models in {elapsed:.1f}s")
+    print(f"Output: {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
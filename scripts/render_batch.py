@@ -0,0 +1,117 @@
+"""
+Render many STL models with Blender through persistent worker sessions.
+
+Starts --workers Blender processes running blender_render_worker.py and
+streams jobs to them, so Blender starts once per worker instead of once
+per model. Finished jobs go to a resume log; rerunning the same command
+skips everything already rendered.
+
+Jobs come from every .stl under --input (oriented and lit like
+render_stl_topdown.py), or with --ships from render_ships.SHIPS_TO_RENDER
+(colours, sizes, lights, material and EEVEE as in render_ships.py).
+
+Run with: python scripts/render_batch.py [--input DIR | --ships] [--output DIR]
+          [--size N] [--workers N] [--blender PATH] [--log FILE] [--force]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.render_queue import JobResult, RenderJob, RenderQueue  # noqa: E402
+
+WORKER_SCRIPT = os.path.join(ROOT, "scripts", "blender_render_worker.py")
+
+
+def directory_jobs(input_dir, output_dir, size, flip=()):
+    """One job per .stl under input_dir, keeping the folder layout."""
+    jobs = []
+    for root, _, files in os.walk(input_dir):
+        for name in sorted(files):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() != ".stl":
+                continue
+            relative = os.path.relpath(os.path.join(root, stem + ".png"), input_dir)
+            jobs.append(
+                RenderJob(
+                    name=stem,
+                    stl=os.path.join(root, name),
+                    output=os.path.join(output_dir, relative),
+                    size=size,
+                    rotate_180=stem in flip,
+                )
+            )
+    return sorted(jobs, key=lambda job: job.stl)
+
+
+def ship_jobs(output_dir):
+    """The render_ships.py ship list as jobs."""
+    from render_ships import SHIPS_TO_RENDER
+
+    return [
+        RenderJob(
+            name=name,
+            stl=config["stl"],
+            output=os.path.join(output_dir, f"{name}.png"),
+            size=config["size"],
+            color=tuple(config["color"]),
+            rotate_180=True,
+            auto_orient=False,
+            engine="BLENDER_EEVEE_NEXT",
+            rig="ships",
+        )
+        for name, config in SHIPS_TO_RENDER.items()
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-render STL models in Blender")
+    parser.add_argument("--input", default=os.path.join(ROOT, "assets", "stl_models"))
+    parser.add_argument("--ships", action="store_true", help="Render render_ships.py's list")
+    parser.add_argument("--output", default=os.path.join(ROOT, "assets", "ship_sprites"))
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--flip", nargs="*", default=[], help="Models to turn 180 degrees")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel Blender sessions")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"))
+    parser.add_argument("--log", help="Resume log (default: <output>/render_log.jsonl)")
+    parser.add_argument("--force", action="store_true", help="Re-render logged jobs too")
+    args = parser.parse_args()
+
+    if args.ships:
+        jobs = ship_jobs(args.output)
+    else:
+        jobs = directory_jobs(args.input, args.output, args.size, args.flip)
+    os.makedirs(args.output, exist_ok=True)
+
+    command = [args.blender, "--background", "--python", WORKER_SCRIPT]
+    render_queue = RenderQueue(
+        command,
+        workers=args.workers,
+        log_path=args.log or os.path.join(args.output, "render_log.jsonl"),
+    )
+
+    def report(result: JobResult):
+        if result.status == "failed":
+            print(f"  [ERROR] {result.job.name}: {result.error}")
+        elif result.status == "skipped":
+            print(f"  [SKIP] {result.job.name}: already rendered")
+        else:
+            print(f"  [OK] {result.job.name} ({result.seconds:.1f}s)")
+
+    started = time.perf_counter()
+    results = render_queue.run(jobs, force=args.force, progress=report)
+    failed = sum(1 for result in results if not result.ok)
+    print(
+        f"\nRendered {len(results) - failed}/{len(results)} models with "
+        f"{render_queue.sessions_started} Blender session(s) "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 """
 Blender script to render STL models as top-down sprites.
 Run with: blender --background --python render_stl_topdown.py -- input.stl output.png [size]
+
+To batch a whole model directory without Blender, use rasterize_stl.py.
 """
 
 import math
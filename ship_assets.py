@@ -3,12 +3,19 @@ Ship Asset Manager for EVE Rebellion
 Downloads, caches, and processes ship renders from EVE Online's image server.
 """
 
+import hashlib
+import json
 import math
+import multiprocessing
 import os
-import urllib.error
-import urllib.request
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.asset_cache import get_asset_cache
+from core.blob_store import file_digest
+from core.downloader import DownloadJob, DownloadOutcome, download_files
 
 try:
     import pygame
@@ -36,6 +43,14 @@ CACHE_DIR = Path("assets/ships")
 # EVE renders are typically at ~35 degrees, we rotate to face "up" for the game
 ROTATION_ANGLE = -45  # Degrees to rotate for top-down view
 
+# Batch build settings; bump PIPELINE_VERSION when the drawing code changes
+PIPELINE_VERSION = 1
+SHEET_EFFECTS = ("pulse",)
+SHEET_FRAMES = 8
+THRUST_FRAMES = 6
+BUILD_MANIFEST = "build_manifest.json"
+BUILD_REPORT = "build_report.json"
+
 
 class ShipAssetManager:
     """Manages downloading, caching, and processing of ship assets."""
@@ -50,9 +65,12 @@ class ShipAssetManager:
         (self.cache_dir / "sprites").mkdir(exist_ok=True)
         (self.cache_dir / "effects").mkdir(exist_ok=True)
 
-        self.loaded_ships: Dict[int, pygame.Surface] = {} if PYGAME_AVAILABLE else {}
-        self.sprite_sheets: Dict[int, pygame.Surface] = {} if PYGAME_AVAILABLE else {}
-        self.thrust_effects: Dict[int, List[pygame.Surface]] = {} if PYGAME_AVAILABLE else {}
+        # Surfaces live in the shared asset cache, namespaced by cache directory
+        cache = get_asset_cache()
+        namespace = str(self.cache_dir.resolve())
+        self.loaded_ships = cache.view("ship_renders", namespace)
+        self.sprite_sheets = cache.view("sprite_sheets", namespace)
+        self.thrust_effects = cache.view("thrust_frames", namespace)
 
     def get_cache_path(self, type_id: int, subdir: str = "raw", suffix: str = ".png") -> Path:
         """Get the cache file path for a ship."""
@@ -71,49 +89,69 @@ class ShipAssetManager:
         Returns:
             Path to downloaded file, or None if failed
         """
-        cache_path = self.get_cache_path(type_id, "raw")
-
-        if cache_path.exists() and not force:
-            print(f"[Cache] {ALL_SHIPS.get(type_id, type_id)} already cached")
-            return cache_path
+        return self.download_all_ships(size, force, type_ids=[type_id]).get(type_id)
 
-        url = EVE_IMAGE_URL.format(type_id=type_id, size=size)
-        ship_name = ALL_SHIPS.get(type_id, f"Unknown ({type_id})")
-
-        try:
-            print(f"[Download] Fetching {ship_name} from {url}")
-
-            # Create request with user agent
-            request = urllib.request.Request(url, headers={"User-Agent": "EVE-Rebellion-Game/1.0"})
+    def download_all_ships(
+        self,
+        size: int = 256,
+        force: bool = False,
+        type_ids: Optional[Iterable[int]] = None,
+        revalidate: bool = False,
+    ) -> Dict[int, Path]:
+        """
+        Download ships over pooled connections, skipping cached renders.
 
-            with urllib.request.urlopen(request, timeout=30) as response:
-                data = response.read()
+        Args:
+            size: Image size (64, 128, 256, 512, 1024)
+            force: Force re-download even if cached
+            type_ids: Ships to download, defaults to the whole manifest
+            revalidate: Re-check cached renders against the server's ETags
 
-            # Save to cache
-            with open(cache_path, "wb") as f:
-                f.write(data)
+        Returns:
+            Dict mapping type_id to the downloaded (or cached) file
+        """
+        type_ids = list(ALL_SHIPS if type_ids is None else type_ids)
+        jobs = [
+            DownloadJob(
+                EVE_IMAGE_URL.format(type_id=type_id, size=size),
+                self.get_cache_path(type_id, "raw"),
+            )
+            for type_id in type_ids
+        ]
+        names = {
+            job.path: ALL_SHIPS.get(tid, f"Unknown ({tid})") for job, tid in zip(jobs, type_ids)
+        }
+
+        def report(outcome: DownloadOutcome):
+            name = names[outcome.job.path]
+            if outcome.status == "cached":
+                print(f"[Cache] {name} already cached")
+            elif outcome.status == "not_modified":
+                print(f"[Cache] {name} is up to date")
+            elif outcome.ok:
+                print(f"[Download] Saved {name} to {outcome.job.path}")
+            else:
+                print(f"[Error] Failed to download {name}: {outcome.error}")
 
-            print(f"[Download] Saved {ship_name} to {cache_path}")
-            return cache_path
+        validators = self._load_validators()
+        outcomes = download_files(
+            jobs, validators, revalidate=revalidate, force=force, progress=report
+        )
+        self._save_validators(validators)
+        return {tid: outcome.job.path for tid, outcome in zip(type_ids, outcomes) if outcome.ok}
 
-        except urllib.error.HTTPError as e:
-            print(f"[Error] HTTP {e.code} downloading {ship_name}: {e.reason}")
-            return None
-        except urllib.error.URLError as e:
-            print(f"[Error] URL error downloading {ship_name}: {e.reason}")
-            return None
-        except Exception as e:
-            print(f"[Error] Failed to download {ship_name}: {e}")
-            return None
+    def _load_validators(self) -> Dict:
+        """ETags of earlier downloads, kept beside the raw renders."""
+        try:
+            return json.loads((self.cache_dir / "raw" / "downloads.json").read_text())
+        except (OSError, ValueError):
+            return {}
 
-    def download_all_ships(self, size: int = 256, force: bool = False) -> Dict[int, Path]:
-        """Download all ships in the manifest."""
-        results = {}
-        for type_id in ALL_SHIPS:
-            path = self.download_ship(type_id, size, force)
-            if path:
-                results[type_id] = path
-        return results
+    def _save_validators(self, validators: Dict):
+        path = self.cache_dir / "raw" / "downloads.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(validators, indent=2))
+        os.replace(tmp_path, path)
 
     def load_and_rotate(
         self, type_id: int, rotation: float = ROTATION_ANGLE
@@ -179,7 +217,20 @@ class ShipAssetManager:
             if not self.load_and_rotate(type_id):
                 return None
 
-        base_surface = self.loaded_ships[type_id]
+        sheet = self.render_sprite_sheet(self.loaded_ships[type_id], frames, effect_type)
+
+        # Save sprite sheet
+        sprite_path = self.get_cache_path(type_id, "sprites", f"_{effect_type}.png")
+        pygame.image.save(sheet, str(sprite_path))
+
+        self.sprite_sheets[type_id] = sheet
+        return sheet
+
+    @staticmethod
+    def render_sprite_sheet(
+        base_surface: "pygame.Surface", frames: int = 8, effect_type: str = "pulse"
+    ) -> "pygame.Surface":
+        """Draw a horizontal strip of animation frames for a ship surface."""
         width, height = base_surface.get_size()
 
         # Create sprite sheet (horizontal strip)
@@ -187,30 +238,26 @@ class ShipAssetManager:
         sheet = pygame.Surface((sheet_width, height), pygame.SRCALPHA)
 
         for i in range(frames):
-            frame = base_surface.copy()
+            # Each effect returns a new surface, so the base is never modified
+            frame = base_surface
 
             if effect_type == "pulse":
                 # Subtle brightness pulse
                 pulse = 0.9 + 0.2 * math.sin(2 * math.pi * i / frames)
-                frame = self._adjust_brightness(frame, pulse)
+                frame = ShipAssetManager._adjust_brightness(frame, pulse)
 
             elif effect_type == "glow":
                 # Add glow effect that pulses
                 glow_intensity = int(50 + 30 * math.sin(2 * math.pi * i / frames))
-                frame = self._add_glow(frame, glow_intensity)
+                frame = ShipAssetManager._add_glow(frame, glow_intensity)
 
             elif effect_type == "shield":
                 # Shield shimmer effect
                 alpha = int(100 + 50 * math.sin(2 * math.pi * i / frames))
-                frame = self._add_shield_effect(frame, alpha)
+                frame = ShipAssetManager._add_shield_effect(frame, alpha)
 
             sheet.blit(frame, (i * width, 0))
 
-        # Save sprite sheet
-        sprite_path = self.get_cache_path(type_id, "sprites", f"_{effect_type}.png")
-        pygame.image.save(sheet, str(sprite_path))
-
-        self.sprite_sheets[type_id] = sheet
         return sheet
 
     def generate_thrust_effects(self, type_id: int, frames: int = 6) -> List["pygame.Surface"]:
@@ -232,20 +279,42 @@ class ShipAssetManager:
             if not self.load_and_rotate(type_id):
                 return []
 
-        base_surface = self.loaded_ships[type_id]
-        width, height = base_surface.get_size()
+        thrust_frames = self.render_thrust_frames(
+            self.loaded_ships[type_id], self.thrust_colors(type_id), frames
+        )
 
-        # Determine ship category for thrust color
+        # Save thrust frames
+        for i, frame in enumerate(thrust_frames):
+            pygame.image.save(frame, str(self.get_thrust_path(type_id, i)))
+
+        self.thrust_effects[type_id] = thrust_frames
+        return thrust_frames
+
+    def get_thrust_path(self, type_id: int, frame: int) -> Path:
+        """Get the cache file path for a thrust animation frame."""
+        name = ALL_SHIPS.get(type_id, str(type_id)).lower()
+        return self.cache_dir / "effects" / f"{name}_thrust_{frame}.png"
+
+    @staticmethod
+    def thrust_colors(type_id: int) -> List[Tuple[int, int, int]]:
+        """Thrust plume colors for a ship, outer layer first."""
         if type_id in PLAYER_SHIPS:
             # Minmatar: Orange/red thrust (rusty, industrial)
-            thrust_colors = [(255, 150, 50), (255, 100, 30), (255, 200, 100)]
-        elif type_id in BOSSES:
+            return [(255, 150, 50), (255, 100, 30), (255, 200, 100)]
+        if type_id in BOSSES:
             # Amarr capitals: Golden/yellow thrust
-            thrust_colors = [(255, 215, 0), (255, 180, 50), (255, 240, 150)]
-        else:
-            # Amarr standard: Yellow/white thrust
-            thrust_colors = [(255, 220, 100), (255, 200, 80), (255, 255, 200)]
-
+            return [(255, 215, 0), (255, 180, 50), (255, 240, 150)]
+        # Amarr standard: Yellow/white thrust
+        return [(255, 220, 100), (255, 200, 80), (255, 255, 200)]
+
+    @staticmethod
+    def render_thrust_frames(
+        base_surface: "pygame.Surface",
+        thrust_colors: List[Tuple[int, int, int]],
+        frames: int = 6,
+    ) -> List["pygame.Surface"]:
+        """Draw the thrust animation frames for a ship surface."""
+        width, height = base_surface.get_size()
         thrust_frames = []
 
         for i in range(frames):
@@ -275,29 +344,24 @@ class ShipAssetManager:
                 alpha = int((200 - j * 50) * intensity)
 
                 # Draw elongated thrust cone
-                self._draw_thrust_plume(thrust, cx, base_y, plume_width, plume_height, color, alpha)
+                ShipAssetManager._draw_thrust_plume(
+                    thrust, cx, base_y, plume_width, plume_height, color, alpha
+                )
 
             # Add glow around thrust
             glow_radius = int(20 * intensity)
             glow_color = thrust_colors[0]
             glow_alpha = int(80 * intensity)
-            self._draw_glow_circle(thrust, cx, base_y + 5, glow_radius, glow_color, glow_alpha)
+            ShipAssetManager._draw_glow_circle(
+                thrust, cx, base_y + 5, glow_radius, glow_color, glow_alpha
+            )
 
             thrust_frames.append(thrust)
 
-        # Save thrust frames
-        for i, frame in enumerate(thrust_frames):
-            effect_path = (
-                self.cache_dir
-                / "effects"
-                / f"{ALL_SHIPS.get(type_id, type_id).lower()}_thrust_{i}.png"
-            )
-            pygame.image.save(frame, str(effect_path))
-
-        self.thrust_effects[type_id] = thrust_frames
         return thrust_frames
 
-    def _adjust_brightness(self, surface: "pygame.Surface", factor: float) -> "pygame.Surface":
+    @staticmethod
+    def _adjust_brightness(surface: "pygame.Surface", factor: float) -> "pygame.Surface":
         """Adjust the brightness of a surface."""
         result = surface.copy()
         arr = pygame.surfarray.pixels3d(result)
@@ -305,7 +369,8 @@ class ShipAssetManager:
         del arr
         return result
 
-    def _add_glow(self, surface: "pygame.Surface", intensity: int) -> "pygame.Surface":
+    @staticmethod
+    def _add_glow(surface: "pygame.Surface", intensity: int) -> "pygame.Surface":
         """Add an outer glow effect to a surface."""
         width, height = surface.get_size()
         result = pygame.Surface((width + 20, height + 20), pygame.SRCALPHA)
@@ -325,7 +390,8 @@ class ShipAssetManager:
 
         return result
 
-    def _add_shield_effect(self, surface: "pygame.Surface", alpha: int) -> "pygame.Surface":
+    @staticmethod
+    def _add_shield_effect(surface: "pygame.Surface", alpha: int) -> "pygame.Surface":
         """Add a shield shimmer effect."""
         result = surface.copy()
         width, height = result.get_size()
@@ -343,8 +409,8 @@ class ShipAssetManager:
         result.blit(shield, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
         return result
 
+    @staticmethod
     def _draw_thrust_plume(
-        self,
         surface: "pygame.Surface",
         x: int,
         y: int,
@@ -372,8 +438,8 @@ class ShipAssetManager:
 
         surface.blit(plume, (x - width, y))
 
+    @staticmethod
     def _draw_glow_circle(
-        self,
         surface: "pygame.Surface",
         x: int,
         y: int,
@@ -423,51 +489,235 @@ class ShipAssetManager:
             return frames[frame % len(frames)]
         return None
 
-    def process_all_ships(self, generate_effects: bool = True) -> Dict[int, bool]:
+    def build_recipe(self, type_id: int, effects: Iterable[str] = SHEET_EFFECTS) -> Dict:
+        """
+        Everything that determines a ship's processed outputs.
+
+        Two builds with the same recipe and the same raw render produce the
+        same files, so an unchanged recipe hash means the ship can be skipped.
+        """
+        return {
+            "version": PIPELINE_VERSION,
+            "rotation": ROTATION_ANGLE,
+            "sheet_frames": SHEET_FRAMES,
+            "effects": list(effects),
+            "thrust_frames": THRUST_FRAMES,
+            "thrust_colors": self.thrust_colors(type_id),
+        }
+
+    def _build_task(self, type_id: int, recipe: Dict) -> Dict:
+        """Paths and parameters for one ship's build, picklable for the pool."""
+        return {
+            "type_id": type_id,
+            "raw": str(self.get_cache_path(type_id, "raw")),
+            "processed": str(self.get_cache_path(type_id, "processed")),
+            "sheets": {
+                effect: str(self.get_cache_path(type_id, "sprites", f"_{effect}.png"))
+                for effect in recipe["effects"]
+            },
+            "thrust": [
+                str(self.get_thrust_path(type_id, i)) for i in range(recipe["thrust_frames"])
+            ],
+            "recipe": recipe,
+        }
+
+    @staticmethod
+    def _task_outputs(task: Dict) -> List[str]:
+        return [task["processed"], *task["sheets"].values(), *task["thrust"]]
+
+    def _load_build_manifest(self) -> Dict:
+        path = self.cache_dir / BUILD_MANIFEST
+        if path.exists():
+            try:
+                return json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not read build manifest: {e}")
+        return {}
+
+    def _write_json(self, name: str, data: Dict):
+        path = self.cache_dir / name
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, path)
+
+    def process_all_ships(
+        self,
+        generate_effects: bool = True,
+        workers: Optional[int] = None,
+        type_ids: Optional[Iterable[int]] = None,
+        force: bool = False,
+    ) -> Dict[int, bool]:
         """
         Download and process all ships in the manifest.
 
+        Each ship is built by one task in a process pool: load, rotate, save
+        the processed render, draw the sprite sheets and the thrust frames.
+        Ships whose raw render and recipe hash match the last build, and whose
+        outputs are all still on disk, are skipped. Per-stage timings go to
+        build_report.json in the cache directory.
+
+        Surfaces are drawn in the workers, so this does not fill the shared
+        asset cache; get_ship() loads on demand as before.
+
         Args:
-            generate_effects: Also generate thrust effects
+            generate_effects: Also generate sprite sheets and thrust effects
+            workers: Pool size (default: CPU count); 1 builds in this process
+            type_ids: Ships to process (default: all in the manifest)
+            force: Rebuild even if nothing changed
 
         Returns:
             Dict mapping type_id to success status
         """
-        results = {}
+        type_ids = list(ALL_SHIPS if type_ids is None else type_ids)
+        results: Dict[int, bool] = {}
+        started = time.perf_counter()
 
         print("\n=== Processing Ship Assets ===\n")
 
-        for type_id, name in ALL_SHIPS.items():
-            print(f"\n--- {name} (ID: {type_id}) ---")
-
-            # Download
-            if self.download_ship(type_id):
-                # Load and rotate
-                if self.load_and_rotate(type_id):
-                    results[type_id] = True
-
-                    if generate_effects:
-                        # Create sprite sheet
-                        self.create_sprite_sheet(type_id)
-                        # Generate thrust effects
-                        self.generate_thrust_effects(type_id)
-
-                    print(f"[Success] {name} processed")
-                else:
-                    results[type_id] = False
-                    print(f"[Failed] {name} - rotation failed")
-            else:
+        # Fetch every missing render in one pooled batch
+        downloaded = self.download_all_ships(type_ids=type_ids)
+
+        manifest = self._load_build_manifest()
+        tasks = []
+        skipped = []
+        for type_id in type_ids:
+            name = ALL_SHIPS.get(type_id, f"ship_{type_id}")
+            if type_id not in downloaded:
                 results[type_id] = False
                 print(f"[Failed] {name} - download failed")
+                continue
+
+            recipe = self.build_recipe(type_id, SHEET_EFFECTS if generate_effects else ())
+            if not generate_effects:
+                recipe["thrust_frames"] = 0
+            task = self._build_task(type_id, recipe)
+            task["hash"] = recipe_hash(recipe, file_digest(downloaded[type_id]))
+
+            if (
+                not force
+                and manifest.get(str(type_id)) == task["hash"]
+                and all(os.path.exists(path) for path in self._task_outputs(task))
+            ):
+                results[type_id] = True
+                skipped.append(type_id)
+                print(f"[Cached] {name} unchanged")
+                continue
+            tasks.append(task)
+
+        records = []
+        if tasks:
+            workers = workers or os.cpu_count() or 1
+            if workers == 1:
+                records = [_build_ship(task) for task in tasks]
+            else:
+                # Spawned workers start with a fresh, headless SDL
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(
+                    max_workers=min(workers, len(tasks)), mp_context=context
+                ) as pool:
+                    records = list(pool.map(_build_ship, tasks))
+
+        for task, record in zip(tasks, records):
+            type_id = task["type_id"]
+            name = ALL_SHIPS.get(type_id, f"ship_{type_id}")
+            results[type_id] = record["ok"]
+            if record["ok"]:
+                manifest[str(type_id)] = task["hash"]
+                print(f"[Success] {name} processed")
+            else:
+                manifest.pop(str(type_id), None)
+                print(f"[Failed] {name} - {record['error']}")
+
+        stage_totals: Dict[str, float] = {}
+        for record in records:
+            for stage, seconds in record["timings"].items():
+                stage_totals[stage] = round(stage_totals.get(stage, 0.0) + seconds, 4)
+
+        self._write_json(BUILD_MANIFEST, manifest)
+        self._write_json(
+            BUILD_REPORT,
+            {
+                "version": PIPELINE_VERSION,
+                "wall_seconds": round(time.perf_counter() - started, 4),
+                "built": [record["type_id"] for record in records if record["ok"]],
+                "failed": [type_id for type_id, ok in results.items() if not ok],
+                "skipped": skipped,
+                "stage_totals": stage_totals,
+                "ships": records,
+            },
+        )
 
         # Summary
         success = sum(1 for v in results.values() if v)
         total = len(results)
-        print(f"\n=== Complete: {success}/{total} ships processed ===\n")
+        print(
+            f"\n=== Complete: {success}/{total} ships processed "
+            f"({len(records)} built, {len(skipped)} unchanged) ===\n"
+        )
 
         return results
 
 
+def recipe_hash(recipe: Dict, raw_digest: str) -> str:
+    """Hash of a build recipe together with the digest of its raw render."""
+    payload = json.dumps({"recipe": recipe, "raw": raw_digest}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _build_ship(task: Dict) -> Dict:
+    """
+    Build one ship's processed render, sprite sheets and thrust frames.
+
+    Runs in a pool worker, so it only touches the files named in the task
+    and reports back a plain dict.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    timings: Dict[str, float] = {}
+    record = {"type_id": task["type_id"], "ok": False, "error": None, "timings": timings}
+
+    def stage(name: str, started: float) -> float:
+        now = time.perf_counter()
+        timings[name] = round(now - started, 4)
+        return now
+
+    try:
+        recipe = task["recipe"]
+        now = time.perf_counter()
+        surface = pygame.image.load(task["raw"])
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        elif not surface.get_flags() & pygame.SRCALPHA:
+            # Pool workers have no display for convert_alpha(). Opaque renders
+            # (the Image Server's are JPEG) still need per-pixel alpha, or
+            # rotating fills the corners with opaque black
+            opaque = surface
+            surface = pygame.Surface(opaque.get_size(), pygame.SRCALPHA)
+            surface.blit(opaque, (0, 0))
+        now = stage("load", now)
+
+        rotated = pygame.transform.rotate(surface, recipe["rotation"])
+        pygame.image.save(rotated, task["processed"])
+        now = stage("rotate", now)
+
+        for effect, path in task["sheets"].items():
+            sheet = ShipAssetManager.render_sprite_sheet(rotated, recipe["sheet_frames"], effect)
+            pygame.image.save(sheet, path)
+            now = stage(f"sheet_{effect}", now)
+
+        if task["thrust"]:
+            frames = ShipAssetManager.render_thrust_frames(
+                rotated, [tuple(c) for c in recipe["thrust_colors"]], recipe["thrust_frames"]
+            )
+            for frame, path in zip(frames, task["thrust"]):
+                pygame.image.save(frame, path)
+            stage("thrust", now)
+
+        record["ok"] = True
+    except Exception as e:
+        record["error"] = str(e)
+    return record
+
+
 def get_asset_manager() -> ShipAssetManager:
     """Get or create the global ship asset manager."""
     global _asset_manager
@@ -1,11 +1,33 @@
 """
 Ship Roster Manager for EVE Rebellion
 Loads ships from JSON config, filters by faction/chapter, and manages unlocks.
+
+Ships are indexed once at load by faction, chapter, class and tier. Queries
+intersect those indexes and cache the result as a tuple sorted by tier then
+roster order; unlocking a ship patches the cached unlocked/locked views in
+place instead of rebuilding them.
 """
 
 import json
+from bisect import bisect_left
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.snapshot import load_json_table
+
+# Sort order for ship selection (unknown tiers sort with t1)
+TIER_ORDER = {"t1": 0, "t2": 1, "t3": 2}
+
+# Indexed ship fields: index name -> ship key
+INDEXED_FIELDS = {
+    "faction": "faction",
+    "chapter": "available_chapters",
+    "class": "class",
+    "tier": "tier",
+}
+
+# (faction, chapter, class, tier, unlocked)
+QueryKey = Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[bool]]
 
 
 class ShipRoster:
@@ -19,6 +41,13 @@ class ShipRoster:
         self.unlocked_ships: set = set()
         self.metadata: Dict = {}
 
+        # Secondary indexes: index name -> value -> ship IDs
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {}
+        self._by_type_id: Dict[int, Dict] = {}
+        self._sort_keys: Dict[str, Tuple[int, int]] = {}  # ship_id -> (tier, roster order)
+        self._unlocked_ids: Optional[Set[str]] = None  # Built on first unlock query
+        self._views: Dict[QueryKey, Tuple[Dict, ...]] = {}
+
         self._load_config()
         self._index_ships()
 
@@ -36,8 +65,7 @@ class ShipRoster:
             return
 
         try:
-            with open(self.config_path, "r") as f:
-                data = json.load(f)
+            data = load_json_table(str(self.config_path))
 
             self.metadata = data.get("metadata", {})
             self.factions = data.get("factions", {})
@@ -49,8 +77,8 @@ class ShipRoster:
                 for category, ship_list in categories.items():
                     if isinstance(ship_list, list):
                         for ship in ship_list:
-                            ship["category"] = category
-                            ship["faction"] = faction_id
+                            # Copy: the parsed config may be shared via the snapshot
+                            ship = {**ship, "category": category, "faction": faction_id}
                             self.ships[faction_id].append(ship)
 
             print(
@@ -65,12 +93,86 @@ class ShipRoster:
             self._create_default_config()
 
     def _index_ships(self):
-        """Create an index of ships by ID for quick lookup."""
+        """Index ships by ID, type ID, faction, chapter, class and tier."""
+        self._indexes = {name: {} for name in INDEXED_FIELDS}
         for faction_id, ship_list in self.ships.items():
             for ship in ship_list:
                 ship_id = ship.get("id")
-                if ship_id:
-                    self.ships_by_id[ship_id] = ship
+                if not ship_id:
+                    continue
+                self.ships_by_id[ship_id] = ship
+                if ship.get("type_id"):
+                    self._by_type_id.setdefault(ship["type_id"], ship)
+                self._sort_keys[ship_id] = (
+                    TIER_ORDER.get(ship.get("tier", "t1"), 0),
+                    len(self._sort_keys),
+                )
+                for name, field in INDEXED_FIELDS.items():
+                    if name == "faction":
+                        values = [faction_id]
+                    elif name == "chapter":
+                        values = ship.get(field) or []
+                    else:
+                        values = [ship[field]] if ship.get(field) is not None else []
+                    for value in values:
+                        self._indexes[name].setdefault(value, set()).add(ship_id)
+        self._unlocked_ids = None
+        self._views.clear()
+
+    def query(
+        self,
+        faction: Optional[str] = None,
+        chapter: Optional[str] = None,
+        ship_class: Optional[str] = None,
+        tier: Optional[str] = None,
+        unlocked: Optional[bool] = None,
+    ) -> Tuple[Dict, ...]:
+        """
+        Find ships matching every given filter.
+
+        Args:
+            faction: Faction ID
+            chapter: Chapter ID the ship must be available in
+            ship_class: Ship class (e.g., 'frigate', 'cruiser')
+            tier: Tech tier (e.g., 't1', 't2')
+            unlocked: True for unlocked ships only, False for locked only
+
+        Returns:
+            Cached tuple of ship dictionaries, sorted by tier then roster
+            order. Do not modify the ships.
+        """
+        key: QueryKey = (faction, chapter, ship_class, tier, unlocked)
+        view = self._views.get(key)
+        if view is not None:
+            return view
+
+        candidates: Optional[Set[str]] = None
+        for name, value in zip(INDEXED_FIELDS, key):
+            if value is not None:
+                ids = self._indexes[name].get(value, set())
+                candidates = ids if candidates is None else candidates & ids
+        if candidates is None:
+            candidates = set(self._sort_keys)
+        if unlocked is not None:
+            unlocked_ids = self._get_unlocked_ids()
+            candidates = candidates & unlocked_ids if unlocked else candidates - unlocked_ids
+
+        view = tuple(self.ships_by_id[i] for i in sorted(candidates, key=self._sort_keys.get))
+        self._views[key] = view
+        return view
+
+    def _get_unlocked_ids(self) -> Set[str]:
+        if self._unlocked_ids is None:
+            self._unlocked_ids = {i for i in self.ships_by_id if self.is_ship_unlocked(i)}
+        return self._unlocked_ids
+
+    def _matches(self, ship: Dict, key: QueryKey) -> bool:
+        """Whether a ship passes a query key's field filters (not unlock state)."""
+        ship_id = ship["id"]
+        for name, value in zip(INDEXED_FIELDS, key):
+            if value is not None and ship_id not in self._indexes[name].get(value, ()):
+                return False
+        return True
 
     def _create_default_config(self):
         """Create a minimal default config if none exists."""
@@ -136,12 +238,7 @@ class ShipRoster:
         Returns:
             List of ship dictionaries
         """
-        ships = self.ships.get(faction, [])
-
-        if chapter:
-            ships = [s for s in ships if chapter in s.get("available_chapters", [])]
-
-        return ships
+        return list(self.query(faction=faction, chapter=chapter or None))
 
     def get_playable_ships(
         self, faction: str, chapter: str, unlocked_only: bool = True
@@ -157,16 +254,8 @@ class ShipRoster:
         Returns:
             List of playable ship dictionaries
         """
-        ships = self.get_faction_ships(faction, chapter)
-
-        if unlocked_only:
-            ships = [s for s in ships if self.is_ship_unlocked(s.get("id"))]
-
-        # Sort by tier (t1 first, then t2)
-        tier_order = {"t1": 0, "t2": 1, "t3": 2}
-        ships.sort(key=lambda s: tier_order.get(s.get("tier", "t1"), 0))
-
-        return ships
+        # Sorted by tier (t1 first, then t2)
+        return list(self.query(faction=faction, chapter=chapter, unlocked=unlocked_only or None))
 
     def get_ship(self, ship_id: str) -> Optional[Dict]:
         """Get a ship by its ID."""
@@ -174,10 +263,7 @@ class ShipRoster:
 
     def get_ship_by_type_id(self, type_id: int) -> Optional[Dict]:
         """Get a ship by its EVE type ID."""
-        for ship in self.ships_by_id.values():
-            if ship.get("type_id") == type_id:
-                return ship
-        return None
+        return self._by_type_id.get(type_id)
 
     def is_ship_unlocked(self, ship_id: str) -> bool:
         """Check if a ship is unlocked."""
@@ -192,8 +278,25 @@ class ShipRoster:
         return ship_id in self.unlocked_ships
 
     def unlock_ship(self, ship_id: str):
-        """Unlock a ship."""
+        """Unlock a ship, updating cached unlock views in place."""
         self.unlocked_ships.add(ship_id)
+        if self._unlocked_ids is None or ship_id in self._unlocked_ids:
+            return
+        ship = self.ships_by_id.get(ship_id)
+        if ship is None:
+            return
+        self._unlocked_ids.add(ship_id)
+
+        for key, view in self._views.items():
+            if key[-1] is None or not self._matches(ship, key):
+                continue
+            ids = [s["id"] for s in view]
+            if key[-1]:
+                sort_keys = [self._sort_keys[i] for i in ids]
+                ids.insert(bisect_left(sort_keys, self._sort_keys[ship_id]), ship_id)
+            else:
+                ids.remove(ship_id)
+            self._views[key] = tuple(self.ships_by_id[i] for i in ids)
 
     def get_faction_info(self, faction: str) -> Dict:
         """Get faction metadata."""
@@ -215,12 +318,7 @@ class ShipRoster:
 
     def get_all_type_ids(self) -> List[int]:
         """Get all EVE type IDs for downloading assets."""
-        type_ids = []
-        for ship in self.ships_by_id.values():
-            type_id = ship.get("type_id")
-            if type_id:
-                type_ids.append(type_id)
-        return list(set(type_ids))
+        return list(self._by_type_id)
 
     def get_ship_options(self, faction: str, chapter: str = "minmatar_rebellion") -> List[str]:
         """
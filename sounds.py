@@ -1,10 +1,16 @@
 """Procedural sound effects for Minmatar Rebellion"""
 
 import io
+import os
 
 import numpy as np
 import pygame
 
+from core.asset_pack import get_asset_pack
+
+# Asset pack key prefix for pre-rendered sound effects
+PACKED_SOUND_PREFIX = "sounds/sfx/"
+
 
 class SoundGenerator:
     """Generate retro-style sound effects procedurally"""
@@ -16,12 +22,41 @@ class SoundGenerator:
 
         try:
             pygame.mixer.init(frequency=sample_rate, size=-16, channels=2, buffer=512)
-            self._generate_all_sounds()
+            if not self._load_packed_sounds():
+                self._generate_all_sounds()
         except pygame.error as e:
             print(f"Audio not available: {e}")
             print("Sound effects disabled.")
             self.enabled = False
 
+    def _load_packed_sounds(self):
+        """Load pre-rendered sound effects from the asset pack.
+
+        Returns False (so everything is synthesized instead) when there is no
+        pack, it holds no sounds, or this module changed after it was built.
+        """
+        pack = get_asset_pack()
+        if pack is None:
+            return False
+        try:
+            if os.path.getmtime(__file__) > os.path.getmtime(pack.path):
+                return False
+        except OSError:
+            # Frozen builds ship no sounds.py to compare against; trust the pack
+            pass
+
+        sounds = {}
+        for key in pack.index:
+            if key.startswith(PACKED_SOUND_PREFIX):
+                sound = pack.get_sound(key)
+                if sound is None:
+                    return False
+                sounds[key[len(PACKED_SOUND_PREFIX) :]] = sound
+        if not sounds:
+            return False
+        self.sounds = sounds
+        return True
+
     def _generate_all_sounds(self):
         """Generate all game sound effects"""
         # Player weapons
@@ -8,6 +8,9 @@ import random
 
 import pygame
 
+from asteroid_sprites import get_asteroid_library
+from core.asset_cache import get_asset_cache
+
 # Ship silhouette definitions (side profile shapes)
 # Each is a list of (x, y) points normalized to 0-1 range
 SHIP_SILHOUETTES = {
@@ -148,8 +151,18 @@ class BackgroundShip:
         # Engine glow
         self.engine_flicker = random.uniform(0, math.pi * 2)
 
-        # Create the ship silhouette
-        self.image = self._create_silhouette()
+        # Create the ship silhouette (shared by ships that look the same)
+        if sprite_cache is None:
+            sprite_cache = get_asset_cache()
+        cache_key = (
+            self.ship_class,
+            self.faction,
+            self.size,
+            self.color,
+            self.alpha,
+            self.facing_right,
+        )
+        self.image = sprite_cache.get("background_ships", cache_key, self._create_silhouette)
 
     def _create_silhouette(self):
         """Create a ship silhouette sprite"""
@@ -250,10 +263,11 @@ class SpaceBackground:
         # Create layered background
         self.nebula_layer = self.create_nebula(width, height)
         self.star_field = self.create_star_field(100)
+        self.asteroid_library = get_asteroid_library()
         self.asteroids = self.create_asteroid_field(30)
 
         # Background ships
-        self.sprite_cache = {}  # Cache loaded ship sprites
+        self.sprite_cache = get_asset_cache()  # Shared ship silhouette cache
         self.background_ships = []
         self.ship_spawn_timer = 0
         self.ship_spawn_interval = 120  # Frames between potential spawns
@@ -330,7 +344,8 @@ class SpaceBackground:
                     "size": size,
                     "speed": speed,
                     "rotation": rotation,
-                    "color": (100, 90, 80),
+                    "shape": self.asteroid_library.pick_shape(),
+                    "color": (80, 75, 70),
                 }
             )
         return asteroids
@@ -398,22 +413,16 @@ class SpaceBackground:
             y = int(asteroid["y"] - self.scroll_y)
             if -asteroid["size"] <= y <= self.height + asteroid["size"]:
                 self.draw_asteroid(
-                    surface, asteroid["x"], y, asteroid["size"], asteroid["rotation"]
+                    surface,
+                    asteroid["x"],
+                    y,
+                    asteroid["size"],
+                    asteroid["rotation"],
+                    asteroid["shape"],
+                    asteroid["color"],
                 )
 
-    def draw_asteroid(self, surface, x, y, size, rotation):
-        """Draw a rocky asteroid"""
-        points = []
-        segments = 8
-
-        for i in range(segments):
-            angle = (i / segments) * math.pi * 2 + rotation
-            distance = size * random.uniform(0.7, 1.0)
-            px = x + math.cos(angle) * distance
-            py = y + math.sin(angle) * distance
-            points.append((int(px), int(py)))
-
-        # Draw filled polygon
-        pygame.draw.polygon(surface, (80, 75, 70), points)
-        # Dark outline
-        pygame.draw.polygon(surface, (40, 35, 30), points, 2)
+    def draw_asteroid(self, surface, x, y, size, rotation, shape=0, color=(80, 75, 70)):
+        """Draw a rocky asteroid (rotation in radians) from the shared library"""
+        image = self.asteroid_library.frame(size, shape, -math.degrees(rotation), color)
+        surface.blit(image, image.get_rect(center=(int(x), int(y))))
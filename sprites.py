@@ -17,14 +17,138 @@ except ImportError:
         return path
 
 
+from bullet_patterns import create_pattern_runner
+from core.asset_pack import entry_key, get_asset_pack
+from core.sprite_atlas import get_sprite_atlas
+
+SHIP_SVG_DIR = "assets/minmatar_rebellion/svg/top"
+
+PLAYER_SHIP_SIZE = (46, 58)  # 15% larger
+
+# Map player ship types to SVG files
+PLAYER_SHIP_SVGS = {
+    "Rifter": f"{SHIP_SVG_DIR}/rifter.svg",
+    "Wolf": f"{SHIP_SVG_DIR}/Wolf.svg",
+    "Jaguar": f"{SHIP_SVG_DIR}/jaguar.svg",
+}
+
+# Amarr hulls drawn for enemies, by ship class
+ENEMY_FRIGATE_SHIPS = [
+    "punisher",
+    "tormentor",
+    "crucifier",
+    "executioner",
+    "inquisitor",
+    "magnate",
+]
+ENEMY_DESTROYER_SHIPS = ["coercer", "dragoon", "heretic", "confessor"]
+ENEMY_CRUISER_SHIPS = [
+    "maller",
+    "omen",
+    "arbitrator",
+    "augoror",
+    "zealot",
+    "sacrilege",
+    "curse",
+    "pilgrim",
+    "absolution",
+]
+
+
+# Explosion (size, color) stamps baked into the sprite atlas
+ATLAS_EXPLOSIONS = [
+    (30, COLOR_AMARR_ACCENT),
+    (80, COLOR_AMARR_ACCENT),
+    (50, COLOR_MINMATAR_ACCENT),
+]
+
+# Animation phases per cycle baked for pulsing bullets and rocket exhaust
+ATLAS_ANIM_FRAMES = 16
+
+
+def _load_packed_sprite(relative_path, size):
+    """Get a pre-rasterized sprite from the asset pack, or None if not packed"""
+    pack = get_asset_pack()
+    if pack is None:
+        return None
+    return pack.get_surface(entry_key(relative_path, size))
+
+
+def _atlas_image(key):
+    """Get a baked sprite from the texture atlas, or None if not baked"""
+    atlas = get_sprite_atlas()
+    if atlas is None:
+        return None
+    return atlas.image(key)
+
+
+def _anim_frame(phase):
+    """Quantize an animation phase (radians) to a baked atlas frame index"""
+    return int(round(phase / (2 * math.pi) * ATLAS_ANIM_FRAMES)) % ATLAS_ANIM_FRAMES
+
+
+def _color_key(color):
+    return "_".join(str(c) for c in color[:3])
+
+
+def _render_svg_ship(svg_rel, size, rotation):
+    """Rasterize ship art at size (asset pack first, then SVG) and rotate it.
+
+    Raises on failure so callers can fall back to a simple shape.
+    """
+    from io import BytesIO
+
+    image = _load_packed_sprite(svg_rel, size)
+    if image is None:
+        import cairosvg
+
+        # Convert SVG to PNG in memory
+        png_data = cairosvg.svg2png(
+            url=get_resource_path(svg_rel), output_width=size[0], output_height=size[1]
+        )
+        image = pygame.image.load(BytesIO(png_data))
+
+    # Ensure proper alpha
+    image = image.convert_alpha()
+    return pygame.transform.rotate(image, rotation)
+
+
+def render_player_ship(ship_type, size=PLAYER_SHIP_SIZE):
+    """Render a player ship sprite with Minmatar outline and glow"""
+    svg_rel = PLAYER_SHIP_SVGS.get(ship_type, PLAYER_SHIP_SVGS["Rifter"])
+
+    # Rotate to face upward (EVE ships face right by default)
+    image = _render_svg_ship(svg_rel, size, 90)
+
+    # Add strong white outline for visibility
+    image = add_strong_outline(
+        image, outline_color=(255, 255, 255), glow_color=(200, 150, 255), thickness=2
+    )
+    # Add Minmatar glow (rust/orange)
+    return add_ship_glow(image, (200, 100, 50), intensity=0.3)
+
+
+def render_enemy_ship(ship_name, size):
+    """Render an Amarr enemy hull with gold outline, tint and glow"""
+    # Rotate to face downward (enemies come from top)
+    image = _render_svg_ship(f"{SHIP_SVG_DIR}/{ship_name}.svg", size, -90)
+
+    # Add gold outline for Amarr ships
+    image = add_strong_outline(
+        image, outline_color=(255, 215, 0), glow_color=(255, 180, 50), thickness=2
+    )
+    # Add Amarr gold tint and glow
+    image = add_colored_tint(image, (255, 215, 0), alpha=40)
+    return add_ship_glow(image, (255, 215, 100), intensity=0.25)
+
+
 class Player(pygame.sprite.Sprite):
     """Player ship - Rifter/Wolf"""
 
     def __init__(self):
         super().__init__()
         self.is_wolf = False
-        self.width = 46  # 15% larger
-        self.height = 58
+        self.width, self.height = PLAYER_SHIP_SIZE
         self.image = self._create_ship_image()
         self.rect = self.image.get_rect()
         self.rect.centerx = SCREEN_WIDTH // 2
@@ -67,47 +191,16 @@ class Player(pygame.sprite.Sprite):
         self.score = 0
 
     def _create_ship_image(self):
-        """Load ship image from SVG file"""
-        from io import BytesIO
-
-        import cairosvg
-
-        # Map ship types to SVG files
-        ship_svgs = {
-            "Rifter": get_resource_path("assets/minmatar_rebellion/svg/top/rifter.svg"),
-            "Wolf": get_resource_path("assets/minmatar_rebellion/svg/top/Wolf.svg"),
-            "Jaguar": get_resource_path("assets/minmatar_rebellion/svg/top/jaguar.svg"),
-        }
-
+        """Load ship image from the sprite atlas, asset pack or SVG file"""
         ship_type = getattr(self, "ship_class", "Rifter")
-        svg_path = ship_svgs.get(ship_type, ship_svgs["Rifter"])
-
-        try:
-            # Convert SVG to PNG in memory
-            png_data = cairosvg.svg2png(
-                url=svg_path, output_width=self.width, output_height=self.height
-            )
-
-            # Load PNG into pygame surface
-            image = pygame.image.load(BytesIO(png_data))
-
-            # Ensure proper alpha
-            image = image.convert_alpha()
-
-            # Rotate to face upward (EVE ships face right by default)
-            image = pygame.transform.rotate(image, 90)
-
-            # Add strong white outline for visibility
-            image = add_strong_outline(
-                image, outline_color=(255, 255, 255), glow_color=(200, 150, 255), thickness=2
-            )
-            # Add Minmatar glow (rust/orange)
-            image = add_ship_glow(image, (200, 100, 50), intensity=0.3)
-
+        image = _atlas_image(f"player/{ship_type}")
+        if image is not None:
             return image
 
+        try:
+            return render_player_ship(ship_type, (self.width, self.height))
         except Exception as e:
-            print(f"Warning: Could not load {svg_path}: {e}")
+            print(f"Warning: Could not load {ship_type} ship image: {e}")
             # Fallback to simple shape
             return self._create_fallback_ship_image()
 
@@ -312,9 +405,13 @@ class Bullet(pygame.sprite.Sprite):
         self.trail_positions = []
         self.max_trail = 4 + upgrade_level * 2 if upgrade_level > 0 else 0
 
-        self.rect = pygame.Rect(
+        spawn = pygame.Rect(
             x - self.width // 2, y - self.height // 2, int(self.width) + 10, int(self.height) + 10
         )
+        # Hitbox is the drawn bullet's size, fixed here so it is the same
+        # whether images come from the atlas or are drawn
+        self.rect = pygame.Rect((0, 0), self._image_size())
+        self.rect.center = spawn.center
         self.dx = dx
         self.dy = dy
         self.damage = damage
@@ -323,14 +420,29 @@ class Bullet(pygame.sprite.Sprite):
 
         self._update_image()
 
+    def _glow_pad(self):
+        return int(self.upgrade_level * 4) if self.upgrade_level > 0 else 2
+
+    def _image_size(self):
+        glow_pad = self._glow_pad()
+        return int(self.width + glow_pad * 2), int(self.height + glow_pad * 2)
+
+    def _atlas_key(self):
+        frame = _anim_frame(self.anim_timer) if self.upgrade_level > 0 else 0
+        return f"bullet/{_color_key(self.color)}/{self.upgrade_level}/{frame}"
+
     def _update_image(self):
         """Render bullet with animated glow"""
+        image = _atlas_image(self._atlas_key())
+        if image is not None:
+            self.image = image
+            return
+
         # Pulsing effect for upgrades
         pulse = 0.7 + 0.3 * math.sin(self.anim_timer) if self.upgrade_level > 0 else 1.0
 
-        glow_pad = int(self.upgrade_level * 4) if self.upgrade_level > 0 else 2
-        surf_w = int(self.width + glow_pad * 2)
-        surf_h = int(self.height + glow_pad * 2)
+        glow_pad = self._glow_pad()
+        surf_w, surf_h = self._image_size()
 
         self.image = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
 
@@ -384,10 +496,6 @@ class Bullet(pygame.sprite.Sprite):
                 1,
             )
 
-        # Update rect to match image center
-        old_center = self.rect.center
-        self.rect = self.image.get_rect(center=old_center)
-
     def draw_trail(self, surface):
         """Draw bullet trail for upgraded bullets"""
         if self.upgrade_level == 0 or len(self.trail_positions) < 2:
@@ -443,6 +551,11 @@ class Rocket(pygame.sprite.Sprite):
 
     def _update_image(self):
         """Render rocket with animated exhaust"""
+        image = _atlas_image(f"rocket/{_anim_frame(self.anim_timer * 0.5)}")
+        if image is not None:
+            self.image = image
+            return
+
         flame_flicker = 0.7 + 0.3 * math.sin(self.anim_timer * 0.5)
         flame_size = int(6 + 4 * flame_flicker)
 
@@ -511,15 +624,29 @@ class Rocket(pygame.sprite.Sprite):
             self.kill()
 
 
+_enemy_bullet_image = None
+
+
+def enemy_bullet_image():
+    """Shared enemy laser surface (also the bullet engine's default stamp)"""
+    global _enemy_bullet_image
+    if _enemy_bullet_image is None:
+        image = _atlas_image("enemy_bullet")
+        if image is None:
+            image = pygame.Surface((4, 16), pygame.SRCALPHA)
+            # Yellow/gold Amarr laser
+            pygame.draw.rect(image, (255, 220, 100), (0, 0, 4, 16))
+            pygame.draw.rect(image, (255, 255, 200), (1, 0, 2, 16))
+        _enemy_bullet_image = image
+    return _enemy_bullet_image
+
+
 class EnemyBullet(pygame.sprite.Sprite):
     """Enemy laser projectile"""
 
     def __init__(self, x, y, dx, dy, damage=10):
         super().__init__()
-        self.image = pygame.Surface((4, 16), pygame.SRCALPHA)
-        # Yellow/gold Amarr laser
-        pygame.draw.rect(self.image, (255, 220, 100), (0, 0, 4, 16))
-        pygame.draw.rect(self.image, (255, 255, 200), (1, 0, 2, 16))
+        self.image = enemy_bullet_image()
         self.rect = self.image.get_rect(center=(x, y))
         self.dx = dx
         self.dy = dy
@@ -593,9 +720,13 @@ class Enemy(pygame.sprite.Sprite):
         self.circle_radius = random.randint(50, 100)
 
         # Boss-specific behavior
+        self.bullet_pattern = None
+        self.pattern_shots = 0  # Bullets the pattern emitted on the last fire()
         if self.is_boss:
             self.boss_phase = 0
             self.boss_phase_timer = 0
+            # Scripted attack from data/patterns, if this boss has one
+            self.bullet_pattern = create_pattern_runner(enemy_type)
 
     def _select_movement_pattern(self):
         """Select movement pattern based on enemy type"""
@@ -633,66 +764,25 @@ class Enemy(pygame.sprite.Sprite):
             return random.randint(80, 300)
 
     def _create_image(self):
-        """Load enemy ship image from SVG based on type"""
+        """Load enemy ship image from the sprite atlas, asset pack or SVG"""
         import random
-        from io import BytesIO
-
-        import cairosvg
-
-        # Map enemy types to ship classes
-        frigate_ships = [
-            "punisher",
-            "tormentor",
-            "crucifier",
-            "executioner",
-            "inquisitor",
-            "magnate",
-        ]
-        destroyer_ships = ["coercer", "dragoon", "heretic", "confessor"]
-        cruiser_ships = [
-            "maller",
-            "omen",
-            "arbitrator",
-            "augoror",
-            "zealot",
-            "sacrilege",
-            "curse",
-            "pilgrim",
-            "absolution",
-        ]
 
         # Determine ship class based on enemy type
         if self.is_boss:
-            ship_name = random.choice(cruiser_ships)
+            ship_name = random.choice(ENEMY_CRUISER_SHIPS)
         elif self.stats.get("tough", False) or self.max_hull > 150:
-            ship_name = random.choice(destroyer_ships)
+            ship_name = random.choice(ENEMY_DESTROYER_SHIPS)
         else:
-            ship_name = random.choice(frigate_ships)
-
-        svg_path = get_resource_path(f"assets/minmatar_rebellion/svg/top/{ship_name}.svg")
-
-        try:
-            # Convert SVG to PNG
-            png_data = cairosvg.svg2png(
-                url=svg_path, output_width=self.width, output_height=self.height
-            )
-            image = pygame.image.load(BytesIO(png_data)).convert_alpha()
-
-            # Rotate to face downward (enemies come from top)
-            image = pygame.transform.rotate(image, -90)
-
-            # Add gold outline for Amarr ships
-            image = add_strong_outline(
-                image, outline_color=(255, 215, 0), glow_color=(255, 180, 50), thickness=2
-            )
-            # Add Amarr gold tint and glow
-            image = add_colored_tint(image, (255, 215, 0), alpha=40)
-            image = add_ship_glow(image, (255, 215, 100), intensity=0.25)
+            ship_name = random.choice(ENEMY_FRIGATE_SHIPS)
 
+        image = _atlas_image(f"enemy/{ship_name}@{self.width}x{self.height}")
+        if image is not None:
             return image
 
+        try:
+            return render_enemy_ship(ship_name, (self.width, self.height))
         except Exception as e:
-            print(f"Warning: Could not load enemy ship {svg_path}: {e}")
+            print(f"Warning: Could not load enemy ship {ship_name}: {e}")
             return self._create_fallback_image()
 
     def _create_fallback_image(self):
@@ -840,9 +930,7 @@ class Enemy(pygame.sprite.Sprite):
         self.boss_phase_timer += 1
 
         # Phase changes based on health
-        health_pct = (self.shields + self.armor + self.hull) / (
-            self.max_shields + self.max_armor + self.max_hull
-        )
+        health_pct = self.health_fraction()
 
         if health_pct < 0.3 and self.boss_phase < 2:
             self.boss_phase = 2
@@ -851,6 +939,12 @@ class Enemy(pygame.sprite.Sprite):
             self.boss_phase = 1
             self.fire_rate = int(self.fire_rate * 0.8)
 
+    def health_fraction(self):
+        """Remaining shields, armor and hull as a fraction of the maximum"""
+        return (self.shields + self.armor + self.hull) / (
+            self.max_shields + self.max_armor + self.max_hull
+        )
+
     def can_shoot(self):
         """Check if enemy can fire"""
         if self.fire_rate == 0:
@@ -858,13 +952,17 @@ class Enemy(pygame.sprite.Sprite):
         now = pygame.time.get_ticks()
         return now - self.last_shot > self.fire_rate
 
-    def shoot(self, player_rect):
-        """Fire at player"""
+    def aim(self, player_rect):
+        """Aim at player if ready to fire
+
+        Returns:
+            List of (x, y, dx, dy, damage) shots, empty if not ready
+        """
         if not self.can_shoot():
             return []
 
         self.last_shot = pygame.time.get_ticks()
-        bullets = []
+        shots = []
 
         # Calculate direction to player
         dx = player_rect.centerx - self.rect.centerx
@@ -882,11 +980,39 @@ class Enemy(pygame.sprite.Sprite):
                 rad = math.radians(angle)
                 bdx = dx * math.cos(rad) - dy * math.sin(rad)
                 bdy = dx * math.sin(rad) + dy * math.cos(rad)
-                bullets.append(EnemyBullet(self.rect.centerx, self.rect.bottom, bdx, bdy, 15))
+                shots.append((self.rect.centerx, self.rect.bottom, bdx, bdy, 15))
         else:
-            bullets.append(EnemyBullet(self.rect.centerx, self.rect.bottom, dx * 0.3, dy, 10))
+            shots.append((self.rect.centerx, self.rect.bottom, dx * 0.3, dy, 10))
 
-        return bullets
+        return shots
+
+    def shoot(self, player_rect):
+        """Fire at player, returning EnemyBullet sprites"""
+        return [EnemyBullet(*shot) for shot in self.aim(player_rect)]
+
+    def fire(self, player_rect, bullets):
+        """Fire at player into an EnemyBulletEngine
+
+        Returns:
+            Number of aimed shots fired, at the enemy's fire rate. Scripted
+            pattern bullets emit nearly every frame and are counted in
+            pattern_shots instead, so callers can key sounds off the return
+        """
+        shots = self.aim(player_rect)
+        for x, y, dx, dy, damage in shots:
+            bullets.spawn(x, y, dx, dy, damage)
+
+        # Scripted boss patterns run once the boss is in position
+        self.pattern_shots = 0
+        if self.bullet_pattern is not None and self.entered:
+            self.pattern_shots = self.bullet_pattern.update(
+                self.rect.centerx,
+                self.rect.centery,
+                self.health_fraction(),
+                (player_rect.centerx, player_rect.centery),
+                bullets,
+            )
+        return len(shots)
 
     def take_damage(self, bullet):
         """Take damage from bullet, return True if destroyed"""
@@ -1041,6 +1167,10 @@ class Powerup(pygame.sprite.Sprite):
 
     def _create_base_image(self):
         """Create the core powerup icon"""
+        self.base_surface = _atlas_image(f"powerup_icon/{self.powerup_type}")
+        if self.base_surface is not None:
+            return
+
         self.base_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
         cx, cy = self.size // 2, self.size // 2
 
@@ -1263,6 +1393,12 @@ class Explosion(pygame.sprite.Sprite):
         self._update_image()
 
     def _update_image(self):
+        image = _atlas_image(f"explosion/{self.size}/{_color_key(self.color)}/{self.frame}")
+        if image is not None:
+            self.image = image
+            self.rect = image.get_rect(center=(self.x, self.y))
+            return
+
         progress = self.frame / self.max_frames
         current_size = int(self.size * (1 + progress))
         alpha = int(255 * (1 - progress))
@@ -0,0 +1,140 @@
+"""Tests for the batched AI engine"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_batch import AIBatchEngine, BatchedAI  # noqa: E402
+from ai_behaviors import (  # noqa: E402
+    AI_BASIC,
+    AI_KAMIKAZE,
+    AI_SNIPER,
+    AI_SPAWNER,
+    AI_TANK,
+    AI_WEAVER,
+    KamikazeAI,
+    SniperAI,
+    TankAI,
+    WeaverAI,
+    create_ai_behavior,
+)
+
+
+def _make_enemy(x=400, y=100, speed=2.0, enemy_type="rifter"):
+    return SimpleNamespace(
+        rect=SimpleNamespace(centerx=x, centery=y),
+        speed=speed,
+        enemy_type=enemy_type,
+        alive=lambda: True,
+    )
+
+
+def _assert_matches_scalar(
+    scalar_class, behavior_type, positions, player_pos, frames, bullets=None
+):
+    """Batched results must match the per-enemy class for deterministic behaviors."""
+    engine = AIBatchEngine(seed=1)
+    scalar = [scalar_class(_make_enemy(x, y)) for x, y in positions]
+    batched = [engine.add(_make_enemy(x, y), behavior_type) for x, y in positions]
+    for _ in range(frames):
+        engine.update(player_pos, bullets)
+        for s, b in zip(scalar, batched):
+            expected = s.update(player_pos, bullets)
+            actual = b.update(player_pos, bullets)
+            assert abs(actual[0] - expected[0]) < 1e-9
+            assert abs(actual[1] - expected[1]) < 1e-9
+            assert actual[2] == expected[2]
+            # Move both enemies the same way
+            for enemy in (s.enemy, b.enemy):
+                enemy.rect.centerx += int(expected[0])
+                enemy.rect.centery += int(expected[1])
+
+
+class TestCreateAIBehavior:
+    def test_engine_returns_batched_handle(self):
+        engine = AIBatchEngine()
+        ai = create_ai_behavior(_make_enemy(enemy_type="punisher"), engine=engine)
+        assert isinstance(ai, BatchedAI)
+        assert ai.behavior_type == AI_TANK
+        assert len(engine.groups[AI_TANK]) == 1
+
+    def test_without_engine_returns_scalar_class(self):
+        assert isinstance(create_ai_behavior(_make_enemy(enemy_type="punisher")), TankAI)
+
+    def test_fire_rate_modifiers_match_scalar(self):
+        engine = AIBatchEngine()
+        for behavior_type, cls in (
+            (AI_TANK, TankAI),
+            (AI_SNIPER, SniperAI),
+            (AI_KAMIKAZE, KamikazeAI),
+        ):
+            handle = engine.add(_make_enemy(), behavior_type)
+            assert handle.get_fire_rate_modifier() == cls(_make_enemy()).get_fire_rate_modifier()
+
+
+class TestBatchMatchesScalar:
+    positions = [(30, 100), (400, 100), (400, 420), (780, 300), (200, 40), (600, 160)]
+
+    def test_tank(self):
+        _assert_matches_scalar(TankAI, AI_TANK, self.positions, (420, 500), 60)
+
+    def test_sniper(self):
+        _assert_matches_scalar(SniperAI, AI_SNIPER, self.positions, (420, 500), 90)
+
+    def test_kamikaze(self):
+        _assert_matches_scalar(KamikazeAI, AI_KAMIKAZE, self.positions, (420, 500), 60)
+
+    def test_weaver_dodging(self):
+        bullets = [
+            SimpleNamespace(rect=SimpleNamespace(centerx=410, centery=60)),
+            SimpleNamespace(rect=SimpleNamespace(centerx=390, centery=380)),
+        ]
+        _assert_matches_scalar(WeaverAI, AI_WEAVER, self.positions, (420, 500), 30, bullets)
+
+
+class TestEngine:
+    def test_first_handle_drives_the_step(self):
+        engine = AIBatchEngine()
+        handles = [engine.add(_make_enemy(), AI_BASIC) for _ in range(3)]
+        for _ in range(4):
+            for handle in handles:
+                handle.update((400, 500))
+        assert engine.steps == 4
+
+    def test_remove_keeps_other_rows(self):
+        engine = AIBatchEngine()
+        low = engine.add(_make_enemy(y=10), AI_TANK)
+        high = engine.add(_make_enemy(y=200), AI_TANK)
+        engine.remove(low)
+        engine.remove(low)
+        engine.update((400, 500))
+        assert high.slot == 0
+        assert high.update((400, 500))[2] is True
+        assert len(engine) == 1
+
+    def test_groups_grow_past_capacity(self):
+        engine = AIBatchEngine()
+        handles = [engine.add(_make_enemy(x=i), AI_TANK) for i in range(100)]
+        engine.update((400, 500))
+        assert [h.slot for h in handles] == list(range(100))
+
+    def test_prune_drops_dead_enemies(self):
+        engine = AIBatchEngine()
+        dead = _make_enemy()
+        dead.alive = lambda: False
+        engine.add(dead, AI_BASIC)
+        engine.add(_make_enemy(), AI_BASIC)
+        engine.prune()
+        assert len(engine) == 1
+
+    def test_spawner_queues_drones(self):
+        engine = AIBatchEngine(seed=3)
+        spawner = engine.add(_make_enemy(x=400, y=100), AI_SPAWNER)
+        for _ in range(200):
+            engine.update((400, 500))
+        queue = spawner.get_spawn_queue()
+        assert len(queue) == 1
+        assert queue[0]["type"] == "drone"
+        assert spawner.get_spawn_queue() == []
@@ -0,0 +1,132 @@
+"""Tests for the unified LRU asset cache"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.asset_cache import AssetCache, surface_bytes  # noqa: E402
+
+
+class FakeSurface:
+    """Just enough of pygame.Surface for memory accounting."""
+
+    def __init__(self, width, height, parent=None):
+        self.width = width
+        self.height = height
+        self.parent = parent
+
+    def get_pitch(self):
+        return self.width * 4
+
+    def get_height(self):
+        return self.height
+
+    def get_parent(self):
+        return self.parent
+
+
+class TestSurfaceBytes:
+    def test_surface_pixels_counted(self):
+        assert surface_bytes(FakeSurface(10, 5)) == 200
+
+    def test_subsurface_counts_as_zero(self):
+        assert surface_bytes(FakeSurface(10, 5, parent=FakeSurface(20, 20))) == 0
+
+    def test_containers_are_summed(self):
+        frames = [FakeSurface(1, 1), FakeSurface(2, 1)]
+        assert surface_bytes(frames) == 12
+        assert surface_bytes({"a": FakeSurface(1, 1)}) == 4
+
+    def test_non_surface_counts_as_zero(self):
+        assert surface_bytes("text") == 0
+
+
+class TestAssetCache:
+    def setup_method(self):
+        self.cache = AssetCache(budget=100, quotas={"small": 30})
+
+    def test_loader_runs_once(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "value"
+
+        assert self.cache.get("misc", "k", loader) == "value"
+        assert self.cache.get("misc", "k", loader) == "value"
+        assert len(calls) == 1
+
+    def test_none_from_loader_not_cached(self):
+        assert self.cache.get("misc", "k", lambda: None) is None
+        assert not self.cache.peek("misc", "k")
+
+    def test_budget_evicts_least_recently_used(self):
+        self.cache.put("misc", "a", "A", size=40)
+        self.cache.put("misc", "b", "B", size=40)
+        self.cache.get("misc", "a")
+        self.cache.put("misc", "c", "C", size=40)
+        assert self.cache.peek("misc", "a")
+        assert not self.cache.peek("misc", "b")
+        assert self.cache.total_bytes == 80
+
+    def test_quota_only_evicts_within_category(self):
+        self.cache.put("misc", "big", "X", size=50)
+        self.cache.put("small", "a", "A", size=20)
+        self.cache.put("small", "b", "B", size=20)
+        assert self.cache.peek("misc", "big")
+        assert not self.cache.peek("small", "a")
+        assert self.cache.stats()["categories"]["small"]["evictions"] == 1
+
+    def test_pinned_entries_survive_eviction(self):
+        self.cache.put("misc", "a", "A", size=60)
+        with self.cache.pinned("misc", "a"):
+            self.cache.put("misc", "b", "B", size=60)
+            assert self.cache.peek("misc", "a")
+        self.cache.put("misc", "c", "C", size=60)
+        assert not self.cache.peek("misc", "a")
+
+    def test_replacing_entry_updates_bytes(self):
+        self.cache.put("misc", "a", "A", size=10)
+        self.cache.put("misc", "a", "A2", size=25)
+        assert self.cache.total_bytes == 25
+        assert self.cache.stats()["entries"] == 1
+
+    def test_clear_keeps_pinned(self):
+        self.cache.put("misc", "a", "A", size=1)
+        self.cache.put("misc", "b", "B", size=1)
+        self.cache.pin("misc", "a")
+        self.cache.clear()
+        assert self.cache.peek("misc", "a")
+        assert not self.cache.peek("misc", "b")
+
+    def test_hit_rate(self):
+        self.cache.get("misc", "a", lambda: "A")
+        self.cache.get("misc", "a")
+        self.cache.get("misc", "a")
+        stats = self.cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+
+
+class TestCacheView:
+    def setup_method(self):
+        self.cache = AssetCache(budget=1000)
+
+    def test_dict_protocol(self):
+        view = self.cache.view("ships")
+        view[1] = "one"
+        assert 1 in view
+        assert view[1] == "one"
+        assert view.get(2, "none") == "none"
+        del view[1]
+        assert 1 not in view
+
+    def test_namespaces_do_not_collide(self):
+        a = self.cache.view("ships", "dir_a")
+        b = self.cache.view("ships", "dir_b")
+        a[1] = "a"
+        assert 1 not in b
+        assert list(a) == [1]
+        assert len(b) == 0
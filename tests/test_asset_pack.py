@@ -0,0 +1,109 @@
+"""Tests for the memory-mapped asset pack"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.asset_pack import (  # noqa: E402
+    DATA_ALIGN,
+    AssetPack,
+    AssetPackError,
+    AssetPackWriter,
+    entry_key,
+)
+
+
+class TestEntryKey:
+    def test_native_key_is_normalized(self):
+        assert entry_key("./assets//eve_renders/archon.png") == "assets/eve_renders/archon.png"
+
+    def test_scaled_key_has_size_suffix(self):
+        assert entry_key("assets/a.svg", (46, 58)) == "assets/a.svg@46x58"
+
+
+class TestAssetPackRoundTrip:
+    def setup_method(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "test.evpak")
+
+    def teardown_method(self):
+        for name in os.listdir(self.tmpdir):
+            os.unlink(os.path.join(self.tmpdir, name))
+        os.rmdir(self.tmpdir)
+
+    def _write_sample(self):
+        writer = AssetPackWriter()
+        writer.add_image("img/a.png", bytes(range(4)) * 6, 3, 2)
+        writer.add_image("img/b.png@1x1", b"\xff\x00\x00\x80", 1, 1)
+        writer.add_audio("sounds/sfx/beep", b"\x01\x00" * 10, 22050, 2)
+        return writer.write(self.path)
+
+    def test_write_reports_file_size(self):
+        total = self._write_sample()
+        assert total == os.path.getsize(self.path)
+        assert not os.path.exists(self.path + ".tmp")
+
+    def test_entries_round_trip(self):
+        self._write_sample()
+        pack = AssetPack(self.path)
+        assert len(pack) == 3
+        assert "img/a.png" in pack
+        assert bytes(pack.get_buffer("img/a.png")) == bytes(range(4)) * 6
+        assert bytes(pack.get_buffer("img/b.png@1x1")) == b"\xff\x00\x00\x80"
+        assert pack.index["sounds/sfx/beep"]["sample_rate"] == 22050
+        pack.close()
+
+    def test_blobs_are_aligned(self):
+        self._write_sample()
+        pack = AssetPack(self.path)
+        for entry in pack.index.values():
+            assert entry["offset"] % DATA_ALIGN == 0
+        pack.close()
+
+    def test_missing_or_non_image_entry_has_no_surface(self):
+        self._write_sample()
+        pack = AssetPack(self.path)
+        assert pack.get_surface("img/missing.png") is None
+        assert pack.get_surface("sounds/sfx/beep") is None
+        pack.close()
+
+    def test_image_size_mismatch_rejected(self):
+        writer = AssetPackWriter()
+        with pytest.raises(ValueError):
+            writer.add_image("bad", b"\x00" * 7, 1, 2)
+
+    def test_bad_magic_rejected(self):
+        with open(self.path, "wb") as f:
+            f.write(b"NOTAPACK" + b"\x00" * 32)
+        with pytest.raises(AssetPackError):
+            AssetPack(self.path)
+
+    def test_truncated_pack_rejected(self):
+        self._write_sample()
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 8)
+        with pytest.raises(AssetPackError):
+            AssetPack(self.path)
+
+
+class TestPackedSounds:
+    def test_frozen_build_trusts_the_pack(self, tmp_path, monkeypatch):
+        import sounds
+
+        class Pack:
+            path = str(tmp_path / "assets.evpak")
+            index = {"sounds/sfx/beep": {}}
+
+            def get_sound(self, key):
+                return key
+
+        # PyInstaller builds have no sounds.py on disk to compare mtimes with
+        monkeypatch.setattr(sounds, "__file__", str(tmp_path / "missing" / "sounds.py"))
+        monkeypatch.setattr(sounds, "get_asset_pack", Pack)
+        generator = sounds.SoundGenerator.__new__(sounds.SoundGenerator)
+        assert generator._load_packed_sounds()
+        assert generator.sounds == {"beep": "sounds/sfx/beep"}
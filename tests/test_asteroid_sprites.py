@@ -0,0 +1,53 @@
+"""Tests for the shared asteroid sprite library"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from asteroid_sprites import (  # noqa: E402
+    RADIUS_STEP,
+    SIZE_CLASSES,
+    frame_index,
+    generate_shape,
+    quantize_radius,
+    size_class_for,
+)
+
+
+class TestSizeClasses:
+    def test_radius_maps_to_class(self):
+        assert size_class_for(15) == "small"
+        assert size_class_for(40) == "medium"
+        assert size_class_for(75) == "large"
+
+    def test_radius_quantized_to_step(self):
+        assert quantize_radius(31) % RADIUS_STEP == 0
+        assert abs(quantize_radius(31) - 31) <= RADIUS_STEP / 2
+        assert quantize_radius(0) == RADIUS_STEP
+
+
+class TestShapes:
+    def test_shapes_are_deterministic(self):
+        assert generate_shape("medium", 3) == generate_shape("medium", 3)
+
+    def test_shapes_differ_by_index(self):
+        assert generate_shape("small", 0) != generate_shape("small", 1)
+
+    def test_outline_fits_inside_unit_radius(self):
+        for name, _, (min_points, max_points) in SIZE_CLASSES:
+            shape = generate_shape(name, 0)
+            assert min_points <= len(shape.outline) <= max_points
+            assert all(0 < r <= 1.0 for _, r in shape.outline)
+
+
+class TestFrameIndex:
+    def test_angles_wrap(self):
+        assert frame_index(0, 36) == 0
+        assert frame_index(360, 36) == 0
+        assert frame_index(-10, 36) == 35
+
+    def test_nearest_frame(self):
+        assert frame_index(14, 36) == 1
+        assert frame_index(16, 36) == 2
+        assert frame_index(359, 36) == 0
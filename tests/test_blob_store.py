@@ -0,0 +1,115 @@
+"""Tests for the content-addressed blob store and its use by AssetManager"""
+
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asset_manager  # noqa: E402
+from core.blob_store import BlobStore, file_digest  # noqa: E402
+from tests.test_downloader import ImageServer  # noqa: E402
+
+
+class TestBlobStore:
+    def test_identical_files_share_one_blob(self, tmp_path):
+        store = BlobStore(tmp_path / "blobs")
+        first, second = tmp_path / "drake.png", tmp_path / "myrmidon.png"
+        first.write_bytes(b"render")
+        second.write_bytes(b"render")
+        digest = store.add(first)
+        assert store.add(second) == digest == file_digest(store.path(digest))
+        assert os.path.samefile(first, second)
+        assert list(store.digests()) == [digest]
+
+    def test_materialize_links_into_place(self, tmp_path):
+        store = BlobStore(tmp_path / "blobs")
+        source = tmp_path / "rifter.png"
+        source.write_bytes(b"rifter")
+        digest = store.add(source)
+        target = tmp_path / "project" / "256" / "rifter_587.png"
+        assert store.materialize(digest, target) is True
+        assert os.path.samefile(target, store.path(digest))
+        assert not list(target.parent.glob("*.tmp"))
+
+    def test_prune_keeps_referenced_blobs(self, tmp_path):
+        store = BlobStore(tmp_path / "blobs")
+        for name in ("a", "b"):
+            (tmp_path / name).write_bytes(name.encode())
+        keep = store.add(tmp_path / "a")
+        store.add(tmp_path / "b")
+        assert store.prune([keep]) == 1
+        assert list(store.digests()) == [keep]
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = ImageServer()
+    threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+    monkeypatch.setattr(asset_manager, "IMAGE_SERVER", server.base_url)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestAssetManager:
+    def test_shared_type_ids_download_once(self, server, tmp_path):
+        manager = asset_manager.AssetManager(tmp_path)
+        results = asyncio.run(manager.download_all_ships([64], classes=["battlecruisers"]))
+        assert all(r.success for r in results) and len(results) == 8
+        # drake and myrmidon are both 24690
+        assert len(server.requests) == 7
+        assert os.path.samefile(
+            tmp_path / "ships" / "64" / "drake_24690.png",
+            tmp_path / "ships" / "64" / "myrmidon_24690.png",
+        )
+        stats = manager.get_stats()
+        assert stats["blobs"] == 7
+
+    def test_known_blobs_skip_the_download(self, server, tmp_path):
+        manager = asset_manager.AssetManager(tmp_path)
+        asyncio.run(manager.download_all_ships([64], classes=["battlecruisers"]))
+        asyncio.run(manager.download_all_ships([64], classes=["battleships"]))
+        # hyperion, rokh and abaddon reuse battlecruiser renders
+        assert len(server.requests) == 7 + 9
+        assert manager.last_download["fetched"] == 9
+        assert manager.last_download["reused"] == 3
+
+    def test_failures_are_not_counted_as_reused(self, server, tmp_path):
+        manager = asset_manager.AssetManager(tmp_path)
+        asyncio.run(manager.download_ship(587, "rifter", 64))
+        requests = [(587, "rifter", 64, "render"), (404, "ghost", 64, "render")]
+        results = asyncio.run(manager._download(requests))
+        assert [r.success for r in results] == [True, False]
+        assert manager.last_download["fetched"] == 0
+        assert manager.last_download["reused"] == 1
+        assert manager.last_download["failed"] == 1
+
+    def test_revalidation_keeps_blobs(self, server, tmp_path):
+        manager = asset_manager.AssetManager(tmp_path)
+        asyncio.run(manager.download_all_ships([64], classes=["battlecruisers"]))
+        results = asyncio.run(
+            manager.download_all_ships([64], classes=["battlecruisers"], revalidate=True)
+        )
+        assert all(r.success for r in results)
+        assert [status for _, status in server.requests[7:]] == [304] * 7
+        assert not list(manager.downloads_dir.glob("*.png"))
+
+    def test_adopts_files_from_before_the_store(self, server, tmp_path):
+        legacy = tmp_path / "ships" / "64" / "rifter_587.png"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(b"old rifter")
+        manager = asset_manager.AssetManager(tmp_path)
+        result = asyncio.run(manager.download_ship(587, "rifter", 64))
+        assert result.success and server.requests == []
+        assert manager.manifest["sources"]["587/render/64"] == file_digest(legacy)
+
+    def test_hardlinks_into_projects(self, server, tmp_path):
+        manager = asset_manager.AssetManager(tmp_path / "assets")
+        asyncio.run(manager.download_all_ships([64], classes=["battlecruisers"]))
+        manager.link_to_project(tmp_path / "game", "hardlink")
+        linked = tmp_path / "game" / "assets" / "eve_ships" / "64" / "drake_24690.png"
+        assert os.path.samefile(linked, manager.ships_dir / "64" / "drake_24690.png")
@@ -0,0 +1,114 @@
+"""Tests for the array-backed enemy bullet engine"""
+
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bullet_engine import DAMAGE, VX, VY, EnemyBulletEngine, X, Y  # noqa: E402
+
+
+class FakeSurface:
+    def __init__(self, size=(4, 16)):
+        self.size = size
+        self.blitted = []
+        self.calls = 0
+
+    def get_size(self):
+        return self.size
+
+    def blits(self, sequence, doreturn=True):
+        self.calls += 1
+        self.blitted.extend(sequence)
+
+
+class TestSpawn:
+    def test_scalar_spawn(self):
+        engine = EnemyBulletEngine(800, 700)
+        assert engine.spawn(100, 200, 1.5, 3, damage=15) == 1
+        assert len(engine) == 1
+        assert engine.data[DAMAGE, 0] == 15
+
+    def test_array_spawn_broadcasts(self):
+        engine = EnemyBulletEngine(800, 700)
+        angles = np.linspace(0, 2 * math.pi, 12, endpoint=False)
+        assert engine.spawn(400, 300, np.cos(angles) * 3, np.sin(angles) * 3) == 12
+        assert np.all(engine.data[X, :12] == 400)
+
+    def test_grows_past_capacity(self):
+        engine = EnemyBulletEngine(800, 700, capacity=4)
+        engine.spawn(np.arange(10) * 10.0, 100, 0, 1)
+        engine.spawn(500, 100, 0, 1)
+        assert len(engine) == 11
+        assert engine.data[X, 10] == 500
+
+
+class TestUpdate:
+    def test_integrates_velocity_and_acceleration(self):
+        engine = EnemyBulletEngine(800, 700)
+        engine.spawn(100, 100, 1, 2, ax=0.5, ay=-0.5)
+        engine.update()
+        engine.update()
+        assert engine.data[X, 0] == 100 + 1.5 + 2.0
+        assert engine.data[Y, 0] == 100 + 1.5 + 1.0
+
+    def test_spin_rotates_velocity(self):
+        engine = EnemyBulletEngine(800, 700)
+        engine.spawn(400, 300, 2, 0, spin=math.pi / 2)
+        engine.update()
+        assert abs(engine.data[VX, 0]) < 1e-9
+        assert abs(engine.data[VY, 0] - 2) < 1e-9
+
+    def test_culls_offscreen_and_expired(self):
+        engine = EnemyBulletEngine(800, 700, margin=10)
+        engine.spawn(400, 695, 0, 20)  # leaves the bottom
+        engine.spawn(5, 300, -20, 0)  # leaves the left
+        engine.spawn(400, 300, 0, 0, life=2)  # expires
+        engine.spawn(400, 300, 0, 1, damage=99)  # survives
+        engine.update()
+        assert len(engine) == 2
+        engine.update()
+        assert len(engine) == 1
+        assert engine.data[DAMAGE, 0] == 99
+
+
+class TestCollide:
+    def test_hits_are_removed_and_returned(self):
+        engine = EnemyBulletEngine(800, 700)
+        engine.spawn(400, 600, 0, 0, damage=10, radius=3)
+        engine.spawn(420, 600, 0, 0, damage=20, radius=3)
+        engine.spawn(400, 400, 0, 0, damage=30, radius=3)
+        hits = engine.collide(400, 600, 18)
+        assert sorted(damage for _, _, damage in hits) == [10, 20]
+        assert len(engine) == 1
+        assert engine.data[DAMAGE, 0] == 30
+
+    def test_no_hits(self):
+        engine = EnemyBulletEngine(800, 700)
+        engine.spawn(100, 100, 0, 0)
+        assert engine.collide(600, 600, 18) == []
+        assert len(engine) == 1
+
+
+class TestDraw:
+    def test_single_batched_blit(self):
+        engine = EnemyBulletEngine(800, 700)
+        laser = FakeSurface((4, 16))
+        orb = FakeSurface((10, 10))
+        engine.add_stamp("laser", laser)
+        engine.spawn(100, 100, 0, 0, stamp=engine.add_stamp("orb", orb))
+        engine.spawn(200, 300, 0, 0)
+        screen = FakeSurface((800, 700))
+        assert engine.draw(screen) == 2
+        assert screen.calls == 1
+        assert screen.blitted == [(orb, (95, 95)), (laser, (198, 292))]
+
+    def test_nothing_to_draw(self):
+        engine = EnemyBulletEngine(800, 700)
+        engine.add_stamp("laser", FakeSurface())
+        screen = FakeSurface((800, 700))
+        assert engine.draw(screen) == 0
+        assert screen.calls == 0
@@ -0,0 +1,155 @@
+"""Tests for declarative boss bullet patterns"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bullet_patterns  # noqa: E402
+from bullet_engine import DAMAGE, STAMP, VX, VY, EnemyBulletEngine, X  # noqa: E402
+from bullet_patterns import (  # noqa: E402
+    BulletPatternRunner,
+    PatternError,
+    compile_pattern,
+)
+from core.loader import load_patterns  # noqa: E402
+
+
+def _pattern(*phases):
+    return {"phases": list(phases)}
+
+
+def _phase(*emitters, health=1.0, loop=60):
+    return {"health": health, "loop": loop, "emitters": list(emitters)}
+
+
+class TestCompile:
+    def test_ring_is_evenly_spaced(self):
+        compiled = compile_pattern(
+            "boss", _pattern(_phase({"type": "ring", "count": 4, "speed": 2}))
+        )
+        rows = compiled.phases[0].rows
+        assert rows.shape[0] == 4
+        np.testing.assert_allclose(rows[:, bullet_patterns.VX], [0, 2, 0, -2], atol=1e-9)
+        np.testing.assert_allclose(rows[:, bullet_patterns.VY], [2, 0, -2, 0], atol=1e-9)
+
+    def test_timeline_indexes_rows_by_frame(self):
+        compiled = compile_pattern(
+            "boss",
+            _pattern(
+                _phase(
+                    {"type": "fan", "at": 10, "count": 3, "spread": 20},
+                    {"type": "spiral", "at": 0, "count": 2, "rotate": 15, "repeat": 3, "every": 5},
+                )
+            ),
+        )
+        starts = compiled.phases[0].starts
+        counts = np.diff(starts)
+        assert len(counts) == 60
+        assert counts[0] == counts[5] == 2
+        assert counts[10] == 2 + 3
+        assert counts.sum() == 9
+
+    def test_phases_sorted_and_selected_by_health(self):
+        compiled = compile_pattern(
+            "boss",
+            _pattern(
+                _phase({"type": "ring", "count": 8}, health=0.3),
+                _phase({"type": "ring", "count": 4}),
+            ),
+        )
+        assert [phase.health for phase in compiled.phases] == [1.0, 0.3]
+        assert compiled.phase_for(0.9) == 0
+        assert compiled.phase_for(0.3) == 1
+
+    @pytest.mark.parametrize(
+        "emitter, message",
+        [
+            ({"type": "burst"}, "type must be one of"),
+            ({"type": "ring", "cuont": 3}, "unknown keys"),
+            ({"type": "ring", "count": 0}, "at least 1"),
+            ({"type": "ring", "speed": "fast"}, "speed must be a number"),
+            ({"type": "ring", "at": 50, "repeat": 3, "every": 10}, "past the 60-frame loop"),
+        ],
+    )
+    def test_invalid_emitters_name_their_path(self, emitter, message):
+        with pytest.raises(PatternError, match=message) as error:
+            compile_pattern("boss", _pattern(_phase({"type": "ring"}, emitter)))
+        assert "boss.phases[0].emitters[1]" in str(error.value)
+
+    def test_bundled_patterns_compile(self):
+        patterns = load_patterns()
+        assert patterns
+        for name, raw in patterns.items():
+            assert compile_pattern(name, raw).phases
+
+
+class TestRunner:
+    def test_spawns_each_frame_block(self):
+        compiled = compile_pattern(
+            "boss", _pattern(_phase({"type": "ring", "at": 2, "count": 6, "damage": 20}, loop=4))
+        )
+        runner = BulletPatternRunner(compiled)
+        engine = EnemyBulletEngine(800, 700)
+        fired = [runner.update(400, 100, 1.0, (400, 600), engine) for _ in range(8)]
+        assert fired == [0, 0, 6, 0, 0, 0, 6, 0]
+        assert np.all(engine.data[DAMAGE, : len(engine)] == 20)
+        assert np.all(engine.data[X, : len(engine)] == 400)
+
+    def test_aimed_rows_point_at_target(self):
+        compiled = compile_pattern(
+            "boss",
+            _pattern(
+                _phase(
+                    {"type": "fan", "count": 1, "speed": 5, "aim": True},
+                    {"type": "fan", "count": 1, "speed": 5},
+                )
+            ),
+        )
+        runner = BulletPatternRunner(compiled)
+        engine = EnemyBulletEngine(800, 700)
+        runner.update(400, 100, 1.0, (700, 500), engine)
+        aimed = engine.data[[VX, VY], 0]
+        assert math.isclose(aimed[0], 3, abs_tol=1e-9)
+        assert math.isclose(aimed[1], 4, abs_tol=1e-9)
+        # Unaimed emitters keep their fixed heading
+        assert tuple(engine.data[[VX, VY], 1]) == (0, 5)
+
+    def test_phase_change_restarts_timeline(self):
+        compiled = compile_pattern(
+            "boss",
+            _pattern(
+                _phase({"type": "ring", "at": 3, "count": 2}),
+                _phase({"type": "ring", "at": 0, "count": 5}, health=0.5),
+            ),
+        )
+        runner = BulletPatternRunner(compiled)
+        engine = EnemyBulletEngine(800, 700)
+        assert runner.update(400, 100, 1.0, (400, 600), engine) == 0
+        assert runner.update(400, 100, 0.4, (400, 600), engine) == 5
+        assert runner.phase == 1
+
+    def test_stamps_resolve_by_name(self):
+        compiled = compile_pattern(
+            "boss", _pattern(_phase({"type": "ring", "count": 2, "stamp": "orb"}))
+        )
+        engine = EnemyBulletEngine(800, 700)
+        engine.stamp_names = ["laser", "orb"]
+        BulletPatternRunner(compiled).update(400, 100, 1.0, (400, 600), engine)
+        assert np.all(engine.data[STAMP, :2] == 1)
+
+
+class TestReload:
+    def test_changed_files_recompile(self, monkeypatch):
+        monkeypatch.setattr(bullet_patterns, "_patterns", {})
+        bullet_patterns._reload_pattern("patterns", "boss", _pattern(_phase({"type": "ring"})))
+        assert "boss" in bullet_patterns.get_bullet_patterns()
+        # A broken edit keeps the previous version
+        bullet_patterns._reload_pattern("patterns", "boss", {"phases": []})
+        assert "boss" in bullet_patterns.get_bullet_patterns()
+        bullet_patterns._reload_pattern("patterns", "boss", None)
+        assert "boss" not in bullet_patterns.get_bullet_patterns()
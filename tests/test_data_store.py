@@ -0,0 +1,110 @@
+"""Tests for the caching, hot-reloading data store"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.loader import DataStore  # noqa: E402
+
+
+def _write(path, data, bump=0):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if bump:
+        # Filesystem mtimes can be coarse; make each edit visible
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump * 10**9))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    enemies = tmp_path / "enemies"
+    enemies.mkdir()
+    _write(enemies / "rifter.json", {"hull": 100})
+    _write(enemies / "omen.json", {"hull": 300})
+    return tmp_path
+
+
+class TestLoad:
+    def test_parses_each_file_once(self, data_dir):
+        store = DataStore(str(data_dir))
+        assert store.load("enemies") == {"rifter": {"hull": 100}, "omen": {"hull": 300}}
+        store.load("enemies")
+        assert store.parses == 2
+
+    def test_missing_category_is_empty(self, data_dir):
+        assert DataStore(str(data_dir)).load("powerups") == {}
+
+    def test_invalid_file_raises_on_first_load(self, data_dir):
+        (data_dir / "enemies" / "broken.json").write_text("{", encoding="utf-8")
+        store = DataStore(str(data_dir))
+        with pytest.raises(json.JSONDecodeError):
+            store.load("enemies")
+
+
+class TestRefresh:
+    def test_only_changed_files_are_reparsed(self, data_dir):
+        store = DataStore(str(data_dir))
+        store.load("enemies")
+        _write(data_dir / "enemies" / "omen.json", {"hull": 350}, bump=1)
+        assert store.refresh() == 1
+        assert store.parses == 3
+        assert store.load("enemies")["omen"] == {"hull": 350}
+        assert store.refresh() == 0
+
+    def test_subscribers_see_changes_and_deletes(self, data_dir):
+        store = DataStore(str(data_dir))
+        store.load("enemies")
+        seen = []
+        store.subscribe(lambda *change: seen.append(change), "enemies")
+        store.subscribe(lambda *change: seen.append(("other",) + change), "stages")
+
+        _write(data_dir / "enemies" / "maller.json", {"hull": 500})
+        os.remove(data_dir / "enemies" / "rifter.json")
+        store.refresh()
+        assert sorted(seen, key=str) == [
+            ("enemies", "maller", {"hull": 500}),
+            ("enemies", "rifter", None),
+        ]
+        assert "rifter" not in store.load("enemies")
+
+    def test_bad_edit_keeps_last_good_version(self, data_dir, capsys):
+        store = DataStore(str(data_dir))
+        store.load("enemies")
+        (data_dir / "enemies" / "omen.json").write_text("{", encoding="utf-8")
+        store.refresh()
+        assert store.load("enemies")["omen"] == {"hull": 300}
+        assert "Warning" in capsys.readouterr().out
+
+    def test_failing_subscriber_does_not_stop_others(self, data_dir):
+        store = DataStore(str(data_dir))
+        store.load("enemies")
+        seen = []
+
+        def broken(*change):
+            raise RuntimeError("boom")
+
+        store.subscribe(broken)
+        store.subscribe(lambda *change: seen.append(change[1]))
+        _write(data_dir / "enemies" / "omen.json", {"hull": 1}, bump=1)
+        store.refresh()
+        assert seen == ["omen"]
+
+
+class TestWatcher:
+    def test_background_thread_picks_up_edits(self, data_dir):
+        store = DataStore(str(data_dir))
+        store.load("enemies")
+        store.start_watching(interval=0.01)
+        try:
+            _write(data_dir / "enemies" / "omen.json", {"hull": 999}, bump=1)
+            deadline = time.monotonic() + 5
+            while store.load("enemies")["omen"]["hull"] != 999:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            store.stop_watching()
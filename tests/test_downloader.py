@@ -0,0 +1,158 @@
+"""Tests for the pooled bulk downloader, against a local stand-in image server"""
+
+import hashlib
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.downloader import AdaptiveLimit, BulkDownloader, DownloadJob  # noqa: E402
+
+
+class ImageServer(ThreadingHTTPServer):
+    """Serves /types/<id>/render like the EVE Image Server, with ETags."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ImageHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []  # (path, status)
+        self.throttle = 0  # Answer this many requests with 503 first
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    @staticmethod
+    def body(type_id):
+        return f"PNG-{type_id}".encode() * 100
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, status, body=b"", headers=None):
+        with self.server.lock:
+            self.server.requests.append((self.path, status))
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.lock:
+            throttled = self.server.throttle > 0
+            self.server.throttle -= throttled
+        if throttled:
+            return self.respond(503)
+        parts = self.path.split("?")[0].split("/")
+        if self.path.startswith("/old/"):
+            return self.respond(302, headers={"Location": "/types/" + parts[2] + "/render"})
+        if len(parts) != 4 or parts[1] != "types" or parts[2] == "404":
+            return self.respond(404)
+        body = ImageServer.body(parts[2])
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            return self.respond(304)
+        self.respond(200, body, {"ETag": etag, "Content-Type": "image/png"})
+
+
+@pytest.fixture
+def server():
+    server = ImageServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _jobs(server, tmp_path, type_ids):
+    return [
+        DownloadJob(f"{server.base_url}/types/{tid}/render?size=256", tmp_path / f"{tid}.png")
+        for tid in type_ids
+    ]
+
+
+class TestDownload:
+    def test_downloads_over_pooled_connections(self, server, tmp_path):
+        jobs = _jobs(server, tmp_path, range(600, 640))
+        with BulkDownloader(max_workers=4, initial_workers=4) as downloader:
+            outcomes = downloader.run(jobs)
+        assert [o.status for o in outcomes] == ["downloaded"] * 40
+        assert (tmp_path / "612.png").read_bytes() == ImageServer.body("612")
+        assert server.connections <= 4
+        assert downloader.connections_opened == server.connections
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_existing_files_are_skipped_without_requests(self, server, tmp_path):
+        jobs = _jobs(server, tmp_path, [587, 588])
+        BulkDownloader().run(jobs[:1])
+        outcomes = BulkDownloader().run(jobs)
+        assert [o.status for o in outcomes] == ["cached", "downloaded"]
+        assert len(server.requests) == 2
+
+    def test_revalidation_uses_stored_etags(self, server, tmp_path):
+        validators = {}
+        jobs = _jobs(server, tmp_path, [587, 593])
+        BulkDownloader(validators).run(jobs)
+        assert set(validators) == {job.url for job in jobs}
+
+        outcomes = BulkDownloader(validators).run(jobs, revalidate=True)
+        assert [o.status for o in outcomes] == ["not_modified"] * 2
+        assert [status for _, status in server.requests[2:]] == [304, 304]
+
+        outcomes = BulkDownloader(validators).run(jobs, force=True)
+        assert [o.status for o in outcomes] == ["downloaded"] * 2
+
+    def test_follows_redirects(self, server, tmp_path):
+        job = DownloadJob(f"{server.base_url}/old/24690", tmp_path / "abaddon.png")
+        assert BulkDownloader().run([job])[0].status == "downloaded"
+        assert job.path.read_bytes() == ImageServer.body("24690")
+
+    def test_missing_image_fails_cleanly(self, server, tmp_path):
+        outcome = BulkDownloader().run(_jobs(server, tmp_path, ["404"]))[0]
+        assert outcome.status == "failed"
+        assert outcome.error == "HTTP 404"
+        assert os.listdir(tmp_path) == []
+
+
+class TestAdaptiveConcurrency:
+    def test_throttling_backs_off_and_retries(self, server, tmp_path):
+        server.throttle = 2
+        downloader = BulkDownloader(initial_workers=8, max_workers=8, backoff=0.01)
+        outcomes = downloader.run(_jobs(server, tmp_path, [587]))
+        assert outcomes[0].status == "downloaded"
+        assert downloader.limit.limit < 8
+
+    def test_gives_up_after_retries(self, server, tmp_path):
+        server.throttle = 10
+        downloader = BulkDownloader(retries=1, backoff=0.01)
+        outcome = downloader.run(_jobs(server, tmp_path, [587]))[0]
+        assert (outcome.status, outcome.error) == ("failed", "HTTP 503")
+
+    def test_limit_grows_after_successes(self):
+        limit = AdaptiveLimit(2, 1, 3)
+        for _ in range(2):
+            limit.acquire()
+            limit.release()
+        assert limit.limit == 3
+        limit.acquire()
+        limit.release(throttled=True)
+        assert limit.limit == 1
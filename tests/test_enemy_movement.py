@@ -0,0 +1,195 @@
+"""Tests for the vectorized enemy movement kernel"""
+
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemy_movement import (  # noqa: E402
+    PATTERN_CIRCLE,
+    PATTERN_DRIFT,
+    PATTERN_FLANK,
+    PATTERN_SINE,
+    PATTERN_SWOOP,
+    EnemyMovementKernel,
+)
+
+
+def _round(value):
+    """pygame stores floats in a Rect rounded half away from zero."""
+    return int(math.floor(abs(value) + 0.5)) * (1 if value >= 0 else -1)
+
+
+class FakeRect:
+    def __init__(self, x, y, width=40, height=40):
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+
+    @property
+    def topleft(self):
+        return self.x, self.y
+
+    @topleft.setter
+    def topleft(self, value):
+        self.x, self.y = value
+
+    @property
+    def centerx(self):
+        return self.x + self.width // 2
+
+    @property
+    def centery(self):
+        return self.y + self.height // 2
+
+
+class FakeEnemy:
+    def __init__(self, pattern, x=380, y=200, entered=True, **state):
+        self.rect = FakeRect(x, y)
+        self.pattern = pattern
+        self.speed = 2
+        self.pattern_timer = 0.0
+        self.target_y = 150
+        self.entered = entered
+        self.swoop_state = "enter"
+        self.flank_side = 1
+        self.circle_center_x = 400
+        self.circle_radius = 60
+        self.is_boss = False
+        self.updates = 0
+        self.dead = False
+        self.__dict__.update(state)
+
+    def alive(self):
+        return not self.dead
+
+    def update(self, player_rect=None):
+        self.updates += 1
+
+
+class TestStep:
+    def test_entering_enemy_descends_then_enters(self):
+        kernel = EnemyMovementKernel(800, 700)
+        enemy = FakeEnemy(PATTERN_DRIFT, y=100, entered=False)
+        kernel.add(enemy)
+        kernel.update()
+        assert enemy.rect.topleft == (380, 103)
+        for _ in range(20):
+            kernel.update()
+        kernel.remove(enemy)
+        assert enemy.entered is True
+        assert enemy.rect.centery >= enemy.target_y
+
+    def test_sine_matches_formula(self):
+        kernel = EnemyMovementKernel(800, 700)
+        enemy = FakeEnemy(PATTERN_SINE, pattern_timer=1.0)
+        kernel.add(enemy)
+        kernel.update()
+        t = 1.05
+        center_x = 400 + math.sin(t * 1.5) * (80 + 40 * math.sin(t * 0.3))
+        center_y = 150 + math.sin(t * 0.8) * 30
+        assert enemy.rect.x == _round(center_x) - 20
+        assert enemy.rect.y == _round(center_y) - 20
+
+    def test_clamped_to_screen(self):
+        kernel = EnemyMovementKernel(800, 700)
+        left = FakeEnemy(
+            PATTERN_CIRCLE, circle_center_x=0, circle_radius=100, pattern_timer=math.pi
+        )
+        right = FakeEnemy(PATTERN_CIRCLE, circle_center_x=800, circle_radius=100)
+        kernel.add(left)
+        kernel.add(right)
+        kernel.update()
+        assert left.rect.x == 10
+        assert right.rect.x + right.rect.width == 790
+        # The circle center drifts back within its bounds
+        kernel.remove(left)
+        assert left.circle_center_x >= 100
+
+    def test_swoop_dives_at_player_then_retreats(self):
+        kernel = EnemyMovementKernel(800, 700)
+        enemy = FakeEnemy(PATTERN_SWOOP, swoop_state="aim", pattern_timer=2 * math.pi - 0.02)
+        kernel.add(enemy)
+        kernel.update(FakeRect(100, 600))
+        kernel.remove(enemy)
+        assert enemy.swoop_state == "dive"
+        assert enemy.swoop_target_x == 120
+
+        kernel.add(enemy)
+        for _ in range(60):
+            kernel.update(FakeRect(100, 600))
+        kernel.remove(enemy)
+        assert enemy.swoop_state in ("retreat", "aim")
+        assert enemy.rect.x < 380
+
+    def test_flank_moves_toward_its_edge(self):
+        kernel = EnemyMovementKernel(800, 700, seed=1)
+        enemy = FakeEnemy(PATTERN_FLANK, flank_side=-1)
+        kernel.add(enemy)
+        kernel.update()
+        assert enemy.rect.x == 378
+        kernel.remove(enemy)
+        assert enemy.flank_side in (-1, 1)
+        assert isinstance(enemy.flank_side, int)
+
+
+class TestTracking:
+    def test_remove_keeps_other_rows(self):
+        kernel = EnemyMovementKernel(800, 700)
+        first = FakeEnemy(PATTERN_SINE)
+        second = FakeEnemy(PATTERN_SINE, pattern_timer=3.0)
+        kernel.add(first)
+        kernel.add(second)
+        kernel.remove(first)
+        kernel.remove(first)
+        kernel.update()
+        kernel.remove(second)
+        assert len(kernel) == 0
+        assert abs(second.pattern_timer - 3.05) < 1e-9
+
+    def test_groups_grow_past_capacity(self):
+        kernel = EnemyMovementKernel(800, 700)
+        enemies = [FakeEnemy(PATTERN_DRIFT, x=20 + i * 7) for i in range(100)]
+        for enemy in enemies:
+            kernel.add(enemy)
+        kernel.update()
+        assert len(kernel) == 100
+        assert all(enemy in kernel for enemy in enemies)
+
+    def test_prune_drops_dead_enemies(self):
+        kernel = EnemyMovementKernel(800, 700)
+        dead = FakeEnemy(PATTERN_DRIFT)
+        kernel.add(dead)
+        kernel.add(FakeEnemy(PATTERN_DRIFT))
+        dead.dead = True
+        kernel.update()
+        assert dead not in kernel
+        assert len(kernel) == 1
+
+
+class TestUpdateGroup:
+    def test_small_groups_update_themselves(self):
+        kernel = EnemyMovementKernel(800, 700)
+        enemies = [FakeEnemy(PATTERN_DRIFT) for _ in range(5)]
+        kernel.update_group(enemies)
+        assert [e.updates for e in enemies] == [1] * 5
+        assert len(kernel) == 0
+
+    def test_shrinking_group_is_handed_back(self):
+        kernel = EnemyMovementKernel(800, 700)
+        kernel.BATCH_THRESHOLD = 4
+        enemies = [FakeEnemy(PATTERN_SWOOP) for _ in range(4)]
+        for enemy in enemies:
+            kernel.add(enemy)
+        kernel.update_group(enemies)
+        assert [e.updates for e in enemies] == [0] * 4
+
+        # Still batched at half the threshold, released below it
+        kernel.update_group(enemies[:2])
+        assert len(kernel) == 4
+        kernel.update_group(enemies[:1])
+        assert len(kernel) == 0
+        assert enemies[0].updates == 1
+        assert enemies[0].swoop_state == "aim"
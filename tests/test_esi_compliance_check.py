@@ -0,0 +1,115 @@
+"""Tests for esi_compliance_check's single-read file scanner"""
+
+import mmap
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import esi_compliance_check as checker  # noqa: E402
+from esi_compliance_check import PATTERNS, Severity  # noqa: E402
+
+CLEAN_CLIENT = """import time
+HEADERS = {"User-Agent": "Rebellion/1.0", "If-None-Match": etag}
+URL = "https://esi.evetech.net/latest/universe/types/"
+# watch X-ESI-Error-Limit-Remain
+time.sleep(1)
+"""
+
+BAD_CLIENT = """URL = "https://esi.evetech.net/universe/types"
+CLIENT_SECRET = 'x'
+client_secret = "abcdef"
+access_token =
+'not on the same line'
+FOR i IN RANGE(9): GET(CHARACTER); access_token = "tok"
+get("/search/?strict=false&categories=character")
+"""
+
+
+def _line_findings(text):
+    """(line, message) pairs the way a line-by-line scan reports them."""
+    found = []
+    for number, line in enumerate(text.split("\n"), 1):
+        for name, _, message, _ in checker.LINE_CHECKS:
+            if PATTERNS[name].search(line):
+                found.append((number, message))
+    return found
+
+
+class TestScanFile:
+    def test_clean_client_has_no_findings(self, tmp_path):
+        path = tmp_path / "esi.py"
+        path.write_text(CLEAN_CLIENT)
+        assert checker.scan_file(path) == []
+
+    def test_files_without_esi_are_skipped(self, tmp_path):
+        path = tmp_path / "game.py"
+        path.write_text("client_secret = 'abc'\n")
+        assert checker.scan_file(path) == []
+
+    def test_line_findings_match_a_line_by_line_scan(self, tmp_path):
+        path = tmp_path / "esi.py"
+        path.write_text(BAD_CLIENT)
+        findings = checker.scan_file(path)
+        by_line = [(f.line, f.message) for f in findings if f.line is not None]
+        assert by_line == _line_findings(BAD_CLIENT)
+        # The token split over two lines is not reported
+        assert 4 not in [line for line, _ in by_line]
+        assert [f.message for f in findings if f.line is None] == [
+            "ESI usage detected but no User-Agent header found",
+            "No cache header handling detected",
+            "No error limit handling detected",
+            "No rate limiting implementation detected",
+            "Unversioned ESI endpoints detected",
+        ]
+
+    def test_large_files_are_memory_mapped(self, tmp_path, monkeypatch):
+        path = tmp_path / "esi.py"
+        path.write_text(BAD_CLIENT)
+        expected = checker.scan_file(path)
+        monkeypatch.setattr(checker, "MMAP_THRESHOLD", 16)
+        assert checker.scan_file(path) == expected
+
+    def test_mapped_files_are_searched_in_place(self, tmp_path):
+        path = tmp_path / "esi.py"
+        path.write_text(BAD_CLIENT)
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            contents = checker._Contents(data)
+            assert all(contents.target(name)[1] is data for name in PATTERNS)
+
+    def test_lowercased_copy_is_made_only_when_needed(self):
+        contents = checker._Contents(b"https://esi.evetech.net/latest/")
+        assert contents.search("esi_url") and contents._folded is None
+        contents.search("rate_limit")
+        assert contents._folded == b"https://esi.evetech.net/latest/"
+
+    def test_unreadable_file_is_reported(self, tmp_path):
+        findings = checker.scan_file(tmp_path / "missing.py")
+        assert len(findings) == 1 and findings[0].severity == Severity.INFO
+        assert findings[0].message.startswith("Could not read file")
+
+
+class TestScanProject:
+    @pytest.fixture
+    def project(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "good.py").write_text(CLEAN_CLIENT)
+        (tmp_path / "src" / "bad.py").write_text(BAD_CLIENT)
+        (tmp_path / "portrait.js").write_text("img = 'https://images.evetech.net/x'\n")
+        (tmp_path / "notes.txt").write_text("login.eveonline.com\n")
+        return tmp_path
+
+    def test_usage_and_findings(self, project):
+        report = checker.scan_project(project, workers=1)
+        assert report.files_scanned == 3
+        assert report.esi_usage_detected and report.image_server_usage
+        assert not report.sso_usage
+        assert {f.file.name for f in report.findings} == {"bad.py"}
+
+    def test_process_pool_gives_the_same_report(self, project, monkeypatch):
+        expected = checker.scan_project(project, workers=1)
+        monkeypatch.setattr(checker, "MIN_PARALLEL_FILES", 1)
+        pooled = checker.scan_project(project, workers=2)
+        assert pooled == expected
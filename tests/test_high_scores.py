@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.persistence import get_persistence  # noqa: E402
 from high_scores import AchievementManager, HighScoreManager  # noqa: E402
 
 
@@ -20,6 +21,7 @@ class TestHighScoreManager:
         self.mgr.scores = []
 
     def teardown_method(self):
+        get_persistence().flush()
         os.unlink(self.tmpfile.name)
 
     def _add(self, score, **kwargs):
@@ -96,6 +98,7 @@ class TestAchievementManager:
         self.mgr.stats = {"total_kills": 0, "total_refugees": 0, "games_played": 0, "victories": 0}
 
     def teardown_method(self):
+        get_persistence().flush()
         os.unlink(self.tmpfile.name)
 
     def test_unlock_new_achievement(self):
@@ -186,3 +189,85 @@ class TestAchievementManager:
     def test_hidden_achievements_included_when_requested(self):
         all_achs = self.mgr.get_all_achievements(include_hidden=True)
         assert len(all_achs) == len(self.mgr.ACHIEVEMENTS)
+
+
+class TestAchievementTracker:
+    def setup_method(self):
+        self.tmpfile = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
+        self.tmpfile.close()
+        os.unlink(self.tmpfile.name)
+        self.mgr = AchievementManager()
+        self.mgr.SAVE_FILE = self.tmpfile.name
+        self.mgr.unlocked = set()
+        self.mgr.stats = {"total_kills": 0, "total_refugees": 0, "games_played": 0, "victories": 0}
+
+    def teardown_method(self):
+        get_persistence().flush()
+        if os.path.exists(self.tmpfile.name):
+            os.unlink(self.tmpfile.name)
+
+    def test_unlocks_mid_run_without_saving(self):
+        tracker = self.mgr.start_run()
+        assert tracker.record_kill() == ["first_blood"]
+        assert tracker.record_kill() == []
+        assert self.mgr.is_unlocked("first_blood")
+        assert not os.path.exists(self.tmpfile.name)
+
+    def test_only_watching_rules_are_evaluated(self):
+        tracker = self.mgr.start_run()
+        calls = []
+        rule = tracker._watchers["refugees"][0]
+        tracker._watchers["refugees"][0] = rule._replace(
+            condition=lambda c: calls.append(c) or rule.condition(c)
+        )
+        tracker.record_kill()
+        tracker.record_score(500)
+        assert calls == []
+        tracker.record_refugees(10)
+        assert len(calls) == 1
+
+    def test_unlocked_rules_are_retired(self):
+        self.mgr.unlock("first_blood")
+        tracker = self.mgr.start_run()
+        assert "first_blood" not in [r.achievement_id for r in tracker._watchers["kills"]]
+        tracker.record_kills(100)
+        assert "centurion" not in [r.achievement_id for r in tracker._watchers["kills"]]
+
+    def test_extreme_kills_and_berserk(self):
+        tracker = self.mgr.start_run()
+        unlocked = []
+        for _ in range(20):
+            unlocked += tracker.record_kill("EXTREME")
+        unlocked += tracker.record_berserk(3.5)
+        assert unlocked == ["first_blood", "up_close", "berserker"]
+
+    def test_endless_rules_need_endless_mode(self):
+        assert self.mgr.start_run().record_endless(50, 600) == []
+        unlocked = self.mgr.start_run(game_mode="endless").record_endless(10, 300)
+        assert unlocked == ["endless_initiate", "endless_warrior", "endless_survivor"]
+
+    def test_finish_saves_stats_once(self):
+        tracker = self.mgr.start_run(difficulty="nightmare")
+        tracker.record_kills(30)
+        tracker.record_refugees(60)
+        with patch.object(self.mgr, "save", wraps=self.mgr.save) as save:
+            unlocked = tracker.finish(victory=True, ship="Wolf")
+        get_persistence().flush()
+        assert save.call_count == 1
+        assert unlocked == ["rebel_hero", "triglavian_slayer", "wolf_pack"]
+        assert self.mgr.stats == {
+            "total_kills": 30,
+            "total_refugees": 60,
+            "games_played": 1,
+            "victories": 1,
+        }
+        with open(self.tmpfile.name) as f:
+            assert "wolf_pack" in json.load(f)["unlocked"]
+
+    def test_flush_only_writes_when_dirty(self):
+        self.mgr.flush()
+        assert not os.path.exists(self.tmpfile.name)
+        self.mgr.unlock("veteran")
+        self.mgr.flush()
+        get_persistence().flush()
+        assert os.path.exists(self.tmpfile.name)
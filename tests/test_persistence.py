@@ -0,0 +1,99 @@
+"""Tests for the write-behind persistence service"""
+
+import json
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.persistence import PersistenceService  # noqa: E402
+
+
+@pytest.fixture
+def service():
+    service = PersistenceService(delay=60)
+    yield service
+    service.close()
+
+
+class TestQueue:
+    def test_writes_wait_for_flush(self, service, tmp_path):
+        path = str(tmp_path / "scores.json")
+        service.write_json(path, {"score": 1})
+        assert not os.path.exists(path)
+        service.flush()
+        with open(path) as f:
+            assert json.load(f) == {"score": 1}
+
+    def test_repeated_writes_coalesce(self, service, tmp_path):
+        path = str(tmp_path / "scores.json")
+        for score in range(5):
+            service.write_json(path, {"score": score})
+        service.flush()
+        assert service.commits == 1
+        assert service.coalesced == 4
+        assert service.read_json(path) == {"score": 4}
+
+    def test_reads_see_queued_writes(self, service, tmp_path):
+        path = str(tmp_path / "progress.json")
+        data = {"sp": 10}
+        service.write_json(path, data)
+        data["sp"] = 99  # Serialized at write time
+        assert service.read_json(path) == {"sp": 10}
+        with pytest.raises(FileNotFoundError):
+            service.read_json(str(tmp_path / "missing.json"))
+
+    def test_writer_thread_commits_after_delay(self, tmp_path):
+        service = PersistenceService(delay=0.01)
+        path = tmp_path / "controls.json"
+        try:
+            service.write_json(str(path), {"fire": "K_SPACE"})
+            deadline = time.monotonic() + 5
+            while not path.exists():
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            service.close()
+
+    def test_close_commits_and_later_writes_are_synchronous(self, tmp_path):
+        service = PersistenceService(delay=60)
+        first, second = tmp_path / "a.json", tmp_path / "b.json"
+        service.write_json(str(first), 1)
+        service.close()
+        assert first.exists()
+        service.write_json(str(second), 2)
+        assert second.exists()
+
+
+class TestCommit:
+    def test_failed_commit_keeps_previous_version(self, service, tmp_path, capsys):
+        path = tmp_path / "save.json"
+        path.write_text('{"stage": 1}')
+        service.write_json(str(path), {"stage": 2})
+        with patch("core.persistence.os.replace", side_effect=OSError("disk full")):
+            service.flush()
+        assert json.loads(path.read_text()) == {"stage": 1}
+        assert os.listdir(tmp_path) == ["save.json"]
+        assert "Warning" in capsys.readouterr().out
+
+    def test_creates_missing_directories(self, service, tmp_path):
+        path = tmp_path / "saves" / "slot1.json"
+        service.write_json(str(path), {})
+        service.flush()
+        assert path.exists()
+
+    @pytest.mark.parametrize("policy, syncs", [("none", 0), ("file", 1), ("full", 2)])
+    def test_fsync_policy(self, tmp_path, policy, syncs):
+        service = PersistenceService(delay=60, fsync=policy)
+        service.write_json(str(tmp_path / "a.json"), {})
+        with patch("core.persistence.os.fsync") as fsync:
+            service.close()
+        assert fsync.call_count == syncs
+
+    def test_unknown_fsync_policy(self):
+        with pytest.raises(ValueError):
+            PersistenceService(fsync="sometimes")
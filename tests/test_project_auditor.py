@@ -0,0 +1,98 @@
+"""Tests for project_auditor's single-pass, cached project scanner"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import project_auditor  # noqa: E402
+from project_auditor import PATTERNS, ProjectScanner, ProjectType  # noqa: E402
+
+ESI_CLIENT = """import requests
+
+HEADERS = {"User-Agent": "Rebellion/1.0"}
+URL = "https://esi.evetech.net/latest/universe/types/"
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "EVE_Test"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "game.py").write_text("import pygame\n\npygame.init()\n")
+    (root / "src" / "esi.py").write_text(ESI_CLIENT)
+    (root / "web.ts").write_text("const x = 1;\n")
+    (root / "package.json").write_text('{"name": "eve"}')
+    (root / "README.md").write_text("EVE Online is a trademark of CCP hf.\n")
+    (root / "node_modules" / "lib").mkdir(parents=True)
+    (root / "node_modules" / "lib" / "index.js").write_text("login.eveonline.com\n")
+    return root
+
+
+class TestMatchPatterns:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            ESI_CLIENT,
+            "CACHE-CONTROL: no-store\nSTATIC DATA EXPORT\nRate_Limit",
+            "CLIENT_SECRET = 'abcdefghijklmnop'\nfor i in range(9): get(Character)",
+            "nothing to see here",
+        ],
+    )
+    def test_agrees_with_each_pattern_alone(self, text):
+        expected = sorted(name for name, pattern in PATTERNS.items() if pattern.search(text))
+        assert project_auditor.match_patterns(text) == expected
+
+
+class TestProjectScanner:
+    def test_one_scan_covers_counts_type_and_patterns(self, project):
+        scan = ProjectScanner().scan(project)
+        assert (scan.python_files, scan.js_files, scan.json_files) == (2, 1, 1)
+        assert scan.total_lines == 4 + 5 + 2
+        assert project_auditor.detect_project_type(project, scan) == ProjectType.GAME
+        assert scan.patterns["esi_url"] and scan.patterns["user_agent"]
+        assert scan.patterns["ccp_attribution"]
+        # node_modules is skipped, and pygame only counts for detection
+        assert not scan.patterns["sso_url"]
+
+    def test_wrappers_match_the_scan(self, project):
+        assert project_auditor.count_files(project) == (2, 1, 1, 11)
+        assert project_auditor.scan_for_patterns(project) == ProjectScanner().scan(project).patterns
+
+    def test_cache_reads_only_changed_files(self, project, tmp_path):
+        cache = tmp_path / "scan_cache.json"
+        with ProjectScanner(cache) as scanner:
+            first = scanner.scan(project)
+            scanner.save()
+        assert scanner.files_read == 5
+
+        (project / "src" / "esi.py").write_text(ESI_CLIENT + "# X-ESI-Error-Limit-Remain\n")
+        with ProjectScanner(cache) as scanner:
+            second = scanner.scan(project)
+        assert (scanner.files_read, scanner.cache_hits) == (1, 4)
+        assert second.patterns["error_limit"] and not first.patterns["error_limit"]
+
+    def test_cache_forgets_deleted_files(self, project, tmp_path):
+        cache = tmp_path / "scan_cache.json"
+        with ProjectScanner(cache) as scanner:
+            scanner.scan(project)
+            scanner.save()
+        (project / "web.ts").unlink()
+        with ProjectScanner(cache) as scanner:
+            scanner.scan(project)
+            scanner.save()
+        assert "web.ts" not in cache.read_text()
+
+    def test_process_pool_gives_the_same_scan(self, project):
+        with ProjectScanner(workers=2, min_parallel=1) as scanner:
+            pooled = scanner.scan(project)
+        assert pooled == ProjectScanner(workers=1).scan(project)
+
+    def test_audit_project_uses_the_scanner(self, project):
+        scanner = ProjectScanner()
+        audit = project_auditor.audit_project(project, scanner)
+        assert audit.project_type == ProjectType.GAME and audit.has_esi
+        assert (audit.python_files, audit.total_lines) == (2, 11)
+        assert scanner.files_read == 5
@@ -0,0 +1,274 @@
+"""Tests for the client templates emitted by project_updater"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import project_updater  # noqa: E402
+
+
+def _load_template(template, name, tmp_path):
+    """Write a template out like apply_updates does and import it."""
+    path = tmp_path / f"{name}.py"
+    path.write_text(template.format(project_name="Test"))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class MockESI(BaseHTTPRequestHandler):
+    """Serves /universe/types/<id>/ with Expires, ETag and error budget headers."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.client_address, dict(self.headers)))
+        time.sleep(server.delay)
+        etag = '"v1"'
+        headers = {
+            "ETag": etag,
+            "Expires": formatdate(time.time() + server.max_age, usegmt=True),
+            "X-ESI-Error-Limit-Remain": str(server.error_remain),
+            "X-ESI-Error-Limit-Reset": "1",
+        }
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            body = b""
+        else:
+            self.send_response(200)
+            type_id = self.path.split("/")[3]
+            body = json.dumps({"type_id": int(type_id), "name": "Rifter"}).encode()
+            headers["Content-Type"] = "application/json"
+        headers["Content-Length"] = str(len(body))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def esi_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockESI)
+    server.requests = []
+    server.delay = 0.0
+    server.max_age = 300
+    server.error_remain = 100
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def esi(tmp_path):
+    pytest.importorskip("httpx")
+    return _load_template(project_updater.ESI_CLIENT_TEMPLATE, "esi_client", tmp_path)
+
+
+def _client(esi, server, tmp_path):
+    return esi.ESIClient(
+        cache_dir=str(tmp_path / "cache"),
+        base_url=f"http://127.0.0.1:{server.server_port}",
+    )
+
+
+class TestESIClientTemplate:
+    def test_concurrent_identical_requests_share_one_call(self, esi, esi_server, tmp_path):
+        esi_server.delay = 0.2
+
+        async def run():
+            async with _client(esi, esi_server, tmp_path) as client:
+                return await asyncio.gather(*(client.get_type(587) for _ in range(10)))
+
+        results = asyncio.run(run())
+        assert results == [{"type_id": 587, "name": "Rifter"}] * 10
+        assert len(esi_server.requests) == 1
+
+    def test_requests_reuse_one_connection(self, esi, esi_server, tmp_path):
+        async def run():
+            async with _client(esi, esi_server, tmp_path) as client:
+                for type_id in (587, 593, 603):
+                    await client.get_type(type_id)
+
+        asyncio.run(run())
+        assert len({address for _, address, _ in esi_server.requests}) == 1
+        assert all("Test/1.0" in headers["User-Agent"] for _, _, headers in esi_server.requests)
+
+    def test_cache_persists_between_clients(self, esi, esi_server, tmp_path):
+        async def fetch():
+            async with _client(esi, esi_server, tmp_path) as client:
+                return await client.get_type(587)
+
+        first = asyncio.run(fetch())
+        assert asyncio.run(fetch()) == first
+        assert len(esi_server.requests) == 1
+
+    def test_expired_entry_is_revalidated(self, esi, esi_server, tmp_path):
+        esi_server.max_age = -60
+
+        async def run():
+            async with _client(esi, esi_server, tmp_path) as client:
+                first = await client.get_type(587)
+                esi_server.max_age = 300
+                second = await client.get_type(587)
+                third = await client.get_type(587)
+                return first, second, third, client.requests_sent
+
+        first, second, third, sent = asyncio.run(run())
+        assert first == second == third and sent == 2
+        assert esi_server.requests[1][2]["If-None-Match"] == '"v1"'
+
+    def test_low_error_budget_pauses_requests(self, esi, esi_server, tmp_path):
+        esi_server.error_remain = 3
+
+        async def run():
+            async with _client(esi, esi_server, tmp_path) as client:
+                await client.get_type(587)
+                started = time.monotonic()
+                await client.get_type(593)
+                return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 0.9
+
+    def test_each_event_loop_closes_its_client(self, esi, esi_server, tmp_path):
+        client = _client(esi, esi_server, tmp_path)
+        sessions = []
+
+        async def fetch(type_id):
+            await client.get_type(type_id)
+            sessions.append(client._http)
+
+        # No close() between runs: the first loop's client must not leak
+        asyncio.run(fetch(587))
+        assert sessions[0].is_closed
+        asyncio.run(fetch(593))
+        assert sessions[1] is not sessions[0] and sessions[1].is_closed
+        asyncio.run(client.close())
+        assert client._http is None
+
+
+class TestTokenBucket:
+    def test_budget_headers_scale_the_rate(self, esi):
+        bucket = esi.TokenBucket(rate=20.0)
+        bucket.update_budget(remain=10, reset=60)
+        assert bucket.rate == pytest.approx(10 / 60)
+        bucket.update_budget(remain=100, reset=60)
+        assert bucket.rate == 20.0
+
+
+# Real pygame, in a fresh interpreter: other test modules replace
+# sys.modules["pygame"] with a mock
+SPRITES_SCRIPT = textwrap.dedent(
+    """
+    import importlib.util, json, sys, threading, time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import pygame
+
+    module_path, cache_dir = sys.argv[1:]
+    spec = importlib.util.spec_from_file_location("ship_sprites", module_path)
+    sprites_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sprites_module)
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    image = pygame.Surface((40, 30), pygame.SRCALPHA)
+    image.fill((200, 120, 60, 128))
+    pygame.image.save(image, f"{cache_dir}/587_64.png")
+    pygame.image.save(image, f"{cache_dir}/render.png")
+
+    class ImageServer(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if not self.path.startswith("/types/593/"):
+                self.send_error(404)
+                return
+            with open(f"{cache_dir}/render.png", "rb") as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImageServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    decode_threads = set()
+    decode = sprites_module._decode_rgba
+
+    def recording_decode(source):
+        decode_threads.add(threading.current_thread().name)
+        return decode(source)
+
+    sprites_module._decode_rgba = recording_decode
+    sprites = sprites_module.ShipSprites(cache_dir)
+    sprites.IMAGE_SERVER = f"http://127.0.0.1:{server.server_port}"
+
+    progress = sprites.preload([587, 593, 404], size=64)
+    fractions = [progress.fraction]
+    while not progress.done:
+        sprites.poll()
+        fractions.append(progress.fraction)
+        time.sleep(0.01)
+
+    surface = sprites.load_sprite_sync(593, 64)
+    print(json.dumps({
+        "loaded": progress.loaded,
+        "failed": progress.failed,
+        "fractions": fractions,
+        "size": surface.get_size(),
+        "pixel": list(surface.get_at((5, 5))),
+        "same": surface is sprites.get_by_name("tristan", 64),
+        "downloaded": sorted(p.name for p in sprites.cache_dir.glob("593_*")),
+        "decode_threads": sorted(decode_threads),
+        "main": threading.current_thread().name,
+    }))
+    sprites.close()
+    """
+)
+
+
+class TestShipSpritesTemplate:
+    def test_preload_decodes_off_the_main_thread(self, tmp_path):
+        pytest.importorskip("httpx")
+        module_path = tmp_path / "ship_sprites.py"
+        module_path.write_text(project_updater.SHIP_SPRITES_TEMPLATE.format(project_name="Test"))
+        cache_dir = tmp_path / "ships"
+        cache_dir.mkdir()
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+        completed = subprocess.run(
+            [sys.executable, "-c", SPRITES_SCRIPT, str(module_path), str(cache_dir)],
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=60,
+        )
+        assert completed.returncode == 0, completed.stderr
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        assert result["loaded"] == 2 and result["failed"] == [404]
+        assert result["fractions"][0] == 0 and result["fractions"][-1] == 1
+        assert result["fractions"] == sorted(result["fractions"])
+        assert result["size"] == [40, 30] and result["pixel"] == [200, 120, 60, 128]
+        assert result["same"] and result["downloaded"] == ["593_64.png"]
+        assert result["decode_threads"] and result["main"] not in result["decode_threads"]
@@ -0,0 +1,119 @@
+"""Tests for the render job queue, with a stand-in worker instead of Blender"""
+
+import json
+import os
+import sys
+import textwrap
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.render_queue import RenderJob, RenderQueue  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Renders by writing the job back out; "bad" jobs raise, "crash" jobs kill
+# the worker unless a sentinel file exists (so a retry succeeds)
+FAKE_WORKER = textwrap.dedent(
+    """
+    import json, os, sys
+    sys.path.insert(0, {root!r})
+    from core.render_queue import serve
+
+    print("Blender 4.2 (fake) starting up")
+
+    def render(job):
+        print("Fra:1 Mem:12M | rendering", job["name"])
+        if job["name"] == "bad":
+            raise RuntimeError("no mesh")
+        if job["name"].startswith("crash"):
+            sentinel = job["output"] + ".crashed"
+            if not os.path.exists(sentinel) or job["name"] == "crash-always":
+                open(sentinel, "w").close()
+                os._exit(3)
+        with open(job["output"], "w") as f:
+            json.dump({{"pid": os.getpid(), **job}}, f)
+
+    serve(render)
+    """
+)
+
+
+@pytest.fixture
+def worker(tmp_path):
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER.format(root=ROOT))
+    return [sys.executable, str(script)]
+
+
+def _jobs(tmp_path, names):
+    return [RenderJob(name, f"/models/{name}.stl", str(tmp_path / f"{name}.png")) for name in names]
+
+
+def _pid(job):
+    with open(job.output) as f:
+        return json.load(f)["pid"]
+
+
+class TestRenderQueue:
+    def test_one_session_renders_every_job(self, worker, tmp_path):
+        jobs = _jobs(tmp_path, ["rifter", "slasher", "omen", "maller"])
+        render_queue = RenderQueue(worker)
+        results = render_queue.run(jobs)
+        assert [r.status for r in results] == ["rendered"] * 4
+        assert [r.job for r in results] == jobs
+        assert render_queue.sessions_started == 1
+        assert len({_pid(job) for job in jobs}) == 1
+
+    def test_parallel_sessions_share_the_queue(self, worker, tmp_path):
+        jobs = _jobs(tmp_path, [f"ship{i}" for i in range(8)])
+        render_queue = RenderQueue(worker, workers=3)
+        results = render_queue.run(jobs)
+        assert all(r.ok for r in results)
+        assert render_queue.sessions_started == 3
+        assert len({_pid(job) for job in jobs}) <= 3
+
+    def test_log_resumes_an_interrupted_batch(self, worker, tmp_path):
+        log = str(tmp_path / "render_log.jsonl")
+        jobs = _jobs(tmp_path, ["rifter", "omen", "maller"])
+        RenderQueue(worker, log_path=log).run(jobs[:2])
+
+        os.remove(jobs[1].output)
+        changed = jobs[0]._replace(size=512)
+        results = RenderQueue(worker, log_path=log).run([jobs[0], jobs[1], jobs[2], changed])
+        assert [r.status for r in results] == ["skipped", "rendered", "rendered", "rendered"]
+        assert RenderQueue(worker, log_path=log).run(jobs, force=True)[0].status == "rendered"
+
+    def test_job_errors_keep_the_session(self, worker, tmp_path):
+        render_queue = RenderQueue(worker)
+        results = render_queue.run(_jobs(tmp_path, ["rifter", "bad", "omen"]))
+        assert [r.status for r in results] == ["rendered", "failed", "rendered"]
+        assert results[1].error == "RuntimeError: no mesh"
+        assert render_queue.sessions_started == 1
+
+    def test_crashed_worker_is_restarted(self, worker, tmp_path):
+        render_queue = RenderQueue(worker, log_path=str(tmp_path / "log.jsonl"))
+        results = render_queue.run(_jobs(tmp_path, ["rifter", "crash", "crash-always", "omen"]))
+        assert [r.status for r in results] == ["rendered", "rendered", "failed", "rendered"]
+        assert "exited with code 3" in results[2].error
+        assert render_queue.sessions_started == 4
+
+    def test_missing_worker_fails_jobs(self, tmp_path):
+        results = RenderQueue(["/nonexistent/blender"]).run(_jobs(tmp_path, ["rifter"]))
+        assert results[0].status == "failed"
+
+
+class TestRenderJob:
+    def test_rig_keeps_older_keys_valid(self):
+        job = RenderJob("rifter", "/models/rifter.stl", "/out/rifter.png")
+        # Key of the same job before RenderJob had a rig field
+        assert job.key() == "45d11963cf183367b048dac9d2ee0d63c1768ec8"
+        assert job._replace(rig="ships").key() != job.key()
+
+    def test_ship_jobs_use_the_render_ships_rig(self, tmp_path):
+        sys.path.insert(0, os.path.join(ROOT, "scripts"))
+        from render_batch import ship_jobs
+
+        jobs = ship_jobs(str(tmp_path))
+        assert jobs and all(job.rig == "ships" and not job.auto_orient for job in jobs)
@@ -0,0 +1,121 @@
+"""Tests for the parallel, incremental ship processing pipeline"""
+
+import json
+import os
+import struct
+import subprocess
+import sys
+import zlib
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ship_assets  # noqa: E402
+from ship_assets import BUILD_MANIFEST, BUILD_REPORT, ShipAssetManager  # noqa: E402
+
+
+def _write_png(path, size, color):
+    """Write a solid RGB or RGBA PNG without needing pygame in this process."""
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = b"\x00" + bytes(color) * size
+    color_type = 6 if len(color) == 4 else 2
+    header = struct.pack(">IIBBBBB", size, size, 8, color_type, 0, 0, 0)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(row * size))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _pixel(path, x, y):
+    """A pixel of a PNG, read by real pygame in a fresh interpreter."""
+    script = "import sys, pygame; print(list(pygame.image.load(sys.argv[1]).get_at((%d, %d))))"
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    completed = subprocess.run(
+        [sys.executable, "-c", script % (x, y), str(path)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ShipAssetManager(tmp_path / "ships")
+    _write_png(manager.get_cache_path(587, "raw"), 16, (200, 120, 60, 255))
+    _write_png(manager.get_cache_path(642, "raw"), 16, (220, 200, 90, 255))
+    return manager
+
+
+def _report(manager):
+    return json.loads((manager.cache_dir / BUILD_REPORT).read_text())
+
+
+class TestProcessAllShips:
+    def test_builds_every_output_in_the_pool(self, manager):
+        results = manager.process_all_ships(type_ids=[587, 642], workers=2)
+        assert results == {587: True, 642: True}
+        assert manager.get_cache_path(587, "processed").exists()
+        assert manager.get_cache_path(642, "sprites", "_pulse.png").exists()
+        for i in range(ship_assets.THRUST_FRAMES):
+            assert manager.get_thrust_path(587, i).exists()
+
+        report = _report(manager)
+        assert sorted(report["built"]) == [587, 642] and report["skipped"] == []
+        assert {"load", "rotate", "sheet_pulse", "thrust"} <= set(report["stage_totals"])
+        manifest = json.loads((manager.cache_dir / BUILD_MANIFEST).read_text())
+        assert set(manifest) == {"587", "642"}
+
+    def test_unchanged_ships_are_skipped(self, manager):
+        manager.process_all_ships(type_ids=[587, 642], workers=2)
+        processed = manager.get_cache_path(587, "processed")
+        built_at = processed.stat().st_mtime_ns
+
+        assert manager.process_all_ships(type_ids=[587, 642], workers=2) == {
+            587: True,
+            642: True,
+        }
+        report = _report(manager)
+        assert report["built"] == [] and sorted(report["skipped"]) == [587, 642]
+        assert processed.stat().st_mtime_ns == built_at
+
+    def test_changed_inputs_rebuild_only_that_ship(self, manager):
+        manager.process_all_ships(type_ids=[587, 642], workers=2)
+        _write_png(manager.get_cache_path(642, "raw"), 16, (10, 10, 10, 255))
+        manager.process_all_ships(type_ids=[587, 642], workers=2)
+        assert _report(manager)["built"] == [642]
+
+        # A missing output or a different recipe also forces a rebuild
+        manager.get_thrust_path(587, 0).unlink()
+        manager.process_all_ships(type_ids=[587, 642], workers=2)
+        assert _report(manager)["built"] == [587]
+        manager.process_all_ships(type_ids=[587, 642], workers=2, generate_effects=False)
+        assert sorted(_report(manager)["built"]) == [587, 642]
+
+    def test_opaque_renders_rotate_onto_transparency(self, manager):
+        # Image Server renders have no alpha channel
+        _write_png(manager.get_cache_path(587, "raw"), 16, (200, 120, 60))
+        assert manager.process_all_ships(type_ids=[587], workers=2) == {587: True}
+        assert _pixel(manager.get_cache_path(587, "processed"), 0, 0)[3] == 0
+        sheet = manager.get_cache_path(587, "sprites", "_pulse.png")
+        assert _pixel(sheet, 0, 0)[3] == 0
+        assert _pixel(manager.get_thrust_path(587, 0), 0, 0)[3] == 0
+
+    def test_broken_render_fails_without_stopping_the_batch(self, manager):
+        manager.get_cache_path(642, "raw").write_bytes(b"not a png")
+        results = manager.process_all_ships(type_ids=[587, 642], workers=2)
+        assert results == {587: True, 642: False}
+        report = _report(manager)
+        assert report["failed"] == [642]
+        assert report["ships"][1]["error"]
+        manifest = json.loads((manager.cache_dir / BUILD_MANIFEST).read_text())
+        assert set(manifest) == {"587"}
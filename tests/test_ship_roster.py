@@ -108,3 +108,97 @@ class TestShipRosterDefaults:
         ship = self.roster.get_ship("rifter")
         assert ship.get("unlock") == "default"
         assert self.roster.is_ship_unlocked("rifter")
+
+
+def _ship(ship_id, cls, tier, unlock="default", chapters=("rebellion",)):
+    return {
+        "id": ship_id,
+        "name": ship_id.title(),
+        "type_id": sum(map(ord, ship_id)),
+        "class": cls,
+        "tier": tier,
+        "available_chapters": list(chapters),
+        "unlock": unlock,
+    }
+
+
+class TestShipRosterQueries:
+    """Test indexed queries against a JSON config."""
+
+    def setup_method(self):
+        config = {
+            "factions": {"minmatar": {"name": "Minmatar Republic"}},
+            "ships": {
+                "minmatar": {
+                    "frigates": [
+                        _ship("wolf", "assault_frigate", "t2", "boss_7"),
+                        _ship("rifter", "frigate", "t1"),
+                        _ship("slasher", "frigate", "t1", chapters=("rebellion", "abyssal")),
+                    ],
+                    "cruisers": [
+                        _ship("stabber", "cruiser", "t1", "boss_3"),
+                        _ship("vagabond", "cruiser", "t2", "boss_9", chapters=("abyssal",)),
+                    ],
+                },
+                "amarr": {"frigates": [_ship("punisher", "frigate", "t1")]},
+            },
+        }
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(config, f)
+        self.roster = ShipRoster(config_path=f.name)
+        os.unlink(f.name)
+
+    @staticmethod
+    def _ids(ships):
+        return [s["id"] for s in ships]
+
+    def test_filters_intersect(self):
+        assert self._ids(self.roster.query(faction="minmatar", ship_class="frigate")) == [
+            "rifter",
+            "slasher",
+        ]
+        assert self._ids(self.roster.query(chapter="abyssal", tier="t2")) == ["vagabond"]
+        assert self.roster.query(faction="minmatar", ship_class="titan") == ()
+
+    def test_views_sorted_by_tier_then_roster_order(self):
+        assert self._ids(self.roster.query(faction="minmatar")) == [
+            "rifter",
+            "slasher",
+            "stabber",
+            "wolf",
+            "vagabond",
+        ]
+
+    def test_views_are_cached(self):
+        first = self.roster.query(faction="minmatar", unlocked=True)
+        assert self.roster.query(faction="minmatar", unlocked=True) is first
+
+    def test_unlock_updates_cached_views(self):
+        unlocked = self.roster.query(faction="minmatar", unlocked=True)
+        locked = self.roster.query(faction="minmatar", unlocked=False)
+        assert self._ids(unlocked) == ["rifter", "slasher"]
+        assert self._ids(locked) == ["stabber", "wolf", "vagabond"]
+
+        self.roster.unlock_ship("stabber")
+        assert self._ids(self.roster.query(faction="minmatar", unlocked=True)) == [
+            "rifter",
+            "slasher",
+            "stabber",
+        ]
+        assert self._ids(self.roster.query(faction="minmatar", unlocked=False)) == [
+            "wolf",
+            "vagabond",
+        ]
+        # Views the ship doesn't belong to are untouched
+        amarr = self.roster.query(faction="amarr", unlocked=True)
+        self.roster.unlock_ship("wolf")
+        assert self.roster.query(faction="amarr", unlocked=True) is amarr
+
+    def test_playable_ships_use_the_index(self):
+        playable = self.roster.get_playable_ships("minmatar", "rebellion")
+        assert self._ids(playable) == ["rifter", "slasher"]
+        self.roster.unlock_ship("wolf")
+        playable = self.roster.get_playable_ships("minmatar", "rebellion")
+        assert self._ids(playable) == ["rifter", "slasher", "wolf"]
+        everything = self.roster.get_playable_ships("minmatar", "rebellion", unlocked_only=False)
+        assert self._ids(everything) == ["rifter", "slasher", "stabber", "wolf"]
@@ -0,0 +1,92 @@
+"""Tests for the static table snapshot"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.loader import DataStore  # noqa: E402
+from core.snapshot import (  # noqa: E402
+    MAGIC,
+    SnapshotError,
+    StaticSnapshot,
+    build_snapshot,
+)
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def app_root(tmp_path):
+    _write(tmp_path / "data" / "enemies" / "rifter.json", {"hull": 100})
+    _write(tmp_path / "data" / "stages" / "belt.json", {"name": "Belt", "waves": 3})
+    _write(tmp_path / "config" / "ship_roster_complete.json", {"ships": {}})
+    _write(tmp_path / "config" / "chapters" / "abyssal.json", {"tiers": {}})
+    (tmp_path / "data" / "enemies" / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+@pytest.fixture
+def snapshot_path(app_root):
+    path = str(app_root / "static.snapshot")
+    build_snapshot(path, str(app_root))
+    return path
+
+
+class TestBuild:
+    def test_captures_every_table(self, app_root, snapshot_path):
+        snapshot = StaticSnapshot(snapshot_path, str(app_root))
+        assert sorted(snapshot.files) == [
+            "config/chapters/abyssal.json",
+            "config/ship_roster_complete.json",
+            "data/enemies/rifter.json",
+            "data/stages/belt.json",
+        ]
+
+    def test_rejects_foreign_and_corrupt_files(self, app_root):
+        bogus = app_root / "bogus.snapshot"
+        bogus.write_bytes(b"hello")
+        with pytest.raises(SnapshotError, match="not a snapshot"):
+            StaticSnapshot(str(bogus), str(app_root))
+        bogus.write_bytes(MAGIC + b"\xff\x00")
+        with pytest.raises(SnapshotError):
+            StaticSnapshot(str(bogus), str(app_root))
+
+
+class TestLookup:
+    def test_current_files_come_from_the_snapshot(self, app_root, snapshot_path):
+        snapshot = StaticSnapshot(snapshot_path, str(app_root))
+        path = str(app_root / "config" / "ship_roster_complete.json")
+        assert snapshot.load_json(path) == {"ships": {}}
+        assert snapshot.hits == 1
+
+    def test_edited_files_fall_back_to_source(self, app_root, snapshot_path):
+        snapshot = StaticSnapshot(snapshot_path, str(app_root))
+        path = app_root / "config" / "ship_roster_complete.json"
+        _write(path, {"ships": {"minmatar": {}}})
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert snapshot.load_json(str(path)) is None
+        assert snapshot.load_json(str(app_root / "config" / "missing.json")) is None
+        assert snapshot.misses == 2
+
+
+class TestDataStore:
+    def test_unchanged_files_are_not_parsed(self, app_root, snapshot_path):
+        store = DataStore(str(app_root / "data"))
+        store.snapshot = StaticSnapshot(snapshot_path, str(app_root))
+        assert store.load("enemies") == {"rifter": {"hull": 100}}
+        assert store.parses == 0
+
+    def test_new_and_edited_files_are_parsed(self, app_root, snapshot_path):
+        _write(app_root / "data" / "enemies" / "omen.json", {"hull": 300})
+        store = DataStore(str(app_root / "data"))
+        store.snapshot = StaticSnapshot(snapshot_path, str(app_root))
+        assert store.load("enemies") == {"rifter": {"hull": 100}, "omen": {"hull": 300}}
+        assert store.parses == 1
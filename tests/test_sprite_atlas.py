@@ -0,0 +1,50 @@
+"""Tests for sprite atlas rectangle packing"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.sprite_atlas import pack_rects  # noqa: E402
+
+
+def _overlaps(a, b):
+    (pa, ax, ay, aw, ah), (pb, bx, by, bw, bh) = a, b
+    if pa != pb:
+        return False
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+class TestPackRects:
+    def test_single_rect_at_padding_offset(self):
+        assert pack_rects([(10, 20)], page_size=64, padding=1) == [(0, 1, 1)]
+
+    def test_placements_stay_on_page(self):
+        random.seed(3)
+        sizes = [(random.randint(4, 60), random.randint(4, 60)) for _ in range(80)]
+        for (page, x, y), (w, h) in zip(pack_rects(sizes, page_size=256), sizes):
+            assert 0 <= x and x + w <= 256
+            assert 0 <= y and y + h <= 256
+
+    def test_no_overlaps(self):
+        random.seed(7)
+        sizes = [(random.randint(4, 40), random.randint(4, 40)) for _ in range(120)]
+        placed = [(page, x, y, w, h) for (page, x, y), (w, h) in zip(pack_rects(sizes, 256), sizes)]
+        for i, a in enumerate(placed):
+            for b in placed[i + 1 :]:
+                assert not _overlaps(a, b)
+
+    def test_spills_onto_new_page_when_full(self):
+        placements = pack_rects([(30, 30)] * 5, page_size=64, padding=1)
+        assert max(page for page, _, _ in placements) >= 1
+
+    def test_same_height_rects_share_a_shelf(self):
+        placements = pack_rects([(10, 10), (10, 10), (10, 10)], page_size=64, padding=0)
+        assert {y for _, _, y in placements} == {0}
+
+    def test_oversized_rect_rejected(self):
+        with pytest.raises(ValueError):
+            pack_rects([(100, 10)], page_size=64)
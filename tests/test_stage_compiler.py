@@ -0,0 +1,240 @@
+"""Tests for compiled stage timelines"""
+
+import json
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.loader import get_data_path, load_stages  # noqa: E402
+from core.stage_compiler import (  # noqa: E402
+    SPAWN_INTERVAL,
+    SPAWN_MARGIN,
+    StageCompiler,
+    StageSchemaError,
+    compile_stage,
+    roll_stage,
+    validate_stage,
+)
+
+ENEMY_TYPES = {"executioner", "punisher", "omen", "bestower", "machariel"}
+
+
+def _simple(**overrides):
+    stage = {
+        "name": "Test Stage",
+        "waves": 4,
+        "enemies": ["executioner", "punisher"],
+        "industrial_chance": 0.0,
+        "boss": "machariel",
+    }
+    stage.update(overrides)
+    return stage
+
+
+def _explicit():
+    return {
+        "name": "Explicit",
+        "waves": [
+            {"enemies": [{"type": "omen", "count": 3}, {"type": "punisher", "count": 2}]},
+            {"enemies": [{"type": "executioner", "count": 4}], "pattern": "pincer"},
+            {"boss": "machariel"},
+        ],
+        "industrial_chance": 0.0,
+    }
+
+
+class TestValidate:
+    def test_bundled_stages(self):
+        stages = load_stages()
+        from constants import ENEMY_STATS
+
+        for stage_id, data in stages.items():
+            if stage_id == "example_stage":
+                # Uses placeholder enemy types the game doesn't define
+                with pytest.raises(StageSchemaError, match="unknown enemy type"):
+                    validate_stage(stage_id, data, ENEMY_STATS)
+            else:
+                validate_stage(stage_id, data, ENEMY_STATS)
+
+    def test_builtin_campaigns(self):
+        from constants import CHAPTERS, ENEMY_STATS
+
+        for chapter in CHAPTERS:
+            for stage in chapter["stages"]:
+                validate_stage(stage["name"], stage, ENEMY_STATS)
+
+    @pytest.mark.parametrize(
+        "stage, message",
+        [
+            (_simple(name=""), "name: required"),
+            (_simple(waves=0), "waves: must be at least 1"),
+            (_simple(enemies=["executioner", "titan"]), r"enemies\[1\]: unknown enemy type"),
+            (_simple(industrial_chance=2), "industrial_chance"),
+            (_simple(boss={"name": "No type"}), "boss objects need a type"),
+            (_simple(waves=[{"enemies": []}]), r"waves\[0\]\.enemies: required"),
+            (_simple(waves=[{"boss": "machariel", "enemies": []}]), "exactly one of"),
+            (
+                _simple(waves=[{"enemies": [{"type": "omen", "count": 0}]}]),
+                r"enemies\[0\]\.count",
+            ),
+            (
+                _simple(waves=[{"enemies": [{"type": "omen"}], "pattern": "zigzag"}]),
+                "unknown wave pattern",
+            ),
+        ],
+    )
+    def test_errors_name_the_field(self, stage, message):
+        with pytest.raises(StageSchemaError, match=message):
+            validate_stage("stage", stage, ENEMY_TYPES)
+
+
+def _roll(stage, stage_index=0, seed=0):
+    return roll_stage(compile_stage("stage", stage, stage_index, ENEMY_TYPES), random.Random(seed))
+
+
+class TestCompile:
+    def test_generated_waves_grow_with_stage_and_end_with_boss(self):
+        timeline = _roll(_simple(), 2)
+        assert timeline.name == "Test Stage"
+        assert [len(wave.spawns) for wave in timeline.waves[:3]] == [5, 6, 7]
+        assert timeline.waves[3].boss == "machariel"
+        assert timeline.waves[3].spawns == ()
+
+    def test_explicit_waves_keep_their_counts(self):
+        timeline = _roll(_explicit())
+        first = sorted(spawn.enemy_type for spawn in timeline.waves[0].spawns)
+        assert first == ["omen"] * 3 + ["punisher"] * 2
+        assert timeline.waves[1].pattern == "pincer"
+        assert timeline.waves[2].boss == "machariel"
+
+    def test_spawns_are_ordered_and_on_screen(self):
+        from constants import SCREEN_WIDTH
+
+        timeline = _roll(_explicit())
+        for wave in timeline.waves[:2]:
+            frames = [spawn.frame for spawn in wave.spawns]
+            assert frames == [SPAWN_INTERVAL * (i + 1) for i in range(len(frames))]
+            assert all(
+                SPAWN_MARGIN <= spawn.x <= SCREEN_WIDTH - SPAWN_MARGIN for spawn in wave.spawns
+            )
+
+    def test_formations_span_the_screen(self):
+        from constants import SCREEN_WIDTH
+
+        xs = {
+            spawn.x for seed in range(10) for spawn in _roll(_simple(), seed=seed).waves[0].spawns
+        }
+        assert max(xs) > SCREEN_WIDTH // 2
+        narrow = roll_stage(
+            compile_stage("stage", _simple(), 0, ENEMY_TYPES), random.Random(0), (800, 700)
+        )
+        assert all(spawn.x <= 800 - SPAWN_MARGIN for spawn in narrow.waves[0].spawns)
+
+    def test_industrial_chance(self):
+        timeline = _roll(_simple(industrial_chance=1.0, boss=None))
+        for i, wave in enumerate(timeline.waves):
+            assert len(wave.spawns) == 3 + i + 1
+            assert "bestower" in [spawn.enemy_type for spawn in wave.spawns]
+
+    def test_enemy_types_are_rolled_per_run(self):
+        stage = _simple(industrial_chance=0.3, boss=None, waves=6)
+        plan = compile_stage("stage", stage, 0, ENEMY_TYPES)
+
+        def types(seed):
+            timeline = roll_stage(plan, random.Random(seed))
+            return [[spawn.enemy_type for spawn in wave.spawns] for wave in timeline.waves]
+
+        assert types(1) == types(1)
+        assert types(1) != types(2)
+
+    def test_formations_are_rolled_per_run(self):
+        plan = compile_stage("stage", _simple(boss=None, waves=8), 0, ENEMY_TYPES)
+
+        def formations(seed):
+            timeline = roll_stage(plan, random.Random(seed))
+            return [(wave.pattern, [spawn.x for spawn in wave.spawns]) for wave in timeline.waves]
+
+        assert formations(1) == formations(1)
+        assert len({str(formations(seed)) for seed in range(5)}) > 1
+        # Explicit patterns are kept in every run
+        explicit = compile_stage("stage", _explicit(), 0, ENEMY_TYPES)
+        assert roll_stage(explicit, random.Random(3)).waves[1].pattern == "pincer"
+
+    def test_explicit_waves_are_shuffled_per_run(self):
+        plan = compile_stage("stage", _explicit(), 0, ENEMY_TYPES)
+        orders = {
+            tuple(
+                spawn.enemy_type for spawn in roll_stage(plan, random.Random(seed)).waves[0].spawns
+            )
+            for seed in range(10)
+        }
+        assert len(orders) > 1
+
+
+class TestStageCompiler:
+    def _write(self, path, stage):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(stage, f)
+
+    def test_artifact_reused_across_instances(self, tmp_path):
+        stage_file = tmp_path / "explicit.json"
+        self._write(stage_file, _explicit())
+        cache = str(tmp_path / "stages.pickle")
+
+        first = StageCompiler(cache, ENEMY_TYPES)
+        plan = first.compile_file(str(stage_file))
+        assert first.compiled == 1
+        assert first.compile_file(str(stage_file)) is plan
+
+        second = StageCompiler(cache, ENEMY_TYPES)
+        assert second.compile_file(str(stage_file)) == plan
+        assert second.compiled == 0
+
+        # Different compile inputs invalidate the artifact
+        third = StageCompiler(cache, ENEMY_TYPES | {"omen_navy_issue"})
+        third.compile_file(str(stage_file))
+        assert third.compiled == 1
+
+    def test_touched_file_reuses_hash_and_edit_recompiles(self, tmp_path):
+        stage_file = tmp_path / "explicit.json"
+        self._write(stage_file, _explicit())
+        compiler = StageCompiler(str(tmp_path / "stages.pickle"), ENEMY_TYPES)
+        compiler.compile_file(str(stage_file))
+
+        stat = os.stat(stage_file)
+        os.utime(stage_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        compiler.compile_file(str(stage_file))
+        assert compiler.compiled == 1
+
+        edited = _explicit()
+        edited["name"] = "Edited"
+        self._write(stage_file, edited)
+        os.utime(stage_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        assert compiler.compile_file(str(stage_file)).name == "Edited"
+        assert compiler.compiled == 2
+
+    def test_builtin_stage_cached_by_content(self, tmp_path):
+        compiler = StageCompiler("", ENEMY_TYPES)
+        plan = compiler.compile(_simple(), 1)
+        assert compiler.compile(_simple(), 1) is plan
+        assert compiler.compiled == 1
+        assert not os.listdir(tmp_path)
+
+    def test_json_source_compiles_from_file(self):
+        compiler = StageCompiler("")
+        plan = compiler.compile({"name": "Pirate Invasion", "source": "pirate_invasion"})
+        with open(os.path.join(get_data_path(), "stages", "pirate_invasion.json")) as f:
+            data = json.load(f)
+        assert len(plan.waves) == len(data["waves"])
+        assert plan.waves[-1].boss == "machariel"
+
+    def test_corrupt_artifact_is_ignored(self, tmp_path):
+        cache = tmp_path / "stages.pickle"
+        cache.write_bytes(b"not a pickle")
+        compiler = StageCompiler(str(cache), ENEMY_TYPES)
+        assert compiler.compile(_simple(), 0).waves
+        assert compiler.compiled == 1
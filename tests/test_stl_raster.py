@@ -0,0 +1,100 @@
+"""Tests for the NumPy STL top-down rasterizer"""
+
+import os
+import struct
+import sys
+import zlib
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import stl_raster  # noqa: E402
+
+# A flat arrow along +Y with a raised fin, 2 x 6 x 1 units
+ARROW = np.array(
+    [
+        [[-1, -3, 0], [1, -3, 0], [0, 3, 0]],
+        [[0, -3, 0], [0, 3, 0], [0, -3, 1]],
+    ],
+    dtype=np.float64,
+)
+
+
+def _write_binary(path, triangles):
+    records = np.zeros(len(triangles), dtype=stl_raster._BINARY_RECORD)
+    records["vertices"] = triangles
+    # Binary headers often start with "solid" too
+    path.write_bytes(
+        b"solid binary".ljust(80) + struct.pack("<I", len(triangles)) + records.tobytes()
+    )
+
+
+def _write_ascii(path, triangles):
+    lines = ["solid arrow"]
+    for triangle in triangles:
+        lines += ["facet normal 0 0 1", "outer loop"]
+        lines += [f"vertex {x} {y} {z}" for x, y, z in triangle]
+        lines += ["endloop", "endfacet"]
+    path.write_text("\n".join(lines + ["endsolid arrow"]))
+
+
+def _read_png(path):
+    data = path.read_bytes()
+    width, height = struct.unpack(">II", data[16:24])
+    rows = np.frombuffer(zlib.decompress(data[41:-12]), dtype=np.uint8)
+    return rows.reshape(height, width * 4 + 1)[:, 1:].reshape(height, width, 4)
+
+
+class TestLoadStl:
+    def test_binary_and_ascii_agree(self, tmp_path):
+        _write_binary(tmp_path / "a.stl", ARROW)
+        _write_ascii(tmp_path / "b.stl", ARROW)
+        assert np.array_equal(stl_raster.load_stl(str(tmp_path / "a.stl")), ARROW)
+        assert np.array_equal(stl_raster.load_stl(str(tmp_path / "b.stl")), ARROW)
+
+
+class TestOrient:
+    def test_longest_axis_points_up(self):
+        along_x = ARROW[..., [1, 0, 2]]
+        standing = ARROW[..., [0, 2, 1]]
+        for model in (ARROW, along_x, standing):
+            points = stl_raster.orient(model).reshape(-1, 3)
+            extent = points.max(axis=0) - points.min(axis=0)
+            assert extent.argmax() == 1
+            assert np.allclose(points.min(axis=0) + points.max(axis=0), 0)
+
+    def test_flip_turns_the_nose_around(self):
+        nose = stl_raster.orient(ARROW)[0, 2]
+        flipped = stl_raster.orient(ARROW, rotate_180=True)[0, 2]
+        assert nose[1] > 0 > flipped[1]
+
+
+class TestRasterize:
+    def test_arrow_silhouette(self):
+        rgba = stl_raster.render_topdown(stl_raster.orient(ARROW), size=64)
+        alpha = rgba[..., 3]
+        assert alpha[0].max() == 0 and alpha[:, 0].max() == 0
+        # Wide at the tail (bottom of the image), narrow at the nose
+        assert (alpha[50] > 0).sum() > 3 * (alpha[14] > 0).sum()
+        assert alpha[32, 32] == 255
+
+    def test_nearest_triangle_wins(self):
+        low = [[0, 0, 0], [8, 0, 0], [0, 8, 0]]
+        high = [[0, 0, 1], [8, 0, 1], [0, 8, 1]]
+        # The raised triangle is shaded 0.75 whichever order they are drawn in
+        for triangles, shades in (([low, high], [0.25, 0.75]), ([high, low], [0.75, 0.25])):
+            coverage, image = stl_raster.rasterize(np.array(triangles, float), 8, np.array(shades))
+            assert coverage[1, 1] and image[1, 1] == 0.75
+            assert not coverage[7, 7]
+
+    def test_render_directory_keeps_layout(self, tmp_path):
+        (tmp_path / "stl" / "caldari").mkdir(parents=True)
+        _write_binary(tmp_path / "stl" / "caldari" / "condor.stl", ARROW)
+        (tmp_path / "stl" / "caldari" / "broken.stl").write_text("solid nothing")
+        results = stl_raster.render_directory(
+            str(tmp_path / "stl"), str(tmp_path / "out"), size=32, workers=1
+        )
+        assert [("error" in r) for r in results] == [True, False]
+        image = _read_png(tmp_path / "out" / "caldari" / "condor.png")
+        assert image.shape == (32, 32, 4) and image[16, 16, 3] == 255
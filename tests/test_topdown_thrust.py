@@ -0,0 +1,85 @@
+"""Tests for the incremental top-down thrust strip generator"""
+
+import json
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate_topdown_thrust as thrust  # noqa: E402
+from tests.test_ship_pipeline import _write_png  # noqa: E402
+
+
+def _png_size(path):
+    return struct.unpack(">II", path.read_bytes()[16:24])
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    sprites, output = tmp_path / "sprites", tmp_path / "effects"
+    sprites.mkdir()
+    _write_png(sprites / "rifter.png", 20, (200, 120, 60, 255))
+    _write_png(sprites / "raven.png", 24, (90, 90, 120, 255))
+    return sprites, output
+
+
+def _build(dirs, ships=("rifter", "raven"), **kwargs):
+    kwargs.setdefault("workers", 2)
+    return thrust.build_thrust_strips(list(ships), str(dirs[0]), str(dirs[1]), **kwargs)
+
+
+class TestBuildThrustStrips:
+    def test_writes_one_strip_per_ship(self, dirs):
+        report = _build(dirs, ["rifter", "raven", "naglfar"])
+        assert sorted(report["built"]) == ["raven", "rifter"]
+        assert report["missing"] == ["naglfar"]
+
+        output = dirs[1]
+        assert _png_size(output / "rifter_topdown_thrust.png") == (20 * 6, 20 + 50)
+        entry = json.loads((output / thrust.MANIFEST_NAME).read_text())["ships"]["raven"]
+        assert entry["frame_size"] == [24, 24 + 50] and entry["frames"] == 6
+        assert entry["recipe"]["colors"][0] == [100, 180, 255]
+
+    def test_up_to_date_strips_are_skipped(self, dirs):
+        _build(dirs)
+        strip = dirs[1] / "rifter_topdown_thrust.png"
+        built_at = strip.stat().st_mtime_ns
+        report = _build(dirs)
+        assert report["built"] == [] and sorted(report["skipped"]) == ["raven", "rifter"]
+        assert strip.stat().st_mtime_ns == built_at
+        assert _build(dirs, force=True)["skipped"] == []
+
+    def test_stale_inputs_rebuild_only_that_ship(self, dirs):
+        _build(dirs)
+        sprite = dirs[0] / "raven.png"
+        os.utime(sprite, ns=(sprite.stat().st_atime_ns, sprite.stat().st_mtime_ns + 10**9))
+        assert _build(dirs)["built"] == ["raven"]
+
+        (dirs[1] / "rifter_topdown_thrust.png").unlink()
+        assert _build(dirs)["built"] == ["rifter"]
+
+        report = _build(dirs, frames=4)
+        assert sorted(report["built"]) == ["raven", "rifter"]
+        assert _png_size(dirs[1] / "rifter_topdown_thrust.png") == (20 * 4, 70)
+
+    def test_replaces_per_frame_files(self, dirs):
+        dirs[1].mkdir()
+        for i in range(6):
+            (dirs[1] / f"rifter_topdown_thrust_{i}.png").write_bytes(b"old")
+        (dirs[1] / "raven_topdown_thrust_0.png").write_bytes(b"old")
+        _build(dirs, ["rifter"])
+        assert sorted(os.listdir(dirs[1])) == [
+            "raven_topdown_thrust_0.png",
+            "rifter_topdown_thrust.png",
+            thrust.MANIFEST_NAME,
+        ]
+
+    def test_unreadable_sprite_fails_alone(self, dirs):
+        (dirs[0] / "raven.png").write_bytes(b"not a png")
+        report = _build(dirs)
+        assert report["built"] == ["rifter"] and report["failed"] == ["raven"]
+        manifest = json.loads((dirs[1] / thrust.MANIFEST_NAME).read_text())
+        assert list(manifest["ships"]) == ["rifter"]
@@ -24,9 +24,16 @@ class SpawnPoint:
 class WavePattern:
     """Base class for wave patterns."""
 
-    def __init__(self, screen_width: int = 800, screen_height: int = 700):
+    def __init__(
+        self,
+        screen_width: int = 800,
+        screen_height: int = 700,
+        rng: Optional[random.Random] = None,
+    ):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        # Edges, jitter and enemy types; the random module unless a run's rng is given
+        self.rng = rng or random
 
     def generate(self, num_enemies: int, enemy_types: List[str]) -> List[SpawnPoint]:
         """Generate spawn points for this pattern."""
@@ -45,7 +52,7 @@ class LinearPattern(WavePattern):
         line_width = (num_enemies - 1) * spacing
 
         # Random edge selection
-        edge = random.choice(["top", "left", "right"])
+        edge = self.rng.choice(["top", "left", "right"])
 
         if edge == "top":
             start_x = (self.screen_width - line_width) // 2
@@ -56,9 +63,9 @@ class LinearPattern(WavePattern):
                         x=x,
                         y=-30 - i * 10,  # Staggered entry
                         vx=0,
-                        vy=random.uniform(2.0, 3.0),
+                        vy=self.rng.uniform(2.0, 3.0),
                         delay=i * 5,
-                        enemy_type=random.choice(enemy_types),
+                        enemy_type=self.rng.choice(enemy_types),
                     )
                 )
         elif edge == "left":
@@ -69,10 +76,10 @@ class LinearPattern(WavePattern):
                     SpawnPoint(
                         x=-30,
                         y=y,
-                        vx=random.uniform(2.5, 3.5),
-                        vy=random.uniform(0.5, 1.0),
+                        vx=self.rng.uniform(2.5, 3.5),
+                        vy=self.rng.uniform(0.5, 1.0),
                         delay=i * 8,
-                        enemy_type=random.choice(enemy_types),
+                        enemy_type=self.rng.choice(enemy_types),
                     )
                 )
         else:  # right
@@ -83,10 +90,10 @@ class LinearPattern(WavePattern):
                     SpawnPoint(
                         x=self.screen_width + 30,
                         y=y,
-                        vx=random.uniform(-3.5, -2.5),
-                        vy=random.uniform(0.5, 1.0),
+                        vx=self.rng.uniform(-3.5, -2.5),
+                        vy=self.rng.uniform(0.5, 1.0),
                         delay=i * 8,
-                        enemy_type=random.choice(enemy_types),
+                        enemy_type=self.rng.choice(enemy_types),
                     )
                 )
 
@@ -112,11 +119,11 @@ class SinePattern(WavePattern):
 
             # Velocity follows the sine curve
             vx = math.cos(phase) * 1.5
-            vy = random.uniform(2.0, 2.5)
+            vy = self.rng.uniform(2.0, 2.5)
 
             points.append(
                 SpawnPoint(
-                    x=x, y=y, vx=vx, vy=vy, delay=i * 10, enemy_type=random.choice(enemy_types)
+                    x=x, y=y, vx=vx, vy=vy, delay=i * 10, enemy_type=self.rng.choice(enemy_types)
                 )
             )
 
@@ -160,7 +167,7 @@ class SpiralPattern(WavePattern):
 
             points.append(
                 SpawnPoint(
-                    x=x, y=y, vx=vx, vy=vy, delay=i * 15, enemy_type=random.choice(enemy_types)
+                    x=x, y=y, vx=vx, vy=vy, delay=i * 15, enemy_type=self.rng.choice(enemy_types)
                 )
             )
 
@@ -190,8 +197,8 @@ class AmbushPattern(WavePattern):
                     break
 
                 spawn = self._get_edge_spawn(edge, i, count)
-                spawn.delay = random.randint(0, 10)  # Near-simultaneous
-                spawn.enemy_type = random.choice(enemy_types)
+                spawn.delay = self.rng.randint(0, 10)  # Near-simultaneous
+                spawn.enemy_type = self.rng.choice(enemy_types)
                 points.append(spawn)
 
         return points
@@ -199,32 +206,34 @@ class AmbushPattern(WavePattern):
     def _get_edge_spawn(self, edge: str, idx: int, count: int) -> SpawnPoint:
         """Get spawn point for a specific edge."""
         if edge == "top":
-            x = random.randint(50, self.screen_width - 50)
-            return SpawnPoint(x=x, y=-30, vx=0, vy=random.uniform(3.0, 4.0))
+            x = self.rng.randint(50, self.screen_width - 50)
+            return SpawnPoint(x=x, y=-30, vx=0, vy=self.rng.uniform(3.0, 4.0))
         elif edge == "bottom":
-            x = random.randint(50, self.screen_width - 50)
-            return SpawnPoint(x=x, y=self.screen_height + 30, vx=0, vy=random.uniform(-3.0, -2.0))
+            x = self.rng.randint(50, self.screen_width - 50)
+            return SpawnPoint(x=x, y=self.screen_height + 30, vx=0, vy=self.rng.uniform(-3.0, -2.0))
         elif edge == "left":
-            y = random.randint(50, self.screen_height - 150)
-            return SpawnPoint(x=-30, y=y, vx=random.uniform(3.0, 4.0), vy=random.uniform(0.5, 1.5))
+            y = self.rng.randint(50, self.screen_height - 150)
+            return SpawnPoint(
+                x=-30, y=y, vx=self.rng.uniform(3.0, 4.0), vy=self.rng.uniform(0.5, 1.5)
+            )
         elif edge == "right":
-            y = random.randint(50, self.screen_height - 150)
+            y = self.rng.randint(50, self.screen_height - 150)
             return SpawnPoint(
                 x=self.screen_width + 30,
                 y=y,
-                vx=random.uniform(-4.0, -3.0),
-                vy=random.uniform(0.5, 1.5),
+                vx=self.rng.uniform(-4.0, -3.0),
+                vy=self.rng.uniform(0.5, 1.5),
             )
         elif edge == "top_left":
             return SpawnPoint(
-                x=-30, y=-30, vx=random.uniform(2.5, 3.5), vy=random.uniform(2.5, 3.5)
+                x=-30, y=-30, vx=self.rng.uniform(2.5, 3.5), vy=self.rng.uniform(2.5, 3.5)
             )
         else:  # top_right
             return SpawnPoint(
                 x=self.screen_width + 30,
                 y=-30,
-                vx=random.uniform(-3.5, -2.5),
-                vy=random.uniform(2.5, 3.5),
+                vx=self.rng.uniform(-3.5, -2.5),
+                vy=self.rng.uniform(2.5, 3.5),
             )
 
 
@@ -245,10 +254,10 @@ class PincerPattern(WavePattern):
                 SpawnPoint(
                     x=-30,
                     y=y,
-                    vx=random.uniform(2.0, 3.0),
-                    vy=random.uniform(0.5, 1.0),
+                    vx=self.rng.uniform(2.0, 3.0),
+                    vy=self.rng.uniform(0.5, 1.0),
                     delay=i * 8,
-                    enemy_type=random.choice(enemy_types),
+                    enemy_type=self.rng.choice(enemy_types),
                 )
             )
 
@@ -259,10 +268,10 @@ class PincerPattern(WavePattern):
                 SpawnPoint(
                     x=self.screen_width + 30,
                     y=y,
-                    vx=random.uniform(-3.0, -2.0),
-                    vy=random.uniform(0.5, 1.0),
+                    vx=self.rng.uniform(-3.0, -2.0),
+                    vy=self.rng.uniform(0.5, 1.0),
                     delay=i * 8,
-                    enemy_type=random.choice(enemy_types),
+                    enemy_type=self.rng.choice(enemy_types),
                 )
             )
 
@@ -299,9 +308,9 @@ class ScreenClearPattern(WavePattern):
                         x=x,
                         y=y,
                         vx=0,
-                        vy=random.uniform(1.5, 2.0),  # Slow, wall-like advance
+                        vy=self.rng.uniform(1.5, 2.0),  # Slow, wall-like advance
                         delay=row * 20,  # Row by row
-                        enemy_type=random.choice(enemy_types),
+                        enemy_type=self.rng.choice(enemy_types),
                     )
                 )
 
@@ -322,11 +331,17 @@ WAVE_PATTERNS = {
 class WavePatternManager:
     """Manages wave pattern selection and generation."""
 
-    def __init__(self, screen_width: int = 800, screen_height: int = 700):
+    def __init__(
+        self,
+        screen_width: int = 800,
+        screen_height: int = 700,
+        rng: Optional[random.Random] = None,
+    ):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.rng = rng or random
         self.patterns = {
-            name: cls(screen_width, screen_height) for name, cls in WAVE_PATTERNS.items()
+            name: cls(screen_width, screen_height, self.rng) for name, cls in WAVE_PATTERNS.items()
         }
         self.last_pattern = None
 
@@ -337,7 +352,7 @@ class WavePatternManager:
     def random_pattern(self, exclude: Optional[str] = None) -> Tuple[str, WavePattern]:
         """Get a random pattern, optionally excluding one."""
         available = [n for n in self.patterns.keys() if n != exclude]
-        name = random.choice(available)
+        name = self.rng.choice(available)
         return name, self.patterns[name]
 
     def generate_wave(
@@ -364,15 +379,15 @@ class WavePatternManager:
         if wave_num < 3:
             return "linear"
         elif wave_num < 5:
-            return random.choice(["linear", "sine"])
+            return self.rng.choice(["linear", "sine"])
         elif wave_num < 8:
-            return random.choice(["sine", "pincer", "spiral"])
+            return self.rng.choice(["sine", "pincer", "spiral"])
         else:
             # Later waves can use any pattern
             patterns = ["sine", "spiral", "ambush", "pincer"]
             if wave_num % 5 == 0:  # Every 5th wave
                 patterns.append("screen_clear")
-            return random.choice(patterns)
+            return self.rng.choice(patterns)
 
 
 # Singleton instance